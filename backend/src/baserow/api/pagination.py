@@ -1,8 +1,21 @@
+import base64
+import datetime
+import json
+from decimal import Decimal
+from uuid import UUID
+
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
 from rest_framework.exceptions import NotFound, APIException
 from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework.pagination import (
+    BasePagination,
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -11,10 +24,23 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, count=None, *args, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count: Optionally an already known total count of the queryset. If
+            provided, the queryset is not counted anymore when paginating.
+        """
+
         self.limit_page_size = limit_page_size
+        self.count = count
         super().__init__(*args, **kwargs)
 
+    def django_paginator_class(self, object_list, per_page):
+        paginator = DjangoPaginator(object_list, per_page)
+        if self.count is not None:
+            paginator.count = self.count
+        return paginator
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -39,3 +65,222 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    def __init__(self, count=None, *args, **kwargs):
+        """
+        :param count: Optionally an already known total count of the queryset. If
+            provided, the queryset is not counted anymore when paginating.
+        """
+
+        self.known_count = count
+        super().__init__(*args, **kwargs)
+
+    def get_count(self, queryset):
+        if self.known_count is not None:
+            return self.known_count
+        return super().get_count(queryset)
+
+
+class KeysetPagination(BasePagination):
+    """
+    A cursor based paginator that, unlike the page number and limit offset
+    paginators, does not count the full queryset and does not use an OFFSET. The
+    cursor contains the values of every order by expression of the last row on the
+    page. The next page is selected by filtering on the rows that are positioned after
+    those values, which means that fetching a page deep into a large table costs the
+    same as fetching the first page.
+
+    The ordering of the provided queryset is respected, including annotated and
+    nullable sort expressions like the ones applied by the view sortings. The `id` is
+    added as the last ordering if it's not already there to guarantee a stable and
+    unique position for every row.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+    keyset_annotation_prefix = "_keyset_"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+        self.request = None
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size <= 0:
+                raise ValueError()
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    def get_order_keys(self, queryset):
+        """
+        Normalizes the ordering of the queryset into a list of
+        `(expression, descending, nulls_first)` tuples. When the nulls position is not
+        explicitly provided, the PostgreSQL default is used which places the nulls
+        last when ordering ascending and first when ordering descending.
+        """
+
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not any(
+            o in ("id", "pk", "-id", "-pk")
+            or (
+                isinstance(o, OrderBy)
+                and isinstance(o.expression, F)
+                and o.expression.name in ("id", "pk")
+            )
+            for o in ordering
+        ):
+            ordering.append("id")
+
+        keys = []
+        for order in ordering:
+            if isinstance(order, str):
+                descending = order.startswith("-")
+                keys.append((F(order.lstrip("-")), descending, descending))
+            elif isinstance(order, OrderBy):
+                nulls_first = (
+                    order.nulls_first or order.descending and not order.nulls_last
+                )
+                keys.append((order.expression, order.descending, nulls_first))
+            else:
+                keys.append((order, False, False))
+
+        return keys
+
+    def encode_cursor(self, values):
+        def to_primitive(value):
+            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+                return value.isoformat()
+            if isinstance(value, (Decimal, UUID)):
+                return str(value)
+            if isinstance(value, datetime.timedelta):
+                # JSON has no duration type, so it's tagged to be able to decode it
+                # back into a timedelta.
+                return {"timedelta": [value.days, value.seconds, value.microseconds]}
+            return value
+
+        data = json.dumps([to_primitive(value) for value in values])
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor, expected_length):
+        def from_primitive(value):
+            if isinstance(value, dict):
+                days, seconds, microseconds = value["timedelta"]
+                return datetime.timedelta(
+                    days=days, seconds=seconds, microseconds=microseconds
+                )
+            return value
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+            if isinstance(values, list):
+                values = [from_primitive(value) for value in values]
+        except (ValueError, TypeError, KeyError):
+            values = None
+
+        if not isinstance(values, list) or len(values) != expected_length:
+            exception = APIException(
+                {
+                    "error": "ERROR_INVALID_CURSOR",
+                    "detail": "The provided cursor is invalid or doesn't match the "
+                    "current ordering anymore.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return values
+
+    def _equal_q(self, name, value):
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        return Q(**{name: value})
+
+    def _after_q(self, name, value, descending, nulls_first):
+        if value is None:
+            # Only non null values can be positioned after a null value if the nulls
+            # come first, otherwise nothing comes after a null.
+            return Q(**{f"{name}__isnull": False}) if nulls_first else Q(pk__in=[])
+
+        after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if not nulls_first:
+            after |= Q(**{f"{name}__isnull": True})
+        return after
+
+    def get_after_cursor_q(self, keys, values):
+        """
+        Constructs the lexicographic filter that only matches the rows positioned
+        after the provided cursor values. The first key is additionally bounded so
+        that PostgreSQL can use a range scan on an index of the first order column.
+        """
+
+        names = [f"{self.keyset_annotation_prefix}{i}" for i in range(len(keys))]
+        q = Q(pk__in=[])
+        equal = Q()
+
+        for name, (_, descending, nulls_first), value in zip(names, keys, values):
+            q |= equal & self._after_q(name, value, descending, nulls_first)
+            equal &= self._equal_q(name, value)
+
+        first_descending, first_nulls_first = keys[0][1], keys[0][2]
+        bound = self._equal_q(names[0], values[0]) | self._after_q(
+            names[0], values[0], first_descending, first_nulls_first
+        )
+        return bound & q
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        keys = self.get_order_keys(queryset)
+
+        queryset = queryset.annotate(
+            **{
+                f"{self.keyset_annotation_prefix}{i}": expression
+                for i, (expression, _, _) in enumerate(keys)
+            }
+        )
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, len(keys))
+            queryset = queryset.filter(self.get_after_cursor_q(keys, values))
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+
+        if len(rows) > page_size:
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(
+                [
+                    getattr(last, f"{self.keyset_annotation_prefix}{i}")
+                    for i in range(len(keys))
+                ]
+            )
+
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
@@ -28,11 +28,19 @@ class UserFileURLAndThumbnailsSerializerMixin(serializers.Serializer):
         url = default_storage.url(path)
         return url
 
+    def get_thumbnails_ready(self, instance):
+        return self.get_instance_attr(instance, "thumbnails_ready")
+
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_thumbnails(self, instance):
         if not self.get_instance_attr(instance, "is_image"):
             return None
 
+        # The thumbnails are generated in the background, so the urls would point to
+        # files that don't exist yet.
+        if not self.get_thumbnails_ready(instance):
+            return None
+
         name = self.get_instance_attr(instance, "name")
 
         return {
@@ -63,6 +71,7 @@ class UserFileSerializer(
             "uploaded_at",
             "url",
             "thumbnails",
+            "thumbnails_ready",
             "name",
             "original_name",
         )
@@ -99,6 +99,7 @@ CELERY_TASK_ROUTES = {
         "queue": "export"
     },
     "baserow.core.trash.tasks.permanently_delete_marked_trash": {"queue": "export"},
+    "baserow.core.user_files.tasks.generate_user_file_thumbnails": {"queue": "export"},
 }
 CELERY_SOFT_TIME_LIMIT = 60 * 5  # 5 minutes
 CELERY_TIME_LIMIT = CELERY_SOFT_TIME_LIMIT + 60  # 60 seconds
@@ -173,6 +174,10 @@ CACHES = {
 }
 
 
+# The maximum amount of built table models that every process keeps in memory. Set to 0
+# to disable this cache.
+BASEROW_BUILT_MODEL_CACHE_SIZE = int(os.getenv("BASEROW_BUILT_MODEL_CACHE_SIZE", 128))
+
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
 # going to be any relations between the application schema and the user schema.
@@ -432,6 +437,15 @@ FROM_EMAIL = os.getenv("FROM_EMAIL", "no-reply@localhost")
 RESET_PASSWORD_TOKEN_MAX_AGE = 60 * 60 * 48  # 48 hours
 
 ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
+# The minimum amount of rows a view must have before its exact row count is cached.
+BASEROW_ROW_COUNT_CACHE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_CACHE_THRESHOLD", 10000)
+)
+# The minimum amount of rows, according to the planner statistics, an unfiltered table
+# must have before an approximate row count is returned when requested.
+BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
@@ -445,6 +459,46 @@ UNIQUE_ROW_VALUES_SIZE_LIMIT = 50
 INITIAL_TABLE_DATA_LIMIT = None
 if "INITIAL_TABLE_DATA_LIMIT" in os.environ:
     INITIAL_TABLE_DATA_LIMIT = int(os.getenv("INITIAL_TABLE_DATA_LIMIT"))
+# The minimum amount of rows that must be inserted at once before they're streamed
+# into the table using `COPY` instead of an `INSERT` statement. Zero disables it.
+BASEROW_ROW_COPY_INSERT_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COPY_INSERT_THRESHOLD", 1000)
+)
+# The amount of rows that are copied into the table per chunk.
+BASEROW_ROW_COPY_INSERT_CHUNK_SIZE = int(
+    os.getenv("BASEROW_ROW_COPY_INSERT_CHUNK_SIZE", 5000)
+)
+# The minimum amount of rows a table must have before the values of its formula fields
+# are recomputed in chunks in a background task after a schema change instead of in
+# the request. Zero disables it.
+BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD = int(
+    os.getenv("BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD", 100000)
+)
+# The amount of rows that are recomputed per chunk in the background.
+BASEROW_FORMULA_RECOMPUTE_CHUNK_SIZE = int(
+    os.getenv("BASEROW_FORMULA_RECOMPUTE_CHUNK_SIZE", 10000)
+)
+FORMULA_RECOMPUTE_CHECK_INTERVAL_MINUTES = 1
+# How often the API token usage, which is accumulated in the cache, is written to
+# the database.
+BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS", 60)
+)
+# The amount of rows that are converted per batch when the type of a field is changed
+# online or when the data of a many to many field is converted.
+BASEROW_FIELD_CONVERSION_BATCH_SIZE = int(
+    os.getenv("BASEROW_FIELD_CONVERSION_BATCH_SIZE", 10000)
+)
+# The amount of rows that are held in memory at the same time when exporting or
+# importing a table as part of an application.
+BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE = int(
+    os.getenv("BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE", 512)
+)
+# The amount of files that are downloaded at the same time from a remote storage
+# when they're added to an export.
+BASEROW_EXPORT_FILES_DOWNLOAD_WORKERS = int(
+    os.getenv("BASEROW_EXPORT_FILES_DOWNLOAD_WORKERS", 8)
+)
 
 MEDIA_URL_PATH = "/media/"
 MEDIA_URL = os.getenv("MEDIA_URL", urljoin(PUBLIC_BACKEND_URL, MEDIA_URL_PATH))
@@ -495,6 +549,14 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = os.getenv(
     "HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum amount of trashed rows of the same table and the maximum amount of
+# trashed tables that are permanently deleted together in one transaction.
+BASEROW_TRASH_ROW_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_ROW_DELETION_BATCH_SIZE", 5000)
+)
+BASEROW_TRASH_TABLE_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_TRASH_TABLE_DELETION_BATCH_SIZE", 20)
+)
 
 MAX_ROW_COMMENT_LENGTH = 10000
 
@@ -517,6 +579,12 @@ WEBHOOKS_MAX_RETRIES_PER_CALL = 8
 WEBHOOKS_MAX_PER_TABLE = 20
 WEBHOOKS_MAX_CALL_LOG_ENTRIES = 10
 WEBHOOKS_REQUEST_TIMEOUT_SECONDS = 5
+WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK", 1)
+)
+WEBHOOKS_CONCURRENCY_LIMIT_COUNTDOWN_SECONDS = 1
+WEBHOOKS_CONCURRENCY_LIMIT_MAX_COUNTDOWN_SECONDS = 60
+WEBHOOKS_CONCURRENCY_LIMIT_MAX_REQUEUES = 10
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -553,6 +621,10 @@ OLD_ACTION_CLEANUP_INTERVAL_MINUTES = os.getenv(
     "OLD_ACTION_CLEANUP_INTERVAL_MINUTES", 5
 )
 MINUTES_UNTIL_ACTION_CLEANED_UP = os.getenv("MINUTES_UNTIL_ACTION_CLEANED_UP", "120")
+# The maximum amount of expired actions that are cleaned up per transaction.
+BASEROW_ACTION_CLEANUP_BATCH_SIZE = int(
+    os.getenv("BASEROW_ACTION_CLEANUP_BATCH_SIZE", 5000)
+)
 
 LOGGING = {
     "version": 1,
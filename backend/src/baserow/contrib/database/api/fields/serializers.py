@@ -12,16 +12,43 @@ from baserow.contrib.database.api.views.serializers import (
     ViewSortSerializer,
     ViewFilterSerializer,
 )
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.dependencies.models import FieldValueRecompute
+from baserow.contrib.database.fields.models import Field, FormulaField
 from baserow.contrib.database.fields.registries import field_type_registry
 
 
+class FieldValueRecomputeSerializer(serializers.ModelSerializer):
+    progress_percentage = serializers.IntegerField(
+        read_only=True,
+        help_text="The percentage of the rows of which the values have been "
+        "recomputed.",
+    )
+
+    class Meta:
+        model = FieldValueRecompute
+        fields = ("processed_rows", "total_rows", "progress_percentage")
+        read_only_fields = fields
+
+
 class FieldSerializer(serializers.ModelSerializer):
     type = serializers.SerializerMethodField(help_text="The type of the related field.")
+    value_recompute = serializers.SerializerMethodField(
+        help_text="If the values of the field are stale because they're still being "
+        "recomputed in the background, this contains the progress of the recompute "
+        "that must finish before the values are up to date. Null otherwise."
+    )
 
     class Meta:
         model = Field
-        fields = ("id", "table_id", "name", "order", "type", "primary")
+        fields = (
+            "id",
+            "table_id",
+            "name",
+            "order",
+            "type",
+            "primary",
+            "value_recompute",
+        )
         extra_kwargs = {
             "id": {"read_only": True},
             "table_id": {"read_only": True},
@@ -38,6 +65,20 @@ class FieldSerializer(serializers.ModelSerializer):
 
         return field.type
 
+    @extend_schema_field(FieldValueRecomputeSerializer(allow_null=True))
+    def get_value_recompute(self, instance):
+        # Only the values of formula fields are recomputed in the background.
+        if not issubclass(instance.specific_class, FormulaField):
+            return None
+
+        # Uses the prefetched recomputes if available. The last one must finish
+        # before the values are up to date.
+        recomputes = list(instance.value_recomputes.all())
+        if len(recomputes) == 0:
+            return None
+
+        return FieldValueRecomputeSerializer(recomputes[-1]).data
+
 
 class FieldWithFiltersAndSortsSerializer(FieldSerializer):
     filters = ViewFilterSerializer(many=True, source="viewfilter_set")
@@ -170,6 +211,12 @@ class FileFieldResponseSerializer(
     def get_instance_attr(self, instance, name):
         return instance[name]
 
+    def get_thumbnails_ready(self, instance):
+        # The serialized files in the cell values don't contain this state because
+        # they're never updated after being stored, so the thumbnails are always
+        # included.
+        return True
+
 
 @extend_schema_field(OpenApiTypes.NONE)
 class MustBeEmptyField(serializers.Field):
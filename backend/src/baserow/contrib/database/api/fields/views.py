@@ -134,7 +134,11 @@ class FieldsView(APIView):
             request, ["read", "create", "update"], table, False
         )
 
-        fields = Field.objects.filter(table=table).select_related("content_type")
+        fields = (
+            Field.objects.filter(table=table)
+            .select_related("content_type")
+            .prefetch_related("value_recomputes")
+        )
 
         data = [
             field_type_registry.get_serializer(field, FieldSerializer).data
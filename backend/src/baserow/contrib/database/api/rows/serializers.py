@@ -323,6 +323,11 @@ class CreateRowQueryParamsSerializer(serializers.Serializer):
 
 class BatchCreateRowsQueryParamsSerializer(serializers.Serializer):
     before = serializers.IntegerField(required=False)
+    minimal_response = serializers.BooleanField(required=False, default=False)
+
+
+class BatchUpdateRowsQueryParamsSerializer(serializers.Serializer):
+    minimal_response = serializers.BooleanField(required=False, default=False)
 
 
 class ListRowsQueryParamsSerializer(serializers.Serializer):
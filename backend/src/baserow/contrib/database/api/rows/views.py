@@ -20,7 +20,7 @@ from baserow.api.exceptions import (
     RequestBodyValidationException,
     QueryParameterValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import PageNumberPagination, KeysetPagination
 from baserow.api.schemas import get_error_schema, CLIENT_SESSION_ID_SCHEMA_PARAMETER
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.user_files.errors import ERROR_USER_FILE_DOES_NOT_EXIST
@@ -85,6 +85,7 @@ from .serializers import (
     CreateRowQueryParamsSerializer,
     RowSerializer,
     BatchCreateRowsQueryParamsSerializer,
+    BatchUpdateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
     get_batch_row_serializer_class,
     get_example_row_serializer_class,
@@ -123,6 +124,16 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the cursor pagination is used instead of the "
+                "page/size style. An empty value returns the first page, the `next` "
+                "link of the response contains the cursor of the following page. The "
+                "total count is not calculated and requesting a page deep into the "
+                "table is as fast as requesting the first one.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -247,6 +258,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -314,7 +326,13 @@ class RowsView(APIView):
         filter_object = {key: request.GET.getlist(key) for key in request.GET.keys()}
         queryset = queryset.filter_by_fields_object(filter_object, filter_type)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
+
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
@@ -938,6 +956,15 @@ class BatchRowsView(APIView):
                     "internal Baserow field names (field_123 etc)."
                 ),
             ),
+            OpenApiParameter(
+                name="minimal_response",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "If provided only the ids of the created rows are returned. This "
+                    "is faster because the rows don't have to be fetched again."
+                ),
+            ),
             CLIENT_SESSION_ID_SCHEMA_PARAMETER,
         ],
         tags=["Database table rows"],
@@ -1020,13 +1047,22 @@ class BatchRowsView(APIView):
             validation_serializer, request.data, partial=True, return_validated=True
         )
 
+        minimal_response = query_params["minimal_response"]
         try:
             rows = action_type_registry.get_by_type(CreateRowsActionType).do(
-                request.user, table, data["items"], before_row, model
+                request.user,
+                table,
+                data["items"],
+                before_row,
+                model,
+                refresh_rows=not minimal_response,
             )
         except ValidationError as exc:
             raise RequestBodyValidationException(detail=exc.message)
 
+        if minimal_response:
+            return Response({"items": [{"id": row.id} for row in rows]})
+
         response_row_serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
         )
@@ -1054,6 +1090,15 @@ class BatchRowsView(APIView):
                     "internal Baserow field names (field_123 etc)."
                 ),
             ),
+            OpenApiParameter(
+                name="minimal_response",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "If provided only the ids of the updated rows are returned. This "
+                    "is faster because the rows don't have to be fetched again."
+                ),
+            ),
             CLIENT_SESSION_ID_SCHEMA_PARAMETER,
         ],
         tags=["Database table rows"],
@@ -1108,7 +1153,8 @@ class BatchRowsView(APIView):
             UserFileDoesNotExist: ERROR_USER_FILE_DOES_NOT_EXIST,
         }
     )
-    def patch(self, request, table_id):
+    @validate_query_parameters(BatchUpdateRowsQueryParamsSerializer)
+    def patch(self, request, table_id, query_params):
         """
         Updates all provided rows at once for the table with
         the given table_id.
@@ -1133,13 +1179,21 @@ class BatchRowsView(APIView):
             validation_serializer, request.data, partial=True, return_validated=True
         )
 
+        minimal_response = query_params["minimal_response"]
         try:
             rows = action_type_registry.get_by_type(UpdateRowsActionType).do(
-                request.user, table, data["items"], model
+                request.user,
+                table,
+                data["items"],
+                model,
+                refresh_rows=not minimal_response,
             )
         except ValidationError as e:
             raise RequestBodyValidationException(detail=e.message)
 
+        if minimal_response:
+            return Response({"items": [{"id": row.id} for row in rows]})
+
         response_row_serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, user_field_names=user_field_names
         )
@@ -116,6 +116,13 @@ class PublicGridViewSerializer(serializers.ModelSerializer):
 
 class PublicFieldSerializer(FieldSerializer):
     table_id = serializers.SerializerMethodField()
+    # The progress of background recomputes is not exposed publicly.
+    value_recompute = None
+
+    class Meta(FieldSerializer.Meta):
+        fields = tuple(
+            name for name in FieldSerializer.Meta.fields if name != "value_recompute"
+        )
 
     @extend_schema_field(OpenApiTypes.INT)
     def get_table_id(self, instance):
@@ -1,7 +1,6 @@
 from django.db import transaction
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.utils import extend_schema
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -9,7 +8,11 @@ from rest_framework.views import APIView
 
 from baserow.api.decorators import map_exceptions, allowed_includes, validate_body
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import (
+    PageNumberPagination,
+    LimitOffsetPagination,
+    KeysetPagination,
+)
 from baserow.api.schemas import get_error_schema
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.contrib.database.api.rows.serializers import (
@@ -109,6 +112,15 @@ class GridViewView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="approximate_count",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description="If provided and the view doesn't filter the rows, the "
+                "count of large tables is estimated based on the database statistics "
+                "instead of being counted exactly. The `count_is_approximate` "
+                "property of the response indicates whether the count is an estimate.",
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -147,8 +159,18 @@ class GridViewView(APIView):
                 name="size",
                 location=OpenApiParameter.QUERY,
                 type=OpenApiTypes.INT,
-                description="Can only be used in combination with the `page` parameter "
-                "and defines how many rows should be returned.",
+                description="Can only be used in combination with the `page` or "
+                "`cursor` parameter and defines how many rows should be returned.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the cursor pagination is used instead. "
+                "An empty value returns the first page, the `next` link of the "
+                "response contains the cursor of the following page. Contrary to the "
+                "other styles, the total count is not calculated and requesting a "
+                "page deep into the view is as fast as requesting the first one.",
             ),
             OpenApiParameter(
                 name="search",
@@ -189,8 +211,9 @@ class GridViewView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's group. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or "
+            "cursor/size style. The style depends on the provided GET parameters. "
+            "The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -216,7 +239,7 @@ class GridViewView(APIView):
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
-            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP", "ERROR_INVALID_CURSOR"]),
             404: get_error_schema(
                 ["ERROR_GRID_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
             ),
@@ -232,9 +255,10 @@ class GridViewView(APIView):
     @allowed_includes("field_options", "row_metadata")
     def get(self, request, view_id, field_options, row_metadata):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will
+        be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -257,14 +281,32 @@ class GridViewView(APIView):
 
         model = view.table.get_model()
         queryset = view_handler.get_queryset(view, search, model)
+        approximate_count = "approximate_count" in request.GET
+        count = None
+        count_is_approximate = False
+
+        # The keyset pagination doesn't need the count, so it's only computed if
+        # it's explicitly requested.
+        if (
+            "count" in request.GET
+            or KeysetPagination.cursor_query_param not in request.GET
+        ):
+            count, count_is_approximate = view_handler.get_view_row_count(
+                view, queryset, search, allow_estimate=approximate_count
+            )
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
-
-        if LimitOffsetPagination.limit_query_param in request.GET:
-            paginator = LimitOffsetPagination()
+            data = {"count": count}
+            if approximate_count:
+                data["count_is_approximate"] = count_is_approximate
+            return Response(data)
+
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
+            paginator = LimitOffsetPagination(count=count)
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count=count)
 
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
@@ -277,6 +319,9 @@ class GridViewView(APIView):
 
         response = paginator.get_paginated_response(serializer.data)
 
+        if approximate_count and count is not None:
+            response.data.update(count_is_approximate=count_is_approximate)
+
         if field_options:
             context = {"fields": [o["field"] for o in model._field_objects.values()]}
             serializer_class = view_type.get_field_options_serializer_class(
@@ -615,8 +660,18 @@ class PublicGridViewRowsView(APIView):
                 name="size",
                 location=OpenApiParameter.QUERY,
                 type=OpenApiTypes.INT,
-                description="Can only be used in combination with the `page` parameter "
-                "and defines how many rows should be returned.",
+                description="Can only be used in combination with the `page` or "
+                "`cursor` parameter and defines how many rows should be returned.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the cursor pagination is used instead. "
+                "An empty value returns the first page, the `next` link of the "
+                "response contains the cursor of the following page. Contrary to the "
+                "other styles, the total count is not calculated and requesting a "
+                "page deep into the view is as fast as requesting the first one.",
             ),
             OpenApiParameter(
                 name="search",
@@ -695,8 +750,9 @@ class PublicGridViewRowsView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
+            "The response is paginated either by a limit/offset, page/size or "
+            "cursor/size style. The style depends on the provided GET parameters. "
+            "The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
@@ -740,9 +796,10 @@ class PublicGridViewRowsView(APIView):
     @allowed_includes("field_options")
     def get(self, request: Request, slug: str, field_options: bool) -> Response:
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the cursor get parameter is provided the keyset pagination will be
+        used, if the limit get parameter is provided the limit/offset pagination will
+        be used else the page number pagination.
 
         Optionally the field options can also be included in the response if the the
         `field_options` are provided in the include GET parameter.
@@ -801,7 +858,9 @@ class PublicGridViewRowsView(APIView):
         if "count" in request.GET:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
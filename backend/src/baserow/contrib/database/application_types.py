@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from django.conf import settings
 from django.core.management.color import no_style
 from django.db import connection
 from django.urls import path, include
@@ -16,10 +17,15 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database, Table
 from baserow.contrib.database.views.registries import view_type_registry
 from baserow.core.registries import ApplicationType
+from baserow.core.serialized_stream import ChunkedList
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import grouper
 
-from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
+from .constants import (
+    EXPORT_SERIALIZED_CACHE_ROW_IDS,
+    IMPORT_SERIALIZED_IMPORTING,
+    IMPORT_SERIALIZED_IMPORTING_TABLE,
+)
 from .export_serialized import DatabaseExportSerializedStructure
 
 
@@ -56,6 +62,18 @@ class DatabaseApplicationType(ApplicationType):
         be imported via the `import_serialized`.
         """
 
+        serialized = self.export_serialized_chunked(database, files_zip, storage)
+        for serialized_table in serialized["tables"]:
+            serialized_table["rows"] = list(serialized_table["rows"])
+        return serialized
+
+    def export_serialized_chunked(self, database, files_zip, storage):
+        """
+        Exports the database application type like `export_serialized`, except that
+        the rows of the tables are `ChunkedList`s. The rows are only fetched and
+        serialized when iterating over them.
+        """
+
         tables = database.table_set.all().prefetch_related(
             "field_set",
             "view_set",
@@ -80,22 +98,10 @@ class DatabaseApplicationType(ApplicationType):
                 )
 
             model = table.get_model(fields=fields, add_dependencies=False)
-            serialized_rows = []
-            table_cache = {}
-            for row in model.objects.all():
-                serialized_row = DatabaseExportSerializedStructure.row(
-                    id=row.id,
-                    order=str(row.order),
-                    created_on=row.created_on.isoformat(),
-                    updated_on=row.updated_on.isoformat(),
-                )
-                for field_object in model._field_objects.values():
-                    field_name = field_object["name"]
-                    field_type = field_object["type"]
-                    serialized_row[field_name] = field_type.get_export_serialized_value(
-                        row, field_name, table_cache, files_zip, storage
-                    )
-                serialized_rows.append(serialized_row)
+            serialized_rows = ChunkedList(
+                self._export_rows_serialized(model, files_zip, storage),
+                model.objects.count(),
+            )
 
             serialized_tables.append(
                 DatabaseExportSerializedStructure.table(
@@ -114,6 +120,35 @@ class DatabaseApplicationType(ApplicationType):
         )
         return serialized
 
+    def _export_rows_serialized(self, model, files_zip, storage):
+        """
+        Lazily fetches the rows of the provided table model using a server side cursor
+        and yields them serialized in chunks of `BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE`
+        rows, so that only one chunk has to be in memory at the same time.
+        """
+
+        chunk_size = settings.BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE
+        rows = model.objects.all().iterator(chunk_size=chunk_size)
+        for chunk in grouper(chunk_size, rows):
+            # The cache only contains the related data of the rows in the chunk.
+            table_cache = {EXPORT_SERIALIZED_CACHE_ROW_IDS: [row.id for row in chunk]}
+            serialized_rows = []
+            for row in chunk:
+                serialized_row = DatabaseExportSerializedStructure.row(
+                    id=row.id,
+                    order=str(row.order),
+                    created_on=row.created_on.isoformat(),
+                    updated_on=row.updated_on.isoformat(),
+                )
+                for field_object in model._field_objects.values():
+                    field_name = field_object["name"]
+                    field_type = field_object["type"]
+                    serialized_row[field_name] = field_type.get_export_serialized_value(
+                        row, field_name, table_cache, files_zip, storage
+                    )
+                serialized_rows.append(serialized_row)
+            yield serialized_rows
+
     def import_serialized(
         self,
         group,
@@ -124,7 +159,10 @@ class DatabaseApplicationType(ApplicationType):
         progress_builder=None,
     ):
         """
-        Imports a database application exported by the `export_serialized` method.
+        Imports a database application exported by the `export_serialized` or
+        `export_serialized_chunked` method. The rows are converted and inserted in
+        chunks, so if they're provided as a `ChunkedList`, only one chunk of rows is
+        held in memory at the same time.
         """
 
         tables = serialized_values.pop("tables")
@@ -240,63 +278,27 @@ class DatabaseApplicationType(ApplicationType):
 
         # Now that everything is in place we can start filling the table with the rows
         # in an efficient matter by using the bulk_create functionality.
+        chunk_size = settings.BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE
         for table in tables:
             model = table["_model"]
             field_ids = [field_object.id for field_object in table["_field_objects"]]
-            rows_to_be_inserted = []
 
-            for row in table["rows"]:
-                created_on = row.get("created_on")
-                updated_on = row.get("updated_on")
-
-                if created_on:
-                    created_on = datetime.fromisoformat(created_on)
-                else:
-                    created_on = timezone.now()
-
-                if updated_on:
-                    updated_on = datetime.fromisoformat(updated_on)
-                else:
-                    updated_on = timezone.now()
-
-                row_object = model(
-                    id=row["id"],
-                    order=row["order"],
-                    created_on=created_on,
-                    updated_on=updated_on,
-                )
-
-                for field in table["fields"]:
-                    field_type = field_type_registry.get(field["type"])
-                    new_field_id = id_mapping["database_fields"][field["id"]]
-                    field_name = f'field_{field["id"]}'
-
-                    # If the new field id is not present in the field_ids then we don't
-                    # want to set that value on the row. This is because upon creation
-                    # of the field there could be a deliberate choice not to populate
-                    # that field. This is for example the case with the related field
-                    # of the `link_row` field which would result in duplicates if we
-                    # would populate.
-                    if new_field_id in field_ids and field_name in row:
-                        field_type.set_import_serialized_value(
-                            row_object,
-                            f'field_{id_mapping["database_fields"][field["id"]]}',
-                            row[field_name],
-                            id_mapping,
-                            files_zip,
-                            storage,
-                        )
-
-                rows_to_be_inserted.append(row_object)
+            for chunk in grouper(chunk_size, table["rows"]):
+                rows_to_be_inserted = [
+                    self._import_row_serialized(
+                        model, table, field_ids, row, id_mapping, files_zip, storage
+                    )
+                    for row in chunk
+                ]
                 progress.increment(
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}"
+                    len(chunk),
+                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}",
                 )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                model.objects.bulk_create(chunk, batch_size=512)
+                # We want to insert the rows in bulk because there could potentially
+                # be hundreds of thousands of rows in there and this will result in
+                # better performance.
+                model.objects.bulk_create(rows_to_be_inserted, batch_size=chunk_size)
                 progress.increment(
                     len(chunk),
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}",
@@ -324,3 +326,52 @@ class DatabaseApplicationType(ApplicationType):
         progress.increment(none_field_count, state=IMPORT_SERIALIZED_IMPORTING)
 
         return database
+
+    def _import_row_serialized(
+        self, model, table, field_ids, row, id_mapping, files_zip, storage
+    ):
+        """
+        Converts the provided serialized row to an unsaved row instance of the model.
+        """
+
+        created_on = row.get("created_on")
+        updated_on = row.get("updated_on")
+
+        if created_on:
+            created_on = datetime.fromisoformat(created_on)
+        else:
+            created_on = timezone.now()
+
+        if updated_on:
+            updated_on = datetime.fromisoformat(updated_on)
+        else:
+            updated_on = timezone.now()
+
+        row_object = model(
+            id=row["id"],
+            order=row["order"],
+            created_on=created_on,
+            updated_on=updated_on,
+        )
+
+        for field in table["fields"]:
+            field_type = field_type_registry.get(field["type"])
+            new_field_id = id_mapping["database_fields"][field["id"]]
+            field_name = f'field_{field["id"]}'
+
+            # If the new field id is not present in the field_ids then we don't want to
+            # set that value on the row. This is because upon creation of the field
+            # there could be a deliberate choice not to populate that field. This is
+            # for example the case with the related field of the `link_row` field
+            # which would result in duplicates if we would populate.
+            if new_field_id in field_ids and field_name in row:
+                field_type.set_import_serialized_value(
+                    row_object,
+                    f'field_{id_mapping["database_fields"][field["id"]]}',
+                    row[field_name],
+                    id_mapping,
+                    files_zip,
+                    storage,
+                )
+
+        return row_object
@@ -377,6 +377,7 @@ class DatabaseConfig(AppConfig):
         # The signals must always be imported last because they use the registries
         # which need to be filled first.
         import baserow.contrib.database.ws.signals  # noqa: F403, F401
+        import baserow.contrib.database.tokens.signals  # noqa: F403, F401
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
         post_migrate.connect(clear_generated_model_cache_receiver, sender=self)
@@ -1,2 +1,5 @@
 IMPORT_SERIALIZED_IMPORTING = "importing"
 IMPORT_SERIALIZED_IMPORTING_TABLE = "importing-table-"
+# The key of the serialized export cache containing the ids of the rows that are
+# being exported in the current chunk.
+EXPORT_SERIALIZED_CACHE_ROW_IDS = "export_serialized_row_ids"
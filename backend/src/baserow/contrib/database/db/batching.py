@@ -0,0 +1,48 @@
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from psycopg2 import sql
+
+
+def get_row_id_batches(
+    connection, table_name: str, batch_size: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yields the id ranges of consecutive batches of rows of the provided table. Every
+    range contains at most `batch_size` rows, the lower bound is exclusive and the
+    upper bound inclusive, so a batch can be selected with
+    `WHERE id > lower AND id <= upper`. The ranges are determined lazily, so rows
+    that are created while iterating are included in the last batch.
+
+    :param connection: The connection that must be used to query the table.
+    :param table_name: The name of the table of which the rows must be batched.
+    :param batch_size: The maximum amount of rows per batch. Defaults to the
+        `BASEROW_FIELD_CONVERSION_BATCH_SIZE` setting.
+    :return: An iterator of (lower, upper) id ranges.
+    """
+
+    if batch_size is None:
+        batch_size = settings.BASEROW_FIELD_CONVERSION_BATCH_SIZE
+
+    next_upper_query = sql.SQL(
+        "SELECT id FROM {table} WHERE id > %s ORDER BY id OFFSET %s LIMIT 1"
+    ).format(table=sql.Identifier(table_name))
+    last_upper_query = sql.SQL("SELECT max(id) FROM {table} WHERE id > %s").format(
+        table=sql.Identifier(table_name)
+    )
+
+    lower = 0
+    while True:
+        with connection.cursor() as cursor:
+            cursor.execute(next_upper_query, [lower, batch_size - 1])
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute(last_upper_query, [lower])
+                row = cursor.fetchone()
+
+        upper = row[0]
+        if upper is None:
+            return
+
+        yield lower, upper
+        lower = upper
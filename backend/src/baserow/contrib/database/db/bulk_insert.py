@@ -0,0 +1,139 @@
+import json
+from datetime import date, datetime, time
+from io import StringIO
+from typing import Any, List, Type
+
+from django.db import connections, router
+from django.db.models import Model
+
+from baserow.contrib.database.fields.fields import BaserowExpressionField
+from baserow.contrib.database.formula import FormulaHandler
+
+
+def reserve_ids(model: Type[Model], amount: int) -> List[int]:
+    """
+    Reserves `amount` values of the primary key sequence of the provided model. This
+    makes it possible to know the ids of rows before they are inserted, which is
+    needed when inserting them with `COPY` because that doesn't return anything.
+
+    :param model: The model for which the ids must be reserved.
+    :param amount: The amount of ids that must be reserved.
+    :return: The reserved ids.
+    """
+
+    if amount == 0:
+        return []
+
+    connection = connections[router.db_for_write(model)]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+            "FROM generate_series(1, %s)",
+            [
+                connection.ops.quote_name(model._meta.db_table),
+                model._meta.pk.column,
+                amount,
+            ],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def format_copy_value(value: Any) -> str:
+    """
+    Formats the provided database value so that it can be used in the text format
+    of the PostgreSQL `COPY` command.
+
+    :param value: The value as prepared by `get_db_prep_save` of the model field.
+    :return: The escaped text representation of the value.
+    """
+
+    if value is None:
+        return "\\N"
+    elif isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, (datetime, date, time)):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value)
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_insert(model: Type[Model], instances: List[Model]) -> List[Model]:
+    """
+    Inserts the provided unsaved instances using PostgreSQL's `COPY FROM STDIN`,
+    which is a lot faster than the `INSERT` statement generated by `bulk_create`
+    when inserting many rows. The primary keys are reserved upfront and set on the
+    instances.
+
+    Values of `BaserowExpressionField` fields can't be copied because they're
+    database expressions. They're calculated afterwards with a single update
+    statement, except for the fields that require a refresh after insert. Just like
+    with `bulk_create`, those must be refreshed by the caller.
+
+    :param model: The model of the instances.
+    :param instances: The instances that must be inserted.
+    :return: The inserted instances with their primary key set.
+    """
+
+    if len(instances) == 0:
+        return instances
+
+    # The connection is looked up once because accessing the `connection` proxy for
+    # every value is relatively slow.
+    connection = connections[router.db_for_write(model)]
+    pk_field = model._meta.pk
+    copy_fields = []
+    expression_fields = []
+    for field in model._meta.concrete_fields:
+        if isinstance(field, BaserowExpressionField):
+            if not field.requires_refresh_after_insert and field.expression:
+                expression_fields.append(field)
+        else:
+            copy_fields.append(field)
+
+    ids = reserve_ids(model, len(instances))
+    stream = StringIO()
+    for instance, instance_id in zip(instances, ids):
+        setattr(instance, pk_field.attname, instance_id)
+        stream.write(
+            "\t".join(
+                format_copy_value(
+                    field.get_db_prep_save(
+                        field.pre_save(instance, add=True), connection
+                    )
+                )
+                for field in copy_fields
+            )
+        )
+        stream.write("\n")
+        instance._state.adding = False
+        instance._state.db = connection.alias
+    stream.seek(0)
+
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in copy_fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN",
+            stream,
+        )
+
+    if len(expression_fields) > 0:
+        to_update_expression = (
+            FormulaHandler.baserow_expression_to_update_django_expression
+        )
+        model._base_manager.db_manager(connection.alias).filter(id__in=ids).update(
+            **{
+                field.attname: to_update_expression(field.expression, model)
+                for field in expression_fields
+            }
+        )
+
+    return instances
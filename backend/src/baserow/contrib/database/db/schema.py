@@ -1,4 +1,5 @@
 import contextlib
+from typing import Dict, Tuple, Union
 
 from django.db import connection, transaction
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
@@ -7,6 +8,41 @@ from django.db.backends.utils import strip_quotes
 from .sql_queries import sql_drop_try_cast, sql_create_try_cast
 
 
+def split_alter_column_prepare_values(
+    alter_column_prepare_old_value: Union[None, str, Tuple[str, Dict[str, str]]],
+    alter_column_prepare_new_value: Union[None, str, Tuple[str, Dict[str, str]]],
+) -> Tuple[str, str, Dict[str, str]]:
+    """
+    The `get_alter_column_prepare_old_value` and `get_alter_column_prepare_new_value`
+    methods of the field types can either return a plain SQL statement or a tuple
+    containing the statement and the variables that must be passed into it. This
+    function splits them so that they can be used in the try cast function.
+
+    :param alter_column_prepare_old_value: The statement converting the `p_in` value
+        to a string format, optionally with its variables.
+    :param alter_column_prepare_new_value: The statement converting the `p_in` text
+        value to the new type, optionally with its variables.
+    :return: The old value statement, the new value statement and the combined
+        variables of both statements.
+    """
+
+    variables = {}
+    statements = []
+    for prepare_value in [
+        alter_column_prepare_old_value,
+        alter_column_prepare_new_value,
+    ]:
+        if isinstance(prepare_value, tuple):
+            prepare_value, v = prepare_value
+            variables = {**variables, **v}
+        statements.append(prepare_value or "")
+
+    for key, value in variables.items():
+        variables[key] = value.replace("$FUNCTION$", "")
+
+    return statements[0], statements[1], variables
+
+
 class PostgresqlLenientDatabaseSchemaEditor:
     """
     Class changes the behavior of the postgres database schema editor slightly. Normally
@@ -49,22 +85,15 @@ class PostgresqlLenientDatabaseSchemaEditor:
             old_type = f"{old_type}_forced"
 
         if old_type != new_type:
-            variables = {}
-            if isinstance(self.alter_column_prepare_old_value, tuple):
-                alter_column_prepare_old_value, v = self.alter_column_prepare_old_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_old_value = self.alter_column_prepare_old_value
-
-            if isinstance(self.alter_column_prepare_new_value, tuple):
-                alter_column_prepare_new_value, v = self.alter_column_prepare_new_value
-                variables = {**variables, **v}
-            else:
-                alter_column_prepare_new_value = self.alter_column_prepare_new_value
-
+            (
+                alter_column_prepare_old_value,
+                alter_column_prepare_new_value,
+                variables,
+            ) = split_alter_column_prepare_values(
+                self.alter_column_prepare_old_value,
+                self.alter_column_prepare_new_value,
+            )
             quoted_column_name = self.quote_name(new_field.column)
-            for key, value in variables.items():
-                variables[key] = value.replace("$FUNCTION$", "")
             self.execute(sql_drop_try_cast)
             self.execute(
                 sql_create_try_cast
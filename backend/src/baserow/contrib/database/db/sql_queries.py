@@ -19,3 +19,87 @@ sql_create_try_cast = """
     $FUNCTION$
     language plpgsql;
 """
+
+sql_create_online_conversion_functions = """
+    create or replace function %(cast_function)s(
+        p_in text,
+        p_default int default null
+    )
+        returns %(type)s
+    as
+    $FUNCTION$
+    begin
+        begin
+            %(alter_column_prepare_old_value)s
+            %(alter_column_prepare_new_value)s
+            return p_in::%(type)s;
+        exception when others then
+            return p_default;
+        end;
+    end;
+    $FUNCTION$
+    language plpgsql;
+
+    create or replace function %(trigger_function)s()
+        returns trigger
+    as
+    $FUNCTION$
+    begin
+        new.%(shadow_column)s = %(cast_function)s(new.%(column)s::text);
+        return new;
+    end;
+    $FUNCTION$
+    language plpgsql;
+
+    create trigger %(trigger)s
+        before insert or update of %(column)s on %(table)s
+        for each row execute procedure %(trigger_function)s();
+"""
+sql_drop_online_conversion_functions = """
+    drop trigger if exists %(trigger)s on %(table)s;
+    drop function if exists %(trigger_function)s();
+    drop function if exists %(cast_function)s(text, int);
+"""
+sql_backfill_online_conversion_batch = """
+    update %(table)s
+    set %(shadow_column)s = %(cast_function)s(%(column)s::text)
+    where id > %%s and id <= %%s
+"""
+sql_create_search_document_function = """
+    create or replace function %(function)s()
+        returns trigger
+    as
+    $FUNCTION$%(body)s$FUNCTION$
+    language plpgsql;
+
+    drop trigger if exists %(trigger)s on %(table)s;
+    create trigger %(trigger)s
+        before insert or update on %(table)s
+        for each row execute procedure %(function)s();
+"""
+sql_search_document_function_body = """
+    declare
+        new_row jsonb = to_jsonb(new);
+    begin
+        new.%(column)s = %(document)s;
+        return new;
+    end;
+"""
+sql_drop_search_document_function = """
+    drop trigger if exists %(trigger)s on %(table)s;
+    drop function if exists %(function)s();
+"""
+sql_backfill_search_document_batch = """
+    update %(table)s
+    set %(column)s = null
+    where id > %%s and id <= %%s
+"""
+sql_create_search_document_index = """
+    create index if not exists %(index)s
+    on %(table)s using gin (%(column)s gin_trgm_ops)
+"""
+sql_delete_trashed_rows = """
+    delete from %(table)s
+    where trashed and id = any(%%s)
+    returning id
+"""
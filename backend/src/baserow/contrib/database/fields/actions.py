@@ -1,4 +1,5 @@
 import dataclasses
+from collections import defaultdict
 from copy import deepcopy
 from typing import Optional, Tuple, List, Dict, Any, Set, Union
 
@@ -156,21 +157,39 @@ class FieldDataBackupHandler:
         backup data to reclaim space used.
         """
 
-        if "backed_up_m2m_table_name" in backup_data:
-            cls._drop_table(backup_data["backed_up_m2m_table_name"])
-        else:
-            try:
-                table = Table.objects_and_trash.get(
-                    id=backup_data["table_id_containing_backup_column"]
-                )
-                cls._drop_column(
-                    table.get_database_table_name(),
-                    backup_data["backed_up_column_name"],
-                )
-            except Table.DoesNotExist:
-                # The table has already been permanently deleted by the trash system
-                # so there is nothing for us to do.
-                pass
+        cls.clean_up_many_backup_data([backup_data])
+
+    @classmethod
+    def clean_up_many_backup_data(cls, backups_data: List[BackupData]):
+        """
+        Deletes the backup data of many dictionaries generated by the
+        backup_field_data method at once. All the backup m2m tables are dropped with a
+        single query and all the backup columns of the same table are dropped with a
+        single query per table.
+        """
+
+        backup_table_names = []
+        backup_column_names_per_table = defaultdict(list)
+        for backup_data in backups_data:
+            if "backed_up_m2m_table_name" in backup_data:
+                backup_table_names.append(backup_data["backed_up_m2m_table_name"])
+            else:
+                backup_column_names_per_table[
+                    backup_data["table_id_containing_backup_column"]
+                ].append(backup_data["backed_up_column_name"])
+
+        if backup_table_names:
+            cls._drop_tables(backup_table_names)
+
+        # Tables that have already been permanently deleted by the trash system are
+        # not found, so there is nothing for us to do for them.
+        for table in Table.objects_and_trash.filter(
+            id__in=backup_column_names_per_table.keys()
+        ):
+            cls._drop_columns(
+                table.get_database_table_name(),
+                backup_column_names_per_table[table.id],
+            )
 
     @staticmethod
     def _create_duplicate_m2m_table(
@@ -202,6 +221,17 @@ class FieldDataBackupHandler:
                 )
             )
 
+    @staticmethod
+    def _drop_tables(backup_names: List[str]):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("DROP TABLE {backup_tables}").format(
+                    backup_tables=sql.SQL(", ").join(
+                        sql.Identifier(backup_name) for backup_name in backup_names
+                    ),
+                )
+            )
+
     @staticmethod
     def _copy_m2m_data_between_tables(
         source_table: str,
@@ -271,6 +301,21 @@ class FieldDataBackupHandler:
                 )
             )
 
+    @staticmethod
+    def _drop_columns(table_name: str, columns_to_drop: List[str]):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table_name} {drop_columns}").format(
+                    table_name=sql.Identifier(table_name),
+                    drop_columns=sql.SQL(", ").join(
+                        sql.SQL("DROP COLUMN {column_to_drop}").format(
+                            column_to_drop=sql.Identifier(column_to_drop)
+                        )
+                        for column_to_drop in columns_to_drop
+                    ),
+                )
+            )
+
 
 class UpdateFieldActionType(ActionType):
     type = "update_field"
@@ -384,6 +429,13 @@ class UpdateFieldActionType(ActionType):
         if params.backup_data is not None:
             FieldDataBackupHandler.clean_up_backup_data(params.backup_data)
 
+    @classmethod
+    def clean_up_any_extra_actions_data(cls, actions_being_cleaned_up: List[Action]):
+        params = [cls.Params(**action.params) for action in actions_being_cleaned_up]
+        FieldDataBackupHandler.clean_up_many_backup_data(
+            [p.backup_data for p in params if p.backup_data is not None]
+        )
+
     @classmethod
     def _backup_field_if_required(
         cls,
@@ -1,4 +1,6 @@
-from typing import Optional, List, Tuple
+from typing import Iterable, Optional, List, Tuple, Union
+
+from django.db.models import F
 
 from baserow.contrib.database.fields.dependencies.depedency_rebuilder import (
     rebuild_field_dependencies,
@@ -8,25 +10,32 @@ from baserow.contrib.database.fields.dependencies.depedency_rebuilder import (
 from baserow.contrib.database.fields.registries import field_type_registry, FieldType
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field
+from baserow.core.db import specific_iterator
 
 from .models import FieldDependency
 
 
 class FieldDependencyHandler:
     @classmethod
-    def get_same_table_dependencies(cls, field: Field) -> List[Field]:
+    def get_same_table_dependencies(
+        cls, fields: Union[Field, Iterable[Field]]
+    ) -> List[Field]:
         """
-        Returns the list of fields that the provided field directly depends on which
-        are in the same table.
+        Returns the list of fields that the provided fields directly depend on which
+        are in the same table. The specific fields are fetched in a constant amount of
+        queries regardless of the number of fields.
 
-        :param field: The field to get dependencies for.
+        :param fields: The field or fields to get dependencies for.
         :return: A list of specific field instances.
         """
 
-        return [
-            dep.specific
-            for dep in field.field_dependencies.filter(table=field.table).all()
-        ]
+        if isinstance(fields, Field):
+            fields = [fields]
+
+        dependencies = Field.objects.filter(
+            dependant_fields__in=fields, table_id=F("dependant_fields__table_id")
+        ).distinct()
+        return list(specific_iterator(dependencies))
 
     @classmethod
     def rebuild_dependencies(cls, field, field_cache: FieldCache):
@@ -49,3 +49,43 @@ class FieldDependency(models.Model):
         """
 
         return f"{self.dependant_id}__{self._dependency_postfix()}"
+
+
+class FieldValueRecompute(models.Model):
+    """
+    A pending recompute of the cell values of one or more formula fields of a table.
+    The rows are updated in chunks ordered by id in a background task instead of with
+    one update statement over the whole table. The `last_row_id` is updated after
+    every chunk, so that the recompute can continue where it left off if the worker
+    crashes. The values of the fields are stale until the recompute has finished and
+    has been deleted.
+    """
+
+    table = models.ForeignKey(
+        "database.Table",
+        on_delete=models.CASCADE,
+        related_name="field_value_recomputes",
+    )
+    fields = models.ManyToManyField(
+        "database.Field",
+        related_name="value_recomputes",
+        help_text="The formula fields of which the values must be recomputed.",
+    )
+    last_row_id = models.PositiveIntegerField(
+        default=0, help_text="The id of the last row that has been recomputed."
+    )
+    processed_rows = models.PositiveIntegerField(default=0)
+    total_rows = models.PositiveIntegerField(
+        null=True,
+        help_text="The amount of rows in the table when the recompute started.",
+    )
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("id",)
+
+    @property
+    def progress_percentage(self) -> int:
+        if not self.total_rows:
+            return 0
+        return min(100, int(self.processed_rows / self.total_rows * 100))
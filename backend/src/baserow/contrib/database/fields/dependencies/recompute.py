@@ -0,0 +1,238 @@
+import logging
+from itertools import groupby
+from typing import Callable, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from baserow.contrib.database.fields.dependencies.models import FieldValueRecompute
+from baserow.contrib.database.fields.models import Field, FormulaField
+from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+from baserow.core.db import specific_iterator
+
+logger = logging.getLogger(__name__)
+
+
+class FieldValueRecomputeHandler:
+    """
+    Recomputes the cell values of formula fields in chunks of rows in a background
+    task. This is used after schema changes in large tables because updating every
+    row with one statement would lock the whole table for the duration of the request.
+    """
+
+    def has_pending_recompute(self, table_id: int) -> bool:
+        """
+        Checks whether the values of any of the fields of the provided table are still
+        being recomputed in the background.
+
+        :param table_id: The id of the table that must be checked.
+        :return: Whether the table has a pending recompute.
+        """
+
+        return FieldValueRecompute.objects.filter(table_id=table_id).exists()
+
+    def should_recompute_in_background(self, model: GeneratedTableModel) -> bool:
+        """
+        Checks whether the values of all the rows of the table of the provided model
+        must be recomputed in the background. This is the case if the table already
+        has a pending recompute, because the new one must be executed after it, or if
+        the table has at least `BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD`
+        rows. Only as many ids as the threshold are scanned, so this is fast even for
+        very large tables.
+
+        :param model: The generated model of the table that must be checked.
+        :return: Whether the formula values must be recomputed in the background.
+        """
+
+        threshold = settings.BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD
+        if threshold <= 0:
+            return False
+
+        if self.has_pending_recompute(model._table_id):
+            return True
+
+        row_ids = model.objects_and_trash.order_by().values_list("id", flat=True)
+        return len(row_ids[threshold - 1 : threshold]) > 0
+
+    def schedule_recompute(
+        self, table: Table, fields: Iterable[Field]
+    ) -> FieldValueRecompute:
+        """
+        Marks the values of the provided fields as stale and schedules them to be
+        recomputed. The recomputes are executed in the order they were scheduled in,
+        so fields depending on the values of other fields must be scheduled last.
+
+        :param table: The table containing the fields.
+        :param fields: The formula fields of which the values must be recomputed.
+        :return: The created recompute.
+        """
+
+        recompute = FieldValueRecompute.objects.create(table=table)
+        recompute.fields.set(fields)
+        return recompute
+
+    def schedule_recompute_for_fields(self, fields: List[Field]):
+        """
+        Schedules the recompute of the values of the provided fields, which can belong
+        to different tables. The consecutive fields of the same table are recomputed
+        together.
+
+        :param fields: The fields ordered so that every field comes after the fields
+            it depends on.
+        """
+
+        for table_id, table_fields in groupby(fields, key=lambda f: f.table_id):
+            table_fields = list(table_fields)
+            self.schedule_recompute(table_fields[0].table, table_fields)
+
+    def start_background_recompute(self):
+        """
+        Starts the task that executes the pending recomputes after the current
+        transaction commits. The periodic task picks the recomputes up as well if
+        this doesn't happen, for example because the worker crashed.
+        """
+
+        from baserow.contrib.database.fields.tasks import run_field_value_recomputes
+
+        transaction.on_commit(lambda: run_field_value_recomputes.delay())
+
+    def recompute_next_chunk(self) -> bool:
+        """
+        Recomputes the next chunk of rows of the oldest pending recompute that isn't
+        being worked on by another worker in its own transaction. The recompute is
+        locked while doing so, which makes it safe to run this in multiple workers at
+        the same time. A recompute is only picked once the older recomputes of the
+        same table and of the tables containing its dependencies have finished,
+        because its values would otherwise be computed from stale values.
+
+        :return: False if there is nothing left that can be recomputed right now.
+        """
+
+        from baserow.contrib.database.formula import FormulaHandler
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        older_blocking_recomputes = FieldValueRecompute.objects.filter(
+            Q(table_id=OuterRef("table_id"))
+            | Q(fields__dependants__dependant__value_recomputes=OuterRef("id")),
+            id__lt=OuterRef("id"),
+        )
+
+        with transaction.atomic():
+            recompute = (
+                FieldValueRecompute.objects.select_for_update(
+                    skip_locked=True, of=("self",)
+                )
+                .select_related("table")
+                .filter(~Exists(older_blocking_recomputes))
+                .order_by("id")
+                .first()
+            )
+            if recompute is None:
+                return False
+
+            fields = [
+                field
+                for field in specific_iterator(recompute.fields.filter(trashed=False))
+                if isinstance(field, FormulaField)
+            ]
+            model = recompute.table.get_model()
+            queryset = model.objects_and_trash.order_by()
+
+            if recompute.total_rows is None:
+                recompute.total_rows = queryset.count()
+
+            chunk_size = settings.BASEROW_FORMULA_RECOMPUTE_CHUNK_SIZE
+            row_ids = list(
+                queryset.filter(id__gt=recompute.last_row_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
+            )
+
+            if len(row_ids) > 0 and len(fields) > 0:
+                queryset.filter(
+                    id__gt=recompute.last_row_id, id__lte=row_ids[-1]
+                ).update(
+                    **{
+                        field.db_column: (
+                            FormulaHandler.baserow_expression_to_update_django_expression(
+                                field.cached_typed_internal_expression, model
+                            )
+                        )
+                        for field in fields
+                    }
+                )
+
+            if len(row_ids) < chunk_size:
+                recompute.delete()
+                logger.info(
+                    f"Finished recomputing the values of {len(fields)} fields in "
+                    f"table {recompute.table_id}."
+                )
+                if len(fields) > 0:
+                    ViewHandler().field_value_updated(fields)
+                    # Let the clients know that the values have changed.
+                    field_updated.send(
+                        self, field=fields[0], related_fields=fields[1:], user=None
+                    )
+            else:
+                recompute.last_row_id = row_ids[-1]
+                recompute.processed_rows += len(row_ids)
+                recompute.save()
+                logger.info(
+                    f"Recomputing the values of {len(fields)} fields in table "
+                    f"{recompute.table_id} is {recompute.progress_percentage}% done."
+                )
+                if len(fields) > 0:
+                    self._broadcast_progress(fields)
+
+        return True
+
+    def _broadcast_progress(self, fields: List[Field]):
+        """
+        Sends the fields, which include the progress of their recompute, to the
+        clients once the chunk has been committed. The `field_updated` signal isn't
+        sent because the fields themselves haven't changed.
+        """
+
+        from baserow.contrib.database.ws.fields.signals import RealtimeFieldMessages
+        from baserow.ws.registries import page_registry
+
+        table_page_type = page_registry.get("table")
+        transaction.on_commit(
+            lambda: table_page_type.broadcast(
+                RealtimeFieldMessages.field_updated(fields[0], fields[1:]),
+                None,
+                table_id=fields[0].table_id,
+            )
+        )
+
+    def run_pending_recomputes(
+        self,
+        should_continue: Optional[Callable[[], bool]] = None,
+        progress_callback: Optional[Callable[[FieldValueRecompute], None]] = None,
+    ) -> bool:
+        """
+        Recomputes chunks until there is nothing left that can be recomputed right
+        now, because the remaining recomputes are being worked on by other workers or
+        are waiting for them.
+
+        :param should_continue: An optional function that is called before every
+            chunk. The recomputing is interrupted if it returns False.
+        :param progress_callback: An optional function that is called with the oldest
+            pending recompute after every chunk.
+        :return: Whether the recomputing has been interrupted by `should_continue`.
+        """
+
+        while True:
+            if should_continue is not None and not should_continue():
+                return True
+
+            if not self.recompute_next_chunk():
+                return False
+
+            if progress_callback is not None:
+                recompute = FieldValueRecompute.objects.first()
+                if recompute is not None:
+                    progress_callback(recompute)
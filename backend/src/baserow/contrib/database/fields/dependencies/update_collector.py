@@ -4,6 +4,9 @@ from typing import Optional, Dict, List, Tuple
 from django.db.models import Expression
 
 from baserow.contrib.database.fields.dependencies.exceptions import InvalidViaPath
+from baserow.contrib.database.fields.dependencies.recompute import (
+    FieldValueRecomputeHandler,
+)
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated
@@ -13,6 +16,7 @@ from baserow.contrib.database.table.models import GeneratedTableModel, Table
 class PathBasedUpdateStatementCollector:
     def __init__(self, table: Table, field_cache: FieldCache):
         self.update_statements: Dict[str, Expression] = {}
+        self.updated_fields: Dict[str, Field] = {}
         self.table = table
         self.sub_paths: Dict[str, PathBasedUpdateStatementCollector] = {}
         self.field_cache = field_cache
@@ -27,6 +31,7 @@ class PathBasedUpdateStatementCollector:
             if self.table != field.table:
                 raise InvalidViaPath()
             self.update_statements[field.db_column] = update_statement
+            self.updated_fields[field.db_column] = field
         else:
             next_via_field_link = path_from_starting_table[0]
             if next_via_field_link.link_row_table != self.table:
@@ -45,19 +50,62 @@ class PathBasedUpdateStatementCollector:
         self,
         starting_row_id: Optional[int] = None,
         path_to_starting_table: Optional[List[str]] = None,
-    ):
+        recompute_in_background: bool = False,
+    ) -> bool:
+        """
+        Executes the update statements of this table and then those of the sub paths.
+        When all the rows must be updated and a table is large, the update is
+        scheduled to be executed in chunks in the background instead, see
+        `FieldValueRecomputeHandler`. Because the updates of the sub paths can depend
+        on the values of this table, those are then scheduled in the background too.
+
+        :param starting_row_id: If set, only the rows that join back to this row are
+            updated.
+        :param path_to_starting_table: The link row columns leading back to the
+            starting table.
+        :param recompute_in_background: Forces the updates to be scheduled in the
+            background.
+        :return: Whether any updates have been scheduled in the background.
+        """
+
         path_to_starting_table = path_to_starting_table or []
-        self._execute_pending_update_statements(path_to_starting_table, starting_row_id)
+        recompute_in_background = self._execute_pending_update_statements(
+            path_to_starting_table, starting_row_id, recompute_in_background
+        )
         for sub_path_column_name, sub_path in self.sub_paths.items():
-            sub_path.execute_all(
+            recompute_in_background = sub_path.execute_all(
                 starting_row_id=starting_row_id,
                 path_to_starting_table=[sub_path_column_name] + path_to_starting_table,
+                recompute_in_background=recompute_in_background,
             )
+        return recompute_in_background
 
     def _execute_pending_update_statements(
-        self, path_to_starting_table: List[str], starting_row_id: Optional[int]
-    ):
+        self,
+        path_to_starting_table: List[str],
+        starting_row_id: Optional[int],
+        recompute_in_background: bool,
+    ) -> bool:
         model = self.field_cache.get_model(self.table)
+
+        if starting_row_id is None:
+            recompute_handler = FieldValueRecomputeHandler()
+            if len(self.update_statements) == 0:
+                # The values of this table might be recomputed in the background
+                # already, the dependant tables then have to wait for it.
+                return recompute_in_background or (
+                    len(self.sub_paths) > 0
+                    and recompute_handler.has_pending_recompute(self.table.id)
+                )
+            elif (
+                recompute_in_background
+                or recompute_handler.should_recompute_in_background(model)
+            ):
+                recompute_handler.schedule_recompute(
+                    self.table, self.updated_fields.values()
+                )
+                return True
+
         qs = model.objects_and_trash
         if starting_row_id is not None:
             if len(path_to_starting_table) == 0:
@@ -70,6 +118,7 @@ class PathBasedUpdateStatementCollector:
                 path_to_starting_table_id_column += "__in"
             qs = qs.filter(**{path_to_starting_table_id_column: starting_row_id})
         qs.update(**self.update_statements)
+        return recompute_in_background
 
 
 class CachingFieldUpdateCollector(FieldCache):
@@ -137,11 +186,13 @@ class CachingFieldUpdateCollector(FieldCache):
     def apply_updates_and_get_updated_fields(self) -> List[Field]:
         """
         Triggers all update statements to be executed in the correct order in as few
-        update queries as possible.
+        update queries as possible. If all the rows of a large table must be updated,
+        the updates are executed in the background after the transaction commits.
         :return: The list of all fields which have been updated in the starting table.
         """
 
-        self._update_statement_collector.execute_all(self._starting_row_id)
+        if self._update_statement_collector.execute_all(self._starting_row_id):
+            FieldValueRecomputeHandler().start_background_recompute()
         return self._for_table(self._starting_table)
 
     def send_additional_field_updated_signals(self):
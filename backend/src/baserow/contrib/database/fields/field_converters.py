@@ -3,6 +3,7 @@ from psycopg2 import sql
 
 from django.db import models, transaction
 
+from baserow.contrib.database.db.batching import get_row_id_batches
 from baserow.contrib.database.db.schema import (
     lenient_schema_editor,
     safe_django_schema_editor,
@@ -133,6 +134,20 @@ class MultipleSelectConversionBase(MultipleSelectConversionConfig):
             2
         ].get_attname_column()[1]
 
+    @staticmethod
+    def format_for_row_id_batches(connection, db_table: str, query: sql.SQL, **kwargs):
+        """
+        Yields the provided query formatted for every batch of rows of the table, so
+        that large tables aren't converted with one huge statement. The query must
+        select the rows using the `{lower}` and `{upper}` placeholders like
+        `WHERE id > {lower} AND id <= {upper}`.
+        """
+
+        for lower, upper in get_row_id_batches(connection, db_table):
+            yield query.format(
+                lower=sql.Literal(lower), upper=sql.Literal(upper), **kwargs
+            )
+
     def insert_into_many_relationship(
         self,
         connection,
@@ -297,6 +312,8 @@ class TextFieldToMultipleSelectFieldConverter(FieldConverter):
                                 unnest(
                                     regexp_split_to_array({table_column_name}, {regex}))
                                 with ordinality as a(elem, index) on true
+                            WHERE
+                                t.id > {lower} AND t.id <= {upper}
                             GROUP BY
                                 a.elem,
                                 t.id
@@ -308,7 +325,11 @@ class TextFieldToMultipleSelectFieldConverter(FieldConverter):
                         opt.value = sub.value
                     WHERE opt.field_id = {field_id}
                 """
-            ).format(
+            )
+            values_queries = helper.format_for_row_id_batches(
+                connection,
+                to_model._meta.db_table,
+                values_query,
                 field_id=sql.Literal(to_field.id),
                 table_name=sql.Identifier(to_model._meta.db_table),
                 table_column_name=sql.Identifier(
@@ -323,7 +344,8 @@ class TextFieldToMultipleSelectFieldConverter(FieldConverter):
             # lower than the allowed threshold and the user has not provided any
             # select_options themselves, we need to extract the options and create them.
             with transaction.atomic():
-                helper.insert_into_many_relationship(connection, values_query)
+                for query in values_queries:
+                    helper.insert_into_many_relationship(connection, query)
             schema_editor.remove_field(to_model, tmp_model_field)
 
 
@@ -399,10 +421,16 @@ class MultipleSelectFieldToTextFieldConverter(FieldConverter):
                         tab.id = dm.{table_column}
                     inner join database_selectoption ds on
                         ds.id = dm.{select_option_column}
+                    where
+                        tab.id > {lower} and tab.id <= {upper}
                     group by
                         tab.id
                 """
-            ).format(
+            )
+            for query in helper.format_for_row_id_batches(
+                connection,
+                from_model._meta.db_table,
+                aggregated_multiple_select_values,
                 table=sql.Identifier(from_model._meta.db_table),
                 through_table=sql.Identifier(helper.through_table_name),
                 table_column=sql.Identifier(helper.through_table_column_name),
@@ -412,14 +440,13 @@ class MultipleSelectFieldToTextFieldConverter(FieldConverter):
                 delimiter_output=sql.Literal(helper.text_delimiter_output),
                 text_delimiter_search=sql.Literal(helper.text_delimiter_search),
                 quote=sql.Literal(helper.quote_sign),
-            )
-
-            helper.update_column_with_values(
-                connection,
-                aggregated_multiple_select_values,
-                from_model._meta.db_table,
-                tmp_model_field.db_column,
-            )
+            ):
+                helper.update_column_with_values(
+                    connection,
+                    query,
+                    from_model._meta.db_table,
+                    tmp_model_field.db_column,
+                )
             schema_editor.remove_field(from_model, from_model_field)
             schema_editor.alter_field(from_model, tmp_model_field, to_model_field)
 
@@ -477,6 +504,8 @@ class MultipleSelectFieldToSingleSelectFieldConverter(FieldConverter):
                     tab.id = dm.{table_column}
                 inner join database_selectoption ds on
                     ds.id = dm.{select_option_column}
+                where
+                    tab.id > {lower} and tab.id <= {upper}
             )
             select
                 row_id,
@@ -486,21 +515,24 @@ class MultipleSelectFieldToSingleSelectFieldConverter(FieldConverter):
             where
                 rank = 1
             """
-        ).format(
+        )
+        for query in helper.format_for_row_id_batches(
+            connection,
+            from_model._meta.db_table,
+            multiple_select_first_value_query,
             table=sql.Identifier(from_model._meta.db_table),
             through_table=sql.Identifier(helper.through_table_name),
             table_column=sql.Identifier(helper.through_table_column_name),
             select_option_column=sql.Identifier(
                 helper.through_select_option_column_name
             ),
-        )
-
-        helper.update_column_with_values(
-            connection,
-            multiple_select_first_value_query,
-            to_model._meta.db_table,
-            to_field.db_column,
-        )
+        ):
+            helper.update_column_with_values(
+                connection,
+                query,
+                to_model._meta.db_table,
+                to_field.db_column,
+            )
 
         with safe_django_schema_editor() as schema_editor:
             schema_editor.remove_field(from_model, from_model_field)
@@ -548,16 +580,17 @@ class SingleSelectFieldToMultipleSelectFieldConverter(FieldConverter):
             from {from_table_name}
             where
                 {from_field_name} is not null
+                and id > {lower} and id <= {upper}
             """
-        ).format(
-            from_field_name=sql.Identifier(from_model_field.name),
-            from_table_name=sql.Identifier(from_model._meta.db_table),
         )
-
-        helper.insert_into_many_relationship(
+        for batch_query in helper.format_for_row_id_batches(
             connection,
+            from_model._meta.db_table,
             query,
-        )
+            from_field_name=sql.Identifier(from_model_field.name),
+            from_table_name=sql.Identifier(from_model._meta.db_table),
+        ):
+            helper.insert_into_many_relationship(connection, batch_query)
 
         with safe_django_schema_editor() as schema_editor:
             schema_editor.remove_field(from_model, from_model_field)
@@ -57,11 +57,13 @@ from baserow.core.models import UserFile
 from baserow.core.user_files.exceptions import UserFileDoesNotExist
 from baserow.core.user_files.handler import UserFileHandler
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
+from baserow.contrib.database.constants import EXPORT_SERIALIZED_CACHE_ROW_IDS
 from .dependencies.exceptions import (
     SelfReferenceFieldDependencyError,
     CircularFieldDependencyError,
 )
 from .dependencies.handler import FieldDependencyHandler
+from .dependencies.recompute import FieldValueRecomputeHandler
 from .dependencies.types import OptionalFieldDependencies
 from .exceptions import (
     LinkRowTableNotInSameDatabase,
@@ -111,6 +113,43 @@ if TYPE_CHECKING:
     from baserow.contrib.database.table.models import GeneratedTableModel
 
 
+def get_export_serialized_relations(
+    row: "GeneratedTableModel", field_name: str, cache: Dict[str, Any]
+) -> List[int]:
+    """
+    Returns the ids of the objects related to the provided row via the many to many
+    field with the given name. In order to prevent a lot of lookup queries in the
+    through table, we want to fetch all the relations and add them to a temporary in
+    memory cache containing a mapping of the row ids to the related ids. If the cache
+    contains the ids of the rows that are being exported, only their relations are
+    fetched, so that exporting a table in chunks doesn't require all the relations of
+    the table to be in memory.
+    """
+
+    cache_entry = f"{field_name}_relations"
+    if cache_entry not in cache:
+        cache[cache_entry] = defaultdict(list)
+        through_model = row._meta.get_field(field_name).remote_field.through
+        through_model_fields = through_model._meta.get_fields()
+        current_field_name = through_model_fields[1].name
+        relation_field_name = through_model_fields[2].name
+        relations = through_model.objects.all()
+        if EXPORT_SERIALIZED_CACHE_ROW_IDS in cache:
+            relations = relations.filter(
+                **{
+                    f"{current_field_name}_id__in": cache[
+                        EXPORT_SERIALIZED_CACHE_ROW_IDS
+                    ]
+                }
+            )
+        for relation in relations:
+            cache[cache_entry][getattr(relation, f"{current_field_name}_id")].append(
+                getattr(relation, f"{relation_field_name}_id")
+            )
+
+    return cache[cache_entry][row.id]
+
+
 class TextFieldMatchingRegexFieldType(FieldType, ABC):
     """
     This is an abstract FieldType you can extend to create a field which is a TextField
@@ -182,6 +221,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} #>> '{{}}'", []
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -256,6 +298,9 @@ class TextFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} #>> '{{}}'", []
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -289,6 +334,9 @@ class LongTextFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} #>> '{{}}'", []
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaTextType()
 
@@ -418,6 +466,9 @@ class NumberFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} #>> '{{}}'", []
+
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
         value = self.get_internal_value_from_db(row, field_name)
         return value if value is None else str(value)
@@ -545,6 +596,9 @@ class RatingFieldType(FieldType):
     def contains_query(self, *args):
         return contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} #>> '{{}}'", []
+
     def to_baserow_formula_type(self, field) -> BaserowFormulaType:
         return BaserowFormulaNumberType(0)
 
@@ -730,6 +784,16 @@ class DateFieldType(FieldType):
             q={f"formatted_date_{field_name}__icontains": value},
         )
 
+    def get_search_document_sql(self, field, value_sql):
+        # The value is only converted if it's a date, because the column can
+        # temporarily contain other values while its type is being changed.
+        cast = "timestamptz" if field.date_include_time else "date"
+        return (
+            f"case when {value_sql} #>> '{{}}' ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}' "
+            f"then to_char(({value_sql} #>> '{{}}')::{cast}, %s) end",
+            [field.get_psql_format()],
+        )
+
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
         """
         If the field type has changed into a date field then we want to parse the old
@@ -874,6 +938,14 @@ class CreatedOnLastModifiedBaseFieldType(ReadOnlyFieldType, DateFieldType):
             q={f"formatted_date_{field_name}__icontains": value},
         )
 
+    def get_search_document_sql(self, field, value_sql):
+        return (
+            f"case when {value_sql} #>> '{{}}' ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}' "
+            f"then to_char(({value_sql} #>> '{{}}')::timestamptz at time zone %s, %s) "
+            f"end",
+            [field.get_timezone(), field.get_psql_format()],
+        )
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         """
         If the field type has changed then we want to convert the date or timestamp to
@@ -1462,23 +1534,7 @@ class LinkRowFieldType(FieldType):
         return field
 
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
-        cache_entry = f"{field_name}_relations"
-        if cache_entry not in cache:
-            # In order to prevent a lot of lookup queries in the through table,
-            # we want to fetch all the relations and add it to a temporary in memory
-            # cache containing a mapping of the old ids to the new ids. Every relation
-            # can use the cached mapped relations to find the correct id.
-            cache[cache_entry] = defaultdict(list)
-            through_model = row._meta.get_field(field_name).remote_field.through
-            through_model_fields = through_model._meta.get_fields()
-            current_field_name = through_model_fields[1].name
-            relation_field_name = through_model_fields[2].name
-            for relation in through_model.objects.all():
-                cache[cache_entry][
-                    getattr(relation, f"{current_field_name}_id")
-                ].append(getattr(relation, f"{relation_field_name}_id"))
-
-        return cache[cache_entry][row.id]
+        return get_export_serialized_relations(row, field_name, cache)
 
     def set_import_serialized_value(
         self, row, field_name, value, id_mapping, files_zip, storage
@@ -1734,35 +1790,56 @@ class FileFieldType(FieldType):
     def contains_query(self, *args):
         return filename_contains_filter(*args)
 
+    def get_search_document_sql(self, field, value_sql):
+        return (
+            f"(select string_agg(file ->> 'visible_name', chr(31)) "
+            f"from jsonb_array_elements(case when jsonb_typeof({value_sql}) = 'array' "
+            f"then {value_sql} end) as file)",
+            [],
+        )
+
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
-        file_names = []
-        user_file_handler = UserFileHandler()
+        # The files of all the rows in the cache are fetched and added to the zip file
+        # at once, so that they can be downloaded in parallel.
+        cache_entry = f"{field_name}_user_files"
+        if cache_entry not in cache:
+            rows = row._meta.model.objects.all()
+            if EXPORT_SERIALIZED_CACHE_ROW_IDS in cache:
+                rows = rows.filter(id__in=cache[EXPORT_SERIALIZED_CACHE_ROW_IDS])
+            names = {
+                file["name"]
+                for value in rows.values_list(field_name, flat=True)
+                for file in value or []
+            }
+            user_files = {}
+            if names:
+                hashes = {
+                    UserFile.deconstruct_name(name)["sha256_hash"] for name in names
+                }
+                user_files = {
+                    user_file.name: user_file
+                    for user_file in UserFile.objects.filter(sha256_hash__in=hashes)
+                    if user_file.name in names
+                }
+            # Load the user files from the storage and write them to the zip file
+            # because they might not exist in the environment that they are going to
+            # be imported in.
+            UserFileHandler().add_user_files_to_zip(
+                user_files.values(), files_zip, storage
+            )
+            cache[cache_entry] = user_files
 
+        file_names = []
         for file in self.get_internal_value_from_db(row, field_name):
-            # Check if the user file object is already in the cache and if not,
-            # it must be fetched and added to to it.
-            cache_entry = f"user_file_{file['name']}"
-            if cache_entry not in cache:
-                try:
-                    user_file = UserFile.objects.all().name(file["name"]).get()
-                except UserFile.DoesNotExist:
-                    continue
-
-                if file["name"] not in files_zip.namelist():
-                    # Load the user file from the content and write it to the zip file
-                    # because it might not exist in the environment that it is going
-                    # to be imported in.
-                    file_path = user_file_handler.user_file_path(user_file.name)
-                    with storage.open(file_path, mode="rb") as storage_file:
-                        files_zip.writestr(file["name"], storage_file.read())
-
-                cache[cache_entry] = user_file
+            user_file = cache[cache_entry].get(file["name"])
+            if user_file is None:
+                continue
 
             file_names.append(
                 DatabaseExportSerializedStructure.file_field_value(
                     name=file["name"],
                     visible_name=file["visible_name"],
-                    original_name=cache[cache_entry].original_name,
+                    original_name=user_file.original_name,
                 )
             )
         return file_names
@@ -1773,13 +1850,21 @@ class FileFieldType(FieldType):
         user_file_handler = UserFileHandler()
         files = []
 
+        # The same file is often used in many rows, so the imported user files are
+        # remembered to only unpack every file once.
+        if "user_files" not in id_mapping:
+            id_mapping["user_files"] = {}
+
         for file in value:
-            with files_zip.open(file["name"]) as stream:
-                # Try to upload the user file with the original name to make sure
-                # that if the was already uploaded, it will not be uploaded again.
-                user_file = user_file_handler.upload_user_file(
-                    None, file["original_name"], stream, storage=storage
-                )
+            user_file = id_mapping["user_files"].get(file["name"])
+            if user_file is None:
+                with files_zip.open(file["name"]) as stream:
+                    # Try to upload the user file with the original name to make sure
+                    # that if the was already uploaded, it will not be uploaded again.
+                    user_file = user_file_handler.upload_user_file(
+                        None, file["original_name"], stream, storage=storage
+                    )
+                id_mapping["user_files"][file["name"]] = user_file
 
             value = user_file.serialize()
             value["visible_name"] = file["visible_name"]
@@ -2091,6 +2176,24 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             q={f"select_option_value_{field_name}__icontains": value},
         )
 
+    def get_search_document_sql(self, field, value_sql):
+        # The values are included in the expression for the same reason as in the
+        # `contains_query`. This also means that the expression changes when an
+        # option is renamed.
+        when_clauses = []
+        params = []
+        for option in field.select_options.all():
+            when_clauses.append("when %s then %s")
+            params += [str(option.id), option.value]
+
+        if len(when_clauses) == 0:
+            return "null", []
+
+        return (
+            f"case {value_sql} #>> '{{}}' {' '.join(when_clauses)} end",
+            params,
+        )
+
     def set_import_serialized_value(
         self, row, field_name, value, id_mapping, files_zip, storage
     ):
@@ -2280,23 +2383,7 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
         apps.clear_cache()
 
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
-        cache_entry = f"{field_name}_relations"
-        if cache_entry not in cache:
-            # In order to prevent a lot of lookup queries in the through table, we want
-            # to fetch all the relations and add it to a temporary in memory cache
-            # containing a mapping of the old ids to the new ids. Every relation can
-            # use the cached mapped relations to find the correct id.
-            cache[cache_entry] = defaultdict(list)
-            through_model = row._meta.get_field(field_name).remote_field.through
-            through_model_fields = through_model._meta.get_fields()
-            current_field_name = through_model_fields[1].name
-            relation_field_name = through_model_fields[2].name
-            for relation in through_model.objects.all():
-                cache[cache_entry][
-                    getattr(relation, f"{current_field_name}_id")
-                ].append(getattr(relation, f"{relation_field_name}_id"))
-
-        return cache[cache_entry][row.id]
+        return get_export_serialized_relations(row, field_name, cache)
 
     def set_import_serialized_value(
         self, row, field_name, value, id_mapping, files_zip, storage
@@ -2535,6 +2622,13 @@ class FormulaFieldType(ReadOnlyFieldType):
         ) = self._get_field_instance_and_type_from_formula_field(field)
         return field_type.contains_query(field_name, value, model_field, field_instance)
 
+    def get_search_document_sql(self, field, value_sql):
+        (
+            field_instance,
+            field_type,
+        ) = self._get_field_instance_and_type_from_formula_field(field)
+        return field_type.get_search_document_sql(field_instance, value_sql)
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         (
             field_instance,
@@ -2699,10 +2793,7 @@ class FormulaFieldType(ReadOnlyFieldType):
         """
 
         model = field.table.get_model()
-        expr = FormulaHandler.baserow_expression_to_update_django_expression(
-            field.cached_typed_internal_expression, model
-        )
-        model.objects_and_trash.all().update(**{f"{field.db_column}": expr})
+        self._update_all_row_values(field, model)
 
     def after_rows_created(self, field: FormulaField, rows, update_collector):
         if field.requires_refresh_after_insert:
@@ -2720,10 +2811,24 @@ class FormulaFieldType(ReadOnlyFieldType):
         before,
     ):
         to_model = to_field.table.get_model()
+        self._update_all_row_values(to_field, to_model)
+
+    def _update_all_row_values(self, field, model):
+        """
+        Populates the values of all the rows. For large tables, this is done in chunks
+        in the background instead, see `FieldValueRecomputeHandler`.
+        """
+
+        recompute_handler = FieldValueRecomputeHandler()
+        if recompute_handler.should_recompute_in_background(model):
+            recompute_handler.schedule_recompute(field.table, [field])
+            recompute_handler.start_background_recompute()
+            return
+
         expr = FormulaHandler.baserow_expression_to_update_django_expression(
-            to_field.cached_typed_internal_expression, to_model
+            field.cached_typed_internal_expression, model
         )
-        to_model.objects_and_trash.all().update(**{f"{to_field.db_column}": expr})
+        model.objects_and_trash.all().update(**{f"{field.db_column}": expr})
 
     def after_import_serialized(self, field, field_cache):
         field.save(recalculate=True, field_lookup_cache=field_cache)
@@ -59,6 +59,7 @@ from .exceptions import (
 )
 from .models import Field, SelectOption, SpecificFieldForUpdate
 from .registries import (
+    FieldConverter,
     field_type_registry,
     field_converter_registry,
 )
@@ -306,6 +307,7 @@ class FieldHandler:
         after_schema_change_callback: Optional[
             Callable[[SpecificFieldForUpdate], None]
         ] = None,
+        converter: Optional[FieldConverter] = None,
         **kwargs,
     ) -> Union[SpecificFieldForUpdate, Tuple[SpecificFieldForUpdate, List[Field]]]:
         """
@@ -325,6 +327,9 @@ class FieldHandler:
         :param after_schema_change_callback: If specified this callback is called
             after the field has had it's schema updated but before any dependant
             fields have been updated.
+        :param converter: If specified this converter is used to alter the field
+            instead of the applicable converter of the registry or the lenient schema
+            editor.
         :param kwargs: The field values that need to be updated
         :raises ValueError: When the provided field is not an instance of Field.
         :raises CannotChangeFieldType: When the database server responds with an
@@ -407,9 +412,10 @@ class FieldHandler:
         )
 
         # Try to find a data converter that can be applied.
-        converter = field_converter_registry.find_applicable_converter(
-            from_model, old_field, field
-        )
+        if converter is None:
+            converter = field_converter_registry.find_applicable_converter(
+                from_model, old_field, field
+            )
 
         if converter:
             # If a field data converter is found we are going to use that one to alter
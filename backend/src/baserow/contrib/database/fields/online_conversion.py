@@ -0,0 +1,343 @@
+import logging
+from copy import deepcopy
+from typing import Any, Callable, Dict, Optional
+
+from django.contrib.auth.models import AbstractUser
+from django.db import connection, models, transaction
+
+from baserow.contrib.database.db.batching import get_row_id_batches
+from baserow.contrib.database.db.schema import (
+    safe_django_schema_editor,
+    split_alter_column_prepare_values,
+)
+from baserow.contrib.database.db.sql_queries import (
+    sql_backfill_online_conversion_batch,
+    sql_create_online_conversion_functions,
+    sql_drop_online_conversion_functions,
+)
+from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.core.utils import extract_allowed, set_allowed_attrs
+
+from .exceptions import CannotChangeFieldType
+from .handler import FieldHandler
+from .models import Field, SpecificFieldForUpdate
+from .registries import FieldConverter, field_converter_registry, field_type_registry
+
+logger = logging.getLogger(__name__)
+
+
+def get_shadow_column_name(field: Field) -> str:
+    """
+    Returns the name of the column in which the converted values of the provided
+    field are stored while it's being converted online.
+    """
+
+    return f"{field.db_column}_online_conversion"
+
+
+def get_shadow_model_field(
+    model: GeneratedTableModel, field: Field, model_field: models.Field
+) -> models.Field:
+    """
+    Returns a copy of the provided model field that points to the shadow column of
+    the field. The shadow column is always nullable because the values are filled
+    afterwards.
+    """
+
+    shadow_model_field = deepcopy(model_field)
+    shadow_model_field.name = None
+    shadow_model_field.db_column = None
+    shadow_model_field.null = True
+    shadow_model_field.set_attributes_from_name(get_shadow_column_name(field))
+    shadow_model_field.model = model
+    return shadow_model_field
+
+
+def get_online_conversion_sql_names(
+    model: GeneratedTableModel, field: Field
+) -> Dict[str, str]:
+    """
+    Returns the quoted names of the database objects that are involved in the online
+    conversion of the provided field. They can be used to format the online
+    conversion sql queries.
+    """
+
+    quote_name = connection.ops.quote_name
+    return {
+        "table": quote_name(model._meta.db_table),
+        "column": quote_name(field.db_column),
+        "shadow_column": quote_name(get_shadow_column_name(field)),
+        "cast_function": quote_name(f"baserow_online_conversion_cast_{field.id}"),
+        "trigger_function": quote_name(f"baserow_online_conversion_trigger_{field.id}"),
+        "trigger": quote_name(f"baserow_online_conversion_{field.id}"),
+    }
+
+
+class ShadowColumnSwapConverter(FieldConverter):
+    """
+    Alters the field by replacing its column with the shadow column that has been
+    filled by the `OnlineFieldTypeConverter`. This only changes the schema, so it's
+    fast no matter how many rows the table has. It's not registered because it can
+    only be used at the end of an online conversion.
+    """
+
+    type = "shadow_column_swap"
+
+    def __init__(self, shadow_column_type: str):
+        """
+        :param shadow_column_type: The database type of the shadow column. If the
+            new field doesn't have this type anymore, for example because it was
+            changed during the conversion, the columns are not swapped.
+        """
+
+        self.shadow_column_type = shadow_column_type
+
+    def is_applicable(self, from_model, from_field, to_field):
+        return False
+
+    def alter_field(
+        self,
+        from_field,
+        to_field,
+        from_model,
+        to_model,
+        from_model_field,
+        to_model_field,
+        user,
+        connection,
+    ):
+        if to_model_field.db_parameters(connection)["type"] != self.shadow_column_type:
+            raise CannotChangeFieldType(
+                "The shadow column does not match with the new field type."
+            )
+
+        shadow_model_field = get_shadow_model_field(to_model, to_field, to_model_field)
+        with safe_django_schema_editor(atomic=False) as schema_editor:
+            schema_editor.execute(
+                sql_drop_online_conversion_functions
+                % get_online_conversion_sql_names(from_model, from_field)
+            )
+            schema_editor.remove_field(from_model, from_model_field)
+            # Renames the shadow column and applies the constraints of the new field,
+            # like `NOT NULL`. The values don't have to be converted anymore because
+            # the type is the same.
+            schema_editor.alter_field(to_model, shadow_model_field, to_model_field)
+
+
+class OnlineFieldTypeConverter:
+    """
+    Changes the type of a field without locking the table for the duration of the
+    data conversion. Altering the column type with the lenient schema editor rewrites
+    the whole table while holding an `ACCESS EXCLUSIVE` lock, which makes large tables
+    unavailable for a long time.
+
+    Instead, a nullable shadow column of the new type is added and filled in batches,
+    each in its own short transaction, using the same conversion as the lenient schema
+    editor. A trigger converts the values that are written in the meantime. Finally,
+    the old column is dropped and the shadow column is renamed to take its place while
+    the field itself is updated. The table stays readable and writable until that last
+    step, which only changes the schema.
+
+    Because of the separate transactions, the conversion must not be executed inside
+    a transaction.
+    """
+
+    def get_new_field(
+        self,
+        user: AbstractUser,
+        field: SpecificFieldForUpdate,
+        new_type_name: Optional[str] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Field:
+        """
+        Returns an unsaved instance of the field as it will be after the conversion.
+        Nothing is changed in the database.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field that must be converted.
+        :param new_type_name: The name of the new field type.
+        :param kwargs: The new field values.
+        :return: The unsaved new field.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get(new_type_name or from_field_type.type)
+
+        if to_field_type.model_class is type(field):
+            new_field = deepcopy(field)
+        else:
+            new_field = to_field_type.model_class(
+                **{
+                    model_field.attname: getattr(field, model_field.attname)
+                    for model_field in Field._meta.concrete_fields
+                }
+            )
+
+        allowed_fields = ["name"] + to_field_type.allowed_fields
+        field_values = to_field_type.prepare_values(
+            extract_allowed(kwargs, allowed_fields), user
+        )
+        return set_allowed_attrs(field_values, allowed_fields, new_field)
+
+    def can_convert_online(self, field: Field, new_field: Field) -> bool:
+        """
+        Checks whether the provided field can be converted online. This is only
+        possible when the lenient schema editor would otherwise alter the column,
+        so not when a converter is needed or when select options must be created.
+
+        :param field: The specific field that must be converted.
+        :param new_field: The unsaved new field as returned by `get_new_field`.
+        :return: Whether the field can be converted online.
+        """
+
+        to_field_type = field_type_registry.get_by_model(new_field)
+        if to_field_type.can_have_select_options:
+            return False
+
+        from_model = field.table.get_model(field_ids=[], fields=[field])
+        if field_converter_registry.find_applicable_converter(
+            from_model, field, new_field
+        ):
+            return False
+
+        from_model_field = from_model._meta.get_field(field.db_column)
+        to_model_field = to_field_type.get_model_field(new_field)
+        return not from_model_field.many_to_many and not to_model_field.many_to_many
+
+    def convert(
+        self,
+        user: AbstractUser,
+        field: SpecificFieldForUpdate,
+        new_type_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        **kwargs: Dict[str, Any],
+    ) -> SpecificFieldForUpdate:
+        """
+        Converts the field to the new type online. Accepts the same field values as
+        `FieldHandler.update_field`.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field that must be converted.
+        :param new_type_name: The name of the new field type.
+        :param batch_size: The amount of rows that are converted per transaction.
+            Defaults to the `BASEROW_FIELD_CONVERSION_BATCH_SIZE` setting.
+        :param progress_callback: An optional function that is called with the
+            amount of converted rows and the total amount of rows after every batch.
+        :param kwargs: The new field values.
+        :raises CannotChangeFieldType: When the field can't be converted online.
+        :return: The updated field.
+        """
+
+        group = field.table.database.group
+        group.has_user(user, raise_error=True)
+
+        new_field = self.get_new_field(user, field, new_type_name, **kwargs)
+        if not self.can_convert_online(field, new_field):
+            raise CannotChangeFieldType(
+                f"The field {field.id} can't be converted online to the "
+                f"{field_type_registry.get_by_model(new_field).type} type."
+            )
+
+        from_field_class = type(field)
+        model = field.table.get_model(field_ids=[], fields=[field])
+        names = get_online_conversion_sql_names(model, field)
+        to_model_field = field_type_registry.get_by_model(new_field).get_model_field(
+            new_field
+        )
+        shadow_model_field = get_shadow_model_field(model, field, to_model_field)
+        shadow_column_type = shadow_model_field.db_parameters(connection)["type"]
+
+        try:
+            with safe_django_schema_editor() as schema_editor:
+                schema_editor.add_field(model, shadow_model_field)
+                self._create_functions(
+                    schema_editor, field, new_field, shadow_column_type, names
+                )
+
+            total_rows = model.objects_and_trash.count()
+            converted_rows = 0
+            for lower, upper in get_row_id_batches(
+                connection, model._meta.db_table, batch_size
+            ):
+                with transaction.atomic(), connection.cursor() as cursor:
+                    cursor.execute(
+                        sql_backfill_online_conversion_batch % names, [lower, upper]
+                    )
+                    converted_rows += cursor.rowcount
+
+                if progress_callback is not None:
+                    progress_callback(converted_rows, total_rows)
+
+            with transaction.atomic():
+                field = FieldHandler().get_specific_field_for_update(field.id)
+                if type(field) is not from_field_class:
+                    raise CannotChangeFieldType(
+                        "The field type has changed during the conversion."
+                    )
+
+                field = FieldHandler().update_field(
+                    user,
+                    field,
+                    new_type_name,
+                    converter=ShadowColumnSwapConverter(shadow_column_type),
+                    **kwargs,
+                )
+        except Exception:
+            self._clean_up(model, names)
+            raise
+
+        logger.info(f"Converted {converted_rows} rows of field {field.id} online.")
+        return field
+
+    def _create_functions(
+        self,
+        schema_editor,
+        field: Field,
+        new_field: Field,
+        shadow_column_type: str,
+        names: Dict[str, str],
+    ):
+        """
+        Creates the function that converts a value exactly like the lenient schema
+        editor would and the trigger that uses it to keep the shadow column up to date
+        with the values that are written during the conversion.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get_by_model(new_field)
+        (
+            alter_column_prepare_old_value,
+            alter_column_prepare_new_value,
+            variables,
+        ) = split_alter_column_prepare_values(
+            from_field_type.get_alter_column_prepare_old_value(
+                connection, field, new_field
+            ),
+            to_field_type.get_alter_column_prepare_new_value(
+                connection, field, new_field
+            ),
+        )
+        schema_editor.execute(
+            sql_create_online_conversion_functions
+            % {
+                **names,
+                "type": shadow_column_type,
+                "alter_column_prepare_old_value": alter_column_prepare_old_value,
+                "alter_column_prepare_new_value": alter_column_prepare_new_value,
+            },
+            variables,
+        )
+
+    def _clean_up(self, model: GeneratedTableModel, names: Dict[str, str]):
+        """
+        Removes the shadow column, the trigger and the functions if the conversion
+        has failed, so that it can be tried again.
+        """
+
+        with safe_django_schema_editor() as schema_editor:
+            schema_editor.execute(sql_drop_online_conversion_functions % names)
+            schema_editor.execute(
+                f"ALTER TABLE {names['table']} "
+                f"DROP COLUMN IF EXISTS {names['shadow_column']}"
+            )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, TYPE_CHECKING, NoReturn, Optional
+from typing import Any, Dict, List, TYPE_CHECKING, NoReturn, Optional, Tuple
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -237,6 +237,28 @@ class FieldType(
 
         return Q()
 
+    def get_search_document_sql(
+        self, field: Field, value_sql: str
+    ) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Can return an SQL expression that converts the value of the field into the
+        text that is matched by the `contains_query`. It's used to build the search
+        document of a table that has a search index, so that the `contains_query` of
+        the field doesn't have to be computed anymore when searching. The value is
+        only available as JSONB because the expression must keep working while the
+        type of the column is being changed.
+
+        Example: return f"{value_sql} ->> 'name'", []
+
+        :param field: The field instance.
+        :param value_sql: The SQL expression containing the JSONB value of the field.
+        :return: The SQL expression and its parameters, or None if the field can't
+            be added to the search document. In that case the `contains_query` is
+            still used when searching.
+        """
+
+        return None
+
     def get_serializer_field(self, instance, **kwargs):
         """
         Should return the serializer field based on the custom model instance
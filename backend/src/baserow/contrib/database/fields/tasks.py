@@ -0,0 +1,36 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def run_field_value_recomputes(self):
+    """
+    Recomputes the values of the formula fields that have been scheduled for a
+    recompute in the background, see `FieldValueRecomputeHandler`. To stay within the
+    soft time limit, the task schedules itself again if it couldn't finish in time.
+    """
+
+    from .dependencies.recompute import FieldValueRecomputeHandler
+
+    deadline = time.monotonic() + settings.CELERY_SOFT_TIME_LIMIT / 2
+    interrupted = FieldValueRecomputeHandler().run_pending_recomputes(
+        should_continue=lambda: time.monotonic() < deadline
+    )
+
+    if interrupted:
+        run_field_value_recomputes.delay()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_field_value_recompute_tasks(sender, **kwargs):
+    # Picks up the recomputes that have been scheduled without starting the task, or
+    # of which the task has crashed.
+    sender.add_periodic_task(
+        timedelta(minutes=settings.FORMULA_RECOMPUTE_CHECK_INTERVAL_MINUTES),
+        run_field_value_recomputes.s(),
+    )
@@ -60,7 +60,7 @@ def _recalculate_depth_first(f, already_recalculated, field_lookup_cache):
     ):
         f.save(field_lookup_cache=field_lookup_cache, raise_if_invalid=False)
         recalculated_dependant = True
-        already_recalculated.add(f.id)
+        already_recalculated[f.id] = f
     return recalculated_dependant
 
 
@@ -379,13 +379,20 @@ class FormulaHandler:
         Ensures all formulas are updated to the latest formula version being used by
         the code. Essentially recalculates the internal formula attributes in dependency
         order if the version of the formula in the database does not match this classes
-        BASEROW_FORMULA_VERSION attribute.
+        BASEROW_FORMULA_VERSION attribute. The cell values of the recalculated formulas
+        are then scheduled to be recomputed in the background, see
+        `FieldValueRecomputeHandler`.
         """
 
         from baserow.contrib.database.fields.models import FormulaField
+        from baserow.contrib.database.fields.dependencies.recompute import (
+            FieldValueRecomputeHandler,
+        )
 
         field_lookup_cache = FieldCache()
-        already_recalculated = set()
+        # Ordered by recalculation, which means that every formula comes after the
+        # formulas it depends on.
+        already_recalculated = {}
 
         def formulas_need_update():
             return FormulaField.objects.filter(
@@ -405,6 +412,9 @@ class FormulaHandler:
                     num_updated = FormulaField.objects.update(
                         version=cls.BASEROW_FORMULA_VERSION,
                     )
+                    FieldValueRecomputeHandler().schedule_recompute_for_fields(
+                        [f for f in already_recalculated.values() if not f.trashed]
+                    )
                     print(f"Updated {num_updated} formulas which were out of date.")
                 else:
                     print(
@@ -256,6 +256,9 @@ class BaserowFormulaDateIntervalType(BaserowFormulaValidType):
     def contains_query(self, field_name, value, model_field, field):
         return Q()
 
+    def get_search_document_sql(self, field, value_sql):
+        return None
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         return None
 
@@ -496,6 +499,9 @@ class BaserowFormulaArrayType(BaserowFormulaValidType):
     def contains_query(self, field_name, value, model_field, field):
         return Q()
 
+    def get_search_document_sql(self, field, value_sql):
+        return None
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         return "p_in = '';"
 
@@ -558,6 +564,9 @@ class BaserowFormulaSingleSelectType(BaserowFormulaValidType):
             return Q()
         return Q(**{f"{field_name}__value__icontains": value})
 
+    def get_search_document_sql(self, field, value_sql):
+        return f"{value_sql} ->> 'value'", []
+
     def get_alter_column_prepare_old_value(self, connection, from_field, to_field):
         sql = f"""
             p_in = p_in->'value';
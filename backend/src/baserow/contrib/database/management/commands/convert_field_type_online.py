@@ -0,0 +1,101 @@
+import json
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.fields.exceptions import (
+    CannotChangeFieldType,
+    FieldDoesNotExist,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.online_conversion import (
+    OnlineFieldTypeConverter,
+)
+from baserow.core.models import GROUP_USER_PERMISSION_ADMIN
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Changes the type of a field while keeping its table readable and writable. "
+        "The values are converted in batches into a new column, which replaces the "
+        "old column at the end. This is meant for very large tables where changing "
+        "the field type via the API would lock the table for too long."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "field_id", type=int, help="The id of the field that must be converted."
+        )
+        parser.add_argument(
+            "type", type=str, help="The name of the new type of the field."
+        )
+        parser.add_argument(
+            "--field-values",
+            type=str,
+            default="{}",
+            help="A JSON object containing the values of the field after the "
+            "conversion (e.g. '{\"number_decimal_places\": 2}').",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="The amount of rows that are converted per transaction.",
+        )
+        parser.add_argument(
+            "--user-email",
+            type=str,
+            default=None,
+            help="The email of the user on whose behalf the field is converted. "
+            "Defaults to the first admin of the group.",
+        )
+
+    def handle(self, *args, **options):
+        field_id = options["field_id"]
+
+        try:
+            field = FieldHandler().get_field(field_id).specific
+        except FieldDoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The field with id {field_id} was not found.")
+            )
+            sys.exit(1)
+
+        group = field.table.database.group
+        if options["user_email"]:
+            user = User.objects.filter(email=options["user_email"]).first()
+        else:
+            group_user = (
+                group.groupuser_set.filter(permissions=GROUP_USER_PERMISSION_ADMIN)
+                .select_related("user")
+                .order_by("id")
+                .first()
+            )
+            user = group_user.user if group_user else None
+
+        if user is None:
+            self.stdout.write(self.style.ERROR("No user was found."))
+            sys.exit(1)
+
+        def progress(converted_rows, total_rows):
+            self.stdout.write(f"Converted {converted_rows} of {total_rows} rows.")
+
+        try:
+            OnlineFieldTypeConverter().convert(
+                user,
+                field,
+                options["type"],
+                batch_size=options["batch_size"],
+                progress_callback=progress,
+                **json.loads(options["field_values"]),
+            )
+        except CannotChangeFieldType as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            sys.exit(1)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"The field {field_id} has been converted.")
+        )
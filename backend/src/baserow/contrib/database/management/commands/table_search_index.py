@@ -0,0 +1,65 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.search_index import TableSearchIndexHandler
+
+
+class Command(BaseCommand):
+    help = (
+        "Enables or disables the search index of a table. When enabled, the "
+        "searchable text of every row is stored in a search document column that "
+        "is kept up to date when rows are written and indexed with pg_trgm if "
+        "available. Searching the table then only has to match that column. Note "
+        "that changing the fields of the table can update the search document of "
+        "all rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id", type=int, help="The id of the table that must be changed."
+        )
+        parser.add_argument(
+            "action",
+            type=str,
+            choices=["enable", "disable"],
+            help="Whether the search index must be enabled or disabled.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="The amount of rows of which the search document is filled per "
+            "transaction when enabling.",
+        )
+
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+
+        try:
+            table = TableHandler().get_table(table_id)
+        except TableDoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The table with id {table_id} was not found.")
+            )
+            sys.exit(1)
+
+        handler = TableSearchIndexHandler()
+        if options["action"] == "disable":
+            handler.disable(table)
+            self.stdout.write(
+                self.style.SUCCESS(f"The search index of table {table_id} is disabled.")
+            )
+            return
+
+        def progress(filled_rows, total_rows):
+            self.stdout.write(f"Filled {filled_rows} of {total_rows} rows.")
+
+        handler.enable(
+            table, batch_size=options["batch_size"], progress_callback=progress
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"The search index of table {table_id} is enabled.")
+        )
@@ -1,5 +1,8 @@
 from django.core.management.base import BaseCommand
 
+from baserow.contrib.database.fields.dependencies.recompute import (
+    FieldValueRecomputeHandler,
+)
 from baserow.contrib.database.formula import FormulaHandler
 
 
@@ -9,5 +12,26 @@ class Command(BaseCommand):
         "formula version."
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recompute-values",
+            action="store_true",
+            help="Recompute the cell values of the updated formulas in chunks right "
+            "away instead of leaving it to the background task.",
+        )
+
     def handle(self, *args, **options):
         FormulaHandler.recalculate_formulas_according_to_version()
+
+        if options["recompute_values"]:
+
+            def progress(recompute):
+                self.stdout.write(
+                    f"Recomputing table {recompute.table_id}: "
+                    f"{recompute.progress_percentage}%"
+                )
+
+            FieldValueRecomputeHandler().run_pending_recomputes(
+                progress_callback=progress
+            )
+            self.stdout.write("All formula values have been recomputed.")
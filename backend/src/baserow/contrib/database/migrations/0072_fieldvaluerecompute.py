@@ -0,0 +1,63 @@
+# Generated by Django 3.2.12 on 2026-10-18 04:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0071_alter_linkrowfield_link_row_relation_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FieldValueRecompute",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_row_id",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The id of the last row that has been recomputed.",
+                    ),
+                ),
+                ("processed_rows", models.PositiveIntegerField(default=0)),
+                (
+                    "total_rows",
+                    models.PositiveIntegerField(
+                        help_text="The amount of rows in the table when the recompute started.",
+                        null=True,
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                (
+                    "fields",
+                    models.ManyToManyField(
+                        help_text="The formula fields of which the values must be recomputed.",
+                        related_name="value_recomputes",
+                        to="database.Field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="field_value_recomputes",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2.12 on 2026-10-18 06:23
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0072_fieldvaluerecompute"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="search_index_enabled",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the table has a search document column that is used when searching all fields.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="table",
+            name="search_index_stale_field_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.PositiveIntegerField(),
+                blank=True,
+                default=list,
+                help_text="The ids of the fields of which the search document of the rows is still being refilled in the background. A field id is listed once for every pending change.",
+                size=None,
+            ),
+        ),
+    ]
@@ -33,7 +33,10 @@ from .webhooks.models import (
 )
 from .airtable.models import AirtableImportJob
 
-from baserow.contrib.database.fields.dependencies.models import FieldDependency
+from baserow.contrib.database.fields.dependencies.models import (
+    FieldDependency,
+    FieldValueRecompute,
+)
 
 
 __all__ = [
@@ -66,6 +69,7 @@ __all__ = [
     "TableWebhookCall",
     "AirtableImportJob",
     "FieldDependency",
+    "FieldValueRecompute",
 ]
 
 
@@ -107,6 +107,7 @@ class CreateRowsActionType(ActionType):
         rows_values: List[Dict[str, Any]],
         before_row: Optional[GeneratedTableModel] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        refresh_rows: bool = True,
     ) -> List[GeneratedTableModel]:
         """
         Creates rows for a given table with the provided values if the user
@@ -122,11 +123,18 @@ class CreateRowsActionType(ActionType):
             the row with this id.
         :param model: If the correct model has already been generated it can be
             provided so that it does not have to be generated for a second time.
+        :param refresh_rows: Indicates whether the created rows must be fetched
+            again with all their values.
         :return: The created list of rows instances.
         """
 
         rows = RowHandler().create_rows(
-            user, table, rows_values, before_row=before_row, model=model
+            user,
+            table,
+            rows_values,
+            before_row=before_row,
+            model=model,
+            refresh_rows=refresh_rows,
         )
 
         params = cls.Params(table.id, [row.id for row in rows])
@@ -536,6 +544,7 @@ class UpdateRowsActionType(ActionType):
         table: Table,
         rows: List,
         model: Optional[Type[GeneratedTableModel]] = None,
+        refresh_rows: bool = True,
     ) -> List[GeneratedTableModelForUpdate]:
         """
         Updates field values in batch based on provided rows with the new values.
@@ -549,6 +558,8 @@ class UpdateRowsActionType(ActionType):
         :param rows: The rows that must be updated.
         :param model: If the correct model has already been generated it can be
             provided so that it does not have to be generated for a second time.
+        :param refresh_rows: Indicates whether the updated rows must be fetched
+            again with all their values.
         :return: The updated rows.
         """
 
@@ -573,7 +584,12 @@ class UpdateRowsActionType(ActionType):
         new_rows = deepcopy(rows)
 
         updated_rows = row_handler.update_rows(
-            user, table, rows, model=model, rows_to_update=original_rows
+            user,
+            table,
+            rows,
+            model=model,
+            rows_to_update=original_rows,
+            refresh_rows=refresh_rows,
         )
 
         params = cls.Params(table.id, original_rows_values, new_rows)
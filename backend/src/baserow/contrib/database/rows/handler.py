@@ -2,13 +2,15 @@ import re
 from collections import defaultdict
 from decimal import Decimal
 from math import floor, ceil
-from typing import cast, Any, Dict, List, NewType, Optional, Type
+from typing import cast, Any, Dict, Iterable, List, NewType, Optional, Tuple, Type
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import transaction
 from django.db.models import Max, F, QuerySet
 from django.db.models.fields.related import ManyToManyField, ForeignKey
 
+from baserow.contrib.database.db.bulk_insert import copy_insert
 from baserow.contrib.database.table.models import Table, GeneratedTableModel
 from baserow.core.trash.handler import TrashHandler
 from baserow.contrib.database.trash.models import TrashedRows
@@ -29,7 +31,7 @@ from baserow.contrib.database.fields.dependencies.update_collector import (
     CachingFieldUpdateCollector,
 )
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
-from baserow.core.utils import get_non_unique_values
+from baserow.core.utils import get_non_unique_values, grouper
 
 
 GeneratedTableModelForUpdate = NewType(
@@ -660,6 +662,7 @@ class RowHandler:
         rows_values: List[Dict[str, Any]],
         before_row: Optional[GeneratedTableModel] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        refresh_rows: bool = True,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -672,6 +675,10 @@ class RowHandler:
             the before_row.
         :param model: If the correct model has already been generated it can be
             provided so that it does not have to be generated for a second time.
+        :param refresh_rows: Indicates whether the created rows must be fetched
+            again with all their values, including the calculated and related
+            ones. If not, the returned rows, and the rows sent with the
+            `rows_created` signal, only contain reliable ids and provided values.
         :return: The created row instances.
         """
 
@@ -699,9 +706,77 @@ class RowHandler:
             }
             rows_relationships.append((instance, relations))
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, relations) in rows_relationships]
+        # Large amounts of rows are streamed into the table using `COPY` in chunks.
+        # The dependant fields are updated once per chunk instead of once for all the
+        # rows, so that the update statements don't have to filter on a huge amount
+        # of row ids.
+        use_copy = (
+            settings.BASEROW_ROW_COPY_INSERT_THRESHOLD > 0
+            and len(rows_relationships) >= settings.BASEROW_ROW_COPY_INSERT_THRESHOLD
         )
+        chunk_size = (
+            settings.BASEROW_ROW_COPY_INSERT_CHUNK_SIZE
+            if use_copy
+            else max(len(rows_relationships), 1)
+        )
+
+        inserted_rows = []
+        for chunk in grouper(chunk_size, rows_relationships):
+            inserted_rows += self._insert_rows_and_update_dependencies(
+                table, model, list(chunk), use_copy
+            )
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        updated_fields = [o["field"] for o in model._field_objects.values()]
+        ViewHandler().field_value_updated(updated_fields)
+
+        if refresh_rows:
+            rows_to_return = list(
+                model.objects.all()
+                .enhance_by_fields()
+                .filter(id__in=[row.id for row in inserted_rows])
+            )
+        else:
+            rows_to_return = inserted_rows
+
+        rows_created.send(
+            self,
+            rows=rows_to_return,
+            before=before_row,
+            user=user,
+            table=table,
+            model=model,
+            rows_refreshed=refresh_rows,
+        )
+
+        return rows_to_return
+
+    def _insert_rows_and_update_dependencies(
+        self,
+        table: Table,
+        model: Type[GeneratedTableModel],
+        rows_relationships: List[Tuple[GeneratedTableModel, Dict[str, List]]],
+        use_copy: bool,
+    ) -> List[GeneratedTableModel]:
+        """
+        Inserts the provided unsaved rows and their many to many relationships and
+        updates the fields depending on them.
+
+        :param table: The table where the rows are inserted in.
+        :param model: The generated model of the table.
+        :param rows_relationships: Tuples containing the unsaved row instance and
+            a dict containing the many to many values per field name.
+        :param use_copy: Indicates whether the rows and relationships must be
+            inserted with the `COPY` command instead of `bulk_create`.
+        :return: The inserted rows.
+        """
+
+        rows = [row for (row, relations) in rows_relationships]
+        if use_copy:
+            inserted_rows = copy_insert(model, rows)
+        else:
+            inserted_rows = model.objects.bulk_create(rows)
 
         many_to_many = defaultdict(list)
         for index, row in enumerate(inserted_rows):
@@ -735,7 +810,10 @@ class RowHandler:
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            if use_copy:
+                copy_insert(through, values)
+            else:
+                through.objects.bulk_create(values)
 
         update_collector = CachingFieldUpdateCollector(
             table,
@@ -769,27 +847,7 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
-        from baserow.contrib.database.views.handler import ViewHandler
-
-        updated_fields = [o["field"] for o in model._field_objects.values()]
-        ViewHandler().field_value_updated(updated_fields)
-
-        rows_to_return = list(
-            model.objects.all()
-            .enhance_by_fields()
-            .filter(id__in=[row.id for row in inserted_rows])
-        )
-
-        rows_created.send(
-            self,
-            rows=rows_to_return,
-            before=before_row,
-            user=user,
-            table=table,
-            model=model,
-        )
-
-        return rows_to_return
+        return inserted_rows
 
     def update_rows(
         self,
@@ -798,6 +856,7 @@ class RowHandler:
         rows: List,
         model: Optional[Type[GeneratedTableModel]] = None,
         rows_to_update: Optional[RowsForUpdate] = None,
+        refresh_rows: bool = True,
     ) -> List[GeneratedTableModelForUpdate]:
         """
         Updates field values in batch based on provided rows with the new values.
@@ -810,6 +869,12 @@ class RowHandler:
         :param rows_to_update: If the rows to update have already been generated
             it can be provided so that it does not have to be generated for a
             second time.
+        :param refresh_rows: Indicates whether the updated rows must be fetched
+            again with all their values, including the calculated and related
+            ones. If not, the returned rows, and the rows sent with the
+            `rows_updated` signal, only contain reliable ids. The
+            `get_rows_with_field_values` method can be used to load the values of
+            the changed fields.
         :raises RowIdsNotUnique: When trying to update the same row multiple times.
         :raises RowDoesNotExist: When any of the rows don't exist.
         :return: The updated row instances.
@@ -936,17 +1001,12 @@ class RowHandler:
             delete_qs._raw_delete(delete_qs.db)
             through.objects.bulk_create([v for v in values if v is not None])
 
-        # For now all fields that don't represent a relationship will be used in
-        # the bulk_update() call. This could be optimized in the future if we can
-        # select just fields that need to be updated (fields that are passed in +
-        # read only fields that need updating too)
-        bulk_update_fields = [
-            field["name"]
-            for field in model._field_objects.values()
-            if not isinstance(model._meta.get_field(field["name"]), ManyToManyField)
-        ] + ["updated_on"]
-        if len(bulk_update_fields) > 0:
-            model.objects.bulk_update(rows_to_update, bulk_update_fields)
+        # Only the fields that are passed in and the read only fields that need to be
+        # refreshed, like the formula and last modified fields, are included in the
+        # bulk_update() call. Including every column of the table would make the
+        # generated `CASE WHEN` statement unnecessarily large for wide tables.
+        bulk_update_fields = self.get_bulk_update_field_names(model, updated_field_ids)
+        model.objects.bulk_update(rows_to_update, bulk_update_fields)
 
         update_collector = CachingFieldUpdateCollector(
             table, starting_row_id=row_ids, existing_model=model
@@ -971,9 +1031,13 @@ class RowHandler:
         updated_fields = [o["field"] for o in model._field_objects.values()]
         ViewHandler().field_value_updated(updated_fields)
 
-        rows_to_return = list(
-            model.objects.all().enhance_by_fields().filter(id__in=row_ids)
-        )
+        if refresh_rows:
+            rows_to_return = list(
+                model.objects.all().enhance_by_fields().filter(id__in=row_ids)
+            )
+        else:
+            rows_to_return = list(rows_to_update)
+
         rows_updated.send(
             self,
             rows=rows_to_return,
@@ -982,10 +1046,92 @@ class RowHandler:
             model=model,
             before_return=before_return,
             updated_field_ids=updated_field_ids,
+            rows_refreshed=refresh_rows,
         )
 
         return rows_to_return
 
+    def get_field_ids_changed_by_update(
+        self, model: Type[GeneratedTableModel], updated_field_ids: Iterable[int]
+    ) -> List[int]:
+        """
+        Returns the ids of the fields whose values can change when the provided
+        fields of a row are updated. These are the updated fields themselves and the
+        fields that must be refreshed after an update, like formula fields.
+
+        :param model: The generated model of the table.
+        :param updated_field_ids: The ids of the fields that have been updated.
+        :return: The ids of the fields that might have a changed value.
+        """
+
+        return [
+            field_id
+            for field_id, field_object in model._field_objects.items()
+            if field_id in updated_field_ids
+            or getattr(
+                model._meta.get_field(field_object["name"]),
+                "requires_refresh_after_update",
+                False,
+            )
+        ]
+
+    def get_rows_with_field_values(
+        self,
+        model: Type[GeneratedTableModel],
+        row_ids: Iterable[int],
+        field_ids: Iterable[int],
+    ) -> List[GeneratedTableModel]:
+        """
+        Fetches the rows with only the values of the provided fields loaded, so that
+        the values of wide tables don't all have to be fetched when only a few of them
+        are needed. The querysets are enhanced for the provided fields only.
+
+        :param model: The generated model of the table.
+        :param row_ids: The ids of the rows that must be fetched.
+        :param field_ids: The ids of the fields whose values must be loaded.
+        :return: The rows in the default order of the model.
+        """
+
+        queryset = model.objects.filter(id__in=row_ids)
+        field_names = ["id", "order"]
+        for field_id in field_ids:
+            field_object = model._field_objects[field_id]
+            queryset = field_object["type"].enhance_queryset(
+                queryset, field_object["field"], field_object["name"]
+            )
+            if not isinstance(
+                model._meta.get_field(field_object["name"]), ManyToManyField
+            ):
+                field_names.append(field_object["name"])
+        return list(queryset.only(*field_names))
+
+    def get_bulk_update_field_names(
+        self, model: GeneratedTableModel, updated_field_ids: Iterable[int]
+    ) -> List[str]:
+        """
+        Returns the names of the model fields that must be written when updating
+        rows in bulk. These are the non relationship fields that have been updated,
+        the fields whose value must be recalculated on every update and the
+        `updated_on` field.
+
+        :param model: The generated table model of the rows that are updated.
+        :param updated_field_ids: The ids of the fields that have new values.
+        :return: The names of the fields that must be passed to `bulk_update`.
+        """
+
+        bulk_update_fields = [
+            model._field_objects[field_id]["name"]
+            for field_id in sorted(updated_field_ids)
+            if not isinstance(
+                model._meta.get_field(model._field_objects[field_id]["name"]),
+                ManyToManyField,
+            )
+        ]
+        for field_name in model.fields_requiring_refresh_after_update():
+            if field_name not in bulk_update_fields:
+                bulk_update_fields.append(field_name)
+        return bulk_update_fields + ["updated_on"]
+
     def get_rows_for_update(
         self, model: GeneratedTableModel, row_ids: List[int]
     ) -> RowsForUpdate:
@@ -20,9 +20,19 @@ When we construct a model we:
 By using different keys for different versions of the model we can
 be sure concurrent changes to the model aren't going to overwrite each others
 changes to the cached field_attrs.
+
+On top of that every process keeps a bounded LRU of the fully built model classes. A
+built model is stored together with the model version of its table and of every
+related table that was built along with it (for example via a link row field). It's
+only reused if all those versions are still the latest ones, which means that
+constructing the model class and deserializing the field_attrs can be skipped on most
+requests.
 """
 
-from typing import Dict, Any
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
@@ -30,6 +40,8 @@ from django.core.exceptions import ImproperlyConfigured
 
 from baserow.version import VERSION as BASEROW_VERSION
 
+logger = logging.getLogger(__name__)
+
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
 
@@ -52,6 +64,18 @@ def get_latest_cached_model_field_attrs(table_id: int) -> Dict[str, Any]:
         been cached yet.
     """
 
+    return get_latest_cached_model_version_and_field_attrs(table_id)[1]
+
+
+def get_latest_cached_model_version_and_field_attrs(
+    table_id: int,
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    :param table_id: The table to lookup any cached mode field attrs for.
+    :return: The latest model version of the table and the cached field attrs of that
+        version or None if nothing has been cached yet.
+    """
+
     model_version_key = table_model_cache_version_key(table_id)
     latest_model_version = generated_models_cache.get_or_set(
         model_version_key, 0, timeout=None
@@ -59,16 +83,17 @@ def get_latest_cached_model_field_attrs(table_id: int) -> Dict[str, Any]:
 
     cache_key = table_model_cache_entry_key(table_id, latest_model_version)
 
-    return generated_models_cache.get(cache_key)
+    return latest_model_version, generated_models_cache.get(cache_key)
 
 
-def set_cached_model_field_attrs(table_id: int, field_attrs: Dict[str, Any]):
+def set_cached_model_field_attrs(table_id: int, field_attrs: Dict[str, Any]) -> int:
     """
     Will increment the latest model version for table_id and store field_attrs in the
     cache entry for that model version.
 
     :param table_id: The table to lookup any cached mode field attrs for.
     :param field_attrs: The field_attrs for table_id to cache.
+    :return: The model version the field_attrs have been stored for.
     """
 
     model_version_key = table_model_cache_version_key(table_id)
@@ -81,10 +106,134 @@ def set_cached_model_field_attrs(table_id: int, field_attrs: Dict[str, Any]):
     next_model_version = generated_models_cache.incr(model_version_key)
     cache_key = table_model_cache_entry_key(table_id, next_model_version)
     generated_models_cache.set(cache_key, field_attrs, timeout=None)
+    return next_model_version
+
+
+class BuiltModelCache:
+    """
+    A thread safe, bounded LRU of built table model classes for the current process.
+    Every entry is keyed by the table id and stores the model versions, see
+    `table_model_cache_version_key`, of all the tables the model has been built with.
+    Older versions of a table model are never requested again, so a newly built model
+    replaces the previous entry of its table.
+    """
+
+    def __init__(self):
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def max_size(self) -> int:
+        return settings.BASEROW_BUILT_MODEL_CACHE_SIZE
+
+    def get(self, table_id: int) -> Optional[Type]:
+        """
+        Returns the built model of the table if it's in the cache and if it has been
+        built with the latest model version of the table and its related tables.
+
+        :param table_id: The id of the table to get the built model for.
+        :return: The built model class or None if there isn't an up to date one.
+        """
+
+        if self.max_size <= 0:
+            return None
+
+        with self._lock:
+            entry = self._models.get(table_id)
+
+        if entry is not None:
+            model_versions, model = entry
+            latest_versions = generated_models_cache.get_many(
+                [table_model_cache_version_key(t) for t in model_versions.keys()]
+            )
+            if all(
+                latest_versions.get(table_model_cache_version_key(t)) == version
+                for t, version in model_versions.items()
+            ):
+                with self._lock:
+                    self.hits += 1
+                    if table_id in self._models:
+                        self._models.move_to_end(table_id)
+                return model
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, table_id: int, model_versions: Dict[int, int], model: Type):
+        """
+        Stores a freshly built model in the cache, evicting the least recently used
+        models if the cache is full.
+
+        :param table_id: The id of the table the model has been built for.
+        :param model_versions: A dict containing the model version of the table and of
+            every related table the model has been built with, keyed by table id.
+        :param model: The built model class.
+        """
+
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._models[table_id] = (model_versions, model)
+            self._models.move_to_end(table_id)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+
+    def record_build(self, build_time: float):
+        """
+        Registers how long it took to build a table model, in seconds.
+        """
+
+        with self._lock:
+            self.builds += 1
+            self.build_time += build_time
+
+        logger.debug(f"Built a table model in {build_time * 1000:.2f}ms.")
+
+    def delete(self, table_id: int):
+        with self._lock:
+            self._models.pop(table_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.build_time = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: The metrics of the cache in this process like the hit rate and the
+            average time it took to build a table model.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._models),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "builds": self.builds,
+                "total_build_time": self.build_time,
+                "average_build_time": (
+                    self.build_time / self.builds if self.builds else 0.0
+                ),
+            }
+
+
+built_model_cache = BuiltModelCache()
 
 
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    built_model_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -110,6 +259,8 @@ def invalidate_table_in_model_cache(
     other tables if need be.
     """
 
+    built_model_cache.delete(table_id)
+
     model_version_key = table_model_cache_version_key(table_id)
     model_version = generated_models_cache.get_or_set(model_version_key, 0)
 
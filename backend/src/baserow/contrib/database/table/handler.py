@@ -24,6 +24,8 @@ from baserow.contrib.database.models import Database
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.utils import grouper
+from baserow.contrib.database.db.bulk_insert import copy_insert
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from .exceptions import (
     TableDoesNotExist,
@@ -244,7 +246,7 @@ class TableHandler:
 
         ViewHandler().create_view(user, table, GridViewType.type, name="Grid")
 
-        bulk_data = [
+        bulk_data = (
             model(
                 order=index + 1,
                 **{
@@ -253,8 +255,18 @@ class TableHandler:
                 },
             )
             for index, row in enumerate(data)
-        ]
-        model.objects.bulk_create(bulk_data)
+        )
+
+        # Large imports are streamed into the table with `COPY` in chunks, so that
+        # not all the model instances have to be kept in memory at once.
+        threshold = settings.BASEROW_ROW_COPY_INSERT_THRESHOLD
+        if threshold > 0 and len(data) >= threshold:
+            for chunk in grouper(
+                settings.BASEROW_ROW_COPY_INSERT_CHUNK_SIZE, bulk_data
+            ):
+                copy_insert(model, list(chunk))
+        else:
+            model.objects.bulk_create(bulk_data)
 
     def fill_example_table_data(self, user: AbstractUser, table: Table):
         """
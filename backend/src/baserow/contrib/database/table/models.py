@@ -1,6 +1,8 @@
 import re
+import time
 from typing import Dict, Any, Union, Type
 
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.db.models import Q, F
 
@@ -18,11 +20,13 @@ from baserow.contrib.database.fields.field_filters import (
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.cache import (
-    get_latest_cached_model_field_attrs,
+    built_model_cache,
+    get_latest_cached_model_version_and_field_attrs,
     set_cached_model_field_attrs,
 )
 from baserow.contrib.database.views.exceptions import ViewFilterTypeNotAllowedForField
 from baserow.contrib.database.views.registries import view_filter_type_registry
+from baserow.core.db import specific_iterator
 from baserow.core.mixins import (
     OrderableMixin,
     CreatedAndUpdatedOnMixin,
@@ -68,14 +72,28 @@ class TableModelQuerySet(models.QuerySet):
         :rtype: QuerySet
         """
 
-        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR).filter(
-            Q(id__contains=search)
+        from baserow.contrib.database.table.search_index import (
+            TableSearchIndexHandler,
         )
+
+        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR)
+        # If the table has a search index, the search document contains the id and
+        # the values of most fields, so they don't have to be searched separately.
+        search_index_filter = TableSearchIndexHandler().get_search_filter(
+            self.model, search, only_search_by_field_ids
+        )
+        if search_index_filter is not None:
+            search_index_q, indexed_field_ids = search_index_filter
+            filter_builder.filter(search_index_q)
+        else:
+            indexed_field_ids = set()
+            filter_builder.filter(Q(id__contains=search))
+
         for field_object in self.model._field_objects.values():
             if (
                 only_search_by_field_ids is not None
                 and field_object["field"].id not in only_search_by_field_ids
-            ):
+            ) or field_object["field"].id in indexed_field_ids:
                 continue
             field_name = field_object["name"]
             model_field = self.model._meta.get_field(field_name)
@@ -349,6 +367,19 @@ class Table(
     database = models.ForeignKey("database.Database", on_delete=models.CASCADE)
     order = models.PositiveIntegerField()
     name = models.CharField(max_length=255)
+    search_index_enabled = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the table has a search document column that is "
+        "used when searching all fields.",
+    )
+    search_index_stale_field_ids = ArrayField(
+        models.PositiveIntegerField(),
+        default=list,
+        blank=True,
+        help_text="The ids of the fields of which the search document of the rows "
+        "is still being refilled in the background. A field id is listed once for "
+        "every pending change.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -413,6 +444,23 @@ class Table(
         if not fields:
             fields = []
 
+        use_cache = (
+            use_cache
+            and len(fields) == 0
+            and field_ids is None
+            and add_dependencies is True
+            and attribute_names is False
+        )
+        # A fully built model can only be reused if it's not being built as part of
+        # a related model and if it isn't managed, because that changes the meta.
+        use_built_model_cache = use_cache and not manytomany_models and not managed
+
+        if use_built_model_cache:
+            model = built_model_cache.get(self.id)
+            if model is not None:
+                return model
+            build_start = time.perf_counter()
+
         if not manytomany_models:
             manytomany_models = {}
 
@@ -455,6 +503,8 @@ class Table(
             # An indication that the model is a generated table model.
             "_generated_table_model": True,
             "_table_id": self.id,
+            "_search_index_enabled": self.search_index_enabled,
+            "_search_index_stale_field_ids": set(self.search_index_stale_field_ids),
             # We are using our own table model manager to implement some queryset
             # helpers.
             "objects": TableModelManager(),
@@ -469,16 +519,12 @@ class Table(
             "__str__": __str__,
         }
 
-        use_cache = (
-            use_cache
-            and len(fields) == 0
-            and field_ids is None
-            and add_dependencies is True
-            and attribute_names is False
-        )
-
+        model_version = None
         if use_cache:
-            field_attrs = get_latest_cached_model_field_attrs(self.id)
+            (
+                model_version,
+                field_attrs,
+            ) = get_latest_cached_model_version_and_field_attrs(self.id)
         else:
             field_attrs = None
 
@@ -493,9 +539,12 @@ class Table(
             )
 
             if use_cache:
-                set_cached_model_field_attrs(self.id, field_attrs)
+                model_version = set_cached_model_field_attrs(self.id, field_attrs)
 
         attrs.update(**field_attrs)
+        # The model version the field attrs belong to, this is None if the model
+        # hasn't been generated using the cached field attrs.
+        attrs["_model_version"] = model_version
 
         # Create the model class.
         model = type(
@@ -523,6 +572,18 @@ class Table(
                 field_object["field"], model, field_object["name"], manytomany_models
             )
 
+        if use_built_model_cache:
+            built_model_cache.record_build(time.perf_counter() - build_start)
+            # All the models that have been built together with this one must still
+            # be the latest version for the built model to be reused.
+            model_versions = {
+                related_model._table_id: related_model._model_version
+                for related_model in manytomany_models.values()
+            }
+            model_versions[self.id] = model_version
+            if None not in model_versions.values():
+                built_model_cache.set(self.id, model_versions, model)
+
         return model
 
     def _fetch_and_generate_field_attrs(
@@ -565,30 +626,35 @@ class Table(
             else:
                 fields_query = fields_query.filter(name__in=field_names)
         # Create a combined list of fields that must be added and belong to the this
-        # table.
-        fields = list(fields) + [field for field in fields_query]
+        # table. The specific fields are fetched with one query per field type.
+        fields = list(specific_iterator(list(fields) + list(fields_query)))
         # If there are duplicate field names we have to store them in a list so we
         # know later which ones are duplicate.
         duplicate_field_names = []
         already_included_field_names = set([f.name for f in fields])
+
+        if filtered and add_dependencies:
+            # Add the direct and indirect dependencies of the fields, one level of
+            # dependencies at the time.
+            new_fields = fields
+            while len(new_fields) > 0:
+                new_fields = [
+                    f
+                    for f in FieldDependencyHandler.get_same_table_dependencies(
+                        new_fields
+                    )
+                    if f.name not in already_included_field_names
+                ]
+                already_included_field_names.update(f.name for f in new_fields)
+                fields += new_fields
+
         # We will have to add each field to with the correct field name and model
         # field to the attribute list in order for the model to work.
-        while len(fields) > 0:
-            field = fields.pop(0)
+        for field in fields:
             trashed = field.trashed
-            field = field.specific
             field_type = field_type_registry.get_by_model(field)
             field_name = field.db_column
 
-            if filtered and add_dependencies:
-                direct_dependencies = (
-                    FieldDependencyHandler.get_same_table_dependencies(field)
-                )
-                for f in direct_dependencies:
-                    if f.name not in already_included_field_names:
-                        fields.append(f)
-                        already_included_field_names.add(f.name)
-
             # If attribute_names is True we will not use 'field_{id}' as attribute
             # name, but we will rather use a name the user provided.
             if attribute_names:
@@ -0,0 +1,352 @@
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import DatabaseError, connection, transaction
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+from baserow.contrib.database.db.batching import get_row_id_batches
+from baserow.contrib.database.db.sql_queries import (
+    sql_backfill_search_document_batch,
+    sql_create_search_document_function,
+    sql_create_search_document_index,
+    sql_drop_search_document_function,
+    sql_search_document_function_body,
+)
+
+from .cache import invalidate_table_in_model_cache
+from .models import GeneratedTableModel, Table
+
+logger = logging.getLogger(__name__)
+
+SEARCH_DOCUMENT_COLUMN = "search_document"
+# The values in the search document are separated by the ASCII unit separator, so
+# that a search query can't match a combination of two values.
+SEARCH_DOCUMENT_SEPARATOR = "chr(31)"
+
+
+def get_search_document_sql_names(table: Table) -> Dict[str, str]:
+    """
+    Returns the quoted names of the database objects that make up the search index
+    of the provided table. They can be used to format the search document sql
+    queries.
+    """
+
+    quote_name = connection.ops.quote_name
+    return {
+        "table": quote_name(table.get_database_table_name()),
+        "column": quote_name(SEARCH_DOCUMENT_COLUMN),
+        "function": quote_name(f"baserow_search_document_{table.id}"),
+        "trigger": quote_name("baserow_search_document"),
+        "index": quote_name(f"tbl_search_document_{table.id}_idx"),
+    }
+
+
+class TableSearchIndexHandler:
+    """
+    Maintains an opt-in search index for a table. Searching normally computes the
+    `contains_query` of every field for every row, which means formatting all the
+    dates and looking up all the select options. When the search index is enabled,
+    the table gets a search document column containing the searchable text of every
+    row. A trigger keeps it up to date when rows are written, so a search only has
+    to match this single column. If the `pg_trgm` extension is available, the column
+    also gets a trigram index so that the rows don't have to be scanned at all.
+
+    When the fields change, the search document of the existing rows is refilled in
+    the background. Until that's done, the changed fields are marked as stale and
+    searched by their `contains_query` instead.
+    """
+
+    def get_search_document(
+        self, model: GeneratedTableModel
+    ) -> Tuple[str, List[Any], Set[int]]:
+        """
+        Builds the SQL expression of the search document of the provided model. It
+        contains the id of the row followed by the text of every field that can be
+        added to the search document.
+
+        :param model: The generated model of the table.
+        :return: The SQL expression, its parameters and the ids of the fields that
+            are in the search document.
+        """
+
+        parts = ["new.id::text"]
+        params = []
+        field_ids = set()
+        for field_object in model._field_objects.values():
+            field = field_object["field"]
+            column = model._meta.get_field(field_object["name"]).column
+            search_document_sql = field_object["type"].get_search_document_sql(
+                field, f"new_row -> '{column}'"
+            )
+            if search_document_sql is None:
+                continue
+
+            sql, sql_params = search_document_sql
+            parts.append(f"coalesce(({sql})::text, '')")
+            params += [
+                param.replace("$FUNCTION$", "") if isinstance(param, str) else param
+                for param in sql_params
+            ]
+            field_ids.add(field.id)
+
+        return f" || {SEARCH_DOCUMENT_SEPARATOR} || ".join(parts), params, field_ids
+
+    def get_search_filter(
+        self,
+        model: GeneratedTableModel,
+        search: str,
+        only_search_by_field_ids: Optional[Set[int]] = None,
+    ) -> Optional[Tuple[Q, Set[int]]]:
+        """
+        Returns the filter that searches the search document of the table, if the
+        search index can be used.
+
+        :param model: The generated model of the table.
+        :param search: The search query.
+        :param only_search_by_field_ids: If provided, the search index is only used
+            if all the fields in the search document must be searched.
+        :return: The filter and the ids of the fields that it searches, or None if
+            the search index can't be used. The ids of the stale fields are not
+            included because the search document doesn't contain their current
+            values yet.
+        """
+
+        search = search.strip()
+        if not model._search_index_enabled or search == "":
+            return None
+
+        *_, field_ids = self.get_search_document(model)
+        field_ids -= model._search_index_stale_field_ids
+        if only_search_by_field_ids is not None and not field_ids.issubset(
+            only_search_by_field_ids
+        ):
+            return None
+
+        quote_name = connection.ops.quote_name
+        # No user input goes into the RawSQL, safe to use.
+        search_filter = RawSQL(  # nosec
+            f"{quote_name(model._meta.db_table)}.{quote_name(SEARCH_DOCUMENT_COLUMN)} "
+            f"ILIKE %s",
+            [f"%{connection.ops.prep_for_like_query(search)}%"],
+            output_field=BooleanField(),
+        )
+        return Q(search_filter), field_ids
+
+    def enable(
+        self,
+        table: Table,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Adds the search document column to the table and fills it in batches, each
+        in its own transaction, so that the table isn't locked for the whole time.
+        Because of that, it must not be executed inside a transaction.
+
+        :param table: The table for which the search index must be enabled.
+        :param batch_size: The amount of rows that are filled per transaction.
+            Defaults to the `BASEROW_FIELD_CONVERSION_BATCH_SIZE` setting.
+        :param progress_callback: An optional function that is called with the
+            amount of filled rows and the total amount of rows after every batch.
+        """
+
+        names = get_search_document_sql_names(table)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {names['table']} "
+                f"ADD COLUMN IF NOT EXISTS {names['column']} text"
+            )
+        self.update_search_document(table, backfill=False)
+
+        self._fill_search_document(table, batch_size, progress_callback)
+        self._create_index(names)
+
+        table.search_index_enabled = True
+        table.search_index_stale_field_ids = []
+        table.save(
+            update_fields=["search_index_enabled", "search_index_stale_field_ids"]
+        )
+        invalidate_table_in_model_cache(table.id)
+        logger.info(f"Enabled the search index of table {table.id}.")
+
+    def disable(self, table: Table):
+        """
+        Removes the search document column, its trigger and its index from the table.
+
+        :param table: The table for which the search index must be disabled.
+        """
+
+        names = get_search_document_sql_names(table)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql_drop_search_document_function % names)
+            cursor.execute(
+                f"ALTER TABLE {names['table']} DROP COLUMN IF EXISTS {names['column']}"
+            )
+            table.search_index_enabled = False
+            table.search_index_stale_field_ids = []
+            table.save(
+                update_fields=["search_index_enabled", "search_index_stale_field_ids"]
+            )
+
+        invalidate_table_in_model_cache(table.id)
+
+    def update_search_document(
+        self,
+        table: Table,
+        backfill: bool = True,
+        changed_field_ids: Iterable[int] = (),
+    ) -> bool:
+        """
+        Recreates the trigger that fills the search document of the table based on
+        its current fields. If the search document has changed, for example because
+        a field has been added or a select option has been renamed, the search
+        document of every row is refilled in the background by the
+        `refill_search_document` task.
+
+        :param table: The table of which the search document must be updated.
+        :param backfill: Indicates whether the rows must be refilled if the search
+            document has changed.
+        :param changed_field_ids: The ids of the fields that have changed. They're
+            marked as stale until the rows have been refilled.
+        :return: Whether the search document has changed.
+        """
+
+        names = get_search_document_sql_names(table)
+        model = table.get_model()
+        document, params, _ = self.get_search_document(model)
+
+        with connection.cursor() as cursor:
+            body = cursor.mogrify(
+                sql_search_document_function_body
+                % {"column": names["column"], "document": document},
+                params,
+            ).decode()
+            cursor.execute(
+                "SELECT prosrc FROM pg_proc WHERE proname = %s",
+                [f"baserow_search_document_{table.id}"],
+            )
+            current = cursor.fetchone()
+            if current is not None and current[0] == body:
+                return False
+
+            cursor.execute(
+                sql_create_search_document_function % {**names, "body": body}
+            )
+
+        if backfill:
+            self._mark_fields_as_stale(table, changed_field_ids)
+
+        return True
+
+    def refill_search_document(self, table: Table, batch_size: Optional[int] = None):
+        """
+        Refills the search document of all the rows in batches using the current
+        trigger and clears the fields that were stale when the refill started. Just
+        like `enable`, it must not be executed inside a transaction.
+
+        :param table: The table of which the search document must be refilled.
+        :param batch_size: The amount of rows that are filled per transaction.
+        """
+
+        with transaction.atomic():
+            stale_field_ids = list(
+                Table.objects_and_trash.select_for_update()
+                .get(id=table.id)
+                .search_index_stale_field_ids
+            )
+
+        self._fill_search_document(table, batch_size)
+
+        with transaction.atomic():
+            locked_table = Table.objects_and_trash.select_for_update().get(id=table.id)
+            # Fields that have changed again while refilling are listed once more,
+            # so they stay stale until the refill of that change has finished.
+            remaining_field_ids = list(locked_table.search_index_stale_field_ids)
+            for field_id in stale_field_ids:
+                if field_id in remaining_field_ids:
+                    remaining_field_ids.remove(field_id)
+            locked_table.search_index_stale_field_ids = remaining_field_ids
+            locked_table.save(update_fields=["search_index_stale_field_ids"])
+
+        invalidate_table_in_model_cache(table.id)
+
+    def _mark_fields_as_stale(self, table: Table, field_ids: Iterable[int]):
+        """
+        Marks the provided fields as stale and schedules the refill of the search
+        document when the transaction commits.
+        """
+
+        from .tasks import refill_search_document
+
+        with transaction.atomic():
+            locked_table = Table.objects_and_trash.select_for_update().get(id=table.id)
+            locked_table.search_index_stale_field_ids += list(field_ids)
+            locked_table.save(update_fields=["search_index_stale_field_ids"])
+            table.search_index_stale_field_ids = (
+                locked_table.search_index_stale_field_ids
+            )
+
+        invalidate_table_in_model_cache(table.id)
+        transaction.on_commit(lambda: refill_search_document.delay(table.id))
+
+    def _fill_search_document(
+        self,
+        table: Table,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Fills the search document of all the rows in batches, each in its own
+        transaction.
+        """
+
+        names = get_search_document_sql_names(table)
+        model = table.get_model(field_ids=[])
+        total_rows = model.objects_and_trash.count()
+        filled_rows = 0
+        for lower, upper in get_row_id_batches(
+            connection, table.get_database_table_name(), batch_size
+        ):
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    sql_backfill_search_document_batch % names, [lower, upper]
+                )
+                filled_rows += cursor.rowcount
+
+            if progress_callback is not None:
+                progress_callback(filled_rows, total_rows)
+
+    def drop_search_document(self, table: Table):
+        """
+        Drops the trigger function of the table. This must be called when the table
+        is deleted, because the function isn't removed together with the table.
+
+        :param table: The table of which the search document function must be
+            dropped.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DROP FUNCTION IF EXISTS "
+                f"{get_search_document_sql_names(table)['function']}() CASCADE"
+            )
+
+    def _create_index(self, names: Dict[str, str]):
+        """
+        Creates the trigram index on the search document column. This is skipped if
+        the `pg_trgm` extension can't be created, in which case searching still
+        benefits from only having to match the search document column.
+        """
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                cursor.execute(sql_create_search_document_index % names)
+        except DatabaseError as e:
+            logger.warning(
+                f"The search document of {names['table']} is not indexed because the "
+                f"pg_trgm extension is not available: {e}"
+            )
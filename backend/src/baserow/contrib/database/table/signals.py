@@ -1,8 +1,12 @@
+from collections import defaultdict
+
 from django.db.models.signals import post_delete
 from django.dispatch import Signal, receiver
 
+from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.search_index import TableSearchIndexHandler
 
 table_created = Signal()
 table_updated = Signal()
@@ -13,3 +17,27 @@ tables_reordered = Signal()
 @receiver(post_delete, sender=Table)
 def invalidate_model_cache_when_table_deleted(sender, instance, **kwargs):
     invalidate_table_in_model_cache(instance.id, invalidate_related_tables=True)
+
+
+@receiver(post_delete, sender=Table)
+def drop_search_document_when_table_deleted(sender, instance, **kwargs):
+    if instance.search_index_enabled:
+        TableSearchIndexHandler().drop_search_document(instance)
+
+
+@receiver(field_signals.field_created)
+@receiver(field_signals.field_updated)
+@receiver(field_signals.field_deleted)
+@receiver(field_signals.field_restored)
+def update_search_document_when_fields_changed(sender, field, related_fields, **kwargs):
+    tables = {}
+    changed_field_ids_per_table = defaultdict(set)
+    for changed_field in [field, *related_fields]:
+        tables[changed_field.table_id] = changed_field.table
+        changed_field_ids_per_table[changed_field.table_id].add(changed_field.id)
+
+    for table_id, table in tables.items():
+        if table.search_index_enabled:
+            TableSearchIndexHandler().update_search_document(
+                table, changed_field_ids=changed_field_ids_per_table[table_id]
+            )
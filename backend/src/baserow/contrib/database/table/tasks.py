@@ -0,0 +1,22 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def refill_search_document(self, table_id: int):
+    """
+    Refills the search document of the rows of the table after its fields have
+    changed, see `TableSearchIndexHandler.update_search_document`.
+    """
+
+    from .models import Table
+    from .search_index import TableSearchIndexHandler
+
+    try:
+        table = Table.objects_and_trash.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    if not table.search_index_enabled or not table.search_index_stale_field_ids:
+        return
+
+    TableSearchIndexHandler().refill_search_document(table)
@@ -0,0 +1,14 @@
+from .fields.tasks import (
+    run_field_value_recomputes,
+    setup_periodic_field_value_recompute_tasks,
+)
+from .table.tasks import refill_search_document
+from .tokens.tasks import flush_token_usage, setup_periodic_token_usage_tasks
+
+__all__ = [
+    "run_field_value_recomputes",
+    "setup_periodic_field_value_recompute_tasks",
+    "refill_search_document",
+    "flush_token_usage",
+    "setup_periodic_token_usage_tasks",
+]
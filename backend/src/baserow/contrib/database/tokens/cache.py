@@ -0,0 +1,152 @@
+"""
+This file is responsible for caching the compiled permissions of the database API
+tokens, see `TokenHandler.get_compiled_permissions`. The compiled permissions are
+stored in the Redis backed Django cache (or in-memory cache for tests) and every
+process additionally keeps them in a bounded LRU, so that checking a permission
+doesn't require any database query.
+
+The compiled permissions depend on the permissions of the token and on the group of
+the token, for example on its members and on which of its databases and tables are
+trashed. Both the token and the group have a version stored in the
+`token_permissions_version_{token_id}` and `token_permissions_group_version_{group_id}`
+cache keys. These versions start at 0 and are incremented every time something
+changes that could influence the permissions. The compiled permissions are stored
+together with the versions they have been compiled for and are only used if those
+are still the latest versions.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+# The compiled permissions of an old version are never requested again, so they
+# don't have to be stored forever.
+TOKEN_PERMISSIONS_CACHE_TIMEOUT = 60 * 60
+LOCAL_TOKEN_PERMISSIONS_CACHE_SIZE = 10000
+
+_local_token_permissions = OrderedDict()
+_local_token_permissions_lock = threading.Lock()
+
+
+def token_permissions_version_key(token_id: int) -> str:
+    return f"token_permissions_version_{token_id}"
+
+
+def token_permissions_group_version_key(group_id: int) -> str:
+    return f"token_permissions_group_version_{group_id}"
+
+
+def token_permissions_entry_key(token_id: int, versions: Tuple[int, int]) -> str:
+    return f"token_permissions_{token_id}_{versions[0]}_{versions[1]}"
+
+
+def get_token_permissions_versions(token_id: int, group_id: int) -> Tuple[int, int]:
+    """
+    :return: The latest version of the token and of its group, which are looked up
+        with a single cache query.
+    """
+
+    token_key = token_permissions_version_key(token_id)
+    group_key = token_permissions_group_version_key(group_id)
+    versions = cache.get_many([token_key, group_key])
+    return versions.get(token_key, 0), versions.get(group_key, 0)
+
+
+def get_cached_token_permissions(
+    token_id: int, group_id: int
+) -> Tuple[Tuple[int, int], Optional[Dict[str, Any]]]:
+    """
+    :param token_id: The token to lookup the cached compiled permissions for.
+    :param group_id: The group of the token.
+    :return: The latest versions of the token and its group and the compiled
+        permissions of those versions, or None if they haven't been cached yet.
+    """
+
+    versions = get_token_permissions_versions(token_id, group_id)
+
+    with _local_token_permissions_lock:
+        entry = _local_token_permissions.get(token_id)
+        if entry is not None and entry[0] == versions:
+            _local_token_permissions.move_to_end(token_id)
+            return versions, entry[1]
+
+    permissions = cache.get(token_permissions_entry_key(token_id, versions))
+    if permissions is not None:
+        _set_local_token_permissions(token_id, versions, permissions)
+    return versions, permissions
+
+
+def set_cached_token_permissions(
+    token_id: int, versions: Tuple[int, int], permissions: Dict[str, Any]
+):
+    """
+    Stores the compiled permissions of the token for the provided versions. If the
+    token or its group has changed in the meantime, the stored permissions are never
+    used because their versions aren't the latest ones anymore.
+    """
+
+    cache.set(
+        token_permissions_entry_key(token_id, versions),
+        permissions,
+        timeout=TOKEN_PERMISSIONS_CACHE_TIMEOUT,
+    )
+    _set_local_token_permissions(token_id, versions, permissions)
+
+
+def _set_local_token_permissions(
+    token_id: int, versions: Tuple[int, int], permissions: Dict[str, Any]
+):
+    with _local_token_permissions_lock:
+        _local_token_permissions[token_id] = (versions, permissions)
+        _local_token_permissions.move_to_end(token_id)
+        while len(_local_token_permissions) > LOCAL_TOKEN_PERMISSIONS_CACHE_SIZE:
+            _local_token_permissions.popitem(last=False)
+
+
+def _increment_version(key: str):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No version has been set yet, which means that it's 0.
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def _invalidate_now_and_on_commit(invalidate: Callable[[], None]):
+    # Invalidating right away makes the change visible in the current transaction.
+    # It's invalidated again when the transaction commits, because another process
+    # could have compiled and cached the old permissions for the new version in the
+    # meantime.
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+def invalidate_token_permissions(token_ids: Iterable[int]):
+    """
+    Invalidates the cached compiled permissions of the provided tokens in all
+    processes.
+    """
+
+    token_ids = list(token_ids)
+
+    def invalidate():
+        for token_id in token_ids:
+            _increment_version(token_permissions_version_key(token_id))
+            with _local_token_permissions_lock:
+                _local_token_permissions.pop(token_id, None)
+
+    _invalidate_now_and_on_commit(invalidate)
+
+
+def invalidate_group_token_permissions(group_id: int):
+    """
+    Invalidates the cached compiled permissions of all the tokens of the provided
+    group in all processes.
+    """
+
+    _invalidate_now_and_on_commit(
+        lambda: _increment_version(token_permissions_group_version_key(group_id))
+    )
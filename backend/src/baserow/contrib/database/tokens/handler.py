@@ -1,6 +1,8 @@
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, F, IntegerField, Value, When
 from django.utils import timezone
 
+from redis.exceptions import LockNotOwnedError
 from rest_framework.request import Request
 
 from baserow.core.utils import random_string
@@ -8,6 +10,11 @@ from baserow.contrib.database.models import Database, Table
 from baserow.contrib.database.exceptions import DatabaseDoesNotBelongToGroup
 from baserow.contrib.database.table.exceptions import TableDoesNotBelongToGroup
 
+from .cache import (
+    get_cached_token_permissions,
+    invalidate_token_permissions,
+    set_cached_token_permissions,
+)
 from .exceptions import (
     TokenDoesNotExist,
     MaximumUniqueTokenTriesError,
@@ -17,6 +24,23 @@ from .exceptions import (
 from .models import Token, TokenPermission
 
 
+# The set containing the ids of the tokens of which the usage must be flushed.
+USED_TOKEN_IDS_CACHE_KEY = "token_usage_used_token_ids"
+FLUSH_TOKEN_USAGE_LOCK_CACHE_KEY = "token_usage_flush_lock"
+FLUSH_TOKEN_USAGE_LOCK_TIMEOUT = 60 * 10
+
+
+def _get_redis_client():
+    """
+    Returns the Redis client of the cache if it's backed by Redis, so that the used
+    token ids can be stored in a Redis set. Other cache backends, like the in-memory
+    cache used for tests, don't have one.
+    """
+
+    get_client = getattr(getattr(cache, "client", None), "get_client", None)
+    return get_client(write=True) if get_client is not None else None
+
+
 class TokenHandler:
     def get_by_key(self, key):
         """
@@ -309,6 +333,9 @@ class TokenHandler:
         if len(to_create) > 0:
             TokenPermission.objects.bulk_create(to_create)
 
+        token._compiled_permissions = None
+        invalidate_token_permissions([token.id])
+
     def has_table_permission(self, token, type_name, table):
         """
         Checks if the provided token has access to perform an operation on the provided
@@ -330,7 +357,8 @@ class TokenHandler:
         if token.group_id != table.database.group_id:
             return False
 
-        if not table.database.group.has_user(token.user):
+        permissions = self.get_compiled_permissions(token)
+        if not permissions["user_in_group"]:
             return False
 
         if isinstance(type_name, str):
@@ -338,13 +366,58 @@ class TokenHandler:
         else:
             type_names = type_name
 
-        return TokenPermission.objects.filter(
-            Q(database__table=table)
-            | Q(table_id=table.id)
-            | Q(table__isnull=True, database__isnull=True),
-            token=token,
-            type__in=type_names,
-        ).exists()
+        for type_name in type_names:
+            type_permissions = permissions["types"].get(type_name)
+            if type_permissions is not None and (
+                type_permissions["all"]
+                or table.database_id in type_permissions["database_ids"]
+                or table.id in type_permissions["table_ids"]
+            ):
+                return True
+
+        return False
+
+    def get_compiled_permissions(self, token):
+        """
+        Returns the permissions of the token compiled to a dict, so that checking if
+        the token has permission to a table doesn't require any query. It contains
+        whether the token's user still belongs to the group and, per operation,
+        whether all the tables in the group are allowed and the ids of the allowed
+        databases and tables. The compiled permissions are cached in every process and
+        in Redis until they are invalidated, see the `tokens/cache.py` module. They
+        are also stored on the token instance, so that checking the permissions of
+        many tables during one request requires only one cache lookup.
+
+        :param token: The token instance.
+        :type token: Token
+        :return: The compiled permissions of the token.
+        :rtype: dict
+        """
+
+        if getattr(token, "_compiled_permissions", None) is not None:
+            return token._compiled_permissions
+
+        versions, permissions = get_cached_token_permissions(token.id, token.group_id)
+        if permissions is None:
+            permissions = {
+                "user_in_group": token.group.has_user(token.user),
+                "types": {},
+            }
+            for permission in TokenPermission.objects.filter(token=token):
+                type_permissions = permissions["types"].setdefault(
+                    permission.type,
+                    {"all": False, "database_ids": set(), "table_ids": set()},
+                )
+                if permission.table_id is not None:
+                    type_permissions["table_ids"].add(permission.table_id)
+                elif permission.database_id is not None:
+                    type_permissions["database_ids"].add(permission.database_id)
+                else:
+                    type_permissions["all"] = True
+            set_cached_token_permissions(token.id, versions, permissions)
+
+        token._compiled_permissions = permissions
+        return permissions
 
     def check_table_permissions(
         self, request_or_token, type_name, table, force_check=False
@@ -418,12 +491,20 @@ class TokenHandler:
                 "The user is not authorized to delete the " "token."
             )
 
+        token_id = token.id
         token.delete()
+        cache.delete_many(self._get_token_usage_cache_keys(token_id))
+        invalidate_token_permissions([token_id])
+
+    def _get_token_usage_cache_keys(self, token_id):
+        return f"token_usage_calls__{token_id}", f"token_usage_last_call__{token_id}"
 
     def update_token_usage(self, token):
         """
         Increases the amount of handled calls and updates the last call timestamp of
-        the token.
+        the token. To avoid writing the token row on every request, the usage is
+        accumulated in the cache and periodically written to the database by the
+        `flush_token_usage` method, so the stored usage is eventually consistent.
 
         :param token: The token instance that needs to be updated.
         :param token: Token
@@ -433,6 +514,146 @@ class TokenHandler:
 
         token.handled_calls += 1
         token.last_call = timezone.now()
-        token.save()
+
+        calls_key, last_call_key = self._get_token_usage_cache_keys(token.id)
+        try:
+            cache.incr(calls_key)
+        except ValueError:
+            # No calls have been accumulated yet. If another request has created the
+            # key in the meantime, we must still increment it.
+            if not cache.add(calls_key, 1, timeout=None):
+                cache.incr(calls_key)
+        cache.set(last_call_key, token.last_call, timeout=None)
+        # The token id is added after incrementing the calls. If a flush pops the id
+        # in between, the calls are still written by that flush.
+        self._add_used_token_id(token.id)
 
         return token
+
+    def _add_used_token_id(self, token_id):
+        redis_client = _get_redis_client()
+        if redis_client is not None:
+            redis_client.sadd(cache.client.make_key(USED_TOKEN_IDS_CACHE_KEY), token_id)
+        else:
+            used_token_ids = cache.get(USED_TOKEN_IDS_CACHE_KEY, set())
+            used_token_ids.add(token_id)
+            cache.set(USED_TOKEN_IDS_CACHE_KEY, used_token_ids, timeout=None)
+
+    def _pop_used_token_ids(self, count):
+        """
+        Removes and returns at most `count` ids of tokens that have been used since
+        they were last popped.
+        """
+
+        redis_client = _get_redis_client()
+        if redis_client is not None:
+            return [
+                int(token_id)
+                for token_id in redis_client.spop(
+                    cache.client.make_key(USED_TOKEN_IDS_CACHE_KEY), count
+                )
+            ]
+
+        used_token_ids = list(cache.get(USED_TOKEN_IDS_CACHE_KEY, set()))
+        cache.set(USED_TOKEN_IDS_CACHE_KEY, set(used_token_ids[count:]), timeout=None)
+        return used_token_ids[:count]
+
+    def flush_token_usage(self, chunk_size=1000):
+        """
+        Writes the token usage that has been accumulated in the cache by the
+        `update_token_usage` method to the database. Only the tokens that have been
+        used since the last flush are looked at and the handled calls of the tokens
+        in a chunk are incremented with a single query. Flushes don't run at the
+        same time, because they would both write the same calls.
+
+        :param chunk_size: The amount of tokens of which the usage is read from the
+            cache and written to the database at once.
+        :type chunk_size: int
+        :return: The amount of calls that have been written to the database.
+        :rtype: int
+        """
+
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(
+                FLUSH_TOKEN_USAGE_LOCK_CACHE_KEY,
+                timeout=FLUSH_TOKEN_USAGE_LOCK_TIMEOUT,
+            )
+            # Another flush is already writing the usage, which will include the
+            # calls accumulated until now.
+            if not cache_lock.acquire(blocking=False):
+                return 0
+
+        try:
+            flushed_calls = 0
+            while True:
+                token_ids = self._pop_used_token_ids(chunk_size)
+                if len(token_ids) == 0:
+                    break
+                try:
+                    flushed_calls += self._flush_token_usage_chunk(token_ids)
+                except Exception:
+                    for token_id in token_ids:
+                        self._add_used_token_id(token_id)
+                    raise
+            return flushed_calls
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    # The lock has expired, which means that the flush took longer
+                    # than the timeout.
+                    pass
+
+    def _flush_token_usage_chunk(self, token_ids):
+        keys = {
+            token_id: self._get_token_usage_cache_keys(token_id)
+            for token_id in token_ids
+        }
+        cached_calls = cache.get_many([calls_key for calls_key, _ in keys.values()])
+        used_token_ids = [
+            token_id
+            for token_id, (calls_key, _) in keys.items()
+            if cached_calls.get(calls_key)
+        ]
+        if len(used_token_ids) == 0:
+            return 0
+
+        cached_last_calls = cache.get_many(
+            [keys[token_id][1] for token_id in used_token_ids]
+        )
+        calls = {
+            token_id: cached_calls[keys[token_id][0]] for token_id in used_token_ids
+        }
+        last_calls = {
+            token_id: cached_last_calls[keys[token_id][1]]
+            for token_id in used_token_ids
+            if keys[token_id][1] in cached_last_calls
+        }
+        Token.objects.filter(id__in=used_token_ids).update(
+            handled_calls=F("handled_calls")
+            + Case(
+                *[
+                    When(id=token_id, then=Value(token_calls))
+                    for token_id, token_calls in calls.items()
+                ],
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+            last_call=Case(
+                *[
+                    When(id=token_id, then=Value(last_call))
+                    for token_id, last_call in last_calls.items()
+                ],
+                default=F("last_call"),
+                output_field=DateTimeField(),
+            ),
+        )
+
+        # Only subtract the calls that have been written, so that calls which
+        # have been accumulated in the meantime are written by the next flush.
+        for token_id, token_calls in calls.items():
+            cache.decr(keys[token_id][0], token_calls)
+
+        return sum(calls.values())
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from baserow.contrib.database.models import Database, Table
+from baserow.core.models import Group, GroupUser
+
+from .cache import invalidate_group_token_permissions
+
+
+@receiver(post_save, sender=GroupUser)
+@receiver(post_delete, sender=GroupUser)
+def invalidate_token_permissions_when_group_user_changed(sender, instance, **kwargs):
+    invalidate_group_token_permissions(instance.group_id)
+
+
+@receiver(post_save, sender=Group)
+def invalidate_token_permissions_when_group_changed(sender, instance, **kwargs):
+    invalidate_group_token_permissions(instance.id)
+
+
+@receiver(post_save, sender=Database)
+def invalidate_token_permissions_when_database_changed(sender, instance, **kwargs):
+    invalidate_group_token_permissions(instance.group_id)
+
+
+@receiver(post_save, sender=Table)
+def invalidate_token_permissions_when_table_changed(sender, instance, **kwargs):
+    # The table could have been trashed, restored or moved to another database.
+    invalidate_group_token_permissions(instance.database.group_id)
@@ -0,0 +1,26 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def flush_token_usage(self):
+    """
+    Writes the API token usage that has been accumulated in the cache to the
+    database.
+    """
+
+    from .handler import TokenHandler
+
+    TokenHandler().flush_token_usage()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_token_usage_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(seconds=settings.BASEROW_TOKEN_USAGE_FLUSH_INTERVAL_SECONDS),
+        flush_token_usage.s(),
+    )
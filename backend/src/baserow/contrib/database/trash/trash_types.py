@@ -1,9 +1,11 @@
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import connection
 
 from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.db.sql_queries import sql_delete_trashed_rows
 from baserow.contrib.database.fields.dependencies.update_collector import (
     CachingFieldUpdateCollector,
 )
@@ -101,6 +103,68 @@ class TableTrashableItemType(TrashableItemType):
 
         trashed_item.delete()
 
+    @property
+    def permanent_deletion_batch_size(self) -> int:
+        return settings.BASEROW_TRASH_TABLE_DELETION_BATCH_SIZE
+
+    def permanently_delete_items(
+        self,
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> List[Tuple[int, Table]]:
+        """
+        Drops the schemas of all the trashed tables in one schema editor and then
+        deletes their instances with a single query.
+        """
+
+        tables = list(
+            Table.trash.filter(
+                id__in=[trash_entry.trash_item_id for trash_entry in trash_entries]
+            )
+        )
+        if len(tables) == 0:
+            return []
+
+        # Both sides of a link row field share the same through table. If both
+        # tables are in the batch, it must only be dropped once.
+        dropped_db_tables = set()
+        with safe_django_schema_editor() as schema_editor:
+            for table in tables:
+                if (
+                    trash_item_lookup_cache is not None
+                    and "row_table_model_cache" in trash_item_lookup_cache
+                ):
+                    trash_item_lookup_cache["row_table_model_cache"].pop(table.id, None)
+                self._delete_model_once(
+                    schema_editor, table.get_model(), dropped_db_tables
+                )
+
+        deleted = [(table.id, table) for table in tables]
+        Table.objects_and_trash.filter(id__in=[table.id for table in tables]).delete()
+        return deleted
+
+    def _delete_model_once(self, schema_editor, model, dropped_db_tables):
+        """
+        Drops the table of the model and its many to many through tables, like
+        `schema_editor.delete_model`, but skips the tables that are in the provided
+        set. The names of the dropped tables are added to the set.
+        """
+
+        for field in model._meta.local_many_to_many:
+            through = field.remote_field.through
+            if (
+                through._meta.auto_created
+                and through._meta.db_table not in dropped_db_tables
+            ):
+                schema_editor.delete_model(through)
+                dropped_db_tables.add(through._meta.db_table)
+
+        schema_editor.execute(
+            schema_editor.sql_delete_table
+            % {"table": schema_editor.quote_name(model._meta.db_table)}
+        )
+        dropped_db_tables.add(model._meta.db_table)
+
     # noinspection PyMethodMayBeStatic
     def trash(self, item_to_trash: Table, requesting_user: User):
         model = item_to_trash.get_model()
@@ -261,6 +325,47 @@ class RowTrashableItemType(TrashableItemType):
     def permanently_delete_item(self, row, trash_item_lookup_cache=None):
         row.delete()
 
+    @property
+    def permanent_deletion_batch_size(self) -> int:
+        return settings.BASEROW_TRASH_ROW_DELETION_BATCH_SIZE
+
+    def permanently_delete_items(
+        self,
+        trash_entries: List[TrashEntry],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> List[Tuple[int, GeneratedTableModel]]:
+        """
+        Deletes all the trashed rows, which all belong to the same table, with a
+        single query instead of deleting them one by one. Their relations in the
+        through tables of the many to many fields are deleted as well, just like
+        Django does when deleting a single row.
+        """
+
+        try:
+            model = self._get_cached_table_model(
+                trash_entries[0].parent_trash_item_id, trash_item_lookup_cache
+            )
+        except TrashItemDoesNotExist:
+            return []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql_delete_trashed_rows
+                % {"table": connection.ops.quote_name(model._meta.db_table)},
+                [[trash_entry.trash_item_id for trash_entry in trash_entries]],
+            )
+            deleted_row_ids = [row[0] for row in cursor.fetchall()]
+
+        if len(deleted_row_ids) > 0:
+            for many_to_many_field in model._meta.many_to_many:
+                through_model = many_to_many_field.remote_field.through
+                delete_qs = through_model.objects.filter(
+                    **{f"{many_to_many_field.m2m_field_name()}__in": deleted_row_ids}
+                )
+                delete_qs._raw_delete(delete_qs.db)
+
+        return [(row_id, model(id=row_id, trashed=True)) for row_id in deleted_row_ids]
+
     def lookup_trashed_item(
         self, trashed_entry: TrashEntry, trash_item_lookup_cache=None
     ):
@@ -275,21 +380,9 @@ class RowTrashableItemType(TrashableItemType):
         :return: An instance of the model_class with trashed_item_id
         """
 
-        # Cache the expensive table.get_model function call if we are looking up
-        # many trash items at once.
-        if trash_item_lookup_cache is not None:
-            model_cache = trash_item_lookup_cache.setdefault(
-                "row_table_model_cache", {}
-            )
-            try:
-                model = model_cache[trashed_entry.parent_trash_item_id]
-            except KeyError:
-                model = model_cache.setdefault(
-                    trashed_entry.parent_trash_item_id,
-                    self._get_table_model(trashed_entry.parent_trash_item_id),
-                )
-        else:
-            model = self._get_table_model(trashed_entry.parent_trash_item_id)
+        model = self._get_cached_table_model(
+            trashed_entry.parent_trash_item_id, trash_item_lookup_cache
+        )
 
         try:
             return model.trash.get(id=trashed_entry.trash_item_id)
@@ -300,6 +393,18 @@ class RowTrashableItemType(TrashableItemType):
         table = self._get_table(table_id)
         return table.get_model()
 
+    def _get_cached_table_model(self, table_id, trash_item_lookup_cache=None):
+        # Cache the expensive table.get_model function call if we are looking up
+        # many trash items at once.
+        if trash_item_lookup_cache is None:
+            return self._get_table_model(table_id)
+
+        model_cache = trash_item_lookup_cache.setdefault("row_table_model_cache", {})
+        try:
+            return model_cache[table_id]
+        except KeyError:
+            return model_cache.setdefault(table_id, self._get_table_model(table_id))
+
 
 class RowsTrashableItemType(TrashableItemType):
     type = "rows"
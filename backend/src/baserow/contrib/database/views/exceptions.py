@@ -141,6 +141,13 @@ class GridViewAggregationDoesNotSupportField(Exception):
         )
 
 
+class AggregationDeltaNotApplicable(Exception):
+    """
+    Raised when the cached result of an aggregation can't be updated with the
+    aggregation of the changed rows and must be recomputed.
+    """
+
+
 class ViewDecorationDoesNotExist(Exception):
     """Raised when trying to get a view decoration that does not exist."""
 
@@ -2,6 +2,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from copy import deepcopy
 from typing import (
+    Callable,
     Dict,
     Any,
     List,
@@ -21,8 +22,9 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.cache import cache
-from django.db import models as django_models
-from django.db.models import F, Count
+from django.db import connection, connections, transaction, models as django_models
+from django.db.models import Count, Exists, F, OuterRef, prefetch_related_objects
+from django.db.models.expressions import RawSQL
 from django.db.models.query import QuerySet
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
@@ -52,6 +54,7 @@ from .exceptions import (
     ViewSortFieldNotSupported,
     ViewDoesNotSupportFieldOptions,
     FieldAggregationNotSupported,
+    AggregationDeltaNotApplicable,
     CannotShareViewTypeError,
     ViewDecorationNotSupported,
     ViewDecorationDoesNotExist,
@@ -90,6 +93,7 @@ FieldOptionsDict = Dict[int, Dict[str, Any]]
 
 class ViewHandler:
     PUBLIC_VIEW_TOKEN_ALGORITHM = "HS256"  # nosec
+    ROW_COUNT_CACHE_NAME = "row_count"
 
     def get_view(
         self,
@@ -228,7 +232,7 @@ class ViewHandler:
         view = set_allowed_attrs(view_values, allowed_fields, view)
         view.save()
 
-        if "filters_disabled" in view_values:
+        if "filters_disabled" in view_values or "filter_type" in view_values:
             view_type.after_filter_update(view)
 
         view_updated.send(self, view=view, user=user)
@@ -432,6 +436,8 @@ class ViewHandler:
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache_for_fields(updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -449,6 +455,8 @@ class ViewHandler:
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache_for_fields(updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_update(updated_fields)
@@ -666,6 +674,10 @@ class ViewHandler:
         view_filter.type = type_name
         view_filter.save()
 
+        # Call view type hooks
+        view_type = view_type_registry.get_by_model(view_filter.view.specific_class)
+        view_type.after_filter_update(view_filter.view)
+
         view_filter_updated.send(self, view_filter=view_filter, user=user)
 
         return view_filter
@@ -1243,6 +1255,212 @@ class ViewHandler:
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _get_row_count_table_version_cache_key(self, table_id: int):
+        """
+        Returns the cache key of the version that is incremented every time rows are
+        created or deleted in the table with the specified id.
+        """
+
+        return f"row_count_table_version__{table_id}"
+
+    def clear_row_count_cache(self, views: Union[View, Iterable[View]]):
+        """
+        Increments the cached row count version of the provided views. This must be
+        called when a change of the row values could influence which rows match the
+        view filters. Changes to the filters themselves are part of the cached version
+        and don't need to be cleared.
+        """
+
+        if isinstance(views, View):
+            views = [views]
+
+        for view in views:
+            self.clear_aggregation_cache(view, self.ROW_COUNT_CACHE_NAME)
+
+    def clear_row_count_cache_for_fields(self, fields: Iterable[Field]):
+        """
+        Invalidates the cached row count of all the views having a filter on one of
+        the provided fields, because changing the values of those fields could change
+        the rows matching the filters.
+        """
+
+        views = View.objects.filter(viewfilter__field__in=fields).distinct()
+        self.clear_row_count_cache(views)
+
+    def clear_table_row_count_cache(self, table_id: int):
+        """
+        Invalidates the cached row count of all the views of the table at once.
+        Called when rows are created, restored or deleted.
+        """
+
+        cache_key = self._get_row_count_table_version_cache_key(table_id)
+        try:
+            cache.incr(cache_key, 1)
+        except ValueError:
+            cache.set(cache_key, 2)
+
+    def get_estimated_row_count(self, table: Table) -> Optional[int]:
+        """
+        Returns the row count of the table as estimated by the PostgreSQL planner
+        statistics. This doesn't scan the table, but the value can deviate from the
+        real count until the table is analyzed again.
+
+        :param table: The table to estimate the row count for.
+        :return: The estimated row count or None if there are no statistics yet.
+        """
+
+        with connections[settings.USER_TABLE_DATABASE].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [table.get_database_table_name()],
+            )
+            result = cursor.fetchone()
+
+        # A table that has never been analyzed has a negative or zero estimate
+        # depending on the PostgreSQL version.
+        if result is None or result[0] <= 0:
+            return None
+
+        return int(result[0])
+
+    def get_view_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        search: Optional[str] = None,
+        allow_estimate: bool = False,
+    ) -> Tuple[int, bool]:
+        """
+        Returns the amount of rows of the provided view queryset. Unless a search is
+        provided, the exact count is cached per view if it exceeds the
+        `BASEROW_ROW_COUNT_CACHE_THRESHOLD` setting and invalidated with the same
+        version scheme as the field aggregations. If an estimate is allowed and the
+        view doesn't filter the rows, the planner estimate is returned instead when
+        the table is larger than the `BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD` setting.
+
+        :param view: The view related to the queryset.
+        :param queryset: The filtered and optionally searched queryset of the view.
+        :param search: The search string that has been applied to the queryset.
+        :param allow_estimate: Whether an approximate count may be returned.
+        :return: A tuple containing the count and whether the count is approximate.
+        """
+
+        if search:
+            return queryset.count(), False
+
+        if allow_estimate:
+            view_type = view_type_registry.get_by_model(view.specific_class)
+            is_filtered = (
+                view_type.can_filter
+                and not view.filters_disabled
+                and view.viewfilter_set.exists()
+            )
+            if not is_filtered:
+                estimate = self.get_estimated_row_count(view.table)
+                if (
+                    estimate is not None
+                    and estimate >= settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD
+                ):
+                    return estimate, True
+
+        # The filters are part of the version, so that any change to them
+        # automatically results in a new count.
+        filters_signature = self._get_filters_signature(view)
+        value_key = self._get_aggregation_value_cache_key(
+            view, self.ROW_COUNT_CACHE_NAME
+        )
+        version_key = self._get_aggregation_version_cache_key(
+            view, self.ROW_COUNT_CACHE_NAME
+        )
+        table_version_key = self._get_row_count_table_version_cache_key(view.table_id)
+        cached = cache.get_many([value_key, version_key, table_version_key])
+
+        # The version is fetched before counting so that a concurrent change, which
+        # increments the version, results in a stale cache entry instead of a wrong
+        # one.
+        version = (
+            cached.get(version_key, 1),
+            cached.get(table_version_key, 1),
+            filters_signature,
+        )
+        cached_value = cached.get(value_key, {"version": None})
+
+        if cached_value["version"] == version:
+            return cached_value["value"], False
+
+        count = queryset.count()
+
+        # Counting a small amount of rows is cheap, so only the counts that are
+        # expensive to compute are cached.
+        if count >= settings.BASEROW_ROW_COUNT_CACHE_THRESHOLD:
+            cache.set(value_key, {"value": count, "version": version})
+
+        return count, False
+
+    def _get_filters_signature(self, view: View) -> Tuple:
+        """
+        Returns a hashable representation of the filters of the view. It changes
+        every time a filter is created, updated or deleted.
+        """
+
+        return (
+            view.filter_type,
+            view.filters_disabled,
+            tuple(
+                view.viewfilter_set.order_by("id").values_list(
+                    "id", "field_id", "type", "value"
+                )
+            ),
+        )
+
+    def get_cached_view_rows_value(
+        self,
+        view: View,
+        name: str,
+        compute: Callable[[], Any],
+        signature: Optional[Tuple] = None,
+    ) -> Any:
+        """
+        Returns a value computed from the filtered rows of the view, like the row
+        count of every group, from the cache or computes and caches it. The value
+        is invalidated when rows are created or deleted, when the filters or the
+        provided signature change and when the row count of the view is cleared. If
+        the value also depends on the values of other fields, it must be cleared
+        with `clear_aggregation_cache(view, name)` when those change.
+
+        :param view: The view of which the value is computed.
+        :param name: The name under which the value is cached.
+        :param compute: Function that computes the value if it isn't cached.
+        :param signature: Optionally, anything else the value depends on.
+        :return: The cached or computed value.
+        """
+
+        value_key = self._get_aggregation_value_cache_key(view, name)
+        version_key = self._get_aggregation_version_cache_key(view, name)
+        row_count_version_key = self._get_aggregation_version_cache_key(
+            view, self.ROW_COUNT_CACHE_NAME
+        )
+        table_version_key = self._get_row_count_table_version_cache_key(view.table_id)
+        cached = cache.get_many(
+            [value_key, version_key, row_count_version_key, table_version_key]
+        )
+
+        version = (
+            cached.get(version_key, 1),
+            cached.get(row_count_version_key, 1),
+            cached.get(table_version_key, 1),
+            self._get_filters_signature(view),
+            signature,
+        )
+        cached_value = cached.get(value_key, {"version": None})
+
+        if cached_value["version"] == version:
+            return cached_value["value"]
+
+        value = compute()
+        cache.set(value_key, {"value": value, "version": version})
+        return value
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -1399,6 +1617,34 @@ class ViewHandler:
 
         return values
 
+    def get_incremental_aggregations_updater(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: Iterable[int],
+        rows_exist: bool = True,
+    ) -> Union["IncrementalViewAggregationsUpdater", "NoopViewAggregationsUpdater"]:
+        """
+        Returns an IncrementalViewAggregationsUpdater object which can apply the
+        changes made to the provided rows directly to the cached aggregation values
+        of the views in the table. It must be created before the rows are updated or
+        deleted and right after they have been created.
+
+        :param table: The table the rows are in.
+        :param model: The model of the table including all fields.
+        :param row_ids: The ids of the rows that are changed.
+        :param rows_exist: Indicates whether the rows already existed before the
+            change. Must be False if the rows have just been created.
+        :return: The updater where `rows_changed` must be called after the change.
+            If none of the views has a valid cached incremental aggregation, an
+            updater that doesn't do anything is returned.
+        """
+
+        updater = IncrementalViewAggregationsUpdater(table, model, row_ids, rows_exist)
+        if not updater.has_cached_aggregations:
+            return NoopViewAggregationsUpdater()
+        return updater
+
     def get_field_aggregations(
         self,
         view: View,
@@ -1791,6 +2037,9 @@ class CachingPublicViewRowChecker:
     upfront for a specific table which public views are always visible, which public
     views can have row check results cached for and finally will pre-construct and
     reuse querysets for performance reasons.
+
+    The filters of all the public views are checked for a batch of rows in a single
+    query which annotates every row with one boolean per view.
     """
 
     def __init__(
@@ -1800,6 +2049,7 @@ class CachingPublicViewRowChecker:
         only_include_views_which_want_realtime_events: bool,
         updated_field_ids: Optional[Iterable[int]] = None,
     ):
+        self._model = model
         self._public_views = (
             table.view_set.filter(public=True).prefetch_related("viewfilter_set").all()
         )
@@ -1807,6 +2057,7 @@ class CachingPublicViewRowChecker:
         self._views_with_filters = []
         self._always_visible_views = []
         self._view_row_check_cache = defaultdict(dict)
+        self._check_rows_visible_queries = {}
         handler = ViewHandler()
         for view in self._public_views:
             if only_include_views_which_want_realtime_events:
@@ -1842,17 +2093,13 @@ class CachingPublicViewRowChecker:
         :param row: A row in the checkers table.
         :return: A list of views where the row is visible for this checkers table.
         """
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
+
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view([row])
+        views = [
+            view
+            for view, _, _ in self._views_with_filters
+            if row.id in visible_row_ids_per_view[view.id]
+        ]
 
         return views + self._always_visible_views
 
@@ -1872,26 +2119,12 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
+        visible_row_ids_per_view = self._get_visible_row_ids_per_view(rows)
         visible_views_rows = []
-        row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
-
-            else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        for view, _, _ in self._views_with_filters:
+            visible_ids = visible_row_ids_per_view[view.id]
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -1900,15 +2133,93 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _get_visible_row_ids_per_view(self, rows) -> Dict[int, Set[int]]:
+        """
+        Returns the ids of the provided rows that are visible in each of the views
+        with filters. The cached results are used for the views of which the checks
+        can be cached, the others are all checked together in a single query.
+        """
+
+        row_ids = {row.id for row in rows}
+        visible_row_ids_per_view = {}
+        views_to_check = []
+        for view, filter_qs, can_use_cache in self._views_with_filters:
+            cache = self._view_row_check_cache[view.id]
+            if can_use_cache and all(row_id in cache for row_id in row_ids):
+                visible_row_ids_per_view[view.id] = {
+                    row_id for row_id in row_ids if cache[row_id]
+                }
+            else:
+                views_to_check.append((view, filter_qs, can_use_cache))
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
-        )
+        if len(views_to_check) == 0:
+            return visible_row_ids_per_view
+
+        checked_row_ids_per_view = self._check_rows_visible(views_to_check, row_ids)
+        for view, _, can_use_cache in views_to_check:
+            visible_ids = checked_row_ids_per_view[view.id]
+            if can_use_cache:
+                for row_id in row_ids:
+                    self._view_row_check_cache[view.id][row_id] = row_id in visible_ids
+            visible_row_ids_per_view[view.id] = visible_ids
+
+        return visible_row_ids_per_view
+
+    def _check_rows_visible(self, views, row_ids) -> Dict[int, Set[int]]:
+        """
+        Checks in which of the provided views the rows are visible with one query.
+        Every row is annotated with an `EXISTS` subquery per view that applies the
+        filters of that view, so that the joins and aggregates of the filters of
+        one view can't affect the others.
+        """
+
+        sql, params, row_ids_index = self._get_check_rows_visible_query(views)
+        params = list(params)
+        params[row_ids_index] = list(row_ids)
+
+        visible_row_ids_per_view = {view.id: set() for view, _, _ in views}
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            for row_id, *visible in cursor.fetchall():
+                for (view, _, _), is_visible in zip(views, visible):
+                    if is_visible:
+                        visible_row_ids_per_view[view.id].add(row_id)
+
+        return visible_row_ids_per_view
+
+    def _get_check_rows_visible_query(self, views) -> Tuple[str, Tuple, int]:
+        """
+        Compiles the query that checks the visibility of rows in the provided views
+        once, because compiling the filters of many views takes longer than running
+        the query. The row ids are passed in as an array parameter, of which the
+        index in the parameters is returned so that it can be replaced.
+        """
+
+        key = tuple(view.id for view, _, _ in views)
+        if key not in self._check_rows_visible_queries:
+            row_ids_placeholder = []
+            annotations = {
+                f"public_view_{view.id}_visible": Exists(
+                    filter_qs.filter(id=OuterRef("id"))
+                )
+                for view, filter_qs, _ in views
+            }
+            queryset = (
+                self._model.objects_and_trash.filter(
+                    id__in=RawSQL("SELECT unnest(%s::int[])", [row_ids_placeholder])
+                )
+                .annotate(**annotations)
+                .values("id", *annotations.keys())
+            )
+            sql, params = queryset.query.sql_with_params()
+            row_ids_index = next(
+                index
+                for index, param in enumerate(params)
+                if param is row_ids_placeholder
+            )
+            self._check_rows_visible_queries[key] = (sql, params, row_ids_index)
+
+        return self._check_rows_visible_queries[key]
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -1924,3 +2235,259 @@ class CachingPublicViewRowChecker:
         # filters and so the result of the first check will be still
         # valid for any subsequent checks.
         return True
+
+
+class NoopViewAggregationsUpdater:
+    """
+    Returned by `ViewHandler.get_incremental_aggregations_updater` when there are no
+    cached incremental aggregations to update, so that changing rows doesn't cost
+    any extra queries.
+    """
+
+    def rows_changed(self, rows_exist: bool = True):
+        pass
+
+
+class IncrementalViewAggregationsUpdater:
+    """
+    A helper class to apply the changes made to some rows directly to the cached
+    aggregation values of the views in a table, so that they don't have to be
+    recomputed over all the rows of the view after every change. The aggregations of
+    the changed rows are computed before and after the change and are combined
+    with the cached value by the `apply_delta` method of the incremental aggregation
+    types once the transaction has been committed.
+
+    The aggregation versions are bumped as usual by `field_value_updated`, which
+    invalidates the cache if a delta can't be applied. A delta is only applied if
+    the cached value was valid right before the change and the version has only been
+    bumped once since, otherwise the value is recomputed on the next read.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: Iterable[int],
+        rows_exist: bool = True,
+    ):
+        self._model = model
+        self._row_ids = list(row_ids)
+        self._handler = ViewHandler()
+        self._aggregations = self._get_incremental_aggregations(table)
+        self._previous_versions = {}
+        self._removed_values = {}
+
+        if not self._aggregations:
+            return
+
+        cached = self._get_cached_aggregations()
+        for view, aggregations in self._aggregations.items():
+            for field, _ in aggregations:
+                value, version = self._get_cached(cached, view, field.db_column)
+                # Rows that have just been created have already bumped the
+                # version, the previous value must have been valid right before.
+                if not rows_exist:
+                    version -= 1
+                if value["version"] == version:
+                    self._previous_versions[(view, field.db_column)] = version
+
+        # Only the views with a valid cached value are aggregated before and after
+        # the change, the others are recomputed on the next read anyway.
+        self._aggregations = {
+            view: [
+                (field, aggregation_type)
+                for field, aggregation_type in aggregations
+                if (view, field.db_column) in self._previous_versions
+            ]
+            for view, aggregations in self._aggregations.items()
+        }
+        self._aggregations = {
+            view: aggregations
+            for view, aggregations in self._aggregations.items()
+            if aggregations
+        }
+        prefetch_related_objects(list(self._aggregations.keys()), "viewfilter_set")
+
+        if rows_exist and self._aggregations:
+            self._removed_values = self._aggregate_rows()
+
+    @property
+    def has_cached_aggregations(self) -> bool:
+        return len(self._previous_versions) > 0
+
+    def _get_incremental_aggregations(self, table):
+        aggregations = defaultdict(list)
+
+        for view_type in view_type_registry.get_all():
+            if not view_type.can_aggregate_field:
+                continue
+
+            table_aggregations = view_type.get_table_aggregations(table)
+            for view, view_aggregations in table_aggregations.items():
+                for field_instance, aggregation_type_name in view_aggregations:
+                    aggregation_type = view_aggregation_type_registry.get(
+                        aggregation_type_name
+                    )
+                    if (
+                        aggregation_type.incremental
+                        and field_instance.id in self._model._field_objects
+                    ):
+                        field = self._model._field_objects[field_instance.id]["field"]
+                        aggregations[view].append((field, aggregation_type))
+
+        return aggregations
+
+    def _get_cached_aggregations(self):
+        keys = []
+        for view, aggregations in self._aggregations.items():
+            for field, _ in aggregations:
+                keys += [
+                    self._handler._get_aggregation_value_cache_key(
+                        view, field.db_column
+                    ),
+                    self._handler._get_aggregation_version_cache_key(
+                        view, field.db_column
+                    ),
+                ]
+        return cache.get_many(keys)
+
+    def _get_cached(self, cached, view, name):
+        value = cached.get(
+            self._handler._get_aggregation_value_cache_key(view, name), {"version": 0}
+        )
+        version = cached.get(
+            self._handler._get_aggregation_version_cache_key(view, name), 1
+        )
+        return value, version
+
+    def _aggregate_rows(self):
+        """
+        Computes the aggregations of the changed rows for every view which has at
+        least one valid cached aggregation value. The view filters are applied, so
+        rows that aren't visible in the view are not taken into account.
+        """
+
+        values = {}
+
+        for view, aggregations in self._aggregations.items():
+            aggregation_dict = {}
+            for field, aggregation_type in aggregations:
+                field_name = field.db_column
+                if (view, field_name) in self._previous_versions:
+                    aggregation_dict[field_name] = aggregation_type.get_aggregation(
+                        field_name, self._model._meta.get_field(field_name), field
+                    )
+
+            if aggregation_dict:
+                queryset = self._model.objects.filter(id__in=self._row_ids)
+                queryset = self._handler.apply_filters(view, queryset)
+                values[view.id] = queryset.aggregate(**aggregation_dict)
+
+        return values
+
+    def rows_changed(self, rows_exist: bool = True):
+        """
+        Must be called after the rows have been changed and
+        `ViewHandler.field_value_updated` has been called. Computes the aggregations
+        of the changed rows and schedules the update of the cached values for when
+        the transaction is committed.
+
+        :param rows_exist: Indicates whether the rows still exist after the change.
+            Must be False if the rows have been deleted.
+        """
+
+        if not self._previous_versions:
+            return
+
+        cached = self._get_cached_aggregations()
+        for (view, name), previous_version in list(self._previous_versions.items()):
+            _, version = self._get_cached(cached, view, name)
+            if version != previous_version + 1:
+                # The value didn't change or has been invalidated by something else
+                # in the meantime.
+                del self._previous_versions[(view, name)]
+
+        if not self._previous_versions:
+            return
+
+        added_values = self._aggregate_rows() if rows_exist else {}
+
+        deltas = defaultdict(list)
+        for view, aggregations in self._aggregations.items():
+            for field, aggregation_type in aggregations:
+                name = field.db_column
+                if (view, name) in self._previous_versions:
+                    deltas[view].append(
+                        (
+                            name,
+                            aggregation_type,
+                            self._previous_versions[(view, name)],
+                            self._removed_values.get(view.id, {}).get(name),
+                            added_values.get(view.id, {}).get(name),
+                        )
+                    )
+
+        transaction.on_commit(lambda: self._apply_deltas(deltas))
+
+    def _apply_deltas(self, deltas):
+        use_lock = hasattr(cache, "lock")
+        for view, view_deltas in deltas.items():
+            if use_lock:
+                # Same lock as the one used when the aggregations are computed in
+                # `get_view_field_aggregations`.
+                cache_lock = cache.lock(
+                    self._handler._get_aggregation_lock_cache_key(view), timeout=10
+                )
+                cache_lock.acquire()
+
+            self._apply_view_deltas(view, view_deltas)
+
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
+
+    def _apply_view_deltas(self, view, view_deltas):
+        keys = [
+            key
+            for name, *_ in view_deltas
+            for key in [
+                self._handler._get_aggregation_value_cache_key(view, name),
+                self._handler._get_aggregation_version_cache_key(view, name),
+            ]
+        ]
+        cached = cache.get_many(keys)
+
+        to_cache = {}
+        to_clear = []
+        for name, aggregation_type, previous_version, removed, added in view_deltas:
+            value, version = self._get_cached(cached, view, name)
+            if version != previous_version + 1:
+                # Invalidated again by another change in the meantime.
+                continue
+
+            if value["version"] == version:
+                # The value has been computed before the transaction was committed,
+                # so it doesn't contain the changes.
+                to_clear.append(name)
+                continue
+
+            if value["version"] != previous_version:
+                continue
+
+            try:
+                new_value = aggregation_type.apply_delta(value["value"], removed, added)
+            except AggregationDeltaNotApplicable:
+                # The version has already been bumped, so the value is recomputed
+                # on the next read.
+                continue
+
+            to_cache[self._handler._get_aggregation_value_cache_key(view, name)] = {
+                "value": new_value,
+                "version": version,
+            }
+
+        cache.set_many(to_cache)
+        if to_clear:
+            self._handler.clear_aggregation_cache(view, to_clear)
@@ -39,6 +39,7 @@ from .exceptions import (
     ViewFilterTypeDoesNotExist,
     AggregationTypeDoesNotExist,
     AggregationTypeAlreadyRegistered,
+    AggregationDeltaNotApplicable,
     DecoratorValueProviderTypeAlreadyRegistered,
     DecoratorValueProviderTypeDoesNotExist,
     DecoratorTypeDoesNotExist,
@@ -486,6 +487,22 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_table_aggregations(
+        self, table: "Table"
+    ) -> Dict["View", List[Tuple[django_models.Field, str]]]:
+        """
+        Should return the aggregation list of every view of this type in the
+        specified table, without executing a query per view.
+
+        returns a dict with the view as key and a list of tuple
+        (Field, aggregation_type) as value.
+        """
+
+        raise NotImplementedError(
+            "If the view supports field aggregation it must implement "
+            "`get_table_aggregations` method."
+        )
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -704,6 +721,13 @@ class ViewAggregationType(Instance):
     aggregation. For example you can compute a sum of all values of a field in a table.
     """
 
+    incremental = False
+    """
+    Indicates whether a cached result of this aggregation can be kept up to date with
+    the `apply_delta` method when rows are created, updated or deleted instead of
+    being recomputed over all the rows of the view.
+    """
+
     def get_aggregation(
         self,
         field_name: str,
@@ -727,6 +751,28 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def apply_delta(self, value: Any, removed_value: Any, added_value: Any) -> Any:
+        """
+        Should return the new aggregation result of the whole view based on the
+        previous result, the aggregation of the changed rows before the change and
+        the aggregation of the changed rows after the change. Only called if
+        `incremental` is True. A partial value is None if it has been computed over
+        no rows, for example because the rows have just been created.
+
+        :param value: The previous aggregation result of the whole view.
+        :param removed_value: The aggregation result of the changed rows before the
+            change.
+        :param added_value: The aggregation result of the changed rows after the
+            change.
+        :raises AggregationDeltaNotApplicable: When the new result can't be derived
+            from the provided values and must be recomputed.
+        :return: The new aggregation result of the whole view.
+        """
+
+        raise AggregationDeltaNotApplicable(
+            f"The {self.type} aggregation can't be updated incrementally."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -2,6 +2,7 @@ from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.rows import signals as row_signals
 
 from .models import GalleryView
 
@@ -42,3 +43,49 @@ def field_deleted(sender, field, **kwargs):
         decorator_value_provider_type
     ) in decorator_value_provider_type_registry.get_all():
         decorator_value_provider_type.after_field_delete(field)
+
+
+@receiver(row_signals.row_created)
+@receiver(row_signals.rows_created)
+@receiver(row_signals.row_deleted)
+@receiver(row_signals.rows_deleted)
+def rows_created_or_deleted(sender, table, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().clear_table_row_count_cache(table.id)
+
+
+@receiver(row_signals.before_row_update)
+@receiver(row_signals.before_rows_update)
+@receiver(row_signals.before_row_delete)
+@receiver(row_signals.before_rows_delete)
+def before_rows_update_or_delete(sender, table, model, row=None, rows=None, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    rows = [row] if row is not None else rows
+    return ViewHandler().get_incremental_aggregations_updater(
+        table, model, [r.id for r in rows]
+    )
+
+
+@receiver(row_signals.row_updated)
+@receiver(row_signals.rows_updated)
+@receiver(row_signals.row_deleted)
+@receiver(row_signals.rows_deleted)
+def rows_updated_or_deleted(sender, signal, before_return=None, **kwargs):
+    updater = dict(before_return or []).get(before_rows_update_or_delete)
+    if updater is not None:
+        updater.rows_changed(
+            rows_exist=signal in [row_signals.row_updated, row_signals.rows_updated]
+        )
+
+
+@receiver(row_signals.row_created)
+@receiver(row_signals.rows_created)
+def rows_created(sender, table, model, row=None, rows=None, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    rows = [row] if row is not None else rows
+    ViewHandler().get_incremental_aggregations_updater(
+        table, model, [r.id for r in rows], rows_exist=False
+    ).rows_changed()
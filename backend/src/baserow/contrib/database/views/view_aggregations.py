@@ -1,3 +1,4 @@
+from .exceptions import AggregationDeltaNotApplicable
 from .registries import ViewAggregationType
 from django.db.models import Count, Min, Max, Sum, StdDev, Variance, Avg
 
@@ -41,6 +42,7 @@ class EmptyCountViewAggregationType(ViewAggregationType):
     """
 
     type = "empty_count"
+    incremental = True
 
     compatible_field_types = [
         TextFieldType.type,
@@ -75,6 +77,9 @@ class EmptyCountViewAggregationType(ViewAggregationType):
             filter=field_type.empty_query(field_name, model_field, field),
         )
 
+    def apply_delta(self, value, removed_value, added_value):
+        return value - (removed_value or 0) + (added_value or 0)
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -134,6 +139,7 @@ class MinViewAggregationType(ViewAggregationType):
     """
 
     type = "min"
+    incremental = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -151,6 +157,19 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        # If one of the removed values was the minimum, the new minimum could be any
+        # of the remaining values.
+        if removed_value is not None and (value is None or removed_value <= value):
+            raise AggregationDeltaNotApplicable(
+                "The minimum value might have been removed."
+            )
+
+        if value is None or added_value is None:
+            return added_value if value is None else value
+
+        return min(value, added_value)
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -158,6 +177,7 @@ class MaxViewAggregationType(ViewAggregationType):
     """
 
     type = "max"
+    incremental = True
 
     compatible_field_types = [
         DateFieldType.type,
@@ -175,6 +195,19 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        # If one of the removed values was the maximum, the new maximum could be any
+        # of the remaining values.
+        if removed_value is not None and (value is None or removed_value >= value):
+            raise AggregationDeltaNotApplicable(
+                "The maximum value might have been removed."
+            )
+
+        if value is None or added_value is None:
+            return added_value if value is None else value
+
+        return max(value, added_value)
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -182,6 +215,7 @@ class SumViewAggregationType(ViewAggregationType):
     """
 
     type = "sum"
+    incremental = True
 
     compatible_field_types = [
         NumberFieldType.type,
@@ -194,6 +228,21 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def apply_delta(self, value, removed_value, added_value):
+        if value is None and added_value is None:
+            return None
+
+        new_value = (value or 0) - (removed_value or 0) + (added_value or 0)
+
+        # The sum is None instead of 0 when there are no values left, which can't be
+        # known if only values have been removed.
+        if new_value == 0 and removed_value is not None and added_value is None:
+            raise AggregationDeltaNotApplicable(
+                "All the values might have been removed."
+            )
+
+        return new_value
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -230,6 +230,24 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_table_aggregations(self, table):
+        """
+        Returns the (Field, aggregation_type) list of every grid view in the table
+        computed from the field options of all views at once.
+        """
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table=table)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+        aggregations = defaultdict(list)
+        for option in field_options:
+            aggregations[option.grid_view].append(
+                (option.field, option.aggregation_raw_type)
+            )
+        return aggregations
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
@@ -479,14 +497,9 @@ class FormViewType(ViewType):
             if not user_file:
                 return None
 
-            name = user_file.name
-
-            if name not in files_zip.namelist():
-                file_path = UserFileHandler().user_file_path(name)
-                with storage.open(file_path, mode="rb") as storage_file:
-                    files_zip.writestr(name, storage_file.read())
+            UserFileHandler().add_user_files_to_zip([user_file], files_zip, storage)
 
-            return {"name": name, "original_name": user_file.original_name}
+            return {"name": user_file.name, "original_name": user_file.original_name}
 
         serialized["title"] = form.title
         serialized["description"] = form.description
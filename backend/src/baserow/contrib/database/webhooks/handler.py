@@ -1,10 +1,13 @@
 import uuid
 import json
+import threading
 from typing import List
+from urllib.parse import urlsplit
 
-from requests import Response, PreparedRequest
+from requests import Response, PreparedRequest, Session
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models.query import QuerySet
 from django.db.models import Q
 from django.contrib.auth.models import User as DjangoUser
@@ -25,6 +28,15 @@ from .exceptions import (
 from .registries import webhook_event_type_registry
 
 
+# The sessions are kept per thread because a `requests.Session` is not guaranteed to
+# be thread safe.
+_sessions = threading.local()
+
+
+def get_webhook_call_slots_cache_key(webhook_id: int) -> str:
+    return f"webhook_{webhook_id}_call_slots"
+
+
 class WebhookHandler:
     def find_webhooks_to_call(self, table_id: int, event_type: str) -> QuerySet:
         """
@@ -282,9 +294,8 @@ class WebhookHandler:
         self, method: str, url: str, headers: dict, payload: dict
     ) -> Response:
         """
-        Makes a request to the provided URL with the provided settings. In production
-        mode, the advocate library is used so that the internal network can't be
-        reached.
+        Makes a request to the provided URL with the provided settings. The request
+        is made using the pooled session of the host, see `get_session`.
 
         :param method: The HTTP request method that must be used.
         :param url: The URL that must called.
@@ -294,12 +305,7 @@ class WebhookHandler:
         :return: The response
         """
 
-        if settings.DEBUG is True:
-            from requests import request
-        else:
-            from advocate import request
-
-        return request(
+        return self.get_session(url).request(
             method,
             url,
             headers=headers,
@@ -307,6 +313,80 @@ class WebhookHandler:
             timeout=settings.WEBHOOKS_REQUEST_TIMEOUT_SECONDS,
         )
 
+    def get_session(self, url: str) -> Session:
+        """
+        Returns a session that is reused for every request to the host of the
+        provided URL in the current thread. This keeps the connections alive, so
+        that consecutive calls to the same endpoint don't have to set up a new
+        connection every time. In production mode, an advocate session is used so
+        that the internal network can't be reached.
+
+        :param url: The URL that must be called with the session.
+        :return: The session related to the scheme and host of the URL.
+        """
+
+        if not hasattr(_sessions, "by_host"):
+            _sessions.by_host = {}
+
+        split_url = urlsplit(url)
+        key = (split_url.scheme, split_url.netloc, settings.DEBUG)
+
+        if key not in _sessions.by_host:
+            if settings.DEBUG is True:
+                _sessions.by_host[key] = Session()
+            else:
+                from advocate import Session as AdvocateSession
+
+                _sessions.by_host[key] = AdvocateSession()
+
+        return _sessions.by_host[key]
+
+    def acquire_call_slot(self, webhook_id: int) -> bool:
+        """
+        Tries to claim one of the `WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK` slots
+        of the webhook. This limits the amount of requests that are made to the same
+        webhook at the same time, without having to lock the webhook row while the
+        request is being made. The slots expire automatically in case they're never
+        released, for example when the worker crashes.
+
+        :param webhook_id: The id of the webhook that is going to be called.
+        :return: Indicates whether a slot has been claimed. If so, it must be
+            released using `release_call_slot` after the call.
+        """
+
+        cache_key = get_webhook_call_slots_cache_key(webhook_id)
+        timeout = settings.WEBHOOKS_REQUEST_TIMEOUT_SECONDS * 2
+        cache.add(cache_key, 0, timeout=timeout)
+
+        try:
+            claimed_slots = cache.incr(cache_key)
+        except ValueError:
+            # The key has expired right after it was added.
+            cache.add(cache_key, 1, timeout=timeout)
+            return True
+
+        if claimed_slots > settings.WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK:
+            self.release_call_slot(webhook_id)
+            return False
+
+        # Only extend the expiry of the slots when one has been claimed, so that
+        # slots which are never released don't block the webhook forever.
+        cache.touch(cache_key, timeout=timeout)
+        return True
+
+    def release_call_slot(self, webhook_id: int):
+        """
+        Releases a slot that was claimed using `acquire_call_slot`.
+
+        :param webhook_id: The id of the webhook that has been called.
+        """
+
+        try:
+            cache.decr(get_webhook_call_slots_cache_key(webhook_id))
+        except ValueError:
+            # The slots have already expired.
+            pass
+
     def get_headers(self, event_type: str, event_id: str):
         """Returns the default headers that must be added to every request."""
 
@@ -14,13 +14,21 @@ def call_webhook(
     url: str,
     headers: dict,
     payload: dict,
-    **kwargs: dict
+    concurrency_limit_requeues: int = 0,
+    **kwargs: dict,
 ):
     """
     This task should be called asynchronously when the webhook call must be trigged.
     All the raw values should be provided as argument. If the call fails for whatever
     reason, it tries again until the max retries have been reached.
 
+    The request is made without holding a transaction or a lock on the webhook. The
+    amount of concurrent calls to the same webhook is limited by the
+    `WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK` setting instead. If no call slot is
+    free, the call is scheduled again with an exponential backoff. After
+    `WEBHOOKS_CONCURRENCY_LIMIT_MAX_REQUEUES` attempts, the call fails like a call
+    that didn't get a response.
+
     :param webhook_id: The id of the webhook related to the call.
     :param event_id: A unique event id that can used as id for the table webhook call
         model.
@@ -30,6 +38,8 @@ def call_webhook(
     :param headers: The additional headers that must be added to the request. The key
         is the name and the value is the value.
     :param payload: The JSON serializable payload that must be used as request body.
+    :param concurrency_limit_requeues: The amount of times the call has been
+        scheduled again because the concurrency limit was reached.
     """
 
     from django.utils import timezone
@@ -39,21 +49,30 @@ def call_webhook(
     from .handler import WebhookHandler
     from .models import TableWebhook, TableWebhookCall
 
-    with transaction.atomic():
-        handler = WebhookHandler()
+    handler = WebhookHandler()
 
-        try:
-            webhook = TableWebhook.objects.select_for_update().get(id=webhook_id)
-        except TableWebhook.DoesNotExist:
-            # If the webhook has been deleted while executing, we don't want to continue
-            # trying to call the URL because we can't update the state of the webhook.
-            return
+    if not TableWebhook.objects.filter(id=webhook_id).exists():
+        # If the webhook has been deleted while executing, we don't want to continue
+        # trying to call the URL because we can't update the state of the webhook.
+        return
 
-        request = None
-        response = None
-        success = False
-        error = ""
+    call_kwargs = dict(
+        webhook_id=webhook_id,
+        event_id=event_id,
+        event_type=event_type,
+        method=method,
+        url=url,
+        headers=headers,
+        payload=payload,
+    )
+    request = None
+    response = None
+    success = False
+    error = ""
 
+    if handler.acquire_call_slot(webhook_id):
+        # The request is made outside of a transaction, so that a slow endpoint
+        # doesn't keep a database connection and a lock on the webhook busy.
         try:
             response = handler.make_request(method, url, headers, payload)
             request = response.request
@@ -64,6 +83,39 @@ def call_webhook(
             error = str(exception)
         except UnacceptableAddressException as exception:
             error = str(exception)
+        finally:
+            handler.release_call_slot(webhook_id)
+    elif concurrency_limit_requeues < settings.WEBHOOKS_CONCURRENCY_LIMIT_MAX_REQUEUES:
+        # The maximum amount of concurrent calls to this webhook has been reached.
+        # Instead of waiting for a slot, the call is scheduled again so that the worker
+        # can do something else in the meantime. This doesn't count as a retry.
+        call_webhook.apply_async(
+            kwargs=dict(
+                call_kwargs, concurrency_limit_requeues=concurrency_limit_requeues + 1
+            ),
+            countdown=min(
+                settings.WEBHOOKS_CONCURRENCY_LIMIT_COUNTDOWN_SECONDS
+                * 2 ** concurrency_limit_requeues,
+                settings.WEBHOOKS_CONCURRENCY_LIMIT_MAX_COUNTDOWN_SECONDS,
+            ),
+            retries=self.request.retries,
+        )
+        return
+    else:
+        # The endpoint hasn't been able to keep up with the calls for too long, so
+        # the call fails without being made.
+        error = (
+            f"No call slot became available after {concurrency_limit_requeues} "
+            f"attempts because the maximum amount of concurrent calls has been "
+            f"reached."
+        )
+
+    with transaction.atomic():
+        try:
+            webhook = TableWebhook.objects.select_for_update().get(id=webhook_id)
+        except TableWebhook.DoesNotExist:
+            # The webhook has been deleted while the request was being made.
+            return
 
         TableWebhookCall.objects.update_or_create(
             id=event_id,
@@ -114,4 +166,4 @@ def call_webhook(
     if not success and self.request.retries < settings.WEBHOOKS_MAX_RETRIES_PER_CALL:
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
-        self.retry(countdown=2 ** self.request.retries)
+        self.retry(countdown=2 ** self.request.retries, kwargs=call_kwargs)
@@ -16,6 +16,8 @@ from baserow.contrib.database.views.registries import view_type_registry
 from baserow.contrib.database.ws.rows.signals import (
     before_row_update,
     before_rows_update,
+    serialize_rows_after_create,
+    serialize_rows_after_update,
     RealtimeRowMessages,
 )
 from baserow.ws.registries import page_registry
@@ -140,13 +142,15 @@ def public_row_created(sender, row, before, user, table, model, **kwargs):
 
 
 @receiver(row_signals.rows_created)
-def public_rows_created(sender, rows, before, user, table, model, **kwargs):
+def public_rows_created(
+    sender, rows, before, user, table, model, rows_refreshed=True, **kwargs
+):
     row_checker = ViewHandler().get_public_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
     transaction.on_commit(
         lambda: _send_rows_created_event_to_views(
-            _serialize_row(model, rows, many=True),
+            serialize_rows_after_create(model, rows, rows_refreshed),
             before,
             row_checker.get_public_views_where_rows_are_visible(rows),
         ),
@@ -313,11 +317,21 @@ def public_row_updated(
 
 @receiver(row_signals.rows_updated)
 def public_rows_updated(
-    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    before_return,
+    updated_field_ids,
+    rows_refreshed=True,
+    **kwargs,
 ):
     before_return_dict = dict(before_return)[public_before_rows_update]
     serialized_old_rows = dict(before_return)[before_rows_update]
-    serialized_updated_rows = _serialize_row(model, rows, many=True)
+    serialized_updated_rows = serialize_rows_after_update(
+        model, rows, updated_field_ids, serialized_old_rows, rows_refreshed
+    )
 
     old_row_public_views: List[PublicViewRows] = before_return_dict[
         "old_rows_public_views"
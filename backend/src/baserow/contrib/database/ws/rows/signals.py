@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Type
 
 from django.db import transaction
 from django.dispatch import receiver
@@ -34,16 +34,123 @@ def row_created(sender, row, before, user, table, model, **kwargs):
     )
 
 
+def serialize_rows_after_create(
+    model: Type[GeneratedTableModel],
+    rows: List[GeneratedTableModel],
+    rows_refreshed: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Serializes the created rows. If the values of the rows have not been refreshed,
+    the values that have been written are serialized from the rows in memory. Only
+    the relationships and the fields that are calculated by the database, like
+    formula fields, are fetched.
+
+    :param model: The generated model of the table.
+    :param rows: The created rows.
+    :param rows_refreshed: Whether the values of the rows have been refreshed.
+    :return: The serialized created rows.
+    """
+
+    if rows_refreshed:
+        return get_row_serializer_class(model, RowSerializer, is_response=True)(
+            rows, many=True
+        ).data
+
+    from baserow.contrib.database.rows.handler import RowHandler
+
+    row_handler = RowHandler()
+    relation_field_ids = [
+        field_id
+        for field_id, field_object in model._field_objects.items()
+        if model._meta.get_field(field_object["name"]).is_relation
+    ]
+    fetched_field_ids = row_handler.get_field_ids_changed_by_update(
+        model, relation_field_ids
+    )
+    in_memory_field_ids = [
+        field_id
+        for field_id in model._field_objects.keys()
+        if field_id not in fetched_field_ids
+    ]
+
+    serialized_fetched_values = {}
+    if fetched_field_ids:
+        fetched_rows = row_handler.get_rows_with_field_values(
+            model, [row.id for row in rows], fetched_field_ids
+        )
+        serialized_fetched_values = {
+            serialized_row["id"]: serialized_row
+            for serialized_row in get_row_serializer_class(
+                model, RowSerializer, is_response=True, field_ids=fetched_field_ids
+            )(fetched_rows, many=True).data
+        }
+
+    serialized_rows = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=in_memory_field_ids
+    )(rows, many=True).data
+    return [
+        {**serialized_row, **serialized_fetched_values.get(serialized_row["id"], {})}
+        for serialized_row in serialized_rows
+    ]
+
+
+def serialize_rows_after_update(
+    model: Type[GeneratedTableModel],
+    rows: List[GeneratedTableModel],
+    updated_field_ids: Iterable[int],
+    serialized_rows_before_update: List[Dict[str, Any]],
+    rows_refreshed: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Serializes the updated rows in the same order as the serialized rows before the
+    update. If the values of the rows have not been refreshed, only the fields that
+    could have been changed by the update are fetched and serialized, the other
+    values are taken from the rows before the update.
+
+    :param model: The generated model of the table.
+    :param rows: The updated rows.
+    :param updated_field_ids: The ids of the fields that have been updated.
+    :param serialized_rows_before_update: The serialized rows before the update.
+    :param rows_refreshed: Whether the values of the rows have been refreshed.
+    :return: The serialized updated rows.
+    """
+
+    if rows_refreshed:
+        return get_row_serializer_class(model, RowSerializer, is_response=True)(
+            rows, many=True
+        ).data
+
+    from baserow.contrib.database.rows.handler import RowHandler
+
+    row_handler = RowHandler()
+    field_ids = row_handler.get_field_ids_changed_by_update(model, updated_field_ids)
+    changed_rows = row_handler.get_rows_with_field_values(
+        model, [row.id for row in rows], field_ids
+    )
+    serialized_changes = {
+        serialized_row["id"]: serialized_row
+        for serialized_row in get_row_serializer_class(
+            model, RowSerializer, is_response=True, field_ids=field_ids
+        )(changed_rows, many=True).data
+    }
+    return [
+        {**serialized_row, **serialized_changes.get(serialized_row["id"], {})}
+        for serialized_row in serialized_rows_before_update
+    ]
+
+
 @receiver(row_signals.rows_created)
-def rows_created(sender, rows, before, user, table, model, **kwargs):
+def rows_created(
+    sender, rows, before, user, table, model, rows_refreshed=True, **kwargs
+):
     table_page_type = page_registry.get("table")
     transaction.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialize_rows_after_create(
+                    model, rows, rows_refreshed
+                ),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -95,17 +202,30 @@ def row_updated(
 
 @receiver(row_signals.rows_updated)
 def rows_updated(
-    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    before_return,
+    updated_field_ids,
+    rows_refreshed=True,
+    **kwargs,
 ):
     table_page_type = page_registry.get("table")
+    serialized_rows_before_update = dict(before_return)[before_rows_update]
     transaction.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
-                serialized_rows_before_update=dict(before_return)[before_rows_update],
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows_before_update=serialized_rows_before_update,
+                serialized_rows=serialize_rows_after_update(
+                    model,
+                    rows,
+                    updated_field_ids,
+                    serialized_rows_before_update,
+                    rows_refreshed,
+                ),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -1,17 +1,23 @@
 import logging
+import time
 import traceback
+from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
-from typing import List, Optional, Set, Tuple
+from typing import Iterator, List, Optional, Set, Tuple
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from baserow.core.action.models import Action
-from baserow.core.action.registries import action_type_registry, ActionScopeStr
+from baserow.core.action.registries import (
+    action_type_registry,
+    ActionScopeStr,
+    ActionType,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -141,88 +147,183 @@ class ActionHandler:
         """
         Any actions which haven't been updated in
         settings.MINUTES_UNTIL_ACTION_CLEANED_UP will be deleted any have an extra
-        data associated with them cleaned up.
+        data associated with them cleaned up. The expired actions are processed in
+        chunks of settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE, each in its own
+        transaction, so that a large backlog doesn't result in one huge transaction.
         """
 
         now = timezone.now()
         minutes = int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP)
         cutoff = now - timezone.timedelta(minutes=minutes)
+        batch_size = settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE
 
         types_with_custom_clean_up = set()
         for action_type in action_type_registry.get_all():
             if action_type.has_custom_cleanup():
                 types_with_custom_clean_up.add(action_type.type)
 
-        # Delete in a separate atomic block so if we crash later we don't roll back
-        # these valid deletes.
-        with transaction.atomic():
-            # Here we delete all actions which have a type which doesn't have a custom
-            # `clean_up_any_extra_action_data` implementation. This means that all
-            # we need to do to clean them up is delete the actions, which we can do
-            # in a single DELETE WHERE query.
-            bulk_delete_count, _ = (
-                Action.objects.filter(updated_on__lte=cutoff)
-                .exclude(type__in=types_with_custom_clean_up)
-                .delete()
-            )
+        expired_actions = Action.objects.filter(updated_on__lte=cutoff)
+        backlog_size = expired_actions.count()
+        start = time.perf_counter()
+
+        # Here we delete all actions which have a type which doesn't have a custom
+        # `clean_up_any_extra_action_data` implementation. This means that all we need
+        # to do to clean them up is delete the actions, which we can do with a single
+        # DELETE WHERE query per chunk. Every chunk is deleted in a separate atomic
+        # block so if we crash later we don't roll back these valid deletes.
+        bulk_delete_count = 0
+        for chunk in cls._get_chunks_of_expired_actions(
+            expired_actions.exclude(type__in=types_with_custom_clean_up).only(
+                "id", "updated_on"
+            ),
+            batch_size,
+        ):
+            with transaction.atomic():
+                deleted, _ = Action.objects.filter(
+                    id__in=[action.id for action in chunk]
+                ).delete()
+                bulk_delete_count += deleted
 
         (
             custom_deleted_count,
             cleanup_error,
         ) = cls._cleanup_actions_with_custom_cleanup_logic(
-            cutoff, types_with_custom_clean_up
+            cutoff, types_with_custom_clean_up, batch_size
         )
         total_deleted = bulk_delete_count + custom_deleted_count
 
-        logger.info(f"Cleaned up {total_deleted} actions.")
+        duration = time.perf_counter() - start
+        logger.info(
+            f"Cleaned up {total_deleted} of {backlog_size} expired actions in "
+            f"{duration:.2f} seconds "
+            f"({total_deleted / duration if duration else 0:.1f} actions per second)."
+        )
 
         if cleanup_error:
             logger.error("However an error was encountered during an action cleanup: ")
             raise cleanup_error
 
+    @classmethod
+    def _get_chunks_of_expired_actions(
+        cls, expired_actions: QuerySet, batch_size: int
+    ) -> Iterator[List[Action]]:
+        """
+        Lazily yields the provided expired actions in chunks ordered by their
+        `updated_on` and `id`. Every next chunk is looked up using the last action of
+        the previous one, so that it can use the index instead of skipping over the
+        actions that have already been processed.
+
+        :param expired_actions: The queryset of the actions that must be chunked.
+        :param batch_size: The maximum amount of actions in a chunk.
+        """
+
+        last_action = None
+        while True:
+            chunk_queryset = expired_actions.order_by("updated_on", "id")
+            if last_action is not None:
+                chunk_queryset = chunk_queryset.filter(
+                    Q(updated_on__gt=last_action.updated_on)
+                    | Q(updated_on=last_action.updated_on, id__gt=last_action.id)
+                )
+            chunk = list(chunk_queryset[:batch_size])
+            if len(chunk) == 0:
+                return
+            yield chunk
+            last_action = chunk[-1]
+
     @classmethod
     def _cleanup_actions_with_custom_cleanup_logic(
-        cls, cutoff: datetime, types_with_custom_clean_up: Set[str]
+        cls,
+        cutoff: datetime,
+        types_with_custom_clean_up: Set[str],
+        batch_size: int,
     ) -> Tuple[int, Optional[Exception]]:
         """
-        ActionTypes can implement a custom clean_up_any_extra_action_data method to
-        clean up any extra data associated with them. This method will loop over all
-        of those actions calling their custom clean_up_any_extra_action_data method
-        and deleting the action.
+        ActionTypes can implement a custom clean_up_any_extra_actions_data method to
+        clean up any extra data associated with them. This method will loop over
+        chunks of those actions, calling the custom method of every type once with
+        all the actions of that type in the chunk and deleting the actions.
 
         :param cutoff: Any actions updated on or before this time will be cleaned up.
         :param types_with_custom_clean_up: The set of ActionType.type names which
             have custom clean_up_any_extra_action_data methods which need to be
             called to do some extra per type cleanup.
+        :param batch_size: The maximum amount of actions cleaned up per transaction.
         :return: A tuple of the number of deleted actions and an optional Exception
             which is present when a custom cleanup failed.
         """
 
-        with transaction.atomic():
-            actions_to_cleanup_with_custom_logic = (
-                Action.objects.filter(
-                    updated_on__lte=cutoff, type__in=types_with_custom_clean_up
-                )
-                .select_for_update()
-                .order_by("updated_on", "id")
-            )
-            deleted_count = 0
-            for action in actions_to_cleanup_with_custom_logic:
-                try:
-                    with transaction.atomic():
-                        # Run each clean up in a single inside its own atomic block so
-                        # later cleanup for different action fails we don't roll back
-                        # previous successful clean ups.
-                        action_type = action_type_registry.get(action.type)
-                        action_type.clean_up_any_extra_action_data(action)
-                        action.delete()
-                        deleted_count += 1
-                except Exception as e:
-                    # We don't want to roll back the entire transaction if one of the
-                    # cleanup's failed. The failed cleanup has already been rolled
-                    # back due to its own inner atomic block so we can safely stop
-                    # , commit the outer transaction which persists the successful
-                    # cleanups and let the caller decide what to do with the error.
-                    return deleted_count, e
+        deleted_count = 0
+        for chunk in cls._get_chunks_of_expired_actions(
+            Action.objects.filter(
+                updated_on__lte=cutoff, type__in=types_with_custom_clean_up
+            ).only("id", "updated_on"),
+            batch_size,
+        ):
+            with transaction.atomic():
+                # Lock the actions of the chunk so they can't be undone or redone
+                # while we are cleaning them up. Actions that have been updated in the
+                # meantime are not expired anymore.
+                actions_per_type = defaultdict(list)
+                for action in (
+                    Action.objects.filter(
+                        id__in=[action.id for action in chunk], updated_on__lte=cutoff
+                    )
+                    .select_for_update()
+                    .order_by("updated_on", "id")
+                ):
+                    actions_per_type[action.type].append(action)
+
+                for action_type_name, actions in actions_per_type.items():
+                    action_type = action_type_registry.get(action_type_name)
+                    try:
+                        with transaction.atomic():
+                            action_type.clean_up_any_extra_actions_data(actions)
+                            Action.objects.filter(
+                                id__in=[action.id for action in actions]
+                            ).delete()
+                        deleted_count += len(actions)
+                    except Exception:
+                        # Clean the actions up one by one instead to find out which
+                        # one failed without losing the clean ups that can succeed.
+                        (
+                            one_by_one_deleted_count,
+                            cleanup_error,
+                        ) = cls._cleanup_actions_one_by_one(action_type, actions)
+                        deleted_count += one_by_one_deleted_count
+                        if cleanup_error:
+                            return deleted_count, cleanup_error
+
+        return deleted_count, None
+
+    @classmethod
+    def _cleanup_actions_one_by_one(
+        cls, action_type: ActionType, actions: List[Action]
+    ) -> Tuple[int, Optional[Exception]]:
+        """
+        Cleans up and deletes the provided actions of the same type one at a time and
+        stops at the first one that fails.
+
+        :return: A tuple of the number of deleted actions and an optional Exception
+            which is present when a custom cleanup failed.
+        """
+
+        deleted_count = 0
+        for action in actions:
+            try:
+                with transaction.atomic():
+                    # Run each clean up in a single inside its own atomic block so
+                    # later cleanup for different action fails we don't roll back
+                    # previous successful clean ups.
+                    action_type.clean_up_any_extra_actions_data([action])
+                    action.delete()
+                    deleted_count += 1
+            except Exception as e:
+                # We don't want to roll back the entire transaction if one of the
+                # cleanup's failed. The failed cleanup has already been rolled
+                # back due to its own inner atomic block so we can safely stop
+                # , commit the outer transaction which persists the successful
+                # cleanups and let the caller decide what to do with the error.
+                return deleted_count, e
 
         return deleted_count, None
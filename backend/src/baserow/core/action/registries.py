@@ -1,6 +1,6 @@
 import abc
 import dataclasses
-from typing import Any, NewType, Optional
+from typing import Any, List, NewType, Optional
 
 from django.contrib.auth.models import AbstractUser
 from rest_framework import serializers
@@ -189,12 +189,29 @@ class ActionType(Instance, abc.ABC):
 
         pass
 
+    @classmethod
+    def clean_up_any_extra_actions_data(cls, actions_being_cleaned_up: List[Action]):
+        """
+        Should cleanup any extra data associated with the provided actions of this
+        type as they have expired. By default `clean_up_any_extra_action_data` is
+        called for every action, but it can be overridden to clean up the data of
+        many actions at once.
+
+        :param actions_being_cleaned_up: The actions that are old and being cleaned
+            up.
+        """
+
+        for action in actions_being_cleaned_up:
+            cls.clean_up_any_extra_action_data(action)
+
     @classmethod
     def has_custom_cleanup(cls) -> bool:
         # noinspection PyUnresolvedReferences
         return (
             cls.clean_up_any_extra_action_data.__func__
             != ActionType.clean_up_any_extra_action_data.__func__
+            or cls.clean_up_any_extra_actions_data.__func__
+            != ActionType.clean_up_any_extra_actions_data.__func__
         )
 
 
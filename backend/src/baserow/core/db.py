@@ -1,4 +1,9 @@
+from collections import defaultdict
+from typing import Callable, Iterable, Iterator, Optional
+
+from django.contrib.contenttypes.models import ContentType
 from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model, QuerySet
 from django.db.transaction import Atomic, get_connection
 
 
@@ -34,3 +39,50 @@ class LockedAtomicTransaction(Atomic):
 
     def __exit__(self, *args, **kwargs):
         return super().__exit__(*args, **kwargs)
+
+
+def specific_iterator(
+    queryset_or_list: Iterable[Model],
+    per_content_type_queryset_hook: Optional[
+        Callable[[Model, QuerySet], QuerySet]
+    ] = None,
+) -> Iterator[Model]:
+    """
+    Yields the specific instances of the provided queryset or list of instances which
+    use the `PolymorphicContentTypeMixin`. Instead of doing one query per instance, as
+    calling `.specific` on every instance would, the specific instances are fetched
+    with one query per content type. The original order is preserved.
+
+    :param queryset_or_list: The non specific instances to get the specific instances
+        for. Instances that are already specific are yielded as is.
+    :param per_content_type_queryset_hook: An optional function that is called with
+        the specific model class and the queryset that fetches the instances of that
+        type. It can for example be used to add a `select_related` and must return
+        the queryset.
+    :return: An iterator of the specific instances.
+    """
+
+    items = []
+    ids_per_content_type = defaultdict(list)
+
+    for item in queryset_or_list:
+        model_class = item.specific_class
+        is_specific = model_class is None or isinstance(item, model_class)
+        if not is_specific:
+            ids_per_content_type[item.content_type_id].append(item.id)
+        items.append((item, is_specific))
+
+    specific_objects = {}
+    for content_type_id, ids in ids_per_content_type.items():
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+        queryset = model_class._base_manager.filter(id__in=ids)
+        if per_content_type_queryset_hook is not None:
+            queryset = per_content_type_queryset_hook(model_class, queryset)
+        specific_objects.update({obj.id: obj for obj in queryset})
+
+    for item, is_specific in items:
+        if is_specific:
+            yield item
+        elif item.id in specific_objects:
+            # Instances that have been deleted in the meantime are skipped.
+            yield specific_objects[item.id]
@@ -48,6 +48,7 @@ from .exceptions import (
     TemplateFileDoesNotExist,
     TemplateDoesNotExist,
 )
+from .serialized_stream import write_serialized_stream
 from .trash.handler import TrashHandler
 from .utils import set_allowed_attrs
 from .registries import application_type_registry
@@ -782,9 +783,8 @@ class CoreHandler:
         """
         Exports the applications of a group to a list. They can later be imported via
         the `import_applications_to_group` method. The result can be serialized to JSON.
-
-        @TODO look into speed optimizations by streaming to a JSON file instead of
-            generating the entire file in memory.
+        Use `export_group_applications_to_stream` for big groups because this method
+        generates the entire export in memory.
 
         :param group: The group of which the applications must be exported.
         :type group: Group
@@ -813,6 +813,47 @@ class CoreHandler:
 
         return exported_applications
 
+    def export_group_applications_to_stream(
+        self, group, export_buffer, files_buffer, storage=None
+    ):
+        """
+        Exports the applications of a group as a stream of newline delimited JSON to
+        the provided buffer. The rows of the tables are fetched with a server side
+        cursor and written in chunks, so the export doesn't have to fit into memory.
+        It can be imported again by passing a `SerializedStreamReader` of the buffer
+        to the `import_applications_to_group` method.
+
+        :param group: The group of which the applications must be exported.
+        :type group: Group
+        :param export_buffer: A text buffer where the applications are written to.
+        :type export_buffer: IOBase
+        :param files_buffer: A file buffer where the files must be written to in ZIP
+            format.
+        :type files_buffer: IOBase
+        :param storage: The storage where the files can be loaded from.
+        :type storage: Storage or None
+        """
+
+        if not storage:
+            storage = default_storage
+
+        with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+            applications = group.application_set.all()
+
+            def export_applications():
+                for a in applications:
+                    application = a.specific
+                    application_type = application_type_registry.get_by_model(
+                        application
+                    )
+                    yield application_type.export_serialized_chunked(
+                        application, files_zip, storage
+                    )
+
+            write_serialized_stream(
+                export_buffer, export_applications(), applications.count()
+            )
+
     def import_applications_to_group(
         self,
         group,
@@ -823,16 +864,17 @@ class CoreHandler:
     ):
         """
         Imports multiple exported applications into the given group. It is compatible
-        with an export of the `export_group_applications` method.
-
-        @TODO look into speed optimizations by streaming from a JSON file instead of
-            loading the entire file into memory.
+        with an export of the `export_group_applications` method and, by providing a
+        `SerializedStreamReader`, with an export of the
+        `export_group_applications_to_stream` method. In that case the rows are read
+        and inserted in chunks.
 
         :param group: The group that the applications must be imported to.
         :type group: Group
         :param exported_applications: A list containing the applications generated by
-            the `export_group_applications` method.
-        :type exported_applications: list
+            the `export_group_applications` method or a reader of the stream written
+            by the `export_group_applications_to_stream` method.
+        :type exported_applications: list or SerializedStreamReader
         :param files_buffer: A file buffer containing the exported files in ZIP format.
         :type files_buffer: IOBase
         :param storage: The storage where the files can be copied to.
@@ -1,12 +1,14 @@
 import math
 import re
+import shutil
 
 # See nosec comment later in file.
 import subprocess  # nosec
 import tarfile
 import tempfile
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 import psycopg2
 from django.utils import timezone
@@ -31,6 +33,8 @@ class BaserowBackupRunner:
         username: str,
         port: Optional[str] = "5432",
         jobs: Optional[int] = 1,
+        parallel_batches: Optional[int] = 1,
+        batch_retries: Optional[int] = 0,
     ):
         """
         Constructs a BaserowBackupRunner.
@@ -40,6 +44,10 @@ class BaserowBackupRunner:
         :param username: The username to connect to the database as.
         :param port: The port to connect to the database using.
         :param jobs: How many parallel dump/restart jobs to run per batch.
+        :param parallel_batches: How many batches of user tables are dumped or
+            restored at the same time. Every batch uses `jobs` connections.
+        :param batch_retries: How many times the dump of a batch is retried when it
+            fails.
         """
 
         self.host = host
@@ -47,6 +55,8 @@ class BaserowBackupRunner:
         self.username = username
         self.port = port
         self.jobs = jobs
+        self.parallel_batches = parallel_batches
+        self.batch_retries = batch_retries
 
     def backup_baserow(
         self,
@@ -168,7 +178,7 @@ class BaserowBackupRunner:
             f"--exclude-table={MultipleSelectField.THROUGH_DATABASE_TABLE_PREFIX}*",
             f"--exclude-table={Table.USER_TABLE_DATABASE_NAME_PREFIX}*",
             f"--exclude-table={LinkRowField.THROUGH_DATABASE_TABLE_PREFIX}*",
-            f"--file={temporary_directory_name}/everything_but_user_tables/",
+            f"--file={temporary_directory_name}/{NO_USER_TABLES_BACKUP_SUB_FOLDER}/",
         ]
         self._run_command_in_sub_process(
             self._build_pg_dump_command(args + additional_pg_dump_args),
@@ -179,33 +189,54 @@ class BaserowBackupRunner:
         batch_size: int,
         output_directory: str,
         additional_pg_dump_args: List[str],
+        on_batch_finished: Optional[Callable[[Path], None]] = None,
     ):
         """
         Loops over all the user tables in the provided database pg_dumps them in batches
-        into sub-folders in the output_directory.
+        into sub-folders in the output_directory. Up to `parallel_batches` batches are
+        dumped at the same time and a failed batch is retried `batch_retries` times.
 
         :param batch_size: How many tables should be dumped in each batch.
         :param output_directory: The directory to write the resulting back up
             directories into.
+        :param on_batch_finished: Called in the calling thread with the directory of
+            every batch as soon as it has been dumped.
         """
 
         with self._build_connection() as connection:
             sorted_user_table_names = _get_sorted_user_tables_names(connection)
         num_batches = math.ceil(len(sorted_user_table_names) / batch_size)
-        for batch_num in range(num_batches):
+
+        def dump_batch(batch_num: int) -> Path:
             tables_to_dump_this_batch = sorted_user_table_names[
                 batch_num * batch_size : (batch_num + 1) * batch_size
             ]
             pg_dump_tables_include_arg = [
                 f"--table={t}" for t in tables_to_dump_this_batch
             ]
-            self._run_command_in_sub_process(
-                self._build_pg_dump_command(
-                    pg_dump_tables_include_arg
-                    + [f"--file={output_directory}/user_tables_batch_{batch_num}/"]
-                    + additional_pg_dump_args
-                ),
+            batch_directory = Path(output_directory, f"user_tables_batch_{batch_num}")
+            command = self._build_pg_dump_command(
+                pg_dump_tables_include_arg
+                + [f"--file={output_directory}/user_tables_batch_{batch_num}/"]
+                + additional_pg_dump_args
             )
+            for attempt in range(self.batch_retries + 1):
+                try:
+                    self._run_command_in_sub_process(command)
+                    break
+                except subprocess.CalledProcessError:
+                    if attempt == self.batch_retries:
+                        raise
+                    print(f"Retrying batch {batch_num} after it failed.")
+                    # pg_dump refuses to write into an existing directory.
+                    shutil.rmtree(batch_directory, ignore_errors=True)
+            return batch_directory
+
+        self._run_batches_in_parallel(
+            [lambda n=n: dump_batch(n) for n in range(num_batches)],
+            "Dumped",
+            on_batch_finished,
+        )
 
     def _restore_everything_but_user_tables(
         self,
@@ -227,16 +258,58 @@ class BaserowBackupRunner:
         extracted_backup_location: Path,
         additional_pg_restore_args: List[str],
     ):
-        for child in extracted_backup_location.iterdir():
-            if child.name != NO_USER_TABLES_BACKUP_SUB_FOLDER:
-                self._run_command_in_sub_process(
-                    self._build_pg_restore_command(
-                        [
-                            str(child),
-                        ]
-                        + additional_pg_restore_args
-                    ),
-                )
+        def restore_batch(child: Path):
+            self._run_command_in_sub_process(
+                self._build_pg_restore_command(
+                    [
+                        str(child),
+                    ]
+                    + additional_pg_restore_args
+                ),
+            )
+
+        # The batches don't depend on each other because the user tables don't have
+        # foreign keys to each other, so they can be restored at the same time.
+        self._run_batches_in_parallel(
+            [
+                lambda child=child: restore_batch(child)
+                for child in sorted(extracted_backup_location.iterdir())
+                if child.name != NO_USER_TABLES_BACKUP_SUB_FOLDER
+            ],
+            "Restored",
+        )
+
+    def _run_batches_in_parallel(
+        self,
+        batches: List[Callable[[], Optional[Path]]],
+        action_name: str,
+        on_batch_finished: Optional[Callable[[Path], None]] = None,
+    ):
+        """
+        Runs the provided batch functions in a thread pool of `parallel_batches`
+        workers. The heavy lifting happens in the `pg_dump` and `pg_restore` sub
+        processes, so threads are enough to run them concurrently. The progress is
+        printed and `on_batch_finished` is called in the calling thread with the
+        result of every batch as soon as it finishes. If a batch fails, the batches
+        that haven't started yet are cancelled and the exception is raised.
+        """
+
+        num_batches = len(batches)
+        num_finished = 0
+        with ThreadPoolExecutor(max_workers=self.parallel_batches) as executor:
+            pending = {executor.submit(batch) for batch in batches}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    if future.exception() is not None:
+                        for not_started in pending:
+                            not_started.cancel()
+                        raise future.exception()
+
+                    num_finished += 1
+                    print(f"{action_name} batch {num_finished} of {num_batches}.")
+                    if on_batch_finished is not None:
+                        on_batch_finished(future.result())
 
     def _open_files_and_run_backup(
         self,
@@ -246,15 +319,34 @@ class BaserowBackupRunner:
     ):
         with tarfile.open(backup_file_name, "w:gz") as backup_output_tar:
             with tempfile.TemporaryDirectory() as temporary_directory_name:
+                backup_internal_folder_name = Path(backup_file_name).name
+                backup_output_tar.add(
+                    temporary_directory_name,
+                    arcname=backup_internal_folder_name,
+                    recursive=False,
+                )
+
+                def add_to_archive(directory: Path):
+                    # Every dumped directory is compressed into the archive right
+                    # away, while the next batches are still being dumped, and is
+                    # removed afterwards to limit the required disk space.
+                    backup_output_tar.add(
+                        directory,
+                        arcname=f"{backup_internal_folder_name}/{directory.name}",
+                    )
+                    shutil.rmtree(directory)
+
                 self._backup_everything_but_user_tables(
                     temporary_directory_name, additional_pg_dump_args
                 )
-                self._backup_user_tables_in_batches(
-                    batch_size, temporary_directory_name, additional_pg_dump_args
+                add_to_archive(
+                    Path(temporary_directory_name, NO_USER_TABLES_BACKUP_SUB_FOLDER)
                 )
-                backup_internal_folder_name = Path(backup_file_name).name
-                backup_output_tar.add(
-                    temporary_directory_name, arcname=backup_internal_folder_name
+                self._backup_user_tables_in_batches(
+                    batch_size,
+                    temporary_directory_name,
+                    additional_pg_dump_args,
+                    on_batch_finished=add_to_archive,
                 )
 
     # noinspection PyMethodMayBeStatic
@@ -71,6 +71,24 @@ class Command(BaseCommand):
             "server. Please read the `pg_dump` documentation for this argument "
             "for further details.",
         )
+        parser.add_argument(
+            "--parallel-batches",
+            type=int,
+            default=1,
+            dest="parallel_batches",
+            help="The number of table batches that are dumped at the same time, "
+            "each by a separate `pg_dump` command. Every `pg_dump` command opens "
+            "`--jobs` connections to the database, so the database must allow at "
+            "least `--parallel-batches` times `--jobs` connections.",
+        )
+        parser.add_argument(
+            "--batch-retries",
+            type=int,
+            default=0,
+            dest="batch_retries",
+            help="The number of times the `pg_dump` command of a table batch is "
+            "retried when it fails.",
+        )
         parser.add_argument(
             "-f",
             "--file",
@@ -101,6 +119,8 @@ class Command(BaseCommand):
         batch_size = options["batch-size"]
         file = options["file"]
         jobs = options["jobs"]
+        parallel_batches = options["parallel_batches"]
+        batch_retries = options["batch_retries"]
         additional_args = options["additional_pg_dump_args"]
 
         runner = BaserowBackupRunner(
@@ -109,6 +129,8 @@ class Command(BaseCommand):
             username,
             port,
             jobs,
+            parallel_batches,
+            batch_retries,
         )
         try:
             backup_file_name = runner.backup_baserow(file, batch_size, additional_args)
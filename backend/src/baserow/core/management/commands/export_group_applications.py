@@ -33,11 +33,20 @@ class Command(BaseCommand):
             "`group_ID.zip` by default, but can optionally be named differently by "
             "proving this argument.",
         )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Writes the applications as newline delimited JSON to a "
+            "`group_ID.ndjson` file instead. The rows are then fetched and written in "
+            "chunks, which is recommended for big groups because the export doesn't "
+            "have to fit into memory.",
+        )
 
     def handle(self, *args, **options):
         group_id = options["group_id"]
         indent = options["indent"]
         name = options["name"]
+        stream = options["stream"]
 
         try:
             group = Group.objects.get(pk=group_id)
@@ -52,6 +61,16 @@ class Command(BaseCommand):
         files_path = os.path.join(current_path, f"{file_name}.zip")
         export_path = os.path.join(current_path, f"{file_name}.json")
 
+        if stream:
+            stream_path = os.path.join(current_path, f"{file_name}.ndjson")
+            with open(files_path, "wb") as files_buffer, open(
+                stream_path, "w"
+            ) as export_buffer:
+                CoreHandler().export_group_applications_to_stream(
+                    group, export_buffer, files_buffer=files_buffer
+                )
+            return
+
         with open(files_path, "wb") as files_buffer:
             exported_applications = CoreHandler().export_group_applications(
                 group, files_buffer=files_buffer
@@ -7,6 +7,7 @@ from django.core.management.base import BaseCommand
 
 from baserow.core.models import Group
 from baserow.core.handler import CoreHandler
+from baserow.core.serialized_stream import SerializedStreamReader
 
 
 class Command(BaseCommand):
@@ -29,8 +30,8 @@ class Command(BaseCommand):
             "name",
             type=str,
             help="The name of the export. An export is by default named `group_{ID}`. "
-            "At least a JSON file with the given name is expected in the working "
-            "directory.",
+            "At least a JSON or NDJSON file with the given name is expected in the "
+            "working directory.",
         )
 
     @transaction.atomic
@@ -49,10 +50,18 @@ class Command(BaseCommand):
         current_path = os.path.abspath(os.getcwd())
         files_path = os.path.join(current_path, f"{name}.zip")
         import_path = os.path.join(current_path, f"{name}.json")
+        stream_path = os.path.join(current_path, f"{name}.ndjson")
         handler = CoreHandler()
 
-        with open(import_path, "r") as import_buffer:
-            content = json.load(import_buffer)
+        # A stream written with the `--stream` argument of the export command is
+        # read lazily so that the rows are imported in chunks.
+        is_stream = os.path.exists(stream_path)
+
+        with open(stream_path if is_stream else import_path, "r") as import_buffer:
+            if is_stream:
+                content = SerializedStreamReader(import_buffer)
+            else:
+                content = json.load(import_buffer)
             files_buffer = None
 
             try:
@@ -1,27 +1,61 @@
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 
 from django.core.management.base import BaseCommand
-from django.core.files.storage import default_storage
+from django.db import connections
 
 from baserow.core.user_files.models import UserFile
 from baserow.core.user_files.handler import UserFileHandler
 
 
+def regenerate_thumbnails(user_file, only_with_name):
+    return UserFileHandler().generate_user_file_thumbnails(
+        user_file, only_with_name=only_with_name
+    )
+
+
+def reset_inherited_connections():
+    """
+    Runs in every forked worker process. The database connections that have been
+    inherited from the parent process are dropped without closing them, because
+    that would close the socket that the parent process is still using. The worker
+    opens its own connection on the first query.
+    """
+
+    for connection in connections.all():
+        connection.connection = None
+
+
+def regenerate_thumbnails_by_id(user_file_id, only_with_name):
+    try:
+        user_file = UserFile.objects.get(id=user_file_id)
+    except UserFile.DoesNotExist:
+        return False
+    return regenerate_thumbnails(user_file, only_with_name)
+
+
 class Command(BaseCommand):
     help = (
         "Regenerates all the user file thumbnails based on the current settings. "
         "Existing files will be overwritten."
     )
+    # The amount of user files that are fetched at once.
+    buffer_size = 100
 
     def add_arguments(self, parser):
         parser.add_argument(
             "name",
             type=str,
             nargs="?",
-            help="The id of the group where the newly created applications must be "
-            "added to.",
+            help="The name of the thumbnail type that must be regenerated. All the "
+            "types are regenerated if not provided.",
             default=None,
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="The number of processes that generate thumbnails at the same time.",
+        )
 
     def handle(self, *args, **options):
         """
@@ -30,31 +64,43 @@ class Command(BaseCommand):
         """
 
         i = 0
-        handler = UserFileHandler()
-        buffer_size = 100
-        queryset = UserFile.objects.filter(is_image=True)
-        count = queryset.count()
-
-        while i < count:
-            user_files = queryset[i : min(count, i + buffer_size)]
-            for user_file in user_files:
-                i += 1
-
-                full_path = handler.user_file_path(user_file)
-                stream = default_storage.open(full_path)
-
-                try:
-                    image = Image.open(stream)
-                    handler.generate_and_save_image_thumbnails(
-                        image,
-                        user_file,
-                        storage=default_storage,
-                        only_with_name=options["name"],
+        only_with_name = options["name"]
+        workers = options["workers"]
+        queryset = UserFile.objects.filter(is_image=True).order_by("id")
+        executor = None
+
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=reset_inherited_connections
+            )
+
+        try:
+            last_id = 0
+            while True:
+                # Iterate over the user files using the last id instead of an offset,
+                # so that the query stays fast for the last pages.
+                user_files = list(queryset.filter(id__gt=last_id)[: self.buffer_size])
+                if len(user_files) == 0:
+                    break
+                last_id = user_files[-1].id
+
+                if executor:
+                    # Only the ids are sent to the workers, which fetch the user files
+                    # using their own connection.
+                    results = executor.map(
+                        regenerate_thumbnails_by_id,
+                        [user_file.id for user_file in user_files],
+                        [only_with_name] * len(user_files),
+                    )
+                else:
+                    results = (
+                        regenerate_thumbnails(user_file, only_with_name)
+                        for user_file in user_files
                     )
-                    image.close()
-                except IOError:
-                    pass
 
-                stream.close()
+                i += sum(1 for generated in results if generated)
+        finally:
+            if executor:
+                executor.shutdown()
 
         self.stdout.write(self.style.SUCCESS(f"{i} thumbnails have been regenerated."))
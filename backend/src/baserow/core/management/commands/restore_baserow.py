@@ -52,6 +52,16 @@ class Command(BaseCommand):
             "server. Please read the `pg_restore` documentation for this argument "
             "for further details.",
         )
+        parser.add_argument(
+            "--parallel-batches",
+            type=int,
+            default=1,
+            dest="parallel_batches",
+            help="The number of table batches that are restored at the same time, "
+            "each by a separate `pg_restore` command. Every `pg_restore` command opens "
+            "`--jobs` connections to the database, so the database must allow at "
+            "least `--parallel-batches` times `--jobs` connections.",
+        )
         parser.add_argument(
             "-f",
             "--file",
@@ -81,6 +91,7 @@ class Command(BaseCommand):
         port = options["port"]
         file = options["file"]
         jobs = options["jobs"]
+        parallel_batches = options["parallel_batches"]
         additional_args = options["additional_pg_restore_args"]
 
         runner = BaserowBackupRunner(
@@ -89,6 +100,7 @@ class Command(BaseCommand):
             username,
             port,
             jobs,
+            parallel_batches,
         )
         try:
             runner.restore_baserow(file, additional_args)
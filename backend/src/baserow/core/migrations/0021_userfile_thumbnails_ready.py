@@ -0,0 +1,21 @@
+# Generated by Django 3.2.12 on 2026-10-18 05:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0020_add_action_updated_on_and_type_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userfile",
+            name="thumbnails_ready",
+            field=models.BooleanField(
+                default=True,
+                help_text="Indicates whether the thumbnails of the image have been generated. They are generated in the background after uploading.",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.12 on 2026-10-18 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0021_userfile_thumbnails_ready"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userlogentry",
+            index=models.Index(
+                fields=["timestamp"], name="core_userlo_timesta_44b88d_idx"
+            ),
+        ),
+    ]
@@ -200,9 +200,10 @@ class PolymorphicContentTypeMixin:
                 )
 
         # Because the field type has changed we need to invalidate the cached
-        # properties so that they wont return the values of the old type.
-        del self.specific
-        del self.specific_class
+        # properties so that they wont return the values of the old type. They might
+        # not have been computed yet if the instance was fetched in its specific form.
+        self.__dict__.pop("specific", None)
+        self.__dict__.pop("specific_class", None)
 
 
 class CreatedAndUpdatedOnMixin(models.Model):
@@ -319,6 +319,7 @@ class UserLogEntry(models.Model):
     class Meta:
         get_latest_by = "timestamp"
         ordering = ["-timestamp"]
+        indexes = [models.Index(fields=["timestamp"])]
 
 
 class TrashEntry(models.Model):
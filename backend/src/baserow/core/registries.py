@@ -194,6 +194,26 @@ class ApplicationType(
             type=self.type,
         )
 
+    def export_serialized_chunked(self, application, files_zip, storage):
+        """
+        Works like `export_serialized`, but large lists, like the rows of a table, can
+        be returned as a `ChunkedList`. Their items are then only serialized chunk by
+        chunk while they're written with the `write_serialized_stream` function, which
+        keeps the memory usage low when exporting large applications.
+
+        :param application: The application that must be exported.
+        :type application: Application
+        :param files_zip: A zip file buffer where the files related to the template
+            must be copied into.
+        :type files_zip: ZipFile
+        :param storage: The storage where the files can be loaded from.
+        :type storage: Storage or None
+        :return: The exported and serialized application.
+        :rtype: dict
+        """
+
+        return self.export_serialized(application, files_zip, storage)
+
     def import_serialized(
         self,
         group,
@@ -210,7 +230,8 @@ class ApplicationType(
         :param group: The group that the application must be added to.
         :type group: Group
         :param serialized_values: The exported serialized values by the
-            `export_serialized` method.
+            `export_serialized` method. Large lists can also be a `ChunkedList` if
+            they were exported with the `export_serialized_chunked` method.
         :type serialized_values: dict`
         :param id_mapping: The map of exported ids to newly created ids that must be
             updated when a new instance has been created.
@@ -0,0 +1,160 @@
+import json
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+SERIALIZED_STREAM_VERSION = 1
+CHUNKED_LIST_MARKER = "$chunked_list"
+
+
+class ChunkedList:
+    """
+    A list of which the items are produced or consumed in chunks. It can be used as a
+    value in a serialized export instead of a list, so that the items don't have to
+    be held in memory all at once. The `write_serialized_stream` function writes
+    every chunk as a separate line and the `SerializedStreamReader` reads them back
+    lazily. The chunks can only be iterated over once.
+    """
+
+    def __init__(self, chunks: Iterable[List[Any]], count: int):
+        """
+        :param chunks: An iterable that lazily yields the chunks of items.
+        :param count: The total amount of items in all the chunks.
+        """
+
+        self._chunks = chunks
+        self._consumed = False
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def chunks(self) -> Iterator[List[Any]]:
+        if self._consumed:
+            raise ValueError("The chunks of a chunked list can only be iterated once.")
+        self._consumed = True
+        return iter(self._chunks)
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self.chunks():
+            yield from chunk
+
+
+def write_serialized_stream(buffer: IO[str], items: Iterable[Dict], count: int):
+    """
+    Writes the provided serialized items, for example exported applications, to the
+    buffer as newline delimited JSON. Every `ChunkedList` in an item is replaced by a
+    marker and its chunks are written on separate lines right after the item, so only
+    one chunk has to be in memory at the same time.
+
+    :param buffer: The text buffer that the stream must be written to.
+    :param items: The JSON serializable items, which may contain `ChunkedList`
+        values. They can be generated lazily.
+    :param count: The amount of items.
+    """
+
+    buffer.write(json.dumps({"version": SERIALIZED_STREAM_VERSION, "count": count}))
+    buffer.write("\n")
+
+    for item in items:
+        chunked_lists = []
+
+        def replace_chunked_lists(value):
+            if isinstance(value, ChunkedList):
+                chunked_lists.append(value)
+                return {
+                    CHUNKED_LIST_MARKER: len(chunked_lists) - 1,
+                    "count": len(value),
+                }
+            elif isinstance(value, dict):
+                return {k: replace_chunked_lists(v) for k, v in value.items()}
+            elif isinstance(value, list):
+                return [replace_chunked_lists(v) for v in value]
+            return value
+
+        buffer.write(json.dumps({"item": replace_chunked_lists(item)}))
+        buffer.write("\n")
+
+        for index, chunked_list in enumerate(chunked_lists):
+            for chunk in chunked_list.chunks():
+                buffer.write(json.dumps({"chunk": index, "items": chunk}))
+                buffer.write("\n")
+
+
+class SerializedStreamReader:
+    """
+    Lazily reads the items written by the `write_serialized_stream` function. The
+    chunked lists are restored as `ChunkedList` values that read their chunks from
+    the buffer when they're iterated over. Because the buffer is read sequentially,
+    the chunked lists of an item must be iterated in the order they were written and
+    before the next item is read. Chunked lists that are not iterated are skipped.
+    """
+
+    def __init__(self, buffer: IO[str]):
+        """
+        :param buffer: The text buffer containing the stream.
+        :raises ValueError: When the buffer doesn't contain a supported stream.
+        """
+
+        self._lines = iter(buffer)
+        self._next_record = None
+        self._item_index = -1
+
+        header = json.loads(next(self._lines, "{}"))
+        if (
+            not isinstance(header, dict)
+            or header.get("version") != SERIALIZED_STREAM_VERSION
+        ):
+            raise ValueError("The buffer does not contain a supported stream.")
+        self.count = header["count"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict]:
+        while True:
+            record = self._pop_record()
+            if record is None:
+                return
+            # The remaining chunks of the previous item are skipped.
+            if "item" in record:
+                self._item_index += 1
+                yield self._restore_chunked_lists(record["item"], self._item_index)
+
+    def _peek_record(self) -> Optional[Dict]:
+        if self._next_record is None:
+            line = next(self._lines, None)
+            if line is not None:
+                self._next_record = json.loads(line)
+        return self._next_record
+
+    def _pop_record(self) -> Optional[Dict]:
+        record = self._peek_record()
+        self._next_record = None
+        return record
+
+    def _restore_chunked_lists(self, value: Any, item_index: int) -> Any:
+        if isinstance(value, dict):
+            if CHUNKED_LIST_MARKER in value:
+                return ChunkedList(
+                    self._read_chunks(item_index, value[CHUNKED_LIST_MARKER]),
+                    value["count"],
+                )
+            return {
+                k: self._restore_chunked_lists(v, item_index) for k, v in value.items()
+            }
+        elif isinstance(value, list):
+            return [self._restore_chunked_lists(v, item_index) for v in value]
+        return value
+
+    def _read_chunks(self, item_index: int, index: int) -> Iterator[List[Any]]:
+        if item_index != self._item_index:
+            raise ValueError(
+                "The chunked lists of an item must be read before the next item."
+            )
+
+        while True:
+            record = self._peek_record()
+            if record is None or "chunk" not in record or record["chunk"] > index:
+                return
+            self._pop_record()
+            if record["chunk"] == index:
+                yield record["items"]
@@ -4,6 +4,7 @@ from .trash.tasks import (
     setup_period_trash_tasks,
 )
 from .action.tasks import setup_periodic_action_tasks, cleanup_old_actions
+from .user_files.tasks import generate_user_file_thumbnails
 
 __all__ = [
     "permanently_delete_marked_trash",
@@ -11,4 +12,5 @@ __all__ = [
     "setup_period_trash_tasks",
     "cleanup_old_actions",
     "setup_periodic_action_tasks",
+    "generate_user_file_thumbnails",
 ]
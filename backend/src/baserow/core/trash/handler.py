@@ -1,4 +1,6 @@
 import logging
+import time
+from collections import Counter
 from typing import Optional, Dict, Any
 
 from django.conf import settings
@@ -190,48 +192,72 @@ class TrashHandler:
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+        The entries are deleted in batches of the same type and parent, so that for
+        example the trashed rows of a table can be deleted with a single query.
         """
 
         trash_item_lookup_cache = {}
         deleted_count = 0
+        deleted_count_per_type = Counter()
+        start = time.perf_counter()
         while True:
             with transaction.atomic():
                 # Perm deleting a group or application can cause cascading deletion of
-                # other trash entries hence we only look up one a time. If we instead
-                # looped over a single queryset lookup of all TrashEntries then we could
-                # end up trying to delete TrashEntries which have already been deleted
-                # by a previous cascading delete of a group or application.
-                trash_entry = TrashEntry.objects.filter(
+                # other trash entries hence we only look up one batch at a time. If we
+                # instead looped over a single queryset lookup of all TrashEntries then
+                # we could end up trying to delete TrashEntries which have already
+                # been deleted by a previous cascading delete of a group or
+                # application.
+                marked_trash = TrashEntry.objects.filter(
                     should_be_permanently_deleted=True
-                ).first()
-                if not trash_entry:
+                ).order_by("id")
+                first_trash_entry = marked_trash.first()
+                if not first_trash_entry:
                     break
 
                 trash_item_type = trash_item_type_registry.get(
-                    trash_entry.trash_item_type
+                    first_trash_entry.trash_item_type
+                )
+                parent_id = first_trash_entry.parent_trash_item_id
+                _check_parent_id_valid(parent_id, trash_item_type)
+                trash_entries = list(
+                    marked_trash.filter(
+                        trash_item_type=first_trash_entry.trash_item_type,
+                        parent_trash_item_id=parent_id,
+                    )[: trash_item_type.permanent_deletion_batch_size]
                 )
 
-                try:
-                    to_delete = trash_item_type.lookup_trashed_item(
-                        trash_entry, trash_item_lookup_cache
-                    )
-                    TrashHandler._permanently_delete_and_signal(
-                        trash_item_type,
-                        to_delete,
-                        trash_entry.parent_trash_item_id,
-                        trash_item_lookup_cache,
+                # When a parent item is deleted it should also delete all of it's
+                # children. Hence we expect that many of these TrashEntries to no
+                # longer point to an existing item. In such a situation we just want
+                # to delete the entry as the item itself has been correctly deleted.
+                deleted_items = trash_item_type.permanently_delete_items(
+                    trash_entries, trash_item_lookup_cache
+                )
+                for trash_item_id, trash_item in deleted_items:
+                    permanently_deleted.send(
+                        sender=trash_item_type.type,
+                        trash_item_id=trash_item_id,
+                        trash_item=trash_item,
+                        parent_id=parent_id,
                     )
-                except TrashItemDoesNotExist:
-                    # When a parent item is deleted it should also delete all of it's
-                    # children. Hence we expect that many of these TrashEntries to no
-                    # longer point to an existing item. In such a situation we just want
-                    # to delete the entry as the item itself has been correctly deleted.
-                    pass
-                trash_entry.delete()
-                deleted_count += 1
+
+                TrashEntry.objects.filter(
+                    id__in=[trash_entry.id for trash_entry in trash_entries]
+                ).delete()
+                deleted_count += len(trash_entries)
+                deleted_count_per_type[trash_item_type.type] += len(trash_entries)
+
+        duration = time.perf_counter() - start
+        per_type = ", ".join(
+            f"{count} {type_name}"
+            for type_name, count in deleted_count_per_type.items()
+        )
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
-            "trashed items."
+            f"trashed items in {duration:.2f} seconds "
+            f"({deleted_count / duration if duration else 0:.1f} entries per second)"
+            + (f": {per_type}." if per_type else ".")
         )
 
     @staticmethod
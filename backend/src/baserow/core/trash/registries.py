@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 
 from baserow.core.exceptions import TrashItemDoesNotExist
 from baserow.core.registry import (
@@ -52,6 +52,46 @@ class TrashableItemType(ModelInstanceMixin, Instance, ABC):
 
         pass
 
+    @property
+    def permanent_deletion_batch_size(self) -> int:
+        """
+        :returns The maximum amount of trash entries of this type and with the same
+            parent that are passed to `permanently_delete_items` at once.
+        """
+
+        return 1
+
+    def permanently_delete_items(
+        self,
+        trash_entries: List[Any],
+        trash_item_lookup_cache: Dict[str, Any] = None,
+    ) -> List[Tuple[int, Any]]:
+        """
+        Permanently deletes the trashed items of the provided trash entries, which
+        are all of this type and have the same parent. By default every item is
+        looked up and deleted separately, but it can be overridden to delete many
+        items at once. Entries of which the item no longer exists, for example
+        because it has been deleted together with its parent, are skipped.
+
+        :param trash_entries: The trash entries of the items to delete permanently.
+        :param trash_item_lookup_cache: If a cache is being used to speed up trash
+            item lookups it should be provided here.
+        :return: The id and the instance of every item that has been deleted.
+        """
+
+        deleted = []
+        for trash_entry in trash_entries:
+            try:
+                trashed_item = self.lookup_trashed_item(
+                    trash_entry, trash_item_lookup_cache
+                )
+            except TrashItemDoesNotExist:
+                continue
+            trash_item_id = trashed_item.id
+            self.permanently_delete_item(trashed_item, trash_item_lookup_cache)
+            deleted.append((trash_item_id, trashed_item))
+        return deleted
+
     @property
     def requires_parent_id(self) -> bool:
         """
@@ -1,10 +1,17 @@
+import math
 import pathlib
 import mimetypes
+import shutil
+import tempfile
+import time
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 from io import BytesIO
 from urllib.parse import urlparse
-from typing import Optional
+from typing import Iterable, Optional
+from zipfile import ZipFile, ZipInfo
 
 import advocate
 from advocate.exceptions import UnacceptableAddressException
@@ -15,6 +22,7 @@ from PIL import Image, ImageOps
 from django.conf import settings
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.db.models import QuerySet
 
 from baserow.core.utils import sha256_hash, stream_size, random_string, truncate_middle
@@ -27,6 +35,10 @@ from .exceptions import (
     InvalidFileURLError,
 )
 from .models import UserFile
+from .tasks import generate_user_file_thumbnails
+
+# The size of the chunks in which the files are copied when they're added to a zip.
+USER_FILE_COPY_CHUNK_SIZE = 1024 * 1024
 
 
 class UserFileHandler:
@@ -126,8 +138,13 @@ class UserFileHandler:
         provided storage. Note that existing files with the same name will be
         overwritten.
 
+        The image is only decoded once at the lowest resolution that is still big
+        enough for all the thumbnails. JPEG images are decoded in draft mode, which
+        lets the decoder scale them down while reading, so big photos don't have to be
+        decoded at full resolution.
+
         :param image: The original Pillow image that serves as base when generating the
-            the image.
+            the image. It must not be loaded yet for the draft mode to have effect.
         :type image: Image
         :param user_file: The user file for which the thumbnails must be generated
             and saved.
@@ -146,6 +163,8 @@ class UserFileHandler:
         storage = storage or default_storage
         image_width = user_file.image_width
         image_height = user_file.image_height
+        image_format = image.format
+        sizes = {}
 
         for name, size in settings.USER_THUMBNAILS.items():
             if only_with_name and only_with_name != name:
@@ -159,9 +178,27 @@ class UserFileHandler:
             elif size_copy[1] is None and size_copy[0] is not None:
                 size_copy[1] = round(image_height / image_width * size_copy[0])
 
-            thumbnail = ImageOps.fit(image.copy(), size_copy, Image.ANTIALIAS)
+            sizes[name] = size_copy
+
+        if not sizes:
+            return
+
+        width, height = image.size
+        scale = min(1, max(max(w / width, h / height) for w, h in sizes.values()))
+        reduced_size = (
+            max(1, math.ceil(width * scale)),
+            max(1, math.ceil(height * scale)),
+        )
+        image.draft(None, reduced_size)
+        if image.size != reduced_size:
+            image = image.resize(reduced_size, Image.ANTIALIAS)
+
+        for name, size in sizes.items():
+            # `ImageOps.fit` returns a new image, so the reduced image can be reused
+            # for all the sizes.
+            thumbnail = ImageOps.fit(image, size, Image.ANTIALIAS)
             thumbnail_stream = BytesIO()
-            thumbnail.save(thumbnail_stream, image.format)
+            thumbnail.save(thumbnail_stream, image_format)
             thumbnail_stream.seek(0)
             thumbnail_path = self.user_file_thumbnail_path(user_file, name)
             storage.save(thumbnail_path, thumbnail_stream)
@@ -169,6 +206,48 @@ class UserFileHandler:
             del thumbnail
             del thumbnail_stream
 
+    def generate_user_file_thumbnails(
+        self, user_file, storage=None, only_with_name=None
+    ):
+        """
+        Opens the image of the provided user file from the storage, generates the
+        thumbnails and marks them as ready. This is called by the
+        `generate_user_file_thumbnails` task after an image has been uploaded.
+
+        :param user_file: The image user file for which the thumbnails must be
+            generated.
+        :type user_file: UserFile
+        :param storage: The storage where the image is loaded from and where the
+            thumbnails must be saved to.
+        :type storage: Storage or None
+        :param only_with_name: If provided, then only thumbnail types with that name
+            will be regenerated.
+        :type only_with_name: None or String
+        :return: Whether the thumbnails have been generated.
+        :rtype: bool
+        """
+
+        storage = storage or default_storage
+        generated = False
+
+        with storage.open(self.user_file_path(user_file)) as stream:
+            try:
+                with Image.open(stream) as image:
+                    self.generate_and_save_image_thumbnails(
+                        image, user_file, storage=storage, only_with_name=only_with_name
+                    )
+                generated = True
+            except IOError:
+                pass
+
+        # Also when the image could not be opened the thumbnails are marked as
+        # ready, because they're never going to be available.
+        if not user_file.thumbnails_ready:
+            user_file.thumbnails_ready = True
+            UserFile.objects.filter(id=user_file.id).update(thumbnails_ready=True)
+
+        return generated
+
     def upload_user_file(self, user, file_name, stream, storage=None):
         """
         Saves the provided uploaded file in the provided storage. If no storage is
@@ -221,7 +300,8 @@ class UserFileHandler:
         image_height = None
 
         # Try to open the image with Pillow. If that succeeds we know the file is an
-        # image.
+        # image. This only reads the header of the file, the image data is decoded
+        # when the thumbnails are generated.
         try:
             image = Image.open(stream)
             is_image = True
@@ -230,6 +310,11 @@ class UserFileHandler:
         except IOError:
             pass
 
+        # The thumbnails are generated in the background when the file is saved to
+        # the default storage because that's the only storage the task has access to.
+        # For any other storage they're generated right away.
+        generate_thumbnails_later = image is not None and storage is default_storage
+
         user_file = UserFile.objects.create(
             original_name=file_name,
             original_extension=extension,
@@ -241,12 +326,13 @@ class UserFileHandler:
             is_image=is_image,
             image_width=image_width,
             image_height=image_height,
+            thumbnails_ready=not generate_thumbnails_later,
         )
 
         # If the uploaded file is an image we need to generate the configurable
         # thumbnails for it. We want to generate them before the file is saved to the
         # storage because some storages close the stream after saving.
-        if image:
+        if image and not generate_thumbnails_later:
             self.generate_and_save_image_thumbnails(image, user_file, storage=storage)
 
             # When all the thumbnails have been generated, the image can be deleted
@@ -260,8 +346,88 @@ class UserFileHandler:
         # Close the stream because we don't need it anymore.
         stream.close()
 
+        if generate_thumbnails_later:
+            user_file_id = user_file.id
+            transaction.on_commit(
+                lambda: generate_user_file_thumbnails.delay(user_file_id)
+            )
+
         return user_file
 
+    def add_user_files_to_zip(
+        self,
+        user_files: Iterable[UserFile],
+        files_zip: ZipFile,
+        storage=None,
+    ):
+        """
+        Adds the files of the provided user files to the zip file, unless a file with
+        the same name has already been added. The files are streamed into the zip file
+        in chunks, so they never have to be in memory entirely. When the storage is
+        not a local file system, the files are downloaded in parallel by a pool of
+        `BASEROW_EXPORT_FILES_DOWNLOAD_WORKERS` threads.
+
+        :param user_files: The user files that must be added to the zip file.
+        :param files_zip: The zip file that the files must be written to.
+        :param storage: The storage where the files can be loaded from.
+        """
+
+        storage = storage or default_storage
+
+        # `NameToInfo` is the index of the zip file by name, unlike `namelist()` it
+        # doesn't have to be rebuilt for every lookup.
+        names = [
+            name
+            for name in dict.fromkeys(user_file.name for user_file in user_files)
+            if name not in files_zip.NameToInfo
+        ]
+
+        def write_to_zip(name, source):
+            zip_info = ZipInfo(name, date_time=time.localtime(time.time())[:6])
+            zip_info.compress_type = files_zip.compression
+            with files_zip.open(zip_info, mode="w") as zip_file:
+                shutil.copyfileobj(source, zip_file, USER_FILE_COPY_CHUNK_SIZE)
+
+        try:
+            storage.path("")
+            is_local_storage = True
+        except NotImplementedError:
+            is_local_storage = False
+
+        if is_local_storage:
+            for name in names:
+                with storage.open(self.user_file_path(name), mode="rb") as source:
+                    write_to_zip(name, source)
+            return
+
+        def download(name):
+            downloaded = tempfile.SpooledTemporaryFile(
+                max_size=USER_FILE_COPY_CHUNK_SIZE
+            )
+            with storage.open(self.user_file_path(name), mode="rb") as source:
+                shutil.copyfileobj(source, downloaded, USER_FILE_COPY_CHUNK_SIZE)
+            downloaded.seek(0)
+            return downloaded
+
+        # The downloads are submitted in a sliding window, so that only a limited
+        # amount of downloaded files are waiting to be written to the zip file.
+        workers = settings.BASEROW_EXPORT_FILES_DOWNLOAD_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            names_iterator = iter(names)
+            for name in names_iterator:
+                pending.append((name, executor.submit(download, name)))
+                if len(pending) >= workers * 2:
+                    break
+
+            while pending:
+                name, future = pending.popleft()
+                with future.result() as downloaded:
+                    write_to_zip(name, downloaded)
+                next_name = next(names_iterator, None)
+                if next_name is not None:
+                    pending.append((next_name, executor.submit(download, next_name)))
+
     def upload_user_file_by_url(self, user, url, storage=None):
         """
         Uploads a user file by downloading it from the provided URL.
@@ -24,6 +24,11 @@ class UserFile(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     sha256_hash = models.CharField(max_length=64, db_index=True)
+    thumbnails_ready = models.BooleanField(
+        default=True,
+        help_text="Indicates whether the thumbnails of the image have been generated. "
+        "They are generated in the background after uploading.",
+    )
 
     objects = UserFileQuerySet.as_manager()
 
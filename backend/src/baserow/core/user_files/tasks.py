@@ -0,0 +1,22 @@
+from baserow.config.celery import app
+
+
+# noinspection PyUnusedLocal
+@app.task(bind=True)
+def generate_user_file_thumbnails(self, user_file_id, only_with_name=None):
+    """
+    Generates the thumbnails of an uploaded image in the background, so that the
+    upload request doesn't have to wait for it.
+    """
+
+    from baserow.core.user_files.handler import UserFileHandler
+    from baserow.core.user_files.models import UserFile
+
+    try:
+        user_file = UserFile.objects.get(id=user_file_id, is_image=True)
+    except UserFile.DoesNotExist:
+        return
+
+    UserFileHandler().generate_user_file_thumbnails(
+        user_file, only_with_name=only_with_name
+    )
@@ -2,6 +2,7 @@ from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 from baserow.ws.registries import page_registry
+from baserow.ws.tasks import get_user_channel_group_name
 
 
 class CoreConsumer(AsyncJsonWebsocketConsumer):
@@ -23,7 +24,12 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
             await self.close()
             return
 
-        await self.channel_layer.group_add("users", self.channel_name)
+        # Anonymous connections to public views don't belong to a user, so they never
+        # receive messages that are broadcasted to users.
+        if user.is_authenticated:
+            await self.channel_layer.group_add(
+                get_user_channel_group_name(user.id), self.channel_name
+            )
 
     async def receive_json(self, content, **parameters):
         if "page" in content:
@@ -103,30 +109,10 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
                 }
             )
 
-    async def broadcast_to_users(self, event):
-        """
-        Broadcasts a message to all the users that are in the provided user_ids list.
-        Optionally the ignore_web_socket_id is ignored because that is often the
-        sender.
-
-        :param event: The event containing the payload, user ids and the web socket
-            id that must be ignored.
-        :type event: dict
-        """
-
-        web_socket_id = self.scope["web_socket_id"]
-        payload = event["payload"]
-        user_ids = event["user_ids"]
-        ignore_web_socket_id = event["ignore_web_socket_id"]
-
-        if (
-            not ignore_web_socket_id or ignore_web_socket_id != web_socket_id
-        ) and self.scope["user"].id in user_ids:
-            await self.send_json(payload)
-
     async def broadcast_to_group(self, event):
         """
-        Broadcasts a message to all the users that are in the provided group name.
+        Broadcasts a message to all the connections that are in the channel group the
+        message has been sent to. This is used for both pages and users.
 
         :param event: The event containing the payload, group name and the web socket
             id that must be ignored.
@@ -142,4 +128,9 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
 
     async def disconnect(self, message):
         await self.discard_current_page(send_confirmation=False)
-        await self.channel_layer.group_discard("users", self.channel_name)
+
+        user = self.scope["user"]
+        if user and user.is_authenticated:
+            await self.channel_layer.group_discard(
+                get_user_channel_group_name(user.id), self.channel_name
+            )
@@ -1,10 +1,25 @@
 from baserow.config.celery import app
 
 
+def get_user_channel_group_name(user_id):
+    """
+    Returns the name of the channel group that contains all the web socket
+    connections of the user.
+
+    :param user_id: The id of the user.
+    :type user_id: int
+    :return: The name of the user's channel group.
+    :rtype: str
+    """
+
+    return f"user-{user_id}"
+
+
 @app.task(bind=True)
 def broadcast_to_users(self, user_ids, payload, ignore_web_socket_id=None):
     """
-    Broadcasts a JSON payload the provided users.
+    Broadcasts a JSON payload the provided users. The payload is only sent to the
+    channel groups of the provided users, so other connections don't receive it.
 
     :param user_ids: A list containing the user ids that should receive the payload.
     :type user_ids: list
@@ -17,20 +32,28 @@ def broadcast_to_users(self, user_ids, payload, ignore_web_socket_id=None):
     :type ignore_web_socket_id: str
     """
 
+    import asyncio
+
     from asgiref.sync import async_to_sync
 
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        "users",
-        {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-        },
-    )
+    message = {
+        "type": "broadcast_to_group",
+        "payload": payload,
+        "ignore_web_socket_id": ignore_web_socket_id,
+    }
+
+    async def send_to_users():
+        await asyncio.gather(
+            *[
+                channel_layer.group_send(get_user_channel_group_name(user_id), message)
+                for user_id in set(user_ids)
+            ]
+        )
+
+    async_to_sync(send_to_users)()
 
 
 @app.task(bind=True)
@@ -38,3 +38,37 @@ def test_get_same_table_deps(data_fixture):
     assert FieldDependencyHandler().get_same_table_dependencies(field_a) == [field_b]
     assert FieldDependencyHandler().get_same_table_dependencies(field_b) == [field_c]
     assert FieldDependencyHandler().get_same_table_dependencies(field_c) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("num_fields", [10, 100, 500])
+def test_get_same_table_deps_of_many_fields_uses_constant_queries(
+    data_fixture, django_assert_num_queries, num_fields
+):
+    table = data_fixture.create_database_table()
+    dependency_text_field = data_fixture.create_text_field(
+        table=table, order=1, create_field=False
+    )
+    dependency_number_field = data_fixture.create_number_field(
+        table=table, order=2, create_field=False
+    )
+    fields = []
+    for i in range(num_fields):
+        field = data_fixture.create_text_field(
+            table=table, name=f"field {i}", order=3 + i, create_field=False
+        )
+        FieldDependency.objects.create(
+            dependant=field,
+            dependency=dependency_text_field if i % 2 else dependency_number_field,
+        )
+        fields.append(field)
+
+    # One query for the dependencies and one per specific field type.
+    with django_assert_num_queries(3):
+        dependencies = FieldDependencyHandler.get_same_table_dependencies(fields)
+
+    assert dependencies == [dependency_text_field, dependency_number_field]
+    assert [type(d) for d in dependencies] == [
+        type(dependency_text_field),
+        type(dependency_number_field),
+    ]
@@ -1081,6 +1081,57 @@ def test_batch_update_rows(api_client, data_fixture):
     assert getattr(row_2, f"field_{text_field.id}") == "yellow"
 
 
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_create_and_update_rows_minimal_response(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, order=0, name="Color")
+    model = table.get_model()
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+
+    response = api_client.post(
+        f"{url}?minimal_response=true",
+        {
+            "items": [
+                {f"field_{text_field.id}": "green"},
+                {f"field_{text_field.id}": "yellow"},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    row_1, row_2 = model.objects.all()
+    assert response.json() == {"items": [{"id": row_1.id}, {"id": row_2.id}]}
+    assert getattr(row_1, f"field_{text_field.id}") == "green"
+    assert getattr(row_2, f"field_{text_field.id}") == "yellow"
+
+    response = api_client.patch(
+        f"{url}?minimal_response=true",
+        {
+            "items": [
+                {"id": row_2.id, f"field_{text_field.id}": "blue"},
+                {"id": row_1.id, f"field_{text_field.id}": "red"},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert sorted(item["id"] for item in response.json()["items"]) == [
+        row_1.id,
+        row_2.id,
+    ]
+    assert response.json()["items"][0].keys() == {"id"}
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert getattr(row_1, f"field_{text_field.id}") == "red"
+    assert getattr(row_2, f"field_{text_field.id}") == "blue"
+
+
 @pytest.mark.django_db
 @pytest.mark.api_rows
 def test_batch_update_rows_last_modified_field(api_client, data_fixture):
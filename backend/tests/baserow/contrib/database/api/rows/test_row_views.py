@@ -513,6 +513,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_4[f"field_{text_field_2.id}"] == ""
     assert response_json_row_4["order"] == "4.00000000000000000000"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 1
 
@@ -536,6 +537,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_5[f"field_{text_field_2.id}"] == ""
     assert response_json_row_5["order"] == "2.99999999999999999999"
 
+    TokenHandler().flush_token_usage()
     token.refresh_from_db()
     assert token.handled_calls == 2
 
@@ -1252,6 +1254,45 @@ def test_delete_row_by_id(api_client, data_fixture):
     assert model.objects.count() == 0
 
 
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_number_field(table=table, name="Number")
+    model = table.get_model()
+    for value in [3, None, 1, 2, None, 1]:
+        model.objects.create(**{f"field_{field.id}": value})
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    def list_all_ids(order_by):
+        ids = []
+        next_url = f"{url}?cursor&size=2&order_by={order_by}"
+        while next_url:
+            response = api_client.get(
+                next_url, format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+            )
+            assert response.status_code == HTTP_200_OK
+            ids += [row["id"] for row in response.json()["results"]]
+            next_url = response.json()["next"]
+        return ids
+
+    for order_by in [f"field_{field.id}", f"-field_{field.id}"]:
+        response = api_client.get(
+            f"{url}?order_by={order_by}",
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        expected_ids = [row["id"] for row in response.json()["results"]]
+        assert list_all_ids(order_by) == expected_ids
+
+    response = api_client.get(
+        f"{url}?cursor&size=201", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
 @pytest.mark.django_db
 def test_list_rows_with_attribute_names(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
@@ -4,6 +4,7 @@ from typing import List, Dict, Any
 import pytest
 from django.shortcuts import reverse
 from django.core.cache import cache
+from django.db import connection
 from rest_framework import serializers
 from rest_framework.fields import Field
 from rest_framework.status import (
@@ -203,6 +204,168 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    option_field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=option_field, value="A")
+    option_b = data_fixture.create_select_option(field=option_field, value="B")
+    grid = data_fixture.create_grid_view(table=table)
+
+    model = grid.table.get_model()
+    values = [
+        ("b", 3, option_b),
+        (None, 1, None),
+        ("a", None, option_a),
+        ("b", 1, option_b),
+        ("a", 2, None),
+        (None, None, option_a),
+        ("c", 2, option_b),
+    ]
+    for text, number, option in values:
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": text,
+                f"field_{number_field.id}": number,
+                f"field_{option_field.id}": option,
+            }
+        )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    def list_all_ids_with_cursor(size):
+        ids = []
+        next_url = f"{url}?cursor=&size={size}"
+        while next_url:
+            response = api_client.get(
+                next_url, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+            )
+            assert response.status_code == HTTP_200_OK
+            response_json = response.json()
+            assert "count" not in response_json
+            assert len(response_json["results"]) <= size
+            ids += [row["id"] for row in response_json["results"]]
+            next_url = response_json["next"]
+        return ids
+
+    def list_all_ids_with_offset():
+        response = api_client.get(
+            url, {"limit": 100}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+        )
+        return [row["id"] for row in response.json()["results"]]
+
+    assert list_all_ids_with_cursor(3) == list_all_ids_with_offset()
+
+    data_fixture.create_view_sort(view=grid, field=text_field, order="DESC")
+    data_fixture.create_view_sort(view=grid, field=number_field, order="ASC")
+    expected_ids = list_all_ids_with_offset()
+    assert list_all_ids_with_cursor(1) == expected_ids
+    assert list_all_ids_with_cursor(2) == expected_ids
+
+    grid.viewsort_set.all().delete()
+    data_fixture.create_view_sort(view=grid, field=option_field, order="DESC")
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+    expected_ids = list_all_ids_with_offset()
+    assert list_all_ids_with_cursor(1) == expected_ids
+    assert list_all_ids_with_cursor(4) == expected_ids
+
+    response = api_client.get(
+        url, {"cursor": "invalid"}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    # The count is still computed when it's requested together with a cursor.
+    response = api_client.get(
+        url, {"cursor": "", "count": ""}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": len(values)}
+
+
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination_sorted_by_interval(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for number in [3, None, 1, 2, 1, 5]:
+        model.objects.create(**{f"field_{number_field.id}": number})
+    interval_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="Interval",
+        formula="date_interval(concat(field('Number'), ' hours 1 second'))",
+    )
+    data_fixture.create_view_sort(view=grid, field=interval_field, order="DESC")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, {"limit": 100}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    ids = []
+    next_url = f"{url}?cursor=&size=2"
+    while next_url:
+        response = api_client.get(next_url, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
+        assert response.status_code == HTTP_200_OK
+        ids += [row["id"] for row in response.json()["results"]]
+        next_url = response.json()["next"]
+
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_approximate_count(api_client, data_fixture, settings):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    model = grid.table.get_model()
+    model.objects.bulk_create([model(**{f"field_{text_field.id}": "a"})] * 4)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {table.get_database_table_name()}")
+    model.objects.create(**{f"field_{text_field.id}": "b"})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 0
+    settings.BASEROW_ROW_COUNT_CACHE_THRESHOLD = 0
+
+    response = api_client.get(
+        f"{url}?count&approximate_count", **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 4, "count_is_approximate": True}
+
+    response = api_client.get(
+        f"{url}?approximate_count&limit=10", **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 4
+    assert response_json["count_is_approximate"] is True
+
+    response = api_client.get(f"{url}?count", **{"HTTP_AUTHORIZATION": f"JWT {token}"})
+    assert response.json() == {"count": 5}
+
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="a"
+    )
+    response = api_client.get(
+        f"{url}?approximate_count", **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    response_json = response.json()
+    assert response_json["count"] == 4
+    assert response_json["count_is_approximate"] is False
+    assert len(response_json["results"]) == 4
+
+
 @pytest.mark.django_db
 def test_list_rows_include_field_options(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -0,0 +1,271 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connections
+from django.test import override_settings
+
+from baserow.contrib.database.api.fields.serializers import FieldSerializer
+from baserow.contrib.database.fields.dependencies.models import FieldValueRecompute
+from baserow.contrib.database.fields.dependencies.recompute import (
+    FieldValueRecomputeHandler,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import FormulaField
+from baserow.contrib.database.formula import FormulaHandler
+
+
+def get_values(table, field):
+    model = table.get_model()
+    return list(
+        model.objects.order_by("id").values_list(field.db_column, flat=True).all()
+    )
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD=10)
+def test_formula_values_of_small_tables_are_updated_right_away(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("number", "number")], rows=[[i] for i in range(3)]
+    )
+
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') * 2"
+    )
+
+    assert get_values(table, formula) == [0, 2, 4]
+    assert FieldValueRecompute.objects.count() == 0
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD=3,
+    BASEROW_FORMULA_RECOMPUTE_CHUNK_SIZE=2,
+)
+def test_formula_values_of_large_tables_are_recomputed_in_chunks(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("number", "number")], rows=[[i] for i in range(5)]
+    )
+    handler = FieldValueRecomputeHandler()
+
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') * 2"
+    )
+
+    assert get_values(table, formula) == [None] * 5
+    recompute = FieldValueRecompute.objects.get()
+    assert recompute.table_id == table.id
+    assert [field.id for field in recompute.fields.all()] == [formula.id]
+    assert recompute.last_row_id == 0
+
+    assert handler.recompute_next_chunk()
+    recompute.refresh_from_db()
+    assert recompute.last_row_id == rows[1].id
+    assert recompute.processed_rows == 2
+    assert recompute.total_rows == 5
+    assert recompute.progress_percentage == 40
+    assert get_values(table, formula) == [0, 2, None, None, None]
+
+    # Continues where the previous chunk has left off.
+    assert handler.recompute_next_chunk()
+    recompute.refresh_from_db()
+    assert recompute.last_row_id == rows[3].id
+    assert get_values(table, formula) == [0, 2, 4, 6, None]
+
+    assert handler.recompute_next_chunk()
+    assert FieldValueRecompute.objects.count() == 0
+    assert get_values(table, formula) == [0, 2, 4, 6, 8]
+
+    assert not handler.recompute_next_chunk()
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD=3,
+    BASEROW_FORMULA_RECOMPUTE_CHUNK_SIZE=2,
+)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_progress_of_value_recompute_is_exposed(
+    mock_broadcast_to_channel_group, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("number", "number")], rows=[[i] for i in range(5)]
+    )
+    handler = FieldValueRecomputeHandler()
+
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') * 2"
+    )
+    assert FieldSerializer(fields[0]).data["value_recompute"] is None
+    assert FieldSerializer(formula).data["value_recompute"] == {
+        "processed_rows": 0,
+        "total_rows": None,
+        "progress_percentage": 0,
+    }
+
+    mock_broadcast_to_channel_group.delay.reset_mock()
+    with django_capture_on_commit_callbacks(execute=True):
+        assert handler.recompute_next_chunk()
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "field_updated"
+    assert args[0][1]["field_id"] == formula.id
+    assert args[0][1]["field"]["value_recompute"] == {
+        "processed_rows": 2,
+        "total_rows": 5,
+        "progress_percentage": 40,
+    }
+
+    handler.run_pending_recomputes()
+    assert FieldSerializer(formula).data["value_recompute"] is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD=3)
+def test_dependant_tables_are_recomputed_after_large_table(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    large_table, large_fields, large_rows = data_fixture.build_table(
+        user=user,
+        database=database,
+        columns=[("name", "text"), ("number", "number")],
+        rows=[["a", 1], ["b", 2], ["c", 3], ["d", 4]],
+    )
+    small_table = data_fixture.create_database_table(user=user, database=database)
+    data_fixture.create_text_field(table=small_table, name="primary", primary=True)
+    handler = FieldHandler()
+    formula = handler.create_field(
+        user, large_table, "formula", name="formula", formula="field('number')"
+    )
+    FieldValueRecomputeHandler().run_pending_recomputes()
+    link = handler.create_field(
+        user, small_table, "link_row", name="link", link_row_table=large_table
+    )
+    small_row = small_table.get_model().objects.create()
+    getattr(small_row, link.db_column).set([large_rows[0].id, large_rows[1].id])
+    lookup = handler.create_field(
+        user,
+        small_table,
+        "formula",
+        name="lookup",
+        formula="sum(lookup('link', 'formula'))",
+    )
+    assert get_values(small_table, lookup) == [Decimal("3")]
+
+    handler.update_field(user, formula, formula="field('number') * 10")
+
+    # The lookup in the small table depends on the values of the large table, so
+    # it must be recomputed after the large table in the background as well.
+    assert list(FieldValueRecompute.objects.values_list("table_id", flat=True)) == [
+        large_table.id,
+        small_table.id,
+    ]
+    assert get_values(small_table, lookup) == [Decimal("3")]
+
+    assert not FieldValueRecomputeHandler().run_pending_recomputes()
+    assert get_values(large_table, formula) == [10, 20, 30, 40]
+    assert get_values(small_table, lookup) == [Decimal("30")]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_locked_recompute_does_not_block_other_tables(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = FieldHandler()
+    tables, formulas = [], []
+    for name in ["a", "b"]:
+        table, fields, rows = data_fixture.build_table(
+            user=user, database=database, columns=[("number", "number")], rows=[[1]]
+        )
+        formula = handler.create_field(
+            user, table, "formula", name="formula", formula="field('number')"
+        )
+        table.get_model().objects.update(**{formula.db_column: None})
+        tables.append(table)
+        formulas.append(formula)
+    table_a, table_b = tables
+    formula_a, formula_b = formulas
+    dependant_table = data_fixture.create_database_table(user=user, database=database)
+    data_fixture.create_text_field(table=dependant_table, name="p", primary=True)
+    handler.create_field(
+        user, dependant_table, "link_row", name="link", link_row_table=table_a
+    )
+    lookup = handler.create_field(
+        user, dependant_table, "formula", name="l", formula="lookup('link', 'formula')"
+    )
+
+    recompute_a = FieldValueRecompute.objects.create(table=table_a)
+    recompute_a.fields.set([formula_a])
+    recompute_dependant = FieldValueRecompute.objects.create(table=dependant_table)
+    recompute_dependant.fields.set([lookup])
+    recompute_b = FieldValueRecompute.objects.create(table=table_b)
+    recompute_b.fields.set([formula_b])
+
+    other_connection = connections.create_connection("default")
+    try:
+        with other_connection.cursor() as cursor:
+            cursor.execute("BEGIN")
+            cursor.execute(
+                f"SELECT id FROM {FieldValueRecompute._meta.db_table} "
+                f"WHERE id = %s FOR UPDATE",
+                [recompute_a.id],
+            )
+
+            # The recompute of the dependant table must wait for the locked one,
+            # but the one of the unrelated table can be executed.
+            assert FieldValueRecomputeHandler().recompute_next_chunk()
+            assert list(FieldValueRecompute.objects.values_list("id", flat=True)) == [
+                recompute_a.id,
+                recompute_dependant.id,
+            ]
+            assert get_values(table_a, formula_a) == [None]
+            assert get_values(table_b, formula_b) == [1]
+            assert not FieldValueRecomputeHandler().recompute_next_chunk()
+
+            cursor.execute("ROLLBACK")
+    finally:
+        other_connection.close()
+
+    assert not FieldValueRecomputeHandler().run_pending_recomputes()
+    assert FieldValueRecompute.objects.count() == 0
+    assert get_values(table_a, formula_a) == [1]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_FORMULA_BACKGROUND_RECOMPUTE_ROW_THRESHOLD=3)
+def test_background_recompute_task_runs_after_commit(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("number", "number")], rows=[[i] for i in range(4)]
+    )
+
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') + 1"
+    )
+
+    assert FieldValueRecompute.objects.count() == 0
+    assert get_values(table, formula) == [1, 2, 3, 4]
+
+
+@pytest.mark.django_db
+def test_update_formulas_command_recomputes_values(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("number", "number")], rows=[[1], [2]]
+    )
+    formula = FieldHandler().create_field(
+        user, table, "formula", name="formula", formula="field('number') + 1"
+    )
+    table.get_model().objects.update(**{formula.db_column: None})
+    FormulaField.objects.update(version=FormulaHandler.BASEROW_FORMULA_VERSION - 1)
+
+    call_command("update_formulas", "--recompute-values")
+
+    assert FieldValueRecompute.objects.count() == 0
+    assert get_values(table, formula) == [2, 3]
@@ -1,12 +1,14 @@
 import pytest
 import json
 from io import BytesIO
+from unittest.mock import patch
 
 from zipfile import ZipFile, ZIP_DEFLATED
 
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
 
 from baserow.core.handler import CoreHandler
 from baserow.core.user_files.models import UserFile
@@ -301,3 +303,68 @@ def test_import_export_file_field(data_fixture, tmpdir):
     file_path = tmpdir.join("user_files", imported_user_file.name)
     assert file_path.isfile()
     assert file_path.open().read() == "Hello World"
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE=2)
+def test_export_file_field_adds_every_file_once(data_fixture, tmpdir):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    field = data_fixture.create_file_field(table=table, name="File")
+
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+    user_file_1 = handler.upload_user_file(
+        user, "a.txt", ContentFile(b"A"), storage=storage
+    )
+    user_file_2 = handler.upload_user_file(
+        user, "b.txt", ContentFile(b"B"), storage=storage
+    )
+    model = table.get_model()
+    for files in [[user_file_1], [user_file_1, user_file_2], [], [user_file_2]]:
+        model.objects.create(
+            **{
+                f"field_{field.id}": [
+                    {"name": f.name, "visible_name": f.original_name} for f in files
+                ]
+            }
+        )
+
+    files_buffer = BytesIO()
+    exported_applications = CoreHandler().export_group_applications(
+        database.group, files_buffer=files_buffer, storage=storage
+    )
+
+    with ZipFile(files_buffer, "r", ZIP_DEFLATED, False) as zip_file:
+        assert sorted(zip_file.namelist()) == sorted(
+            [user_file_1.name, user_file_2.name]
+        )
+        assert zip_file.read(user_file_1.name) == b"A"
+        assert zip_file.read(user_file_2.name) == b"B"
+
+    rows = exported_applications[0]["tables"][0]["rows"]
+    assert [[f["original_name"] for f in row[f"field_{field.id}"]] for row in rows] == [
+        ["a.txt"],
+        ["a.txt", "b.txt"],
+        [],
+        ["b.txt"],
+    ]
+
+    imported_group = data_fixture.create_group(user=user)
+    with patch.object(
+        UserFileHandler, "upload_user_file", wraps=handler.upload_user_file
+    ) as upload_user_file:
+        imported_applications, _ = CoreHandler().import_applications_to_group(
+            imported_group, exported_applications, files_buffer, storage
+        )
+
+    # Every file is only unpacked once, even though it's used in multiple rows.
+    assert upload_user_file.call_count == 2
+    imported_table = imported_applications[0].table_set.get()
+    imported_field = imported_table.field_set.get()
+    imported_rows = imported_table.get_model().objects.all()
+    assert [
+        [f["visible_name"] for f in getattr(row, f"field_{imported_field.id}")]
+        for row in imported_rows
+    ] == [["a.txt"], ["a.txt", "b.txt"], [], ["b.txt"]]
@@ -17,6 +17,7 @@ from baserow.contrib.database.fields.field_types import (
     MultipleSelectFieldType,
 )
 from django.apps.registry import apps
+from django.test.utils import override_settings
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.field_converters import (
     MultipleSelectConversionConfig,
@@ -1549,6 +1550,55 @@ def test_convert_multiple_select_to_text(data_fixture):
     assert cell_2 == "Option 2, Option 1"
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_CONVERSION_BATCH_SIZE=2)
+def test_convert_multiple_select_fields_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("text", "text")],
+        rows=[["a, b"], ["b"], [""], ["c, a"], ["a"]],
+    )
+    field_handler = FieldHandler()
+
+    def get_cells():
+        model = table.get_model()
+        return [
+            [option.value for option in getattr(row, f"field_{fields[0].id}").all()]
+            for row in model.objects.order_by("id")
+        ]
+
+    field = field_handler.update_field(
+        user=user,
+        field=fields[0],
+        new_type_name="multiple_select",
+        select_options=[{"value": value, "color": "red"} for value in ["a", "b", "c"]],
+    )
+    assert get_cells() == [["a", "b"], ["b"], [], ["c", "a"], ["a"]]
+
+    field = field_handler.update_field(
+        user=user, field=field, new_type_name="single_select"
+    )
+    model = table.get_model()
+    assert [
+        getattr(row, f"field_{field.id}").value
+        if getattr(row, f"field_{field.id}")
+        else None
+        for row in model.objects.order_by("id")
+    ] == ["a", "b", None, "c", "a"]
+
+    field = field_handler.update_field(
+        user=user, field=field, new_type_name="multiple_select"
+    )
+    assert get_cells() == [["a"], ["b"], [], ["c"], ["a"]]
+
+    field = field_handler.update_field(user=user, field=field, new_type_name="text")
+    model = table.get_model()
+    assert [
+        getattr(row, f"field_{field.id}") for row in model.objects.order_by("id")
+    ] == ["a", "b", None, "c", "a"]
+
+
 @pytest.mark.django_db
 def test_convert_multiple_select_to_text_with_comma_and_quotes(data_fixture):
     user = data_fixture.create_user()
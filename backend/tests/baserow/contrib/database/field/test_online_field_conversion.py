@@ -0,0 +1,181 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from baserow.contrib.database.fields.exceptions import CannotChangeFieldType
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import NumberField, TextField
+from baserow.contrib.database.fields.online_conversion import (
+    OnlineFieldTypeConverter,
+    get_shadow_column_name,
+)
+
+
+def get_values(table, field):
+    model = table.get_model()
+    return list(
+        model.objects.order_by("id").values_list(field.db_column, flat=True).all()
+    )
+
+
+def get_column_names(table):
+    with connection.cursor() as cursor:
+        return [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+
+
+def get_online_conversion_function_names():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT proname FROM pg_proc WHERE proname LIKE "
+            "'baserow_online_conversion_%%'"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+@pytest.mark.django_db
+def test_convert_field_type_online(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("text", "text")],
+        rows=[["1"], ["2.5"], ["not a number"], [None], ["-4"]],
+    )
+    progress = []
+
+    field = OnlineFieldTypeConverter().convert(
+        user,
+        fields[0],
+        "number",
+        batch_size=2,
+        progress_callback=lambda *args: progress.append(args),
+        number_decimal_places=1,
+        number_negative=True,
+    )
+
+    assert isinstance(field, NumberField)
+    assert field.number_decimal_places == 1
+    assert get_values(table, field) == [
+        Decimal("1.0"),
+        Decimal("2.5"),
+        None,
+        None,
+        Decimal("-4.0"),
+    ]
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    assert get_shadow_column_name(field) not in get_column_names(table)
+    assert get_online_conversion_function_names() == []
+
+
+@pytest.mark.django_db
+def test_values_written_during_online_conversion_are_converted(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["1"], ["2"], ["3"]]
+    )
+    model = table.get_model()
+    text_field = fields[0]
+
+    def write_rows(converted_rows, total_rows):
+        if converted_rows == 1:
+            # Already converted row.
+            model.objects.filter(id=rows[0].id).update(**{text_field.db_column: "10"})
+            # Not yet converted row.
+            model.objects.filter(id=rows[2].id).update(**{text_field.db_column: "30"})
+            model.objects.create(**{text_field.db_column: "40"})
+
+    field = OnlineFieldTypeConverter().convert(
+        user, text_field, "number", batch_size=1, progress_callback=write_rows
+    )
+
+    assert get_values(table, field) == [10, 2, 30, 40]
+
+
+@pytest.mark.django_db
+def test_convert_single_select_field_online(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=field, value="A")
+    option_b = data_fixture.create_select_option(field=field, value="B")
+    model = table.get_model()
+    for option in [option_a, None, option_b]:
+        model.objects.create(**{f"{field.db_column}_id": getattr(option, "id", None)})
+
+    field = OnlineFieldTypeConverter().convert(user, field, "text", batch_size=2)
+
+    assert isinstance(field, TextField)
+    assert get_values(table, field) == ["A", None, "B"]
+    assert field.select_options.count() == 0
+
+
+@pytest.mark.django_db
+def test_fields_that_cant_be_converted_online(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["a"]]
+    )
+    converter = OnlineFieldTypeConverter()
+
+    with pytest.raises(CannotChangeFieldType):
+        converter.convert(user, fields[0], "single_select")
+
+    with pytest.raises(CannotChangeFieldType):
+        converter.convert(user, fields[0], "multiple_select")
+
+    with pytest.raises(CannotChangeFieldType):
+        converter.convert(user, fields[0], "formula", formula="'a'")
+
+    assert get_values(table, fields[0]) == ["a"]
+
+
+@pytest.mark.django_db
+def test_failed_online_conversion_is_cleaned_up(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["1"], ["2"]]
+    )
+
+    def fail(converted_rows, total_rows):
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError):
+        OnlineFieldTypeConverter().convert(
+            user, fields[0], "number", progress_callback=fail
+        )
+
+    field = FieldHandler().get_field(fields[0].id).specific
+    assert isinstance(field, TextField)
+    assert get_values(table, field) == ["1", "2"]
+    assert get_shadow_column_name(field) not in get_column_names(table)
+    assert get_online_conversion_function_names() == []
+
+
+@pytest.mark.django_db
+def test_convert_field_type_online_command(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["1.25"], ["2"]]
+    )
+    out = StringIO()
+
+    call_command(
+        "convert_field_type_online",
+        fields[0].id,
+        "number",
+        "--field-values",
+        '{"number_decimal_places": 2}',
+        stdout=out,
+    )
+
+    field = FieldHandler().get_field(fields[0].id).specific
+    assert isinstance(field, NumberField)
+    assert get_values(table, field) == [Decimal("1.25"), Decimal("2.00")]
+    assert "Converted 2 of 2 rows." in out.getvalue()
@@ -6,8 +6,10 @@ from pytz import UTC
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInGroup
@@ -365,6 +367,101 @@ def test_create_rows_created_on_and_last_modified(data_fixture):
         assert row.updated_on == datetime(2020, 1, 1, 12, 0, tzinfo=UTC)
 
 
+@pytest.mark.django_db
+def test_create_rows_using_copy(data_fixture, settings):
+    settings.BASEROW_ROW_COPY_INSERT_THRESHOLD = 2
+    settings.BASEROW_ROW_COPY_INSERT_CHUNK_SIZE = 2
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    related_table = data_fixture.create_database_table(database=table.database)
+    related_primary = data_fixture.create_text_field(table=related_table, primary=True)
+    related_row = related_table.get_model().objects.create(
+        **{related_primary.db_column: "related"}
+    )
+    field_handler = FieldHandler()
+    text_field = field_handler.create_field(user, table, "text", name="text")
+    long_text_field = field_handler.create_field(user, table, "long_text", name="long")
+    number_field = field_handler.create_field(
+        user, table, "number", name="number", number_decimal_places=2
+    )
+    boolean_field = field_handler.create_field(user, table, "boolean", name="bool")
+    date_field = field_handler.create_field(
+        user, table, "date", name="date", date_include_time=True
+    )
+    select_field = field_handler.create_field(
+        user,
+        table,
+        "single_select",
+        name="select",
+        select_options=[{"value": "A", "color": "blue"}],
+    )
+    option = select_field.select_options.first()
+    link_field = field_handler.create_field(
+        user, table, "link_row", name="link", link_row_table=related_table
+    )
+    formula_field = field_handler.create_field(
+        user, table, "formula", name="formula", formula="concat(field('text'), '!')"
+    )
+    lookup_field = field_handler.create_field(
+        user,
+        table,
+        "formula",
+        name="lookup",
+        formula="join(lookup('link', '%s'), '')" % related_primary.name,
+    )
+
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: f"row {i}",
+                long_text_field.db_column: "a\tb\\c\nd",
+                number_field.db_column: Decimal("1.25") + i,
+                boolean_field.db_column: i % 2 == 0,
+                date_field.db_column: "2020-01-01T12:30:00Z",
+                select_field.db_column: option.id,
+                link_field.db_column: [related_row.id] if i < 2 else [],
+            }
+            for i in range(3)
+        ],
+    )
+
+    assert len(rows) == 3
+    assert len({row.id for row in rows}) == 3
+    assert [getattr(row, text_field.db_column) for row in rows] == [
+        "row 0",
+        "row 1",
+        "row 2",
+    ]
+    assert getattr(rows[0], long_text_field.db_column) == "a\tb\\c\nd"
+    assert [getattr(row, number_field.db_column) for row in rows] == [
+        Decimal("1.25"),
+        Decimal("2.25"),
+        Decimal("3.25"),
+    ]
+    assert [getattr(row, boolean_field.db_column) for row in rows] == [
+        True,
+        False,
+        True,
+    ]
+    assert getattr(rows[0], date_field.db_column) == datetime(
+        2020, 1, 1, 12, 30, tzinfo=UTC
+    )
+    assert getattr(rows[0], select_field.db_column).id == option.id
+    assert [
+        [r.id for r in getattr(row, link_field.db_column).all()] for row in rows
+    ] == [[related_row.id], [related_row.id], []]
+    assert getattr(rows[2], formula_field.db_column) == "row 2!"
+    assert [getattr(row, lookup_field.db_column) for row in rows] == [
+        "related",
+        "related",
+        None,
+    ]
+    assert rows[0].created_on is not None
+
+
 @pytest.mark.django_db
 def test_update_rows_created_on_and_last_modified(data_fixture):
     user = data_fixture.create_user()
@@ -386,6 +483,49 @@ def test_update_rows_created_on_and_last_modified(data_fixture):
         assert row.updated_on == datetime(2020, 1, 2, 12, 0, tzinfo=UTC)
 
 
+@pytest.mark.django_db
+def test_update_rows_only_writes_updated_and_refreshed_columns(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    untouched_field = data_fixture.create_text_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"concat(field('{field.name}'), 'a')"
+    )
+    last_modified_field = data_fixture.create_last_modified_field(table=table)
+    handler = RowHandler()
+    model = table.get_model()
+    row = handler.create_row(
+        user=user,
+        table=table,
+        model=model,
+        values={untouched_field.db_column: "untouched"},
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        rows = handler.update_rows(
+            user=user,
+            table=table,
+            model=model,
+            rows=[{"id": row.id, field.db_column: "Test"}],
+        )
+
+    bulk_update_query = next(
+        query["sql"]
+        for query in captured.captured_queries
+        if query["sql"].startswith(f'UPDATE "{model._meta.db_table}"')
+    )
+    assert f'"{field.db_column}" = ' in bulk_update_query
+    assert f'"{formula_field.db_column}" = ' in bulk_update_query
+    assert f'"{last_modified_field.db_column}" = ' in bulk_update_query
+    assert f'"{untouched_field.db_column}" = ' not in bulk_update_query
+
+    row = rows[0]
+    assert getattr(row, field.db_column) == "Test"
+    assert getattr(row, untouched_field.db_column) == "untouched"
+    assert getattr(row, formula_field.db_column) == "Testa"
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.row_updated.send")
 @patch("baserow.contrib.database.rows.signals.before_row_update.send")
@@ -1,7 +1,9 @@
 from unittest.mock import patch, call
 
 import pytest
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.table.cache import (
+    built_model_cache,
     invalidate_table_in_model_cache,
     get_latest_cached_model_field_attrs,
 )
@@ -97,3 +99,59 @@ def test_deleting_tables_group_removes_generated_model_cache_entry(data_fixture)
     table.database.group.delete()
 
     assert get_latest_cached_model_field_attrs(table.id) is None
+
+
+@pytest.mark.django_db
+def test_built_model_is_reused_until_the_table_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table)
+    built_model_cache.clear()
+    built_model_cache.reset_stats()
+
+    model = table.get_model()
+    assert table.get_model() is model
+    assert table.get_model(field_ids=[]) is not model
+    assert table.get_model(attribute_names=True) is not model
+
+    stats = built_model_cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["builds"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["average_build_time"] > 0
+
+    field = FieldHandler().create_field(user, table, "number", name="Number")
+    new_model = table.get_model()
+    assert new_model is not model
+    assert field.db_column in [f.column for f in new_model._meta.get_fields()]
+    assert table.get_model() is new_model
+
+
+@pytest.mark.django_db
+def test_built_model_is_not_reused_when_a_related_table_changes(data_fixture):
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables()
+    built_model_cache.clear()
+
+    model_a = table_a.get_model()
+    assert table_a.get_model() is model_a
+
+    # Only the model version of table b changes.
+    invalidate_table_in_model_cache(table_b.id)
+
+    assert table_a.get_model() is not model_a
+
+
+@pytest.mark.django_db
+def test_built_model_cache_evicts_least_recently_used_models(data_fixture, settings):
+    settings.BASEROW_BUILT_MODEL_CACHE_SIZE = 2
+    tables = [data_fixture.create_database_table() for _ in range(3)]
+    built_model_cache.clear()
+
+    models = [table.get_model() for table in tables]
+    assert built_model_cache.get_stats()["size"] == 2
+    assert tables[0].get_model() is not models[0]
+    assert tables[2].get_model() is models[2]
+
+    settings.BASEROW_BUILT_MODEL_CACHE_SIZE = 0
+    assert tables[2].get_model() is not models[2]
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.db import connection
 from django.conf import settings
+from django.test.utils import override_settings
 from decimal import Decimal
 
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -278,6 +279,45 @@ def test_fill_table_with_initial_data(data_fixture):
     assert num_fields == 5
 
 
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_ROW_COPY_INSERT_THRESHOLD=2, BASEROW_ROW_COPY_INSERT_CHUNK_SIZE=2
+)
+def test_fill_table_with_initial_data_using_copy(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    data = [
+        ["A", "B"],
+        ["1-1", "tab\tnew line\nback\\slash"],
+        ["2-1", ""],
+        ["3-1", "\\N"],
+    ]
+    table = TableHandler().create_table(
+        user, database, name="Table 1", data=data, first_row_header=True
+    )
+
+    text_fields = TextField.objects.filter(table=table)
+    results = table.get_model().objects.all()
+
+    assert len(results) == 3
+    assert [row.order for row in results] == [Decimal("1"), Decimal("2"), Decimal("3")]
+    assert [getattr(row, f"field_{text_fields[0].id}") for row in results] == [
+        "1-1",
+        "2-1",
+        "3-1",
+    ]
+    assert [getattr(row, f"field_{text_fields[1].id}") for row in results] == [
+        "tab\tnew line\nback\\slash",
+        "",
+        "\\N",
+    ]
+
+    # The sequence must have been moved forward so that new rows don't clash.
+    row = table.get_model().objects.create()
+    assert row.id > max(result.id for result in results)
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.table.signals.table_updated.send")
 def test_update_database_table(send_mock, data_fixture):
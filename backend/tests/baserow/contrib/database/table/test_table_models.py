@@ -720,3 +720,37 @@ def test_table_model_fields_requiring_refresh_after_update(data_fixture):
     )
     assert len(fields_from_normal_formula_model) == 1
     assert fields_from_normal_formula_model[0] == f"field_{formula_field.id}"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("num_fields", [10, 100, 500])
+def test_generate_field_attrs_uses_constant_queries(
+    data_fixture, django_assert_num_queries, num_fields
+):
+    table = data_fixture.create_database_table()
+    field_creators = [
+        data_fixture.create_text_field,
+        data_fixture.create_number_field,
+        data_fixture.create_boolean_field,
+        data_fixture.create_date_field,
+    ]
+    for i in range(num_fields):
+        field_creators[i % len(field_creators)](
+            table=table, name=f"field {i}", order=i, create_field=False
+        )
+
+    # One query for the fields and one per specific field type.
+    with django_assert_num_queries(5):
+        field_attrs = table._fetch_and_generate_field_attrs(
+            add_dependencies=True,
+            attribute_names=False,
+            field_ids=None,
+            field_names=None,
+            fields=[],
+            filtered=False,
+        )
+
+    assert len(field_attrs["_field_objects"]) == num_fields
+    assert [f["field"].name for f in field_attrs["_field_objects"].values()] == [
+        f"field {i}" for i in range(num_fields)
+    ]
@@ -0,0 +1,244 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.search_index import (
+    SEARCH_DOCUMENT_COLUMN,
+    TableSearchIndexHandler,
+)
+from baserow.core.trash.handler import TrashHandler
+from baserow.test_utils.helpers import setup_interesting_test_table
+
+
+def search(table, query, only_search_by_field_ids=None):
+    model = table.get_model()
+    return sorted(
+        model.objects.all()
+        .search_all_fields(query, only_search_by_field_ids)
+        .values_list("id", flat=True)
+    )
+
+
+def get_search_documents(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {SEARCH_DOCUMENT_COLUMN} FROM "
+            f"{table.get_database_table_name()} ORDER BY id"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_search_document_function_names():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT proname FROM pg_proc WHERE proname LIKE "
+            "'baserow_search_document_%%'"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+@pytest.mark.django_db
+def test_search_index_finds_the_same_rows_as_searching_all_fields(data_fixture):
+    table, user, row, blank_row = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    row = model.objects.get(id=row.id)
+    queries = ["1", "-1.2", "TEXT", "02/01", "2020", "01:23", "b.txt", "A", "z"]
+    for field_object in model._field_objects.values():
+        value = field_object["type"].get_human_readable_value(
+            getattr(row, field_object["name"]), field_object
+        )
+        if value:
+            queries.append(value)
+
+    expected = {query: search(table, query) for query in queries}
+    TableSearchIndexHandler().enable(table)
+    table.refresh_from_db()
+
+    assert table.search_index_enabled
+    assert len([d for d in get_search_documents(table) if d]) == model.objects.count()
+    for query in queries:
+        assert search(table, query) == expected[query], query
+
+
+@pytest.mark.django_db
+def test_search_index_is_maintained_on_row_writes(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["apple"], ["banana"]]
+    )
+    TableSearchIndexHandler().enable(table, batch_size=1)
+    table.refresh_from_db()
+
+    row_handler = RowHandler()
+    row_handler.update_row_by_id(user, table, rows[0].id, {fields[0].id: "cherry"})
+    new_row = row_handler.create_row(user, table, {fields[0].id: "apple pie"})
+
+    assert search(table, "apple") == [new_row.id]
+    assert search(table, "CHERRY") == [rows[0].id]
+    assert search(table, str(rows[1].id)) == [rows[1].id]
+
+
+@pytest.mark.django_db
+def test_search_index_is_updated_when_fields_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field, value="Option")
+    model = table.get_model()
+    row = model.objects.create(
+        **{text_field.db_column: "text", f"{select_field.db_column}_id": option.id}
+    )
+    TableSearchIndexHandler().enable(table)
+    table.refresh_from_db()
+    field_handler = FieldHandler()
+
+    assert search(table, "option") == [row.id]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        field_handler.update_field(
+            user,
+            select_field,
+            select_options=[{"id": option.id, "value": "Renamed", "color": "blue"}],
+        )
+    assert search(table, "option") == []
+    assert search(table, "renamed") == [row.id]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        formula_field = field_handler.create_field(
+            user, table, "formula", name="formula", formula="concat('calculated', 1)"
+        )
+    assert search(table, "calculated") == [row.id]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        field_handler.delete_field(user, formula_field)
+    assert search(table, "calculated") == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        field_handler.update_field(user, text_field, name="renamed text")
+    assert search(table, "text") == [row.id]
+
+    table.refresh_from_db()
+    assert table.search_index_stale_field_ids == []
+
+
+@pytest.mark.django_db
+def test_changed_fields_are_searched_without_index_until_refilled(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field, value="Option")
+    model = table.get_model()
+    row = model.objects.create(**{f"{select_field.db_column}_id": option.id})
+    TableSearchIndexHandler().enable(table)
+    table.refresh_from_db()
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        FieldHandler().update_field(
+            user,
+            select_field,
+            select_options=[{"id": option.id, "value": "Renamed", "color": "blue"}],
+        )
+
+    # The rows are not refilled in the request, so the search document is stale.
+    table.refresh_from_db()
+    assert table.search_index_stale_field_ids == [select_field.id]
+    assert "Option" in get_search_documents(table)[0]
+    assert search(table, "renamed") == [row.id]
+
+    for callback in callbacks:
+        callback()
+
+    table.refresh_from_db()
+    assert table.search_index_stale_field_ids == []
+    assert "Renamed" in get_search_documents(table)[0]
+    assert search(table, "option") == []
+    assert search(table, "renamed") == [row.id]
+
+
+@pytest.mark.django_db
+def test_search_index_is_not_used_when_only_searching_some_fields(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("visible", "text"), ("hidden", "text")],
+        rows=[["a", "secret"], ["secret", "b"]],
+    )
+    TableSearchIndexHandler().enable(table)
+    table.refresh_from_db()
+
+    assert search(table, "secret") == [rows[0].id, rows[1].id]
+    assert search(table, "secret", [fields[0].id]) == [rows[1].id]
+
+
+@pytest.mark.django_db
+def test_disable_search_index(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["apple"]]
+    )
+    handler = TableSearchIndexHandler()
+    handler.enable(table)
+    handler.disable(table)
+    table.refresh_from_db()
+
+    assert not table.search_index_enabled
+    assert get_search_document_function_names() == []
+    assert SEARCH_DOCUMENT_COLUMN not in [
+        column.name
+        for column in connection.introspection.get_table_description(
+            connection.cursor(), table.get_database_table_name()
+        )
+    ]
+    RowHandler().create_row(user, table, {fields[0].id: "apple"})
+    assert len(search(table, "apple")) == 2
+
+
+@pytest.mark.django_db
+def test_search_document_function_is_dropped_with_the_table(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    TableSearchIndexHandler().enable(table)
+    table.refresh_from_db()
+
+    assert get_search_document_function_names() == [
+        f"baserow_search_document_{table.id}"
+    ]
+
+    TableHandler().delete_table(user, table)
+    TrashHandler.permanently_delete(table)
+
+    assert get_search_document_function_names() == []
+
+
+@pytest.mark.django_db
+def test_table_search_index_command(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user, columns=[("text", "text")], rows=[["apple"], ["banana"]]
+    )
+    out = StringIO()
+
+    call_command(
+        "table_search_index", table.id, "enable", "--batch-size", "1", stdout=out
+    )
+
+    table.refresh_from_db()
+    assert table.search_index_enabled
+    assert "Filled 1 of 2 rows." in out.getvalue()
+    assert "Filled 2 of 2 rows." in out.getvalue()
+    assert search(table, "banana") == [rows[1].id]
+
+    call_command("table_search_index", table.id, "disable", stdout=out)
+
+    table.refresh_from_db()
+    assert not table.search_index_enabled
@@ -4,16 +4,20 @@ import string
 from pytz import timezone
 from freezegun import freeze_time
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 from pytest_unordered import unordered
 
 from django.http import HttpRequest
 from rest_framework.request import Request
 
 from baserow.core.exceptions import UserNotInGroup
+from baserow.core.handler import CoreHandler
+from baserow.core.models import GroupUser
+from baserow.core.trash.handler import TrashHandler
 from baserow.contrib.database.exceptions import DatabaseDoesNotBelongToGroup
 from baserow.contrib.database.table.exceptions import TableDoesNotBelongToGroup
 from baserow.contrib.database.tokens.models import Token, TokenPermission
-from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.contrib.database.tokens.handler import TokenHandler, cache
 from baserow.contrib.database.tokens.exceptions import (
     TokenDoesNotExist,
     MaximumUniqueTokenTriesError,
@@ -631,6 +635,56 @@ def test_delete_token(data_fixture):
     assert Token.objects.all().first().id == token_2.id
 
 
+@pytest.mark.django_db
+def test_has_table_permission_uses_the_compiled_permissions(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    group = data_fixture.create_group(users=[user, user_2])
+    database = data_fixture.create_database_application(group=group)
+    table_1 = data_fixture.create_database_table(database=database)
+    table_2 = data_fixture.create_database_table(database=database)
+    token = data_fixture.create_token(user=user_2, group=group)
+
+    handler = TokenHandler()
+    handler.update_token_permissions(
+        user_2, token, create=[database], read=[table_1], update=True, delete=False
+    )
+
+    def get_token():
+        return Token.objects.select_related("group", "user").get(id=token.id)
+
+    # The permissions are compiled once, after that checking them doesn't require
+    # any query, also not for a different instance of the same token.
+    assert handler.has_table_permission(get_token(), "read", table_1)
+    token_instance = get_token()
+    with django_assert_num_queries(0):
+        assert handler.has_table_permission(token_instance, "create", table_1)
+        assert handler.has_table_permission(token_instance, "create", table_2)
+        assert handler.has_table_permission(token_instance, "read", table_1)
+        assert not handler.has_table_permission(token_instance, "read", table_2)
+        assert handler.has_table_permission(
+            token_instance, ["delete", "update"], table_2
+        )
+        assert not handler.has_table_permission(token_instance, "delete", table_2)
+
+    handler.update_token_permissions(user_2, token, read=True)
+    assert handler.has_table_permission(get_token(), "read", table_2)
+    assert not handler.has_table_permission(get_token(), "create", table_2)
+
+    TrashHandler.trash(user, group, database, table_1)
+    assert handler.has_table_permission(get_token(), "read", table_2)
+    handler.update_token_permissions(user_2, token, read=[table_2])
+    TrashHandler.trash(user, group, database, table_2)
+    assert not handler.has_table_permission(get_token(), "read", table_2)
+    TrashHandler.restore_item(user, "table", table_2.id)
+    assert handler.has_table_permission(get_token(), "read", table_2)
+
+    CoreHandler().delete_group_user(user, GroupUser.objects.get(user=user_2))
+    assert not handler.has_table_permission(get_token(), "read", table_2)
+
+
 @pytest.mark.django_db
 def test_update_token_usage(data_fixture):
     token_1 = data_fixture.create_token()
@@ -645,3 +699,73 @@ def test_update_token_usage(data_fixture):
 
     assert token_1.handled_calls == 1
     assert token_1.last_call == datetime(2020, 1, 1, 12, 00, tzinfo=timezone("UTC"))
+
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 0
+    assert token_1.last_call is None
+
+    assert handler.flush_token_usage() == 1
+    token_1.refresh_from_db()
+    assert token_1.handled_calls == 1
+    assert token_1.last_call == datetime(2020, 1, 1, 12, 00, tzinfo=timezone("UTC"))
+
+
+@pytest.mark.django_db
+def test_flush_token_usage(data_fixture, django_assert_num_queries):
+    token_1 = data_fixture.create_token()
+    token_2 = data_fixture.create_token()
+    token_3 = data_fixture.create_token()
+
+    handler = TokenHandler()
+
+    with freeze_time("2020-01-01 12:00"):
+        for _ in range(3):
+            handler.update_token_usage(token_1)
+    with freeze_time("2020-01-01 12:30"):
+        handler.update_token_usage(token_1)
+        handler.update_token_usage(token_2)
+
+    # Only the used tokens are looked at and their usage is written with a single
+    # query.
+    with django_assert_num_queries(1):
+        assert handler.flush_token_usage() == 5
+
+    for token in [token_1, token_2, token_3]:
+        token.refresh_from_db()
+    assert token_1.handled_calls == 4
+    assert token_1.last_call == datetime(2020, 1, 1, 12, 30, tzinfo=timezone("UTC"))
+    assert token_2.handled_calls == 1
+    assert token_2.last_call == datetime(2020, 1, 1, 12, 30, tzinfo=timezone("UTC"))
+    assert token_3.handled_calls == 0
+    assert token_3.last_call is None
+
+    # The usage is only written once and calls made after the flush are written by
+    # the next one.
+    assert handler.flush_token_usage() == 0
+    handler.update_token_usage(token_2)
+    assert handler.flush_token_usage() == 1
+    token_2.refresh_from_db()
+    assert token_2.handled_calls == 2
+
+
+@pytest.mark.django_db
+def test_flush_token_usage_is_skipped_while_another_flush_runs(data_fixture):
+    token = data_fixture.create_token()
+    handler = TokenHandler()
+    handler.update_token_usage(token)
+
+    cache_lock = MagicMock()
+    cache_lock.acquire.return_value = False
+    with patch.object(cache, "lock", create=True, return_value=cache_lock):
+        assert handler.flush_token_usage() == 0
+
+    token.refresh_from_db()
+    assert token.handled_calls == 0
+
+    cache_lock.acquire.return_value = True
+    with patch.object(cache, "lock", create=True, return_value=cache_lock):
+        assert handler.flush_token_usage() == 1
+    cache_lock.release.assert_called_once()
+
+    token.refresh_from_db()
+    assert token.handled_calls == 1
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 from django.conf import settings
+from django.test.utils import override_settings
 from django.db import connection
 from django.urls import reverse
 from django.utils import timezone
@@ -87,18 +88,12 @@ def test_perm_deleting_many_rows_at_once_only_looks_up_the_model_once(
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
     invalidate_table_in_model_cache(table.id, invalidate_related_tables=True)
-    # We only want seven more queries when deleting 2 rows instead of 1 compared to
-    # above:
-    # 1. An extra query to open the second trash entries savepoint
-    # 2. An extra query to lookup the second trash entry
-    # 3. A query to lookup the extra row we are deleting
-    # 4. A query to delete said row
-    # 5. A query to delete it's trash entry.
-    # 6. A query to delete any related row comments.
-    # 7. An extra query to close the second trash entries savepoint
+    # The trashed rows of the same table are deleted with a single query, so we only
+    # want one more query when deleting 2 rows instead of 1 compared to above, which
+    # is the query to delete any related row comments of the second row.
     # If we weren't caching the table models an extra number of queries would be first
     # performed to lookup the table information which breaks this assertion.
-    with django_assert_num_queries(20):
+    with django_assert_num_queries(14):
         TrashHandler.permanently_delete_marked_trash()
 
 
@@ -972,8 +967,8 @@ def test_trashing_a_field_with_a_sort_trashes_the_sort(
 def test_can_perm_delete_tables(
     data_fixture,
 ):
-    patcher = patch("baserow.core.models.TrashEntry.delete")
-    trash_entry_delete = patcher.start()
+    patcher = patch("baserow.core.trash.handler.permanently_deleted.send")
+    permanently_deleted_send = patcher.start()
 
     user = data_fixture.create_user()
     table = data_fixture.create_database_table(name="Car", user=user)
@@ -985,7 +980,9 @@ def test_can_perm_delete_tables(
 
     TrashEntry.objects.update(should_be_permanently_deleted=True)
 
-    trash_entry_delete.side_effect = RuntimeError("Force the outer transaction to fail")
+    permanently_deleted_send.side_effect = RuntimeError(
+        "Force the outer transaction to fail"
+    )
     with pytest.raises(RuntimeError):
         TrashHandler.permanently_delete_marked_trash()
 
@@ -1559,3 +1556,98 @@ def test_trash_restore_view(data_fixture):
     view.refresh_from_db()
 
     assert view.trashed is False
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_TRASH_ROW_DELETION_BATCH_SIZE=2)
+def test_perm_deleting_marked_rows_deletes_them_per_table_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(name="Car", database=database)
+    other_table = data_fixture.create_database_table(name="Brand", database=database)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Brand", link_row_table=other_table
+    )
+    other_row = RowHandler().create_row(user, other_table)
+    unrelated_other_row = RowHandler().create_row(user, other_table)
+    rows = [
+        RowHandler().create_row(user, table, {link_field.id: [other_row.id]})
+        for _ in range(4)
+    ]
+    for row in rows[:3]:
+        TrashHandler.trash(user, database.group, database, row, parent_id=table.id)
+    TrashHandler.trash(
+        user, database.group, database, unrelated_other_row, parent_id=other_table.id
+    )
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    with patch("baserow.core.trash.handler.permanently_deleted.send") as send:
+        TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    model = table.get_model()
+    assert list(model.objects_and_trash.values_list("id", flat=True)) == [rows[3].id]
+    assert list(
+        other_table.get_model().objects_and_trash.values_list("id", flat=True)
+    ) == [other_row.id]
+    through_model = model._meta.get_field(link_field.db_column).remote_field.through
+    assert through_model.objects.count() == 1
+    assert [
+        (call.kwargs["trash_item_id"], call.kwargs["parent_id"])
+        for call in send.call_args_list
+    ] == [
+        (rows[0].id, table.id),
+        (rows[1].id, table.id),
+        (rows[2].id, table.id),
+        (unrelated_other_row.id, other_table.id),
+    ]
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_TRASH_TABLE_DELETION_BATCH_SIZE=2)
+def test_perm_deleting_marked_tables_drops_them_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    tables = [data_fixture.create_database_table(database=database) for _ in range(3)]
+    row = RowHandler().create_row(user, tables[0])
+    TrashHandler.trash(user, database.group, database, row, parent_id=tables[0].id)
+    for table in tables:
+        TrashHandler.trash(user, database.group, database, table)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    assert not Table.objects_and_trash.filter(database=database).exists()
+    table_names = connection.introspection.table_names()
+    for table in tables:
+        assert table.get_database_table_name() not in table_names
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_TRASH_TABLE_DELETION_BATCH_SIZE=2)
+def test_perm_deleting_marked_tables_linked_to_each_other_in_one_batch(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table_a = data_fixture.create_database_table(database=database)
+    table_b = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=table_a, primary=True)
+    data_fixture.create_text_field(table=table_b, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table_a, "link_row", name="link", link_row_table=table_b
+    )
+    through_table_name = link_field.through_table_name
+    for table in [table_a, table_b]:
+        TrashHandler.trash(user, database.group, database, table)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    assert not Table.objects_and_trash.filter(database=database).exists()
+    table_names = connection.introspection.table_names()
+    assert table_a.get_database_table_name() not in table_names
+    assert table_b.get_database_table_name() not in table_names
+    assert through_table_name not in table_names
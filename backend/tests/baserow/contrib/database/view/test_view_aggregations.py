@@ -3,9 +3,14 @@ import random
 from decimal import Decimal
 
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
-from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.handler import (
+    IncrementalViewAggregationsUpdater,
+    NoopViewAggregationsUpdater,
+    ViewHandler,
+)
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.core.trash.handler import TrashHandler
 
@@ -431,3 +436,202 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
     TrashHandler().restore_item(user, "view", grid_view_one.id)
     aggregations_restored_view = view_handler.get_view_field_aggregations(grid_view_one)
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_cached_aggregations_are_updated_incrementally(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="not_equal", value="100"
+    )
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"}
+        },
+    )
+
+    model = table.get_model()
+    for value in [1, 5, 10, 100, None]:
+        model.objects.create(**{number_field.db_column: value})
+
+    def warm_up(aggregation_type):
+        view_handler.update_field_options(
+            view=grid_view,
+            field_options={
+                number_field.id: {
+                    "aggregation_type": aggregation_type,
+                    "aggregation_raw_type": aggregation_type,
+                }
+            },
+        )
+        view_handler.get_view_field_aggregations(grid_view, model=model)
+
+    def run_and_check(aggregation_type, action, expected_incremental=True):
+        warm_up(aggregation_type)
+        with django_capture_on_commit_callbacks(execute=True):
+            action()
+        (cached_values, need_computation,) = view_handler._get_aggregations_to_compute(
+            grid_view, [(number_field, aggregation_type)]
+        )
+        computed = view_handler.get_field_aggregations(
+            grid_view, [(number_field, aggregation_type)], model=model
+        )[number_field.db_column]
+        if expected_incremental:
+            assert need_computation == {}
+            assert cached_values[number_field.db_column] == computed
+        else:
+            assert number_field.db_column in need_computation
+
+    for aggregation_type in ["sum", "min", "max", "empty_count", "not_empty_count"]:
+        # Creating a row visible in the view.
+        run_and_check(
+            aggregation_type,
+            lambda: row_handler.create_row(
+                user, table, {number_field.id: 20}, model=model
+            ),
+        )
+        # Creating a row that is filtered out of the view.
+        run_and_check(
+            aggregation_type,
+            lambda: row_handler.create_row(
+                user, table, {number_field.id: 100}, model=model
+            ),
+        )
+        row = row_handler.create_row(user, table, {number_field.id: 7}, model=model)
+        # Updating a value that's not the min or max.
+        run_and_check(
+            aggregation_type,
+            lambda: row_handler.update_rows(
+                user, table, [{"id": row.id, number_field.db_column: 8}], model=model
+            ),
+        )
+        # Moving the row doesn't change anything.
+        run_and_check(
+            aggregation_type,
+            lambda: row_handler.move_row(user, table, row, model=model),
+        )
+        # Deleting the row.
+        run_and_check(
+            aggregation_type,
+            lambda: row_handler.delete_row(user, table, row, model=model),
+        )
+
+    # Deleting the minimum value can't be done incrementally.
+    minimum_row = model.objects.get(**{number_field.db_column: 1})
+    run_and_check(
+        "min",
+        lambda: row_handler.delete_rows(user, table, [minimum_row.id], model=model),
+        expected_incremental=False,
+    )
+    maximum_row = row_handler.create_row(
+        user, table, {number_field.id: 50}, model=model
+    )
+    run_and_check(
+        "max",
+        lambda: row_handler.update_row(
+            user, table, maximum_row, {number_field.id: 2}, model=model
+        ),
+        expected_incremental=False,
+    )
+    run_and_check(
+        "sum",
+        lambda: row_handler.update_row(
+            user, table, maximum_row, {number_field.id: 3}, model=model
+        ),
+    )
+    # Non incremental aggregation types are still recomputed.
+    run_and_check(
+        "average",
+        lambda: row_handler.create_row(user, table, {number_field.id: 4}, model=model),
+        expected_incremental=False,
+    )
+
+
+@pytest.mark.django_db
+def test_incremental_aggregation_delta_is_not_applied_if_computed_during_transaction(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"}
+        },
+    )
+    model = table.get_model()
+    model.objects.create(**{number_field.db_column: 1})
+
+    assert view_handler.get_view_field_aggregations(grid_view, model=model) == {
+        number_field.db_column: 1
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_row(user, table, {number_field.id: 2}, model=model)
+        # Simulates a value computed by another request before the commit, which
+        # must be invalidated because it could miss the changes.
+        view_handler.get_view_field_aggregations(grid_view, model=model)
+
+    cached_values, need_computation = view_handler._get_aggregations_to_compute(
+        grid_view, [(number_field, "sum")]
+    )
+    assert number_field.db_column in need_computation
+    assert view_handler.get_view_field_aggregations(grid_view, model=model) == {
+        number_field.db_column: 3
+    }
+
+
+@pytest.mark.django_db
+def test_incremental_aggregations_updater_only_queries_cached_views(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_views = [data_fixture.create_grid_view(table=table) for _ in range(3)]
+
+    view_handler = ViewHandler()
+    for grid_view in grid_views:
+        view_handler.update_field_options(
+            view=grid_view,
+            field_options={
+                number_field.id: {
+                    "aggregation_type": "sum",
+                    "aggregation_raw_type": "sum",
+                }
+            },
+        )
+
+    model = table.get_model()
+    row = model.objects.create(**{number_field.db_column: 1})
+
+    # The field options of all the views are fetched in one query and nothing is
+    # aggregated because none of the values are cached.
+    with django_assert_num_queries(1):
+        updater = view_handler.get_incremental_aggregations_updater(
+            table, model, [row.id]
+        )
+        updater.rows_changed()
+    assert isinstance(updater, NoopViewAggregationsUpdater)
+
+    view_handler.get_view_field_aggregations(grid_views[0], model=model)
+
+    # Only the view of which the value is cached is aggregated.
+    with django_assert_num_queries(3):
+        updater = view_handler.get_incremental_aggregations_updater(
+            table, model, [row.id]
+        )
+    assert isinstance(updater, IncrementalViewAggregationsUpdater)
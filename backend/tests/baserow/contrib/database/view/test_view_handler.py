@@ -3,6 +3,7 @@ from unittest.mock import patch
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.view_types import GridViewType
@@ -1823,13 +1824,13 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
     )
 
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             public_grid_view.view_ptr
         ]
     with django_assert_num_queries(1):
-        # Only should run a single exists query to check if the row is in the single
+        # Only should run a single query to check if the row is in the single
         # public view
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
@@ -1849,17 +1850,81 @@ def test_public_view_row_checker_runs_expected_queries_when_checking_rows(
         only_include_views_which_want_realtime_events=True,
         updated_field_ids=[filtered_field.id, unfiltered_field.id],
     )
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query which checks both public views at once
         assert row_checker.get_public_views_where_row_is_visible(visible_row) == [
             public_grid_view.view_ptr,
             another_public_grid_view.view_ptr,
         ]
-    with django_assert_num_queries(2):
-        # Now should run two queries, one per public view
+    with django_assert_num_queries(1):
+        # Should still run a single query which checks both public views at once
         assert row_checker.get_public_views_where_row_is_visible(invisible_row) == []
 
 
+@pytest.mark.django_db
+def test_public_view_row_checker_checks_rows_of_all_views_in_one_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field)
+    option_b = data_fixture.create_select_option(field=multiple_select_field)
+    text_view = data_fixture.create_grid_view(user, table=table, public=True, order=0)
+    data_fixture.create_view_filter(
+        view=text_view, field=text_field, type="contains", value="match"
+    )
+    select_view = data_fixture.create_grid_view(user, table=table, public=True, order=1)
+    data_fixture.create_view_filter(
+        view=select_view,
+        field=multiple_select_field,
+        type="multiple_select_has",
+        value=option_a.id,
+    )
+    empty_view = data_fixture.create_grid_view(user, table=table, public=True, order=2)
+    data_fixture.create_view_filter(
+        view=empty_view, field=multiple_select_field, type="empty", value=""
+    )
+    row_handler = RowHandler()
+    text, multiple_select = text_field.db_column, multiple_select_field.db_column
+    row_1, row_2, row_3 = row_handler.create_rows(
+        user,
+        table,
+        [
+            {text: "match", multiple_select: [option_a.id]},
+            {text: "other", multiple_select: [option_b.id]},
+            {text: "match", multiple_select: []},
+        ],
+    )
+
+    model = table.get_model()
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table,
+        model,
+        only_include_views_which_want_realtime_events=True,
+        updated_field_ids=[multiple_select_field.id],
+    )
+
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible(
+            [row_1, row_2, row_3]
+        ) == [
+            PublicViewRows(text_view.view_ptr, {row_1.id, row_3.id}),
+            PublicViewRows(select_view.view_ptr, {row_1.id}),
+            PublicViewRows(empty_view.view_ptr, {row_3.id}),
+        ]
+
+    # The results of the text view are cached because its field isn't updated, so
+    # only the other views are checked again.
+    model.objects.filter(id=row_2.id).update(**{text_field.db_column: "match"})
+    with django_assert_num_queries(1):
+        assert row_checker.get_public_views_where_rows_are_visible([row_1, row_2]) == [
+            PublicViewRows(text_view.view_ptr, {row_1.id}),
+            PublicViewRows(select_view.view_ptr, {row_1.id}),
+        ]
+
+
 @pytest.mark.django_db
 def test_cant_get_view_filter_when_view_trashed(data_fixture):
     user = data_fixture.create_user()
@@ -1910,3 +1975,123 @@ def test_cant_update_sort_when_view_trashed(data_fixture):
 
     with pytest.raises(ViewSortDoesNotExist):
         ViewHandler().update_sort(user, view_sort, field)
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_is_cached_and_invalidated(
+    data_fixture, django_assert_num_queries, settings
+):
+    settings.BASEROW_ROW_COUNT_CACHE_THRESHOLD = 0
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    other_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    view_filter = data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+
+    handler = ViewHandler()
+    row_handler = RowHandler()
+    model = table.get_model()
+    row = row_handler.create_row(user, table, {text_field.id: "a"}, model=model)
+    row_handler.create_row(user, table, {text_field.id: "b"}, model=model)
+
+    def get_count(**kwargs):
+        queryset = handler.get_queryset(grid_view, model=model, **kwargs)
+        return handler.get_view_row_count(
+            grid_view, queryset, search=kwargs.get("search")
+        )
+
+    assert get_count() == (1, False)
+
+    # The second call must be served from the cache, only the filters are fetched.
+    queryset = handler.get_queryset(grid_view, model=model)
+    with django_assert_num_queries(1):
+        assert handler.get_view_row_count(grid_view, queryset) == (1, False)
+
+    # Searching never uses the cache.
+    assert get_count(search="b") == (0, False)
+
+    row_handler.create_row(user, table, {text_field.id: "a"}, model=model)
+    assert get_count() == (2, False)
+
+    row_handler.update_row_by_id(user, table, row.id, {text_field.id: "b"}, model)
+    assert get_count() == (1, False)
+
+    # Updating a field which isn't filtered doesn't invalidate the count.
+    row_handler.update_row_by_id(user, table, row.id, {other_field.id: "b"}, model)
+    queryset = handler.get_queryset(grid_view, model=model)
+    with django_assert_num_queries(1):
+        assert handler.get_view_row_count(grid_view, queryset) == (1, False)
+
+    handler.update_filter(user, view_filter, value="b")
+    assert get_count() == (2, False)
+
+    # Changing the filters outside of the handler must also result in a new count.
+    ViewFilter.objects.filter(id=view_filter.id).update(value="a")
+    assert get_count() == (1, False)
+    ViewFilter.objects.filter(id=view_filter.id).update(value="b")
+
+    handler.update_view(user, grid_view, filters_disabled=True)
+    assert get_count() == (3, False)
+
+    handler.update_view(user, grid_view, filters_disabled=False)
+    assert get_count() == (2, False)
+
+    row_handler.delete_row_by_id(user, table, row.id, model)
+    assert get_count() == (1, False)
+
+    handler.delete_filter(user, view_filter)
+    assert get_count() == (2, False)
+
+    # Small counts are not cached because they're cheap to compute.
+    settings.BASEROW_ROW_COUNT_CACHE_THRESHOLD = 100
+    row_handler.create_row(user, table, {text_field.id: "a"}, model=model)
+    assert get_count() == (3, False)
+    model.objects.all().delete()
+    assert get_count() == (0, False)
+
+
+@pytest.mark.django_db
+def test_get_view_row_count_estimate(data_fixture, settings):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    model = table.get_model()
+    model.objects.bulk_create([model(**{f"field_{text_field.id}": "a"})] * 10)
+    handler = ViewHandler()
+    queryset = handler.get_queryset(grid_view, model=model)
+
+    # The table has never been analyzed, so the exact count must be returned.
+    assert handler.get_estimated_row_count(table) is None
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 0
+    assert handler.get_view_row_count(grid_view, queryset, allow_estimate=True) == (
+        10,
+        False,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {table.get_database_table_name()}")
+
+    assert handler.get_estimated_row_count(table) == 10
+    assert handler.get_view_row_count(grid_view, queryset, allow_estimate=True) == (
+        10,
+        True,
+    )
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 11
+    assert handler.get_view_row_count(grid_view, queryset, allow_estimate=True) == (
+        10,
+        False,
+    )
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 0
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    assert handler.get_view_row_count(grid_view, queryset, allow_estimate=True) == (
+        10,
+        False,
+    )
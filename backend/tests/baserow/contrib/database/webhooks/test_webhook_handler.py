@@ -388,3 +388,32 @@ def test_clean_webhook_calls(data_fixture):
         ).count()
         == 0
     )
+
+
+@pytest.mark.django_db
+@override_settings(WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK=2)
+def test_acquire_and_release_call_slot():
+    handler = WebhookHandler()
+
+    assert handler.acquire_call_slot(1)
+    assert handler.acquire_call_slot(1)
+    assert not handler.acquire_call_slot(1)
+    assert handler.acquire_call_slot(2)
+
+    handler.release_call_slot(1)
+    assert handler.acquire_call_slot(1)
+    assert not handler.acquire_call_slot(1)
+
+    handler.release_call_slot(1)
+    handler.release_call_slot(1)
+    handler.release_call_slot(2)
+
+
+@override_settings(DEBUG=True)
+def test_get_session_per_host():
+    handler = WebhookHandler()
+
+    session = handler.get_session("http://localhost/webhook")
+    assert handler.get_session("http://localhost/other") is session
+    assert handler.get_session("https://localhost/webhook") is not session
+    assert handler.get_session("http://localhost:8000/webhook") is not session
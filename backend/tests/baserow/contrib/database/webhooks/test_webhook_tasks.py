@@ -1,10 +1,12 @@
 import pytest
 import responses
+from unittest.mock import patch
 
 from celery.exceptions import Retry
 from django.test import override_settings
 from django.db import transaction
 
+from baserow.contrib.database.webhooks.handler import WebhookHandler
 from baserow.contrib.database.webhooks.models import TableWebhookCall
 from baserow.contrib.database.webhooks.tasks import call_webhook
 
@@ -137,3 +139,132 @@ def test_call_webhook(data_fixture):
     assert "{}" in created_call.response
     assert created_call.response_status == 400
     assert created_call.error == ""
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+def test_call_webhook_makes_request_outside_of_transaction(data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    in_atomic_block = []
+
+    def request_callback(request):
+        in_atomic_block.append(transaction.get_connection().in_atomic_block)
+        return 200, {}, "{}"
+
+    responses.add_callback(responses.POST, "http://localhost/", request_callback)
+
+    call_webhook.run(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000000",
+        event_type="row.created",
+        method="POST",
+        url="http://localhost/",
+        headers={},
+        payload={"type": "row.created"},
+    )
+
+    assert in_atomic_block == [False]
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 1
+    # The call slot must have been released after the call.
+    assert WebhookHandler().acquire_call_slot(webhook.id)
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK=1)
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook.apply_async")
+def test_call_webhook_concurrency_limit_reached(mock_apply_async, data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    handler = WebhookHandler()
+    assert handler.acquire_call_slot(webhook.id)
+
+    call_webhook.push_request(retries=2)
+    call_webhook.run(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000000",
+        event_type="row.created",
+        method="POST",
+        url="http://localhost/",
+        headers={},
+        payload={"type": "row.created"},
+    )
+    call_webhook.pop_request()
+
+    assert len(responses.calls) == 0
+    assert TableWebhookCall.objects.all().count() == 0
+    mock_apply_async.assert_called_once()
+    assert mock_apply_async.call_args.kwargs["retries"] == 2
+    assert mock_apply_async.call_args.kwargs["kwargs"]["webhook_id"] == webhook.id
+    assert (
+        mock_apply_async.call_args.kwargs["kwargs"]["concurrency_limit_requeues"] == 1
+    )
+    assert mock_apply_async.call_args.kwargs["countdown"] == 1
+
+    handler.release_call_slot(webhook.id)
+    call_webhook.run(
+        webhook_id=webhook.id,
+        event_id="00000000-0000-0000-0000-000000000000",
+        event_type="row.created",
+        method="POST",
+        url="http://localhost/",
+        headers={},
+        payload={"type": "row.created"},
+    )
+
+    assert len(responses.calls) == 1
+    assert TableWebhookCall.objects.all().count() == 1
+    mock_apply_async.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@override_settings(
+    WEBHOOKS_MAX_CONCURRENT_CALLS_PER_WEBHOOK=1,
+    WEBHOOKS_CONCURRENCY_LIMIT_COUNTDOWN_SECONDS=1,
+    WEBHOOKS_CONCURRENCY_LIMIT_MAX_COUNTDOWN_SECONDS=5,
+    WEBHOOKS_CONCURRENCY_LIMIT_MAX_REQUEUES=4,
+    WEBHOOKS_MAX_RETRIES_PER_CALL=0,
+)
+@patch("baserow.contrib.database.webhooks.tasks.call_webhook.apply_async")
+def test_call_webhook_concurrency_limit_backoff(mock_apply_async, data_fixture):
+    webhook = data_fixture.create_table_webhook()
+    handler = WebhookHandler()
+    assert handler.acquire_call_slot(webhook.id)
+
+    def run(concurrency_limit_requeues):
+        call_webhook.run(
+            webhook_id=webhook.id,
+            event_id="00000000-0000-0000-0000-000000000000",
+            event_type="row.created",
+            method="POST",
+            url="http://localhost/",
+            headers={},
+            payload={"type": "row.created"},
+            concurrency_limit_requeues=concurrency_limit_requeues,
+        )
+
+    countdowns = []
+    for concurrency_limit_requeues in range(4):
+        run(concurrency_limit_requeues)
+        kwargs = mock_apply_async.call_args.kwargs
+        assert (
+            kwargs["kwargs"]["concurrency_limit_requeues"]
+            == concurrency_limit_requeues + 1
+        )
+        countdowns.append(kwargs["countdown"])
+    assert countdowns == [1, 2, 4, 5]
+
+    # After the maximum amount of requeues, the call fails without being made.
+    mock_apply_async.reset_mock()
+    run(4)
+    mock_apply_async.assert_not_called()
+    assert len(responses.calls) == 0
+    call = TableWebhookCall.objects.get()
+    assert call.response_status is None
+    assert "No call slot became available after 4 attempts" in call.error
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 1
+
+    handler.release_call_slot(webhook.id)
@@ -1,12 +1,18 @@
 from typing import List, Any, Dict
 
 import pytest
+from django.db import transaction
 
 from unittest.mock import patch
 
 from rest_framework import serializers
 from rest_framework.fields import Field
 
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.registries import (
     RowMetadataType,
@@ -72,6 +78,114 @@ def test_row_created_with_metadata(mock_broadcast_to_channel_group, data_fixture
     assert args[0][1]["metadata"] == {"row_id": row.id}
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_created_and_updated_without_refreshing_rows(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    other_field = data_fixture.create_text_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"concat(field('{field.name}'), '!')"
+    )
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {field.db_column: "a", other_field.db_column: "other a"},
+            {field.db_column: "b", other_field.db_column: "other b"},
+        ],
+        refresh_rows=False,
+    )
+
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["type"] == "rows_created"
+    assert [row["id"] for row in args[0][1]["rows"]] == [row.id for row in rows]
+    assert args[0][1]["rows"][0][formula_field.db_column] == "a!"
+    assert args[0][1]["rows"][1][other_field.db_column] == "other b"
+
+    with transaction.atomic():
+        RowHandler().update_rows(
+            user,
+            table,
+            [
+                {"id": rows[1].id, field.db_column: "d"},
+                {"id": rows[0].id, field.db_column: "c"},
+            ],
+            refresh_rows=False,
+        )
+
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["type"] == "rows_updated"
+    assert [row["id"] for row in args[0][1]["rows_before_update"]] == [
+        row["id"] for row in args[0][1]["rows"]
+    ]
+    rows_by_id = {row["id"]: row for row in args[0][1]["rows"]}
+    assert rows_by_id[rows[0].id][field.db_column] == "c"
+    assert rows_by_id[rows[0].id][formula_field.db_column] == "c!"
+    assert rows_by_id[rows[0].id][other_field.db_column] == "other a"
+    assert rows_by_id[rows[1].id][field.db_column] == "d"
+    assert rows_by_id[rows[1].id][formula_field.db_column] == "d!"
+    assert rows_by_id[rows[1].id][other_field.db_column] == "other b"
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_created_without_refreshing_rows_serializes_all_values(
+    mock_broadcast_to_channel_group, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    linked_table = data_fixture.create_database_table(database=table.database)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=select_field, value="Option")
+    data_fixture.create_text_field(table=linked_table, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=linked_table
+    )
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"concat(field('{text_field.name}'), '!')"
+    )
+    linked_row = linked_table.get_model().objects.create()
+
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: "a",
+                number_field.db_column: "1.5",
+                boolean_field.db_column: True,
+                date_field.db_column: "2020-01-01",
+                select_field.db_column: option.id,
+                link_field.db_column: [linked_row.id],
+            },
+            {},
+        ],
+        refresh_rows=False,
+    )
+
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][1]["type"] == "rows_created"
+    model = table.get_model()
+    expected_rows = get_row_serializer_class(model, RowSerializer, is_response=True)(
+        model.objects.all().enhance_by_fields().filter(id__in=[r.id for r in rows]),
+        many=True,
+    ).data
+    assert args[0][1]["rows"] == [dict(row) for row in expected_rows]
+    assert args[0][1]["rows"][0][formula_field.db_column] == "a!"
+    assert args[0][1]["rows"][0][select_field.db_column]["value"] == "Option"
+    assert args[0][1]["rows"][0][link_field.db_column][0]["id"] == linked_row.id
+
+
 def test_populates_with_row_id_metadata():
     class RowIdMetadata(RowMetadataType):
         type = "row_id"
@@ -636,3 +636,61 @@ def _create_an_action_with_custom_cleanup_which_raises(
     return mutable_action_registry.get_by_type(
         ActionWithCustomCleanupThatAlwaysRaises
     ).do(data_fixture.create_user())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cleanup_deletes_expired_actions_in_chunks(data_fixture, settings):
+    settings.BASEROW_ACTION_CLEANUP_BATCH_SIZE = 3
+    now = timezone.now()
+    num_minutes_where_actions_will_be_old_enough_for_cleaning = timedelta(
+        minutes=int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP) * 2
+    )
+    with transaction.atomic():
+        with freeze_time(
+            now - num_minutes_where_actions_will_be_old_enough_for_cleaning
+        ):
+            for _ in range(3):
+                _create_two_no_custom_cleanup_actions(data_fixture)
+                _create_an_action_with_custom_cleanup(data_fixture)
+        _create_two_no_custom_cleanup_actions(data_fixture)
+
+    with freeze_time(now):
+        assert Action.objects.count() == 11
+        ActionHandler.clean_up_old_actions()
+        assert Action.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cleanup_cleans_up_the_actions_of_the_same_type_at_once(data_fixture, settings):
+    now = timezone.now()
+    num_minutes_where_actions_will_be_old_enough_for_cleaning = timedelta(
+        minutes=int(settings.MINUTES_UNTIL_ACTION_CLEANED_UP) * 2
+    )
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    with transaction.atomic():
+        with freeze_time(
+            now - num_minutes_where_actions_will_be_old_enough_for_cleaning
+        ):
+            for _ in range(3):
+                text_field = data_fixture.create_text_field(table=table)
+                action_type_registry.get_by_type(UpdateFieldActionType).do(
+                    user, text_field, "boolean"
+                )
+    table_name = table.get_database_table_name()
+
+    def get_column_count():
+        with connection.cursor() as cursor:
+            return len(
+                connection.introspection.get_table_description(cursor, table_name)
+            )
+
+    assert get_column_count() == 11
+
+    with freeze_time(now):
+        with CaptureQueriesContext(connection) as clean_up:
+            ActionHandler.clean_up_old_actions()
+        assert Action.objects.count() == 0
+
+    assert get_column_count() == 8
+    assert len([q for q in clean_up.captured_queries if "DROP COLUMN" in q["sql"]]) == 1
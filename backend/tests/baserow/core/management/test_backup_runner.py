@@ -1,6 +1,8 @@
 import os
+import tarfile
 import tempfile
 from pathlib import Path
+from subprocess import CalledProcessError  # nosec
 from unittest.mock import patch, call
 
 import pytest
@@ -82,6 +84,7 @@ def test_backup_baserow_dumps_database_in_batches(
     )
 
     mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
 
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -152,6 +155,7 @@ def test_can_change_num_jobs_and_insert_extra_args_for_baserow_backup(
     )
 
     mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
 
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -235,6 +239,7 @@ def test_backup_baserow_table_batches_includes_all_tables_when_final_batch_small
     )
 
     mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
 
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -295,6 +300,7 @@ def test_backup_baserow_includes_all_tables_when_batch_size_matches_num_tables(
     )
 
     mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
 
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -342,6 +348,7 @@ def test_backup_baserow_does_no_table_batches_when_no_user_tables_found(
     )
 
     mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
 
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -575,6 +582,158 @@ def test_restore_baserow_raises_exception_if_sub_folder_not_found_after_extract(
     mock_check_output.assert_not_called()
 
 
+@patch("tempfile.TemporaryDirectory")
+@patch("psycopg2.connect")
+@patch("subprocess.check_output")
+def test_backup_baserow_dumps_batches_in_parallel_into_archive(
+    mock_check_output, mock_connect, mock_tempfile, fs, data_fixture, environ
+):
+
+    tables = [f"public.database_table_{i}" for i in range(1, 5)]
+    mock_pyscopg2_call_to_return(mock_connect, [(t,) for t in tables])
+
+    mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
+
+    runner = BaserowBackupRunner(
+        host=connection.settings_dict["HOST"],
+        database=connection.settings_dict["NAME"],
+        username=connection.settings_dict["USER"],
+        port=connection.settings_dict["PORT"],
+        jobs=1,
+        parallel_batches=3,
+    )
+
+    runner.backup_baserow("backup.tar.gz", batch_size=1)
+
+    assert mock_check_output.call_count == 5
+    mock_check_output.assert_has_calls(
+        [a_pg_dump_for_everything_else()]
+        + [
+            a_pg_dump_table_batch(tables=[table], batch_num=batch_num)
+            for batch_num, table in enumerate(tables)
+        ],
+        any_order=True,
+    )
+    with tarfile.open("backup.tar.gz", "r:gz") as backup_tar:
+        assert sorted(backup_tar.getnames()) == [
+            "backup.tar.gz",
+            "backup.tar.gz/everything_but_user_tables",
+            "backup.tar.gz/user_tables_batch_0",
+            "backup.tar.gz/user_tables_batch_1",
+            "backup.tar.gz/user_tables_batch_2",
+            "backup.tar.gz/user_tables_batch_3",
+        ]
+
+
+@patch("tempfile.TemporaryDirectory")
+@patch("psycopg2.connect")
+@patch("subprocess.check_output")
+def test_backup_baserow_retries_failed_batches(
+    mock_check_output, mock_connect, mock_tempfile, fs, data_fixture, environ
+):
+
+    mock_pyscopg2_call_to_return(mock_connect, [("public.database_table_1",)])
+
+    mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
+    create_output_dir = mock_check_output.side_effect
+    failed_commands = []
+
+    def fail_first_batch_attempt(command):
+        create_output_dir(command)
+        if "--table=public.database_table_1" in command and not failed_commands:
+            failed_commands.append(command)
+            raise CalledProcessError(1, command)
+
+    mock_check_output.side_effect = fail_first_batch_attempt
+
+    runner = BaserowBackupRunner(
+        host=connection.settings_dict["HOST"],
+        database=connection.settings_dict["NAME"],
+        username=connection.settings_dict["USER"],
+        port=connection.settings_dict["PORT"],
+        jobs=1,
+        batch_retries=1,
+    )
+
+    runner.backup_baserow("backup.tar.gz", batch_size=1)
+
+    assert mock_check_output.call_count == 3
+    assert failed_commands[0] == mock_check_output.call_args_list[2][0][0]
+    assert os.path.exists("backup.tar.gz")
+
+
+@patch("tempfile.TemporaryDirectory")
+@patch("psycopg2.connect")
+@patch("subprocess.check_output")
+def test_backup_baserow_fails_when_batch_keeps_failing(
+    mock_check_output, mock_connect, mock_tempfile, fs, data_fixture, environ
+):
+
+    mock_pyscopg2_call_to_return(mock_connect, [("public.database_table_1",)])
+
+    mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir")
+    mock_pg_dump_to_create_output_dirs(fs, mock_check_output)
+    create_output_dir = mock_check_output.side_effect
+
+    def fail_batch(command):
+        create_output_dir(command)
+        if "--table=public.database_table_1" in command:
+            raise CalledProcessError(1, command)
+
+    mock_check_output.side_effect = fail_batch
+
+    runner = BaserowBackupRunner(
+        host=connection.settings_dict["HOST"],
+        database=connection.settings_dict["NAME"],
+        username=connection.settings_dict["USER"],
+        port=connection.settings_dict["PORT"],
+        jobs=1,
+        batch_retries=2,
+    )
+
+    with pytest.raises(CalledProcessError):
+        runner.backup_baserow("backup.tar.gz", batch_size=1)
+
+    assert mock_check_output.call_count == 4
+    assert not os.path.exists("backup.tar.gz")
+
+
+@patch("tempfile.TemporaryDirectory")
+@patch("subprocess.check_output")
+@patch("tarfile.open")
+def test_restore_baserow_restores_batches_in_parallel(
+    mock_tarfile_open, mock_check_output, mock_tempfile, fs, data_fixture, environ
+):
+
+    mock_tempdir_to_be(fs, mock_tempfile, "/fake_tmp_dir/")
+    fs.create_dir("/fake_tmp_dir/backup.tar.gz/everything_but_user_tables")
+    for batch_num in range(3):
+        fs.create_dir(f"/fake_tmp_dir/backup.tar.gz/user_tables_batch_{batch_num}")
+
+    runner = BaserowBackupRunner(
+        host=connection.settings_dict["HOST"],
+        database=connection.settings_dict["NAME"],
+        username=connection.settings_dict["USER"],
+        port=connection.settings_dict["PORT"],
+        jobs=1,
+        parallel_batches=2,
+    )
+
+    runner.restore_baserow("backup.tar.gz")
+
+    assert mock_check_output.call_count == 4
+    # The tables that aren't user tables must always be restored first.
+    assert mock_check_output.call_args_list[0][0][0][-1] == (
+        "/fake_tmp_dir/backup.tar.gz/everything_but_user_tables/"
+    )
+    assert sorted(c[0][0][-1] for c in mock_check_output.call_args_list[1:]) == [
+        f"/fake_tmp_dir/backup.tar.gz/user_tables_batch_{batch_num}"
+        for batch_num in range(3)
+    ]
+
+
 def a_pg_dump_for_everything_else():
     dbname = connection.settings_dict["NAME"]
     host = connection.settings_dict["HOST"]
@@ -632,3 +791,12 @@ def mock_pyscopg2_call_to_return(mock_connect, results):
     with mock_connect() as conn:
         with conn.cursor() as cursor:
             cursor.fetchall.return_value = results
+
+
+def mock_pg_dump_to_create_output_dirs(fs, mock_check_output):
+    def create_output_dir(command):
+        for arg in command:
+            if arg.startswith("--file="):
+                fs.create_dir(arg[len("--file=") :])
+
+    mock_check_output.side_effect = create_output_dir
@@ -0,0 +1,72 @@
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.db import connection
+from PIL import Image
+
+from baserow.core.management.commands.regenerate_user_file_thumbnails import (
+    regenerate_thumbnails_by_id,
+    reset_inherited_connections,
+)
+from baserow.core.user_files.handler import UserFileHandler
+
+
+@pytest.mark.django_db
+def test_regenerate_user_file_thumbnails(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+    user_files = []
+    for index in range(3):
+        image_bytes = BytesIO()
+        Image.new("RGB", (100 + index, 100), color="red").save(image_bytes, "PNG")
+        user_files.append(
+            handler.upload_user_file(None, f"{index}.png", image_bytes, storage)
+        )
+    text_file = handler.upload_user_file(None, "a.txt", BytesIO(b"a"), storage)
+    for user_file in user_files:
+        tmpdir.join("thumbnails", "tiny", user_file.name).remove()
+    # An image that can't be opened anymore is skipped.
+    storage.delete(handler.user_file_path(user_files[2]))
+    storage.save(handler.user_file_path(user_files[2]), BytesIO(b"broken"))
+
+    out = StringIO()
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        with patch(
+            "baserow.core.management.commands.regenerate_user_file_thumbnails."
+            "Command.buffer_size",
+            new=2,
+        ):
+            call_command("regenerate_user_file_thumbnails", stdout=out)
+
+    assert "2 thumbnails have been regenerated." in out.getvalue()
+    assert tmpdir.join("thumbnails", "tiny", user_files[0].name).isfile()
+    assert tmpdir.join("thumbnails", "tiny", user_files[1].name).isfile()
+    assert not tmpdir.join("thumbnails", "tiny", user_files[2].name).isfile()
+    assert not tmpdir.join("thumbnails", "tiny", text_file.name).isfile()
+
+
+@pytest.mark.django_db
+def test_regenerate_user_file_thumbnails_worker(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    image_bytes = BytesIO()
+    Image.new("RGB", (100, 100), color="red").save(image_bytes, "PNG")
+    user_file = UserFileHandler().upload_user_file(
+        None, "image.png", image_bytes, storage
+    )
+    tmpdir.join("thumbnails", "tiny", user_file.name).remove()
+
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        assert regenerate_thumbnails_by_id(user_file.id, "tiny")
+        assert not regenerate_thumbnails_by_id(user_file.id + 1, "tiny")
+
+    assert tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+
+    # The connection inherited from the parent process must not be closed.
+    inherited_connection = connection.connection
+    reset_inherited_connections()
+    assert connection.connection is None
+    assert not inherited_connection.closed
+    connection.connection = inherited_connection
@@ -3,8 +3,9 @@ import pytest
 from django.db import connection
 from django.test.utils import override_settings
 
-from baserow.core.db import LockedAtomicTransaction
-from baserow.core.models import Settings
+from baserow.contrib.database.models import Database
+from baserow.core.db import LockedAtomicTransaction, specific_iterator
+from baserow.core.models import Application, Settings
 
 
 @pytest.mark.django_db
@@ -24,3 +25,34 @@ def test_locked_atomic_transaction(api_client, data_fixture):
 
     with LockedAtomicTransaction(Settings):
         assert is_locked(Settings)
+
+
+@pytest.mark.django_db
+def test_specific_iterator(data_fixture, django_assert_num_queries):
+    group = data_fixture.create_group()
+    database_1 = data_fixture.create_database_application(group=group, order=1)
+    database_2 = data_fixture.create_database_application(group=group, order=2)
+    database_3 = data_fixture.create_database_application(group=group, order=3)
+
+    base_queryset = Application.objects.filter(group=group).order_by("order")
+
+    with django_assert_num_queries(2):
+        specific_applications = list(specific_iterator(base_queryset.all()))
+
+    assert specific_applications == [database_1, database_2, database_3]
+    assert all(isinstance(a, Database) for a in specific_applications)
+
+    # Already specific instances are returned as is.
+    with django_assert_num_queries(0):
+        assert list(specific_iterator([database_2])) == [database_2]
+
+    with django_assert_num_queries(2):
+        specific_applications = list(
+            specific_iterator(
+                base_queryset.all(),
+                per_content_type_queryset_hook=(
+                    lambda model, queryset: queryset.select_related("group")
+                ),
+            )
+        )
+        assert specific_applications[0].group == group
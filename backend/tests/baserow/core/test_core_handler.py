@@ -1,14 +1,17 @@
 import os
-from io import BytesIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from django.conf import settings
 from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
 from itsdangerous.exc import BadSignature
 
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.models import Database
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import (
     UserNotInGroup,
     ApplicationTypeDoesNotExist,
@@ -37,6 +40,7 @@ from baserow.core.models import (
     TemplateCategory,
     GROUP_USER_PERMISSION_ADMIN,
 )
+from baserow.core.serialized_stream import SerializedStreamReader
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.user_files.models import UserFile
 
@@ -966,6 +970,76 @@ def test_export_import_group_application(data_fixture):
     assert id_mapping["applications"][database.id] == imported_database.id
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_IMPORT_EXPORT_ROWS_CHUNK_SIZE=2)
+def test_export_import_group_application_stream(data_fixture):
+    user = data_fixture.create_user()
+    group = data_fixture.create_group(user=user)
+    imported_group = data_fixture.create_group(user=user)
+    database = data_fixture.create_database_application(group=group)
+    table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table)
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field)
+    option_b = data_fixture.create_select_option(field=multiple_select_field)
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        name="Link",
+        type_name="link_row",
+        link_row_table=customers_table,
+    )
+    customers = [
+        RowHandler().create_row(user=user, table=customers_table, values={})
+        for _ in range(3)
+    ]
+    for index in range(5):
+        RowHandler().create_row(
+            user=user,
+            table=table,
+            values={
+                f"field_{text_field.id}": f"Row {index}",
+                f"field_{multiple_select_field.id}": [option_a.id, option_b.id][
+                    : index % 3
+                ],
+                f"field_{link_row_field.id}": [customers[index % 3].id],
+            },
+        )
+
+    handler = CoreHandler()
+    export_buffer = StringIO()
+    handler.export_group_applications_to_stream(group, export_buffer, BytesIO())
+    export_buffer.seek(0)
+    imported_applications, id_mapping = handler.import_applications_to_group(
+        imported_group, SerializedStreamReader(export_buffer), BytesIO(), None
+    )
+
+    assert len(imported_applications) == 1
+    imported_table = imported_applications[0].table_set.get(
+        id=id_mapping["database_tables"][table.id]
+    )
+    imported_text_field_id = id_mapping["database_fields"][text_field.id]
+    imported_multiple_select_field_id = id_mapping["database_fields"][
+        multiple_select_field.id
+    ]
+    imported_link_row_field_id = id_mapping["database_fields"][link_row_field.id]
+    imported_rows = imported_table.get_model().objects.all()
+    assert len(imported_rows) == 5
+    for index, row in enumerate(imported_rows):
+        assert getattr(row, f"field_{imported_text_field_id}") == f"Row {index}"
+        assert [
+            option.value
+            for option in getattr(
+                row, f"field_{imported_multiple_select_field_id}"
+            ).order_by("id")
+        ] == [option_a.value, option_b.value][: index % 3]
+        assert [
+            linked_row.id
+            for linked_row in getattr(row, f"field_{imported_link_row_field_id}").all()
+        ] == [customers[index % 3].id]
+
+
 @pytest.mark.django_db
 def test_sync_and_install_all_templates(data_fixture, tmpdir):
     storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
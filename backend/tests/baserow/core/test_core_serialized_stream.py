@@ -0,0 +1,87 @@
+from io import StringIO
+
+import pytest
+
+from baserow.core.serialized_stream import (
+    ChunkedList,
+    SerializedStreamReader,
+    write_serialized_stream,
+)
+
+
+def test_chunked_list():
+    chunked_list = ChunkedList(iter([[1, 2], [3]]), 3)
+
+    assert len(chunked_list) == 3
+    assert list(chunked_list) == [1, 2, 3]
+
+    with pytest.raises(ValueError):
+        list(chunked_list)
+
+
+def test_write_and_read_serialized_stream():
+    def generate_items():
+        yield {"name": "a", "rows": ChunkedList(iter([[1, 2], [3]]), 3)}
+        yield {
+            "name": "b",
+            "tables": [
+                {"rows": ChunkedList(iter([[4]]), 1)},
+                {"rows": ChunkedList(iter([]), 0)},
+                {"rows": ChunkedList(iter([[5, 6]]), 2)},
+            ],
+        }
+
+    buffer = StringIO()
+    write_serialized_stream(buffer, generate_items(), 2)
+    lines = buffer.getvalue().splitlines()
+
+    assert len(lines) == 7
+    assert (
+        lines[1] == '{"item": {"name": "a", "rows": {"$chunked_list": 0, "count": 3}}}'
+    )
+    assert lines[2] == '{"chunk": 0, "items": [1, 2]}'
+
+    buffer.seek(0)
+    reader = SerializedStreamReader(buffer)
+    assert len(reader) == 2
+
+    items = iter(reader)
+    item = next(items)
+    assert item["name"] == "a"
+    assert isinstance(item["rows"], ChunkedList)
+    assert len(item["rows"]) == 3
+    assert list(item["rows"].chunks()) == [[1, 2], [3]]
+
+    item = next(items)
+    assert item["name"] == "b"
+    assert [len(table["rows"]) for table in item["tables"]] == [1, 0, 2]
+    assert [list(table["rows"]) for table in item["tables"]] == [[4], [], [5, 6]]
+
+    assert next(items, None) is None
+
+
+def test_read_serialized_stream_skips_unread_chunks():
+    buffer = StringIO()
+    write_serialized_stream(
+        buffer,
+        [
+            {"rows": ChunkedList(iter([[1], [2]]), 2)},
+            {"rows": ChunkedList(iter([[3]]), 1)},
+        ],
+        2,
+    )
+    buffer.seek(0)
+
+    items = []
+    for item in SerializedStreamReader(buffer):
+        items.append(item)
+        if len(items) == 2:
+            assert list(item["rows"]) == [3]
+
+    with pytest.raises(ValueError):
+        list(items[0]["rows"])
+
+
+def test_read_invalid_serialized_stream():
+    with pytest.raises(ValueError):
+        SerializedStreamReader(StringIO('[{"type": "database"}]'))
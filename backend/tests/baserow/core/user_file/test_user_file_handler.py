@@ -1,14 +1,17 @@
 import pytest
 import responses
 import string
+from unittest.mock import patch
 
 from freezegun import freeze_time
 from PIL import Image
 from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.storage import FileSystemStorage
+from django.test.utils import override_settings
 
 from baserow.core.models import UserFile
 from baserow.core.user_files.exceptions import (
@@ -218,6 +221,106 @@ def test_upload_user_file(data_fixture, tmpdir):
     )
 
 
+@pytest.mark.django_db
+def test_upload_image_generates_thumbnails_in_background(
+    data_fixture, tmpdir, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+
+    image = Image.new("RGB", (100, 140), color="red")
+    image_bytes = BytesIO()
+    image.save(image_bytes, format="PNG")
+
+    with patch("baserow.core.user_files.handler.default_storage", new=storage):
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            user_file = handler.upload_user_file(user, "image.png", image_bytes)
+            assert user_file.thumbnails_ready is False
+            assert not tmpdir.join("thumbnails", "tiny", user_file.name).isfile()
+
+    assert len(callbacks) == 1
+    user_file.refresh_from_db()
+    assert user_file.thumbnails_ready is True
+    thumbnail = Image.open(tmpdir.join("thumbnails", "tiny", user_file.name).open("rb"))
+    assert thumbnail.size == (21, 21)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        text_file = handler.upload_user_file(user, "test.txt", BytesIO(b"Hello"))
+
+    assert len(callbacks) == 0
+    assert text_file.thumbnails_ready is True
+
+
+@pytest.mark.django_db
+@override_settings(
+    USER_THUMBNAILS={"tiny": [None, 21], "small": [48, 48], "card_cover": [None, 160]}
+)
+def test_generate_and_save_jpeg_thumbnails_in_draft_mode(data_fixture, tmpdir):
+    storage = FileSystemStorage(location=str(tmpdir), base_url="http://localhost")
+    handler = UserFileHandler()
+    user_file = data_fixture.create_user_file(
+        is_image=True, image_width=2000, image_height=1000
+    )
+    image_bytes = BytesIO()
+    Image.new("RGB", (2000, 1000), color="red").save(image_bytes, format="JPEG")
+    image_bytes.seek(0)
+    image = Image.open(image_bytes)
+
+    handler.generate_and_save_image_thumbnails(image, user_file, storage=storage)
+
+    # The JPEG decoder has scaled down the image while decoding it because the
+    # biggest thumbnail only needs a height of 160 pixels.
+    assert image.size == (500, 250)
+    for name, size in [
+        ("tiny", (42, 21)),
+        ("small", (48, 48)),
+        ("card_cover", (320, 160)),
+    ]:
+        with Image.open(
+            tmpdir.join("thumbnails", name, user_file.name).open("rb")
+        ) as thumbnail:
+            assert thumbnail.size == size
+            assert thumbnail.format == "JPEG"
+
+
+class RemoteFileSystemStorage(FileSystemStorage):
+    def path(self, name):
+        raise NotImplementedError("This backend doesn't support absolute paths.")
+
+    def _open(self, name, mode="rb"):
+        return File(open(super().path(name), mode))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage_class", [FileSystemStorage, RemoteFileSystemStorage])
+def test_add_user_files_to_zip(data_fixture, tmpdir, storage_class):
+    handler = UserFileHandler()
+    user_files = [
+        handler.upload_user_file(
+            None,
+            f"{index}.txt",
+            ContentFile(b"a" * index),
+            storage=FileSystemStorage(location=str(tmpdir)),
+        )
+        for index in range(1, 6)
+    ]
+    storage = storage_class(location=str(tmpdir), base_url="http://localhost")
+    files_buffer = BytesIO()
+
+    with override_settings(BASEROW_EXPORT_FILES_DOWNLOAD_WORKERS=2):
+        with ZipFile(files_buffer, "a", ZIP_DEFLATED, False) as files_zip:
+            handler.add_user_files_to_zip(user_files[:2], files_zip, storage)
+            handler.add_user_files_to_zip(
+                user_files + user_files[::-1], files_zip, storage
+            )
+
+    with ZipFile(files_buffer, "r") as files_zip:
+        assert files_zip.namelist() == [user_file.name for user_file in user_files]
+        for index, user_file in enumerate(user_files, start=1):
+            assert files_zip.read(user_file.name) == b"a" * index
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_upload_user_file_by_url(data_fixture, tmpdir):
@@ -1,8 +1,13 @@
+import time
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pyinstrument import Profiler
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.views.handler import ViewHandler
 
 
 @pytest.mark.django_db
@@ -177,3 +182,68 @@ def test_updating_many_rows_in_public_filtered_views(
          [11 frames hidden]  django
 
     """
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_checking_rows_in_many_public_filtered_views(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        columns=[("number", "number"), ("text", "text")], rows=[], user=user
+    )
+    number_field, text_field = fields
+
+    num_public_views = 30
+    num_rows = 200
+    for i in range(num_public_views):
+        view = data_fixture.create_grid_view(user=user, table=table, public=True)
+        data_fixture.create_view_filter(
+            view=view, field=number_field, type="higher_than", value=i
+        )
+        data_fixture.create_view_filter(
+            view=view, field=text_field, type="contains", value=str(i % 10)
+        )
+    model = table.get_model()
+    rows = [
+        model.objects.create(
+            **{number_field.db_column: i, text_field.db_column: f"row {i}"}
+        )
+        for i in range(num_rows)
+    ]
+    handler = ViewHandler()
+    checker = handler.get_public_views_row_checker(
+        table, model, True, updated_field_ids=[number_field.id]
+    )
+
+    # The checker used to run one exists query per filtered public view and row.
+    filter_querysets = [
+        handler.apply_filters(view, model.objects)
+        for view, _, _ in checker._views_with_filters
+    ]
+    with CaptureQueriesContext(connection) as per_view_queries:
+        start = time.perf_counter()
+        expected = [
+            [qs.filter(id=row.id).exists() for qs in filter_querysets] for row in rows
+        ]
+        per_view_time = time.perf_counter() - start
+
+    with CaptureQueriesContext(connection) as batched_queries:
+        start = time.perf_counter()
+        visible_views = [
+            checker.get_public_views_where_row_is_visible(row) for row in rows
+        ]
+        batched_time = time.perf_counter() - start
+
+    for row_expected, row_visible_views in zip(expected, visible_views):
+        assert sum(row_expected) == len(row_visible_views)
+
+    print(
+        f"\nChecking {num_rows} rows one by one in {num_public_views} filtered public "
+        f"views:\n"
+        f"  exists query per view: {len(per_view_queries)} queries, "
+        f"{per_view_time * 1000:.1f}ms\n"
+        f"  batched checker: {len(batched_queries)} queries, "
+        f"{batched_time * 1000:.1f}ms"
+    )
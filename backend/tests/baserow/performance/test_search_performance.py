@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.table.search_index import TableSearchIndexHandler
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_search_large_table_with_and_without_search_index(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_long_text_field(table=table)
+    data_fixture.create_number_field(table=table, number_decimal_places=2)
+    data_fixture.create_date_field(table=table, date_include_time=True)
+    select_field = data_fixture.create_single_select_field(table=table)
+    for value in ["Todo", "Doing", "Done"]:
+        data_fixture.create_select_option(field=select_field, value=value)
+    count = 1000000
+    fill_table_rows(count, table)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+
+    def timed_search(query):
+        model = table.get_model()
+        start = time.perf_counter()
+        queryset = ViewHandler().get_queryset(grid_view, search=query, model=model)
+        matching_rows = queryset.count()
+        list(queryset[:100])
+        return time.perf_counter() - start, matching_rows
+
+    queries = ["Doing", "ipsum", "12.5", "zzzzzz"]
+    without_index = {query: timed_search(query) for query in queries}
+    start = time.perf_counter()
+    TableSearchIndexHandler().enable(table)
+    enable_time = time.perf_counter() - start
+    table.refresh_from_db()
+    with_index = {query: timed_search(query) for query in queries}
+
+    print(f"\nSearching {count} rows, enabling the index took {enable_time:.1f}s:")
+    for query in queries:
+        assert without_index[query][1] == with_index[query][1]
+        print(
+            f"  {query!r}: {without_index[query][0] * 1000:.1f}ms without index, "
+            f"{with_index[query][0] * 1000:.1f}ms with index"
+        )
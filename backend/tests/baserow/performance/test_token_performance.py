@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.client import RequestFactory
+
+from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
+from baserow.contrib.database.tokens.handler import TokenHandler
+from baserow.contrib.database.tokens.models import Token
+
+
+def update_token_usage_with_a_write_per_request(self, token):
+    token.handled_calls += 1
+    token.save()
+    return token
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_authenticated_request_throughput_with_one_hot_token(data_fixture):
+    token = data_fixture.create_token()
+    request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Token {token.key}")
+    threads = 8
+    requests_per_thread = 250
+
+    def authenticate_requests():
+        try:
+            for _ in range(requests_per_thread):
+                TokenAuthentication().authenticate(request)
+        finally:
+            connection.close()
+
+    def timed_requests():
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [
+                executor.submit(authenticate_requests) for _ in range(threads)
+            ]:
+                future.result()
+        return threads * requests_per_thread / (time.perf_counter() - start)
+
+    with patch.object(
+        TokenHandler, "update_token_usage", update_token_usage_with_a_write_per_request
+    ):
+        write_per_request = timed_requests()
+    buffered = timed_requests()
+    TokenHandler().flush_token_usage()
+
+    print(
+        f"\nAuthenticated requests with one token: {write_per_request:.0f}/s with a "
+        f"write per request, {buffered:.0f}/s with buffered usage"
+    )
+    assert Token.objects.get(id=token.id).handled_calls >= threads * requests_per_thread
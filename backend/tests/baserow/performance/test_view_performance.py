@@ -1,9 +1,13 @@
+import time
+
 import pytest
 from django.urls import reverse
 from pyinstrument import Profiler
 from rest_framework.status import HTTP_200_OK
 
+from baserow.api.pagination import KeysetPagination
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
 
@@ -32,3 +36,52 @@ def test_getting_rows_from_large_grid_view(data_fixture, api_client):
     assert len(response_json["results"]) == limit
     profiler.stop()
     print(profiler.output_text(unicode=True, color=True))
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+def test_deep_page_latency_offset_vs_cursor_pagination(data_fixture, api_client):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    count = 200000
+    fill_table_rows(count, table)
+    grid_view = data_fixture.create_grid_view(user=user, table=table)
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="ASC")
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    limit = 200
+    offset = count - limit * 2
+
+    # Construct the cursor of the row right before the deep page by fetching the
+    # sort values of that row directly from the database.
+    paginator = KeysetPagination()
+    model = table.get_model()
+    queryset = ViewHandler().get_queryset(grid_view, model=model)
+    keys = paginator.get_order_keys(queryset)
+    row_before = queryset.annotate(
+        **{f"_keyset_{i}": expression for i, (expression, _, _) in enumerate(keys)}
+    )[offset - 1]
+    cursor = paginator.encode_cursor(
+        [getattr(row_before, f"_keyset_{i}") for i in range(len(keys))]
+    )
+
+    def timed_get(params):
+        start = time.perf_counter()
+        response = api_client.get(url, params, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
+        assert response.status_code == HTTP_200_OK
+        return time.perf_counter() - start, response.json()["results"]
+
+    offset_time, offset_results = timed_get({"limit": limit, "offset": offset})
+    first_cursor_time, _ = timed_get({"cursor": "", "size": limit})
+    cursor_time, cursor_results = timed_get({"cursor": cursor, "size": limit})
+
+    assert [r["id"] for r in offset_results] == [r["id"] for r in cursor_results]
+    print(
+        f"\nDeep page at offset {offset} of {count} rows:\n"
+        f"  limit/offset: {offset_time * 1000:.1f}ms\n"
+        f"  cursor first page: {first_cursor_time * 1000:.1f}ms\n"
+        f"  cursor deep page: {cursor_time * 1000:.1f}ms"
+    )
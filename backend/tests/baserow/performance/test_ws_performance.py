@@ -0,0 +1,64 @@
+import time
+import uuid
+
+import pytest
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+
+from baserow.ws.consumers import CoreConsumer
+from baserow.ws.tasks import broadcast_to_users
+
+User = get_user_model()
+
+
+async def connect_web_sockets(num_users):
+    """
+    Connects one web socket per user directly to the core consumer. The users are not
+    saved in the database and the authentication middleware is bypassed, so that
+    thousands of sockets can be connected quickly using the in memory channel layer.
+    """
+
+    application = CoreConsumer.as_asgi()
+    communicators = []
+    for user_id in range(1, num_users + 1):
+        communicator = WebsocketCommunicator(application, "ws/core/")
+        communicator.scope["user"] = User(id=user_id)
+        communicator.scope["web_socket_id"] = str(uuid.uuid4())
+        connected, _ = await communicator.connect()
+        assert connected
+        await communicator.receive_json_from()
+        communicators.append(communicator)
+    return communicators
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_users", [100, 1000])
+# You must add --runslow -s to pytest to run this test, you can do this in intellij by
+# editing the run config for this test and adding --runslow -s to additional args.
+async def test_broadcasting_to_one_user_with_many_connected_users(num_users):
+    communicators = await connect_web_sockets(num_users)
+    target = communicators[0]
+    num_messages = 100
+
+    start = time.perf_counter()
+    for i in range(num_messages):
+        await sync_to_async(broadcast_to_users)([1], {"message": i})
+        response = await target.receive_json_from(timeout=10)
+        assert response["message"] == i
+    duration = (time.perf_counter() - start) / num_messages
+
+    for communicator in communicators[1:]:
+        assert await communicator.receive_nothing(0)
+
+    # As of 18/10/2026 broadcasting a message to one user with 1000 connected users
+    # took ~488 ms when every consumer received the message and checked whether it
+    # was meant for its user, and ~3.4 ms using a channel group per user.
+    print(
+        f"Broadcasting a message to one user with {num_users} connected users took "
+        f"{duration * 1000:.2f} ms on average."
+    )
+
+    for communicator in communicators:
+        await communicator.disconnect()
@@ -236,3 +236,45 @@ async def test_broadcast_to_group(data_fixture):
     await communicator_1.disconnect()
     await communicator_2.disconnect()
     await communicator_3.disconnect()
+
+
+@pytest.mark.run(order=7)
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_broadcast_to_users_with_multiple_and_anonymous_connections(
+    data_fixture,
+):
+    user_1, token_1 = data_fixture.create_user_and_token()
+
+    communicators = []
+    for token in [token_1, token_1, "anonymous"]:
+        communicator = WebsocketCommunicator(
+            application,
+            f"ws/core/?jwt_token={token}",
+            headers=[(b"origin", b"http://localhost")],
+        )
+        await communicator.connect()
+        response = await communicator.receive_json_from()
+        assert response["success"] is True
+        communicators.append(communicator)
+
+    communicator_1, communicator_2, anonymous_communicator = communicators
+
+    await sync_to_async(broadcast_to_users)([user_1.id, user_1.id], {"message": "test"})
+    response_1 = await communicator_1.receive_json_from(0.1)
+    response_2 = await communicator_2.receive_json_from(0.1)
+    await anonymous_communicator.receive_nothing(0.1)
+
+    assert response_1["message"] == "test"
+    assert response_2["message"] == "test"
+
+    await communicator_1.disconnect()
+    await sync_to_async(broadcast_to_users)([user_1.id], {"message": "test2"})
+    response_2 = await communicator_2.receive_json_from(0.1)
+    assert response_2["message"] == "test2"
+
+    assert communicator_2.output_queue.qsize() == 0
+    assert anonymous_communicator.output_queue.qsize() == 0
+
+    await communicator_2.disconnect()
+    await anonymous_communicator.disconnect()
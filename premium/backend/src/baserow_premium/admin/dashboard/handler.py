@@ -1,12 +1,23 @@
-from django.db.models import Count, Q
+import pytz
+from datetime import datetime, time, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 from baserow.core.models import UserLogEntry
 
+from .models import AdminDashboardDailyActiveUser, AdminDashboardDailyCount
+
 
 User = get_user_model()
 
+# The timezone of the days of the active users rollup. The counts of the last 24
+# hours, 7 days, etc don't depend on a timezone, so they're always computed with
+# the rollups of this timezone.
+ROLLUP_TIMEZONE = "UTC"
+
 
 class AdminDashboardHandler:
     def get_counts_from_delta_range(
@@ -101,32 +112,385 @@ class AdminDashboardHandler:
 
         return queryset.aggregate(**aggregations)
 
+    def get_midnight(self, day, timezone_name):
+        """
+        Returns the start of the provided day in the provided timezone.
+
+        :type day: date
+        :type timezone_name: str
+        :rtype: datetime
+        """
+
+        return pytz.timezone(timezone_name).localize(datetime.combine(day, time.min))
+
+    def get_last_rollup_date(self, timezone_name):
+        """
+        Returns the last day of which the counts have been stored in the daily
+        rollups of the provided timezone.
+
+        :type timezone_name: str
+        :return: The last stored date or None if nothing has been stored yet.
+        :rtype: date or None
+        """
+
+        return AdminDashboardDailyCount.objects.filter(
+            timezone=timezone_name
+        ).aggregate(last_date=Max("date"))["last_date"]
+
+    def split_range(self, start, end, timezone_name, last_rollup_date):
+        """
+        Splits the range (start until end) into the complete days in between that
+        are stored in the daily rollups, and the rest of the range, which must be
+        computed live. That is the partial days at the start and the end of the
+        range and the complete days that haven't been stored yet.
+
+        :param start: The exclusive start of the range.
+        :type start: datetime
+        :param end: The inclusive end of the range.
+        :type end: datetime
+        :param timezone_name: The timezone of the days.
+        :type timezone_name: str
+        :param last_rollup_date: The last date that is stored in the daily rollups
+            of the timezone, see `get_last_rollup_date`.
+        :type last_rollup_date: date or None
+        :return: The first and the last date that must be served from the rollups
+            and a function that returns the filter of the rest of the range for the
+            provided date field name. If there aren't any days to be served from
+            the rollups, the first date is after the last date.
+        :rtype: tuple
+        """
+
+        start_date = start.astimezone(pytz.timezone(timezone_name)).date()
+        end_date = end.astimezone(pytz.timezone(timezone_name)).date()
+        first_date = start_date + timedelta(days=1)
+        last_date = end_date - timedelta(days=1)
+        if last_rollup_date is None:
+            last_date = start_date
+        else:
+            last_date = min(last_date, last_rollup_date)
+
+        def get_live_filter(date_field_name):
+            if first_date > last_date:
+                return Q(
+                    **{f"{date_field_name}__gt": start, f"{date_field_name}__lte": end}
+                )
+
+            return Q(
+                **{
+                    f"{date_field_name}__gt": start,
+                    f"{date_field_name}__lt": self.get_midnight(
+                        first_date, timezone_name
+                    ),
+                }
+            ) | Q(
+                **{
+                    f"{date_field_name}__gte": self.get_midnight(
+                        last_date + timedelta(days=1), timezone_name
+                    ),
+                    f"{date_field_name}__lte": end,
+                }
+            )
+
+        return first_date, last_date, get_live_filter
+
+    def get_counts_per_day(
+        self, queryset, date_field_name, timezone_name, expression="pk", distinct=False
+    ):
+        """
+        Counts the queryset per day in the provided timezone.
+
+        :type queryset: QuerySet
+        :type date_field_name: str
+        :type timezone_name: str
+        :type expression: str
+        :type distinct: bool
+        :return: A dict containing the date as key and the count as value. Dates
+            without any count are not included.
+        :rtype: dict
+        """
+
+        return {
+            row["date"]: row["count"]
+            for row in queryset.extra(
+                {"date": f"date({date_field_name} at time zone %s)"},
+                select_params=(timezone_name,),
+            )
+            .order_by("date")
+            .values("date")
+            .annotate(count=Count(expression, distinct=distinct))
+        }
+
+    def update_daily_rollups(self, timezone_name=ROLLUP_TIMEZONE, now=None):
+        """
+        Stores the new and active user counts of every complete day in the provided
+        timezone that hasn't been stored yet. Because the counts of a day don't
+        change after it has passed, only the days after the last rollup have to be
+        counted. For the `ROLLUP_TIMEZONE`, the users that were active on each day
+        are stored as well.
+
+        :param timezone_name: The timezone of the days that must be stored.
+        :type timezone_name: str
+        :param now: If not provided, the current date will be used. All the days
+            before the day of this date are stored.
+        :type now: datetime or None
+        :return: The amount of days that have been stored.
+        :rtype: int
+        """
+
+        if not now:
+            now = timezone.now()
+
+        today = now.astimezone(pytz.timezone(timezone_name)).date()
+        last_date = self.get_last_rollup_date(timezone_name)
+
+        if last_date is None:
+            first_dates = [
+                first_date
+                for first_date in [
+                    User.objects.aggregate(first=Min("date_joined"))["first"],
+                    UserLogEntry.objects.filter(action="SIGNED_IN").aggregate(
+                        first=Min("timestamp")
+                    )["first"],
+                ]
+                if first_date is not None
+            ]
+            if len(first_dates) == 0:
+                return 0
+            first_date = (
+                min(first_dates).astimezone(pytz.timezone(timezone_name)).date()
+            )
+        else:
+            first_date = last_date + timedelta(days=1)
+
+        if first_date >= today:
+            return 0
+
+        start = self.get_midnight(first_date, timezone_name)
+        end = self.get_midnight(today, timezone_name)
+        new_users = self.get_counts_per_day(
+            User.objects.filter(date_joined__gte=start, date_joined__lt=end),
+            "date_joined",
+            timezone_name,
+        )
+        sign_ins = UserLogEntry.objects.filter(
+            action="SIGNED_IN", timestamp__gte=start, timestamp__lt=end
+        )
+        active_users = self.get_counts_per_day(
+            sign_ins, "timestamp", timezone_name, expression="actor_id", distinct=True
+        )
+        daily_counts = []
+        for day in range((today - first_date).days):
+            date = first_date + timedelta(days=day)
+            daily_counts.append(
+                AdminDashboardDailyCount(
+                    timezone=timezone_name,
+                    date=date,
+                    new_users=new_users.get(date, 0),
+                    active_users=active_users.get(date, 0),
+                )
+            )
+
+        with transaction.atomic():
+            if timezone_name == ROLLUP_TIMEZONE:
+                self._insert_daily_active_users(start, end)
+            # Another process could have stored the same days in the meantime,
+            # which results in the same counts.
+            AdminDashboardDailyCount.objects.bulk_create(
+                daily_counts, ignore_conflicts=True
+            )
+
+        return len(daily_counts)
+
+    def _insert_daily_active_users(self, start, end):
+        """
+        Stores which users signed in on every `ROLLUP_TIMEZONE` day in the range
+        (start until end). This is done in a single query so that the log entries
+        don't have to be loaded in memory.
+        """
+
+        quote_name = connection.ops.quote_name
+        # No user input goes into the query, safe to use.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                insert into {quote_name(AdminDashboardDailyActiveUser._meta.db_table)}
+                    (date, user_id)
+                select distinct date(timestamp at time zone %s), actor_id
+                from {quote_name(UserLogEntry._meta.db_table)}
+                where action = 'SIGNED_IN' and timestamp >= %s and timestamp < %s
+                on conflict do nothing
+                """,  # nosec
+                [ROLLUP_TIMEZONE, start, end],
+            )
+
+    def remove_user_from_daily_rollups(self, user):
+        """
+        Removes the provided user from the daily counts of every stored timezone.
+        This must be called right before the user is deleted, because the live
+        counts of the partial days don't include deleted users either. The
+        `AdminDashboardDailyActiveUser` rows are deleted together with the user.
+
+        :param user: The user that is going to be deleted.
+        :type user: User
+        """
+
+        timezone_names = (
+            AdminDashboardDailyCount.objects.order_by()
+            .values_list("timezone", flat=True)
+            .distinct()
+        )
+        sign_ins = UserLogEntry.objects.filter(actor=user, action="SIGNED_IN")
+
+        for timezone_name in timezone_names:
+            date_joined = user.date_joined.astimezone(
+                pytz.timezone(timezone_name)
+            ).date()
+            AdminDashboardDailyCount.objects.filter(
+                timezone=timezone_name, date=date_joined, new_users__gt=0
+            ).update(new_users=F("new_users") - 1)
+
+            active_dates = self.get_counts_per_day(
+                sign_ins, "timestamp", timezone_name
+            ).keys()
+            if len(active_dates) > 0:
+                AdminDashboardDailyCount.objects.filter(
+                    timezone=timezone_name, date__in=active_dates, active_users__gt=0
+                ).update(active_users=F("active_users") - 1)
+
+    def get_ranges_from_delta_mapping(self, delta_mapping, now, include_previous):
+        """
+        Returns the (now - delta until now) range of every provided delta mapping
+        value and optionally the range before that.
+
+        :type delta_mapping: dict
+        :type now: datetime
+        :type include_previous: bool
+        :return: A dict containing the names as key and the start and end of the
+            range as value.
+        :rtype: dict
+        """
+
+        ranges = {}
+
+        for name, delta in delta_mapping.items():
+            ranges[name] = (now - delta, now)
+
+            if include_previous:
+                ranges[f"previous_{name}"] = (now - delta - delta, now - delta)
+
+        return ranges
+
     def get_new_user_counts(self, delta_mapping, now=None, include_previous=False):
-        return self.get_counts_from_delta_range(
-            queryset=User.objects,
-            date_field_name="date_joined",
-            delta_mapping=delta_mapping,
-            now=now,
-            include_previous=include_previous,
+        """
+        Calculates the new user count of multiple date ranges like
+        `get_counts_from_delta_range`. The complete days in the ranges that have
+        been stored in the daily rollups are served from them, so only the users of
+        the rest of the ranges are counted.
+        """
+
+        if not now:
+            now = timezone.now()
+
+        last_rollup_date = self.get_last_rollup_date(ROLLUP_TIMEZONE)
+        live_aggregations = {}
+        rollup_aggregations = {}
+        ranges = self.get_ranges_from_delta_mapping(
+            delta_mapping, now, include_previous
         )
 
+        for name, (start, end) in ranges.items():
+            first_date, last_date, get_live_filter = self.split_range(
+                start, end, ROLLUP_TIMEZONE, last_rollup_date
+            )
+            live_aggregations[name] = Count("pk", filter=get_live_filter("date_joined"))
+            rollup_aggregations[name] = Sum(
+                "new_users", filter=Q(date__gte=first_date, date__lte=last_date)
+            )
+
+        live_counts = User.objects.aggregate(**live_aggregations)
+        rollup_counts = AdminDashboardDailyCount.objects.filter(
+            timezone=ROLLUP_TIMEZONE
+        ).aggregate(**rollup_aggregations)
+
+        return {name: live_counts[name] + (rollup_counts[name] or 0) for name in ranges}
+
     def get_active_user_count(self, delta_mapping, now=None, include_previous=False):
-        return self.get_counts_from_delta_range(
-            queryset=UserLogEntry.objects,
-            date_field_name="timestamp",
-            delta_mapping=delta_mapping,
-            expression="actor_id",
-            now=now,
-            distinct=True,
-            additional_filters={"action": "SIGNED_IN"},
-            include_previous=include_previous,
+        """
+        Calculates the distinct active user count of multiple date ranges like
+        `get_counts_from_delta_range`. The users that were active on the complete
+        days in the ranges that have been stored in the daily rollups are served
+        from them, so only the log entries of the rest of the ranges are queried.
+        """
+
+        if not now:
+            now = timezone.now()
+
+        last_rollup_date = self.get_last_rollup_date(ROLLUP_TIMEZONE)
+
+        counts = {}
+        ranges = self.get_ranges_from_delta_mapping(
+            delta_mapping, now, include_previous
+        )
+
+        for name, (start, end) in ranges.items():
+            first_date, last_date, get_live_filter = self.split_range(
+                start, end, ROLLUP_TIMEZONE, last_rollup_date
+            )
+            rollup_user_ids = (
+                AdminDashboardDailyActiveUser.objects.filter(
+                    date__gte=first_date, date__lte=last_date
+                )
+                .order_by()
+                .values_list("user_id")
+            )
+            live_user_ids = (
+                UserLogEntry.objects.filter(
+                    get_live_filter("timestamp"), action="SIGNED_IN"
+                )
+                .order_by()
+                .values_list("actor_id")
+            )
+            counts[name] = rollup_user_ids.union(live_user_ids).count()
+
+        return counts
+
+    def _get_count_per_day_from_rollups(
+        self, delta, now, rollup_field_name, live_counts
+    ):
+        """
+        Returns the daily counts of the range (now - delta until now) in the timezone
+        of now. The days that have been stored in the rollups of that timezone are
+        served from them and the counts of the rest of the range are computed with
+        the provided function. Nothing is stored here, the rollups are only updated
+        by the periodic task.
+        """
+
+        if not now:
+            now = timezone.now()
+
+        timezone_name = str(now.tzinfo)
+        first_date, last_date, get_live_filter = self.split_range(
+            now - delta, now, timezone_name, self.get_last_rollup_date(timezone_name)
         )
 
+        counts = dict(
+            AdminDashboardDailyCount.objects.filter(
+                timezone=timezone_name, date__gte=first_date, date__lte=last_date
+            ).values_list("date", rollup_field_name)
+        )
+        counts.update(live_counts(get_live_filter, timezone_name))
+
+        return [
+            {"date": date, "count": count}
+            for date, count in sorted(counts.items())
+            if count > 0
+        ]
+
     def get_new_user_count_per_day(self, delta, now=None):
         """
         Returns the new user count for each day in the provided range. The range is
         calculated based by subtracting the delta from the row until now. (now -
-        delta until now).
+        delta until now). The complete days are served from the daily rollups.
 
         :param delta: The timedelta that is subtracted from the now date to
             calculate the range. If for example timedelta(days=14) is provided,
@@ -140,18 +504,15 @@ class AdminDashboardHandler:
         :rtype: list
         """
 
-        if not now:
-            now = timezone.now()
-
-        return (
-            User.objects.filter(date_joined__gt=now - delta, date_joined__lte=now)
-            .extra(
-                {"date": "date(date_joined at time zone %s)"},
-                select_params=(str(now.tzinfo),),
-            )
-            .order_by("date")
-            .values("date")
-            .annotate(count=Count("id"))
+        return self._get_count_per_day_from_rollups(
+            delta,
+            now,
+            "new_users",
+            lambda get_live_filter, timezone_name: self.get_counts_per_day(
+                User.objects.filter(get_live_filter("date_joined")),
+                "date_joined",
+                timezone_name,
+            ),
         )
 
     def get_active_user_count_per_day(self, delta, now=None):
@@ -159,7 +520,8 @@ class AdminDashboardHandler:
         Returns the active user count for each day in the provided range. Someone is
         classified as an active user if he has signed in during the provided date
         range. The range is calculated based by subtracting the delta from the row
-        until now. (now - delta until now).
+        until now. (now - delta until now). The complete days are served from the
+        daily rollups.
 
         :param delta: The timedelta that is subtracted from the now date to
             calculate the range. If for example timedelta(days=14) is provided,
@@ -173,18 +535,17 @@ class AdminDashboardHandler:
         :rtype: list
         """
 
-        if not now:
-            now = timezone.now()
-
-        return (
-            UserLogEntry.objects.filter(
-                action="SIGNED_IN", timestamp__gt=now - delta, timestamp__lte=now
-            )
-            .extra(
-                {"date": "date(timestamp at time zone %s)"},
-                select_params=(str(now.tzinfo),),
-            )
-            .order_by("date")
-            .values("date")
-            .annotate(count=Count("actor_id", distinct=True))
+        return self._get_count_per_day_from_rollups(
+            delta,
+            now,
+            "active_users",
+            lambda get_live_filter, timezone_name: self.get_counts_per_day(
+                UserLogEntry.objects.filter(
+                    get_live_filter("timestamp"), action="SIGNED_IN"
+                ),
+                "timestamp",
+                timezone_name,
+                expression="actor_id",
+                distinct=True,
+            ),
         )
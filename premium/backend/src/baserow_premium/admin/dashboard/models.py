@@ -0,0 +1,38 @@
+from django.contrib.auth import get_user_model
+from django.db import models
+
+
+User = get_user_model()
+
+
+class AdminDashboardDailyCount(models.Model):
+    """
+    The amount of new and active users of a day in a timezone. The rows are
+    created for every complete day by `AdminDashboardHandler.update_daily_rollups`,
+    so that the admin dashboard doesn't have to count all the users and log entries
+    every time it's loaded.
+    """
+
+    timezone = models.CharField(max_length=64)
+    date = models.DateField()
+    new_users = models.PositiveIntegerField()
+    active_users = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("timezone", "date")
+        ordering = ("timezone", "date")
+
+
+class AdminDashboardDailyActiveUser(models.Model):
+    """
+    Indicates that the user has signed in at least once on the UTC date. It's used
+    to count the distinct active users of a period spanning multiple days, which
+    can't be derived from the daily counts.
+    """
+
+    date = models.DateField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        unique_together = ("date", "user")
+        ordering = ("date", "user_id")
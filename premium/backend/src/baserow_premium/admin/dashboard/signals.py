@@ -0,0 +1,12 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .handler import AdminDashboardHandler
+
+User = get_user_model()
+
+
+@receiver(pre_delete, sender=User)
+def remove_user_from_daily_rollups_before_delete(sender, instance, **kwargs):
+    AdminDashboardHandler().remove_user_from_daily_rollups(instance)
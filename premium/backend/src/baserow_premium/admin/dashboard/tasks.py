@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def update_admin_dashboard_rollups(self):
+    """
+    Periodic task that stores the admin dashboard counts of the days that have
+    passed since the last run.
+    """
+
+    from .handler import AdminDashboardHandler
+
+    AdminDashboardHandler().update_daily_rollups()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_admin_dashboard_tasks(sender, **kwargs):
+    sender.add_periodic_task(timedelta(hours=1), update_admin_dashboard_rollups.s())
@@ -81,7 +81,10 @@ class KanbanViewView(APIView):
                     "`?select_option=1&select_option=null` will only include the rows "
                     "for both select option with id `1` and `null`. "
                     "`?select_option=1,10,20` will only include the rows of select "
-                    "option id `1` with a limit of `10` and and offset of `20`."
+                    "option id `1` with a limit of `10` and and offset of `20`. "
+                    "`?select_option=1,10,0,30` will only include the rows of select "
+                    "option id `1` that come after the row with id `30`, which is "
+                    "faster than an offset when fetching the next rows of a stack."
                 ),
             ),
         ],
@@ -151,6 +154,8 @@ class KanbanViewView(APIView):
                     included_select_options[splitted[0]]["limit"] = int(splitted[1])
                 if 2 < len(splitted):
                     included_select_options[splitted[0]]["offset"] = int(splitted[2])
+                if 3 < len(splitted):
+                    included_select_options[splitted[0]]["after"] = int(splitted[3])
             except ValueError:
                 raise InvalidSelectOptionParameter(splitted[0])
 
@@ -22,6 +22,8 @@ class BaserowPremiumConfig(AppConfig):
 
         # noinspection PyUnresolvedReferences
         import baserow_premium.row_comments.recievers  # noqa: F401
+        import baserow_premium.license.signals  # noqa: F401
+        import baserow_premium.admin.dashboard.signals  # noqa: F401
 
         from .plugins import PremiumPlugin
         from .export.exporter_types import JSONTableExporter, XMLTableExporter
@@ -0,0 +1,139 @@
+"""
+This file is responsible for caching everything that is needed to check whether a
+user has an active premium license, see `has_active_premium_license`.
+
+Verifying the signature of a license is expensive, so every process keeps the
+decoded payloads in a bounded LRU keyed by the hash of the raw license. Because the
+raw license is signed, the same blob always results in the same payload.
+
+The answer of whether a user has an active license is stored in the Redis backed
+Django cache (or in-memory cache for tests) together with the version it has been
+computed for and the period during which it stays the same. The version is stored
+in the `premium_license_version` cache key and is incremented every time a license
+or a seat changes. Licenses and seats rarely change, so a single version for all
+the users is enough.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+# The answer of a user that is not active anymore doesn't have to be stored forever.
+ACTIVE_PREMIUM_LICENSE_CACHE_TIMEOUT = 60 * 60 * 24
+LOCAL_LICENSE_PAYLOAD_CACHE_SIZE = 1000
+PREMIUM_LICENSE_VERSION_KEY = "premium_license_version"
+
+_local_license_payloads = OrderedDict()
+_local_license_payloads_lock = threading.Lock()
+
+
+def license_payload_cache_key(public_key_name: str, license_payload: bytes) -> str:
+    return f"{public_key_name}_{hashlib.sha256(license_payload).hexdigest()}"
+
+
+def get_cached_license_payload(key: str) -> Optional[Dict[str, Any]]:
+    """
+    :param key: The key generated by `license_payload_cache_key`.
+    :return: A copy of the decoded license payload or None if the license hasn't
+        been decoded by this process yet.
+    """
+
+    with _local_license_payloads_lock:
+        payload = _local_license_payloads.get(key)
+        if payload is None:
+            return None
+        _local_license_payloads.move_to_end(key)
+    return dict(payload)
+
+
+def set_cached_license_payload(key: str, payload: Dict[str, Any]):
+    """
+    Stores a decoded license payload of which the signature has been verified.
+    """
+
+    with _local_license_payloads_lock:
+        _local_license_payloads[key] = dict(payload)
+        _local_license_payloads.move_to_end(key)
+        while len(_local_license_payloads) > LOCAL_LICENSE_PAYLOAD_CACHE_SIZE:
+            _local_license_payloads.popitem(last=False)
+
+
+def active_premium_license_key(public_key_name: str, user_id: int) -> str:
+    return f"active_premium_license_{public_key_name}_{user_id}"
+
+
+def get_cached_active_premium_license(
+    public_key_name: str, user_id: int, at: datetime
+) -> Tuple[int, Optional[bool]]:
+    """
+    :param public_key_name: The name of the public key that the licenses are
+        verified with.
+    :param user_id: The user to lookup the cached answer for.
+    :param at: The moment for which the answer is requested.
+    :return: The latest license version and whether the user has an active premium
+        license at the provided moment, or None if that hasn't been cached yet.
+    """
+
+    key = active_premium_license_key(public_key_name, user_id)
+    values = cache.get_many([PREMIUM_LICENSE_VERSION_KEY, key])
+    version = values.get(PREMIUM_LICENSE_VERSION_KEY, 0)
+    entry = values.get(key)
+
+    if entry is None or entry[0] != version:
+        return version, None
+
+    _, active, start, end = entry
+    if active and start <= at <= end:
+        return version, True
+    if not active and (start is None or start < at) and (end is None or at < end):
+        return version, False
+    return version, None
+
+
+def set_cached_active_premium_license(
+    public_key_name: str,
+    user_id: int,
+    version: int,
+    active: bool,
+    start: Optional[datetime],
+    end: Optional[datetime],
+):
+    """
+    Stores whether the user has an active premium license. The answer is only used
+    for the provided version and between the provided start and end, because the
+    licenses are only valid for a certain period. If active, the start and end are
+    inclusive, otherwise they are exclusive and None means unbounded.
+    """
+
+    cache.set(
+        active_premium_license_key(public_key_name, user_id),
+        (version, active, start, end),
+        timeout=ACTIVE_PREMIUM_LICENSE_CACHE_TIMEOUT,
+    )
+
+
+def _increment_version():
+    try:
+        cache.incr(PREMIUM_LICENSE_VERSION_KEY)
+    except ValueError:
+        # No version has been set yet, which means that it's 0.
+        if not cache.add(PREMIUM_LICENSE_VERSION_KEY, 1, timeout=None):
+            cache.incr(PREMIUM_LICENSE_VERSION_KEY)
+
+
+def invalidate_active_premium_licenses():
+    """
+    Invalidates the cached answers of all the users in all processes. This must be
+    called every time a license or a seat changes.
+    """
+
+    # Invalidating right away makes the change visible in the current transaction.
+    # It's invalidated again when the transaction commits, because another process
+    # could have cached the old answer for the new version in the meantime.
+    _increment_version()
+    transaction.on_commit(_increment_version)
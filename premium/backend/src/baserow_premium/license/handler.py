@@ -28,6 +28,14 @@ from baserow.core.exceptions import IsNotAdminError
 from baserow.core.handler import CoreHandler
 from baserow.ws.signals import broadcast_to_users
 
+from .cache import (
+    get_cached_active_premium_license,
+    get_cached_license_payload,
+    invalidate_active_premium_licenses,
+    license_payload_cache_key,
+    set_cached_active_premium_license,
+    set_cached_license_payload,
+)
 from .models import License, LicenseUser
 from .exceptions import (
     NoPremiumLicenseError,
@@ -51,28 +59,50 @@ from .constants import (
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+_public_keys = {}
+
 
 def has_active_premium_license(user: DjangoUser) -> bool:
     """
-    Checks if the provided user has an active license.
+    Checks if the provided user has an active license. The answer is cached until a
+    license or a seat changes, or until the period of the answer has passed.
 
     :param user: The user for whom must be checked if it has an active license.
     :return: True if the user has an active license to the version.
     """
 
+    public_key_name = get_public_key_name()
+    at = now()
+    version, active = get_cached_active_premium_license(public_key_name, user.id, at)
+    if active is not None:
+        return active
+
+    # The answer stays the same until one of the licenses of the user starts or
+    # stops being valid, so that period is cached together with the answer.
+    active, start, end = False, None, None
     available_licenses = License.objects.filter(users__user_id__in=[user.id]).distinct()
 
     for available_license in available_licenses:
         try:
-            if (
-                available_license.product_code == "premium"
-                and available_license.is_active
-            ):
-                return True
+            if available_license.product_code != "premium":
+                continue
+            valid_from = available_license.valid_from
+            valid_through = available_license.valid_through
         except InvalidPremiumLicenseError:
-            pass
+            continue
 
-    return False
+        if valid_from <= at <= valid_through:
+            if not active or valid_through > end:
+                active, start, end = True, valid_from, valid_through
+        elif not active and valid_through < at:
+            start = valid_through if start is None else max(start, valid_through)
+        elif not active and at < valid_from:
+            end = valid_from if end is None else min(end, valid_from)
+
+    set_cached_active_premium_license(
+        public_key_name, user.id, version, active, start, end
+    )
+    return active
 
 
 def check_active_premium_license(user):
@@ -85,21 +115,32 @@ def check_active_premium_license(user):
         raise NoPremiumLicenseError()
 
 
+def get_public_key_name() -> str:
+    """
+    Returns the file name of the public key that is used to verify licenses. A
+    different key file is used when Baserow is in debug mode.
+    """
+
+    return "public_key_debug.pem" if settings.DEBUG else "public_key.pem"
+
+
 def get_public_key():
     """
     Returns the public key instance that can be used to verify licenses. A different
-    key file is loaded when Baserow is in debug mode.
+    key file is loaded when Baserow is in debug mode. The key is only loaded once
+    per process.
     """
 
     import baserow_premium
 
-    file_name = "public_key_debug.pem" if settings.DEBUG else "public_key.pem"
-    public_key_path = join(dirname(baserow_premium.__file__), file_name)
-    with open(public_key_path, "rb") as key_file:
-        public_key = serialization.load_pem_public_key(
-            key_file.read(), backend=default_backend()
-        )
-    return public_key
+    file_name = get_public_key_name()
+    if file_name not in _public_keys:
+        public_key_path = join(dirname(baserow_premium.__file__), file_name)
+        with open(public_key_path, "rb") as key_file:
+            _public_keys[file_name] = serialization.load_pem_public_key(
+                key_file.read(), backend=default_backend()
+            )
+    return _public_keys[file_name]
 
 
 def decode_license(license_payload: bytes) -> dict:
@@ -115,6 +156,17 @@ def decode_license(license_payload: bytes) -> dict:
     :return: If successful, the decoded license payload is returned.
     """
 
+    cache_key = license_payload_cache_key(get_public_key_name(), license_payload)
+    payload = get_cached_license_payload(cache_key)
+    if payload is not None:
+        return payload
+
+    payload = _decode_license(license_payload)
+    set_cached_license_payload(cache_key, payload)
+    return payload
+
+
+def _decode_license(license_payload: bytes) -> dict:
     try:
         payload_base64, signature_base64 = license_payload.split(b".")
     except ValueError:
@@ -498,6 +550,8 @@ def fill_remaining_seats_of_license(
             LicenseUser(license=license_object, user=user) for user in users_to_add
         ]
         LicenseUser.objects.bulk_create(user_licenses)
+        # The `bulk_create` doesn't send the signals that normally invalidate.
+        invalidate_active_premium_licenses()
 
         if license_object.is_active:
             transaction.on_commit(
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_active_premium_licenses
+from .models import License, LicenseUser
+
+
+@receiver(post_save, sender=License)
+@receiver(post_delete, sender=License)
+@receiver(post_save, sender=LicenseUser)
+@receiver(post_delete, sender=LicenseUser)
+def invalidate_active_premium_licenses_on_change(sender, **kwargs):
+    invalidate_active_premium_licenses()
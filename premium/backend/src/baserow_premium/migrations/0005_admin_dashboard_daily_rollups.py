@@ -0,0 +1,64 @@
+# Generated by Django 3.2.12 on 2026-10-18 07:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("baserow_premium", "0004_kanbanview_card_cover_image_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AdminDashboardDailyCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("timezone", models.CharField(max_length=64)),
+                ("date", models.DateField()),
+                ("new_users", models.PositiveIntegerField()),
+                ("active_users", models.PositiveIntegerField()),
+            ],
+            options={
+                "ordering": ("timezone", "date"),
+                "unique_together": {("timezone", "date")},
+            },
+        ),
+        migrations.CreateModel(
+            name="AdminDashboardDailyActiveUser",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("date", "user_id"),
+                "unique_together": {("date", "user")},
+            },
+        ),
+    ]
@@ -1,5 +1,15 @@
+from .admin.dashboard.models import (
+    AdminDashboardDailyActiveUser,
+    AdminDashboardDailyCount,
+)
 from .license.models import License, LicenseUser
 from .row_comments.models import RowComment
 
 
-__all__ = ["License", "LicenseUser", "RowComment"]
+__all__ = [
+    "AdminDashboardDailyActiveUser",
+    "AdminDashboardDailyCount",
+    "License",
+    "LicenseUser",
+    "RowComment",
+]
@@ -1,3 +1,12 @@
+from .admin.dashboard.tasks import (
+    setup_periodic_admin_dashboard_tasks,
+    update_admin_dashboard_rollups,
+)
 from .license.tasks import license_check, setup_periodic_tasks
 
-__all__ = ["license_check", "setup_periodic_tasks"]
+__all__ = [
+    "license_check",
+    "setup_periodic_tasks",
+    "setup_periodic_admin_dashboard_tasks",
+    "update_admin_dashboard_rollups",
+]
@@ -1,14 +1,29 @@
-from typing import Dict, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from collections import defaultdict
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.handler import ViewHandler
 
-from django.db.models import Q, Count
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
 
 from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.fields.models import SingleSelectField
 
+KANBAN_STACK_COUNTS_CACHE_NAME = "kanban_stack_counts"
+
 
 def get_rows_grouped_by_single_select_field(
     view: View,
@@ -23,7 +38,9 @@ def get_rows_grouped_by_single_select_field(
     efficient manner. Optionally `limit` and `offset` settings can be provided per
     option. If the option settings not provided, then rows for all the select options
     will be fetched. If one or more options have been provided, then only the rows
-    for those will be fetched.
+    for those will be fetched. Instead of an offset, the id of the last row that has
+    already been fetched can be provided as `after` to fetch the following rows of
+    that option. The counts per option are cached until the rows of the view change.
 
     Example:
 
@@ -31,14 +48,15 @@ def get_rows_grouped_by_single_select_field(
         ...
         options_settings={
             "1": {"limit": 10, "offset": 10},
-            "2": {"limit": 10, "offset": 20}
+            "2": {"limit": 10, "offset": 20},
+            "3": {"limit": 10, "after": 120}
         }
     )
 
     :param view: The view where to fetch the fields from.
     :param single_select_field: The single select field where the rows must be
         grouped by.
-    :param option_settings: Optionally, additional `limit` and `offset`
+    :param option_settings: Optionally, additional `limit`, `offset` and `after`
         configurations per field option can be provided.
     :param default_limit: The default limit that applies to all options if no
         specific settings for that field have been provided.
@@ -57,21 +75,19 @@ def get_rows_grouped_by_single_select_field(
     if model is None:
         model = table.get_model()
 
+    field_name = f"field_{single_select_field.id}_id"
     base_queryset = model.objects.all().enhance_by_fields().order_by("order", "id")
     base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
-    all_filters = Q()
-    count_aggregates = {}
     all_options = list(single_select_field.select_options.all())
     all_option_ids = [option.id for option in all_options]
+    # Somehow the `Count` aggregate doesn't support an empty `__in` lookup. That's
+    # why we always add the `-1` value that never exists to make sure there is
+    # always a value in there.
+    null_filters = ~Q(**{f"{field_name}__in": all_option_ids + [-1]})
 
-    def get_id_and_string(option):
-        return (
-            option.id if option else None,
-            str(option.id) if option else "null",
-        )
-
-    for select_option in [None] + all_options:
-        option_id, option_string = get_id_and_string(select_option)
+    stacks = {}
+    for option_id in [None] + all_option_ids:
+        option_string = "null" if option_id is None else str(option_id)
 
         # If option settings have been provided, we only want to return rows for
         # those options, otherwise we will include all options.
@@ -79,45 +95,150 @@ def get_rows_grouped_by_single_select_field(
             continue
 
         option_setting = option_settings.get(option_string, {})
-        limit = option_setting.get("limit", default_limit)
-        offset = option_setting.get("offset", default_offset)
+        filters = null_filters if option_id is None else Q(**{field_name: option_id})
+        after = option_setting.get("after")
+        if after is not None:
+            filters &= _get_rows_after_filter(model, after)
+
+        stacks[option_string] = (
+            option_id,
+            filters,
+            option_setting.get("limit", default_limit),
+            option_setting.get("offset", default_offset),
+        )
 
-        if option_id is None:
-            # Somehow the `Count` aggregate doesn't support an empty `__in` lookup.
-            # That's why we always add the `-1` value that never exists to make sure
-            # there is always a value in there.
-            filters = ~Q(
-                **{f"field_{single_select_field.id}_id__in": all_option_ids + [-1]}
+    if len(stacks) == 1:
+        # A single stack is requested when scrolling through it, in which case a
+        # plain limit is the fastest.
+        _, filters, limit, offset = next(iter(stacks.values()))
+        queryset = list(base_option_queryset.filter(filters)[offset : offset + limit])
+    else:
+        queryset = list(
+            base_queryset.filter(
+                id__in=_get_stacked_row_ids_subquery(
+                    base_option_queryset, field_name, all_option_ids, stacks
+                )
             )
-        else:
-            filters = Q(**{f"field_{single_select_field.id}_id": option_id})
-
-        # We don't want to execute a single query for each select option,
-        # so we create a subquery that finds the ids of the rows related to the
-        # option group. After the single query has been executed we can group the rows.
-        sub_queryset = base_option_queryset.filter(filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        # Same goes for fetching the total count. We will construct a single query,
-        # that calculates to total amount of rows per option.
-        count_aggregates[option_string] = Count(
-            "pk",
-            filter=filters,
         )
 
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
+    counts = _get_stack_counts(
+        view, base_option_queryset, field_name, all_option_ids, null_filters
+    )
 
     rows = defaultdict(lambda: {"count": 0, "results": []})
 
+    for option_string in stacks.keys():
+        rows[option_string]["count"] = counts[option_string]
+
     for row in queryset:
-        option_id = getattr(row, f"field_{single_select_field.id}_id")
+        option_id = getattr(row, field_name)
         option_string = str(option_id) if option_id in all_option_ids else "null"
         rows[option_string]["results"].append(row)
 
-    for key, value in counts.items():
-        rows[key]["count"] = value
-
     return rows
+
+
+def _get_rows_after_filter(model: GeneratedTableModel, row_id: int) -> Q:
+    """
+    Returns the filter that matches the rows that come after the provided row in
+    the `order`, `id` ordering. This way a stack can be paginated with the last
+    row it contains as cursor, which doesn't have to skip all the previous rows
+    like an offset. Trashed rows keep their order, so they can still be used as a
+    cursor.
+    """
+
+    row_order = model.objects_and_trash.filter(id=row_id).values("order")[:1]
+    return Q(order__gt=Subquery(row_order)) | Q(
+        order=Subquery(row_order), id__gt=row_id
+    )
+
+
+def _get_stacked_row_ids_subquery(
+    queryset: QuerySet,
+    field_name: str,
+    all_option_ids: List[int],
+    stacks: Dict[str, Tuple[Optional[int], Q, int, int]],
+) -> RawSQL:
+    """
+    Returns a subquery that selects the ids of the rows of all the provided stacks
+    at once. Every row is numbered within its stack using the `ROW_NUMBER` window
+    function, so that only one scan of the table is needed instead of a subquery
+    per stack.
+    """
+
+    stack = Case(
+        When(**{f"{field_name}__in": all_option_ids + [-1]}, then=F(field_name)),
+        default=Value(None),
+        output_field=IntegerField(),
+    )
+    all_filters = Q()
+    for _, filters, _, _ in stacks.values():
+        all_filters |= filters
+
+    numbered_queryset = (
+        queryset.filter(all_filters)
+        .annotate(
+            kanban_stack=stack,
+            kanban_stack_position=Window(
+                expression=RowNumber(),
+                partition_by=[stack],
+                order_by=[F("order").asc(), F("id").asc()],
+            ),
+        )
+        .values_list("id", "kanban_stack", "kanban_stack_position")
+    )
+    sql, params = numbered_queryset.query.sql_with_params()
+
+    conditions = []
+    params = list(params)
+    for option_id, _, limit, offset in stacks.values():
+        if option_id is None:
+            conditions.append(
+                "(kanban_stack is null and position > %s and position <= %s)"
+            )
+        else:
+            conditions.append(
+                "(kanban_stack = %s and position > %s and position <= %s)"
+            )
+            params.append(option_id)
+        params += [offset, offset + limit]
+
+    # No user input goes into the RawSQL, safe to use.
+    return RawSQL(  # nosec
+        f"select id from ({sql}) stacks(id, kanban_stack, position) "
+        f"where {' or '.join(conditions)}",
+        params,
+    )
+
+
+def _get_stack_counts(
+    view: View,
+    queryset: QuerySet,
+    field_name: str,
+    all_option_ids: List[int],
+    null_filters: Q,
+) -> Dict[str, int]:
+    """
+    Returns the count of the rows of every stack. The counts of all the stacks are
+    computed with a single aggregate query and cached until the rows of the view
+    change.
+    """
+
+    def compute():
+        count_aggregates = {"null": Count("pk", filter=null_filters)}
+        for option_id in all_option_ids:
+            count_aggregates[str(option_id)] = Count(
+                "pk", filter=Q(**{field_name: option_id})
+            )
+        return queryset.aggregate(**count_aggregates)
+
+    # The view can be an unsaved instance, which can't be cached.
+    if view.pk is None:
+        return compute()
+
+    return ViewHandler().get_cached_view_rows_value(
+        view,
+        KANBAN_STACK_COUNTS_CACHE_NAME,
+        compute,
+        signature=(field_name, tuple(all_option_ids)),
+    )
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Union
 from zipfile import ZipFile
 
 from django.core.files.storage import Storage
@@ -6,9 +6,14 @@ from django.urls import path, include
 
 from rest_framework.serializers import PrimaryKeyRelatedField
 
-from baserow.contrib.database.fields.models import SingleSelectField, FileField
+from baserow.contrib.database.fields.models import (
+    Field,
+    SingleSelectField,
+    FileField,
+)
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.api.fields.errors import ERROR_FIELD_NOT_IN_TABLE
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import ViewType
 from baserow.contrib.database.table.models import Table
@@ -19,6 +24,7 @@ from baserow_premium.api.views.kanban.errors import (
     ERROR_KANBAN_VIEW_FIELD_DOES_NOT_BELONG_TO_SAME_TABLE,
 )
 
+from .handler import KANBAN_STACK_COUNTS_CACHE_NAME
 from .models import KanbanView, KanbanViewFieldOptions
 from .exceptions import KanbanViewFieldDoesNotBelongToSameTable
 
@@ -172,6 +178,21 @@ class KanbanViewType(ViewType):
                 hidden=False
             )
 
+    def after_field_value_update(self, updated_fields: Union[Iterable[Field], Field]):
+        """
+        Clears the cached stack counts of the kanban views that are grouped by one
+        of the updated fields, because rows could have moved to another stack.
+        """
+
+        if not isinstance(updated_fields, list):
+            updated_fields = [updated_fields]
+
+        view_handler = ViewHandler()
+        for view in KanbanView.objects.filter(
+            single_select_field_id__in=[field.id for field in updated_fields]
+        ).only("id"):
+            view_handler.clear_aggregation_cache(view, KANBAN_STACK_COUNTS_CACHE_NAME)
+
     def export_prepared_values(self, view: KanbanView) -> Dict[str, Any]:
 
         values = super().export_prepared_values(view)
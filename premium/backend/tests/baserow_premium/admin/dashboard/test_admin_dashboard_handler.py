@@ -8,6 +8,10 @@ from django.test.utils import override_settings
 from baserow.core.models import UserLogEntry
 
 from baserow_premium.admin.dashboard.handler import AdminDashboardHandler
+from baserow_premium.admin.dashboard.models import (
+    AdminDashboardDailyActiveUser,
+    AdminDashboardDailyCount,
+)
 
 
 @pytest.mark.django_db
@@ -322,3 +326,145 @@ def test_get_active_users_per_day(premium_data_fixture):
     assert counts[0]["count"] == 2
     assert counts[1]["date"] == date(2021, 1, 1)
     assert counts[1]["count"] == 1
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_update_daily_rollups(premium_data_fixture):
+    utc = timezone("UTC")
+    gmt3 = timezone("Etc/GMT+3")
+
+    user_1 = premium_data_fixture.create_user(
+        date_joined=datetime(2021, 1, 1, 12, tzinfo=utc)
+    )
+    user_2 = premium_data_fixture.create_user(
+        date_joined=datetime(2021, 1, 3, 1, tzinfo=utc)
+    )
+    for user, timestamp in [
+        (user_1, datetime(2021, 1, 2, 12, tzinfo=utc)),
+        (user_1, datetime(2021, 1, 2, 13, tzinfo=utc)),
+        (user_2, datetime(2021, 1, 3, 12, tzinfo=utc)),
+    ]:
+        entry = UserLogEntry.objects.create(actor=user, action="SIGNED_IN")
+        # To override the auto_now_add.
+        entry.timestamp = timestamp
+        entry.save()
+
+    handler = AdminDashboardHandler()
+    now = datetime(2021, 1, 3, 18, tzinfo=utc)
+
+    # Without any rollups, everything is computed live and nothing is stored.
+    assert handler.get_new_user_counts({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 2
+    }
+    assert handler.get_active_user_count({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 2
+    }
+    assert handler.get_new_user_count_per_day(timedelta(days=7), now) == [
+        {"date": date(2021, 1, 1), "count": 1},
+        {"date": date(2021, 1, 3), "count": 1},
+    ]
+    assert AdminDashboardDailyCount.objects.count() == 0
+
+    assert handler.update_daily_rollups(now=now) == 2
+    assert handler.update_daily_rollups(now=now) == 0
+    assert list(
+        AdminDashboardDailyCount.objects.values_list(
+            "timezone", "date", "new_users", "active_users"
+        )
+    ) == [
+        ("UTC", date(2021, 1, 1), 1, 0),
+        ("UTC", date(2021, 1, 2), 0, 1),
+    ]
+    assert list(
+        AdminDashboardDailyActiveUser.objects.values_list("date", "user_id")
+    ) == [(date(2021, 1, 2), user_1.id)]
+
+    # The complete days are served from the rollups and today is computed live.
+    AdminDashboardDailyCount.objects.filter(date=date(2021, 1, 1)).update(new_users=10)
+    assert handler.get_new_user_counts({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 11
+    }
+    assert handler.get_active_user_count({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 2
+    }
+
+    # The days after the last rollup are computed live.
+    assert handler.get_new_user_counts(
+        {"last_7_days": timedelta(days=7)}, now + timedelta(days=2)
+    ) == {"last_7_days": 11}
+    assert handler.get_active_user_count_per_day(
+        timedelta(days=7), now + timedelta(days=2)
+    ) == [
+        {"date": date(2021, 1, 2), "count": 1},
+        {"date": date(2021, 1, 3), "count": 1},
+    ]
+
+    # Only the days after the last rollup are added.
+    assert handler.update_daily_rollups(now=now + timedelta(days=2)) == 2
+    assert AdminDashboardDailyCount.objects.get(date=date(2021, 1, 1)).new_users == 10
+    assert list(
+        AdminDashboardDailyActiveUser.objects.values_list("date", "user_id")
+    ) == [(date(2021, 1, 2), user_1.id), (date(2021, 1, 3), user_2.id)]
+
+    # Requesting another timezone doesn't store rollups for it.
+    assert handler.get_new_user_count_per_day(
+        timedelta(days=7), now.astimezone(gmt3)
+    ) == [
+        {"date": date(2021, 1, 1), "count": 1},
+        {"date": date(2021, 1, 2), "count": 1},
+    ]
+    assert AdminDashboardDailyCount.objects.filter(timezone="Etc/GMT+3").count() == 0
+
+
+@pytest.mark.django_db
+def test_deleted_users_are_removed_from_daily_rollups(premium_data_fixture):
+    utc = timezone("UTC")
+    user_1 = premium_data_fixture.create_user(
+        date_joined=datetime(2021, 1, 1, 12, tzinfo=utc)
+    )
+    user_2 = premium_data_fixture.create_user(
+        date_joined=datetime(2021, 1, 1, 23, tzinfo=utc)
+    )
+    for user, timestamp in [
+        (user_1, datetime(2021, 1, 2, 12, tzinfo=utc)),
+        (user_2, datetime(2021, 1, 2, 13, tzinfo=utc)),
+        (user_2, datetime(2021, 1, 3, 1, tzinfo=utc)),
+    ]:
+        entry = UserLogEntry.objects.create(actor=user, action="SIGNED_IN")
+        entry.timestamp = timestamp
+        entry.save()
+
+    handler = AdminDashboardHandler()
+    now = datetime(2021, 1, 4, 18, tzinfo=utc)
+    handler.update_daily_rollups(now=now)
+    handler.update_daily_rollups("Etc/GMT-3", now=now)
+
+    user_2.delete()
+
+    assert list(
+        AdminDashboardDailyCount.objects.order_by("timezone", "date").values_list(
+            "timezone", "date", "new_users", "active_users"
+        )
+    ) == [
+        ("Etc/GMT-3", date(2021, 1, 1), 1, 0),
+        ("Etc/GMT-3", date(2021, 1, 2), 0, 1),
+        ("Etc/GMT-3", date(2021, 1, 3), 0, 0),
+        ("UTC", date(2021, 1, 1), 1, 0),
+        ("UTC", date(2021, 1, 2), 0, 1),
+        ("UTC", date(2021, 1, 3), 0, 0),
+    ]
+    # The values are the same as if they were counted without the rollups.
+    assert handler.get_new_user_counts({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 1
+    }
+    assert handler.get_active_user_count({"last_7_days": timedelta(days=7)}, now) == {
+        "last_7_days": 1
+    }
+
+
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_update_daily_rollups_without_users():
+    assert AdminDashboardHandler().update_daily_rollups() == 0
+    assert AdminDashboardDailyCount.objects.count() == 0
@@ -756,11 +756,18 @@ def test_admin_getting_view_users_only_runs_two_queries_instead_of_n(
         is_staff=True,
         has_active_premium_license=True,
     )
-    fixed_num_of_queries_unrelated_to_number_of_rows = 6
+    fixed_num_of_queries_unrelated_to_number_of_rows = 5
 
     for i in range(10):
         premium_data_fixture.create_user_group()
 
+    # The first request caches whether the user has an active premium license.
+    api_client.get(
+        reverse("api:premium:admin:users:list"),
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+
     with django_assert_num_queries(fixed_num_of_queries_unrelated_to_number_of_rows):
         response = api_client.get(
             reverse("api:premium:admin:users:list"),
@@ -367,6 +367,46 @@ def test_list_all_rows_with_limit_and_offset(api_client, premium_data_fixture):
     assert response_json["rows"][str(option_a.id)]["results"][1]["id"] == row_a2.id
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_list_rows_of_select_option_after_row(api_client, premium_data_fixture):
+    user, token = premium_data_fixture.create_user_and_token(
+        has_active_premium_license=True
+    )
+    table = premium_data_fixture.create_database_table(user=user)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    option_a = premium_data_fixture.create_select_option(
+        field=single_select_field, value="A", color="blue"
+    )
+    kanban = premium_data_fixture.create_kanban_view(
+        table=table, single_select_field=single_select_field
+    )
+
+    model = table.get_model()
+    row_a1, row_a2, row_a3 = [
+        model.objects.create(**{f"field_{single_select_field.id}_id": option_a.id})
+        for _ in range(3)
+    ]
+
+    url = reverse("api:database:views:kanban:list", kwargs={"view_id": kanban.id})
+    response = api_client.get(
+        f"{url}?select_option={option_a.id},1,0,{row_a1.id}",
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["rows"][str(option_a.id)]["count"] == 3
+    assert len(response_json["rows"][str(option_a.id)]["results"]) == 1
+    assert response_json["rows"][str(option_a.id)]["results"][0]["id"] == row_a2.id
+
+    response = api_client.get(
+        f"{url}?select_option={option_a.id},1,0,a",
+        **{"HTTP_AUTHORIZATION": f"JWT {token}"},
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_SELECT_OPTION_PARAMETER"
+
+
 @pytest.mark.django_db
 @override_settings(DEBUG=True)
 def test_kanban_filter(api_client, data_fixture, premium_data_fixture):
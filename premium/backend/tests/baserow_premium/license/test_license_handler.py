@@ -1,6 +1,7 @@
 import pytest
 import responses
 import base64
+from collections import OrderedDict
 from freezegun import freeze_time
 from unittest.mock import patch
 
@@ -13,6 +14,7 @@ from django.test.utils import override_settings
 
 from baserow.core.exceptions import IsNotAdminError
 
+from baserow_premium.license import handler as license_handler
 from baserow_premium.license.handler import (
     has_active_premium_license,
     check_active_premium_license,
@@ -175,6 +177,58 @@ def test_has_active_premium_license(data_fixture):
     assert not has_active_premium_license(invalid_user)
 
 
+@pytest.mark.django_db
+@override_settings(DEBUG=True)
+def test_has_active_premium_license_is_cached(data_fixture, django_assert_num_queries):
+    admin = data_fixture.create_user(is_staff=True)
+    user = data_fixture.create_user()
+    license = License.objects.create(license=VALID_TWO_SEAT_LICENSE.decode())
+
+    with freeze_time("2021-09-01 12:00"):
+        assert not has_active_premium_license(user)
+        with django_assert_num_queries(0):
+            assert not has_active_premium_license(user)
+
+        add_user_to_license(admin, license, user)
+        assert has_active_premium_license(user)
+        with django_assert_num_queries(0):
+            assert has_active_premium_license(user)
+
+    # The cached answer must not be used when the license isn't valid anymore.
+    with freeze_time("2021-10-01 12:00"):
+        assert not has_active_premium_license(user)
+        with django_assert_num_queries(0):
+            assert not has_active_premium_license(user)
+
+    with freeze_time("2021-09-01 12:00"):
+        assert has_active_premium_license(user)
+        remove_user_from_license(admin, license, user)
+        assert not has_active_premium_license(user)
+
+        # The `bulk_create` of filling the seats must also invalidate the cache.
+        fill_remaining_seats_of_license(admin, license)
+        assert has_active_premium_license(user)
+
+
+@override_settings(DEBUG=True)
+def test_decode_license_verifies_the_signature_once():
+    with patch(
+        "baserow_premium.license.cache._local_license_payloads", OrderedDict()
+    ), patch(
+        "baserow_premium.license.handler._decode_license",
+        wraps=license_handler._decode_license,
+    ) as mock_decode_license:
+        payload = decode_license(VALID_ONE_SEAT_LICENSE)
+        payload["seats"] = 100
+        assert decode_license(VALID_ONE_SEAT_LICENSE)["seats"] == 1
+
+    assert mock_decode_license.call_count == 1
+
+    with override_settings(DEBUG=False):
+        with pytest.raises(InvalidPremiumLicenseError):
+            decode_license(VALID_ONE_SEAT_LICENSE)
+
+
 @override_settings(DEBUG=True)
 def test_get_public_key_debug():
     public_key = get_public_key()
@@ -1,5 +1,8 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.models import View
 from baserow_premium.views.handler import get_rows_grouped_by_single_select_field
 
@@ -232,3 +235,122 @@ def test_get_rows_grouped_by_single_select_field_with_empty_table(
     assert len(rows) == 1
     assert rows["null"]["count"] == 0
     assert len(rows["null"]["results"]) == 0
+
+
+@pytest.mark.django_db
+def test_get_rows_grouped_by_single_select_field_after_row(premium_data_fixture):
+    table = premium_data_fixture.create_database_table()
+    view = View()
+    view.table = table
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    option_a = premium_data_fixture.create_select_option(
+        field=single_select_field, value="A", color="blue"
+    )
+    option_b = premium_data_fixture.create_select_option(
+        field=single_select_field, value="B", color="red"
+    )
+
+    model = table.get_model()
+    rows_a = [
+        model.objects.create(
+            order=order, **{f"field_{single_select_field.id}_id": option_a.id}
+        )
+        for order in [3, 1, 2, 2]
+    ]
+    rows_b = [
+        model.objects.create(**{f"field_{single_select_field.id}_id": option_b.id})
+        for _ in range(3)
+    ]
+    ordered_rows_a = [rows_a[1], rows_a[2], rows_a[3], rows_a[0]]
+
+    rows = get_rows_grouped_by_single_select_field(
+        view,
+        single_select_field,
+        option_settings={
+            str(option_a.id): {"limit": 2, "after": ordered_rows_a[0].id},
+            str(option_b.id): {"limit": 1, "offset": 1, "after": rows_b[0].id},
+        },
+    )
+
+    assert len(rows) == 2
+    assert rows[str(option_a.id)]["count"] == 4
+    assert [row.id for row in rows[str(option_a.id)]["results"]] == [
+        ordered_rows_a[1].id,
+        ordered_rows_a[2].id,
+    ]
+    assert rows[str(option_b.id)]["count"] == 3
+    assert [row.id for row in rows[str(option_b.id)]["results"]] == [rows_b[2].id]
+
+    # A single stack is fetched without the window function, but must result in
+    # the same rows.
+    rows = get_rows_grouped_by_single_select_field(
+        view,
+        single_select_field,
+        option_settings={
+            str(option_a.id): {"limit": 2, "after": ordered_rows_a[1].id},
+        },
+    )
+
+    assert [row.id for row in rows[str(option_a.id)]["results"]] == [
+        ordered_rows_a[2].id,
+        ordered_rows_a[3].id,
+    ]
+
+    # A trashed row can still be used as cursor.
+    ordered_rows_a[2].trashed = True
+    ordered_rows_a[2].save()
+    rows = get_rows_grouped_by_single_select_field(
+        view,
+        single_select_field,
+        option_settings={
+            str(option_a.id): {"limit": 2, "after": ordered_rows_a[2].id},
+        },
+    )
+
+    assert [row.id for row in rows[str(option_a.id)]["results"]] == [
+        ordered_rows_a[3].id
+    ]
+
+
+@pytest.mark.django_db
+def test_get_rows_grouped_by_single_select_field_caches_the_counts(
+    premium_data_fixture, django_assert_num_queries
+):
+    user = premium_data_fixture.create_user()
+    table = premium_data_fixture.create_database_table(user=user)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    option_a = premium_data_fixture.create_select_option(
+        field=single_select_field, value="A", color="blue"
+    )
+    view = premium_data_fixture.create_kanban_view(
+        table=table, single_select_field=single_select_field
+    )
+    row_handler = RowHandler()
+    row = row_handler.create_row(
+        user, table, {f"field_{single_select_field.id}": option_a.id}
+    )
+
+    def get_counts():
+        rows = get_rows_grouped_by_single_select_field(view, single_select_field)
+        return {key: value["count"] for key, value in rows.items()}
+
+    assert get_counts() == {"null": 0, str(option_a.id): 1}
+
+    with CaptureQueriesContext(connection) as captured:
+        assert get_counts() == {"null": 0, str(option_a.id): 1}
+    assert not any("COUNT" in query["sql"] for query in captured.captured_queries)
+
+    row_handler.update_row_by_id(
+        user, table, row.id, {f"field_{single_select_field.id}": None}
+    )
+    assert get_counts() == {"null": 1, str(option_a.id): 0}
+
+    row_handler.create_row(
+        user, table, {f"field_{single_select_field.id}": option_a.id}
+    )
+    assert get_counts() == {"null": 1, str(option_a.id): 1}
+
+    premium_data_fixture.create_view_filter(
+        view=view, field=single_select_field, type="empty", value=""
+    )
+    assert get_counts() == {"null": 1, str(option_a.id): 0}